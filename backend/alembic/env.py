@@ -14,7 +14,7 @@ sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
 # 설정 및 모델 import
 from app.config import settings
 from app.database import Base
-from app.models import Stock, Price, TradingTrend, News  # 모든 모델 import
+from app.models import Stock, Price, TradingTrend, News, DataCheck, BackfillCheckpoint, SchedulerFence  # 모든 모델 import
 
 # this is the Alembic Config object, which provides
 # access to the values within the .ini file in use.
@@ -0,0 +1,46 @@
+"""prices, trading_trends (ticker, date) 유니크 제약조건 추가
+
+벌크 upsert(ON DUPLICATE KEY UPDATE / ON CONFLICT DO UPDATE)의 충돌 키로 사용합니다.
+create_all로 만든 기존 데이터베이스에 적용하며, 중복 행은 가장 최근 id만 남깁니다.
+
+Revision ID: 0001_unique_ticker_date
+Revises: 
+Create Date: 2026-10-17 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0001_unique_ticker_date'
+down_revision: Union[str, None] = None
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# (테이블, 기존 인덱스, 유니크 제약조건)
+_TABLES = (
+    ("prices", "idx_price_ticker_date", "uq_price_ticker_date"),
+    ("trading_trends", "idx_trading_ticker_date", "uq_trading_ticker_date"),
+)
+
+
+def upgrade() -> None:
+    for table, index_name, constraint_name in _TABLES:
+        # 중복 (ticker, date) 행 정리 (MySQL은 같은 테이블 서브쿼리를 파생 테이블로 감싸야 함)
+        op.execute(
+            f"DELETE FROM {table} WHERE id NOT IN "
+            f"(SELECT id FROM (SELECT MAX(id) AS id FROM {table} GROUP BY ticker, date) AS keep_rows)"
+        )
+        with op.batch_alter_table(table) as batch_op:
+            batch_op.create_unique_constraint(constraint_name, ["ticker", "date"])
+            batch_op.drop_index(index_name)
+
+
+def downgrade() -> None:
+    for table, index_name, constraint_name in _TABLES:
+        with op.batch_alter_table(table) as batch_op:
+            batch_op.create_index(index_name, ["ticker", "date"])
+            batch_op.drop_constraint(constraint_name, type_="unique")
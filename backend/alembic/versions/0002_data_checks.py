@@ -0,0 +1,37 @@
+"""data_checks 테이블 추가
+
+값이 바뀌지 않은 가격/매매동향 행은 다시 쓰지 않으므로,
+종목·데이터 유형별 마지막 확인 시각을 별도 테이블에 기록합니다.
+
+Revision ID: 0002_data_checks
+Revises: 0001_unique_ticker_date
+Create Date: 2026-10-17 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0002_data_checks'
+down_revision: Union[str, None] = '0001_unique_ticker_date'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "data_checks",
+        sa.Column("ticker", sa.String(length=10), nullable=False, comment="종목 코드"),
+        sa.Column("data_type", sa.String(length=20), nullable=False, comment="데이터 유형 (prices/trading)"),
+        sa.Column("last_checked_at", sa.DateTime(), nullable=False, comment="마지막 확인 시각"),
+        sa.Column("last_changed_at", sa.DateTime(), nullable=True, comment="마지막으로 행이 삽입/갱신된 시각"),
+        sa.ForeignKeyConstraint(["ticker"], ["stocks.ticker"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("ticker", "data_type"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("data_checks")
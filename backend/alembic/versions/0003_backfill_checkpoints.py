@@ -0,0 +1,49 @@
+"""backfill_checkpoints 테이블 추가
+
+과거 데이터 백필을 페이지 묶음 단위로 커밋하면서 다음 페이지를 기록해,
+프로세스가 중단되어도 마지막 체크포인트부터 이어서 수집합니다.
+
+Revision ID: 0003_backfill_checkpoints
+Revises: 0002_data_checks
+Create Date: 2026-10-17 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0003_backfill_checkpoints'
+down_revision: Union[str, None] = '0002_data_checks'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "backfill_checkpoints",
+        sa.Column("ticker", sa.String(length=10), nullable=False, comment="종목 코드"),
+        sa.Column("data_type", sa.String(length=20), nullable=False, comment="데이터 유형 (prices/trading)"),
+        sa.Column("status", sa.String(length=20), nullable=False, comment="상태 (pending/running/completed/failed)"),
+        sa.Column("start_date", sa.Date(), nullable=False, comment="백필 목표 시작 날짜 (이 날짜까지 과거로 수집)"),
+        sa.Column("next_page", sa.Integer(), nullable=False, comment="다음에 수집할 페이지 번호"),
+        sa.Column("pages_done", sa.Integer(), nullable=False, comment="수집 완료한 페이지 수"),
+        sa.Column("rows_saved", sa.Integer(), nullable=False, comment="저장한 행 수"),
+        sa.Column("oldest_date", sa.Date(), nullable=True, comment="지금까지 수집한 가장 과거 날짜"),
+        sa.Column("active_seconds", sa.Float(), nullable=False, comment="수집에 걸린 누적 시간 (초, 남은 시간 추정용)"),
+        sa.Column("failures", sa.Integer(), nullable=False, comment="연속 실패 횟수"),
+        sa.Column("last_error", sa.String(length=500), nullable=True, comment="마지막 오류 메시지"),
+        sa.Column("owner", sa.String(length=100), nullable=True, comment="수집 중인 프로세스 (호스트명:PID)"),
+        sa.Column("lease_until", sa.DateTime(), nullable=True, comment="owner의 점유 만료 시각 (지나면 다른 프로세스가 이어받음)"),
+        sa.Column("created_at", sa.DateTime(), nullable=False, comment="요청 시각"),
+        sa.Column("updated_at", sa.DateTime(), nullable=False, comment="마지막 갱신 시각"),
+        sa.Column("completed_at", sa.DateTime(), nullable=True, comment="완료 시각"),
+        sa.ForeignKeyConstraint(["ticker"], ["stocks.ticker"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("ticker", "data_type"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("backfill_checkpoints")
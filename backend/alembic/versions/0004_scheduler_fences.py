@@ -0,0 +1,35 @@
+"""scheduler_fences 테이블 추가
+
+리더가 종목 트랜잭션 안에서 fencing 토큰을 조건부로 갱신해, 락을 잃은 이전 리더의
+트랜잭션이 새 리더의 커밋 뒤에 커밋되지 않도록 합니다.
+
+Revision ID: 0004_scheduler_fences
+Revises: 0003_backfill_checkpoints
+Create Date: 2026-10-17 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0004_scheduler_fences'
+down_revision: Union[str, None] = '0003_backfill_checkpoints'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "scheduler_fences",
+        sa.Column("name", sa.String(length=50), nullable=False, comment="락 이름"),
+        sa.Column("token", sa.BigInteger(), nullable=False, comment="커밋된 가장 큰 fencing 토큰"),
+        sa.Column("updated_at", sa.DateTime(), nullable=False, comment="마지막 갱신 시각"),
+        sa.PrimaryKeyConstraint("name"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("scheduler_fences")
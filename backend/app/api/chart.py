@@ -5,6 +5,7 @@ from sqlalchemy.orm import Session
 from typing import Optional
 
 from app.database import get_db
+from app.utils.access_heat import record_ticker_access
 
 router = APIRouter()
 
@@ -16,6 +17,7 @@ async def get_chart(
     db: Session = Depends(get_db),
 ):
     """차트 데이터 조회"""
+    record_ticker_access(ticker)
     # TODO: 구현 필요
     if days > 30:
         days = 30
@@ -2,17 +2,32 @@
 데이터 수집 API 라우터
 
 Naver Finance에서 가격 데이터, 매매 동향 데이터, 뉴스 데이터를 수집하는 API를 제공합니다.
+수집 요청은 백그라운드 작업으로 등록되어 바로 202와 작업 ID를 반환하며, 결과는 작업 상태 API로 조회합니다.
+같은 종목/유형/파라미터의 작업이 진행 중이면 새 작업을 만들지 않고 그 작업을 반환합니다.
+(COLLECTION_WORKER_ENABLED이면 수집 워커 프로세스가, 아니면 API 프로세스의 스레드 풀이 실행)
+days<=365보다 긴 이력은 체크포인트 기반 백필(/api/data/backfill)로 수집합니다.
 """
 
-from fastapi import APIRouter, Depends, Query, HTTPException
+from fastapi import APIRouter, Depends, Query, HTTPException, status
+from fastapi.responses import JSONResponse
 from sqlalchemy.orm import Session
 from typing import Optional
-from datetime import datetime, date
+from datetime import date, datetime
 
 from app.database import get_db
 from app.models.stock import Stock
-from app.collectors.finance_collector import FinanceCollector
-from app.collectors.news_collector import NewsCollector
+from app.collectors.finance_collector import DATA_TYPE_PRICES, DATA_TYPE_TRADING
+from app.collectors.news_collector import DATA_TYPE_NEWS
+from app.scheduler.collection_jobs import get_collection_job_queue
+from app.scheduler.backfill import (
+    ACTIVE_STATUSES,
+    BACKFILL_DATA_TYPES,
+    checkpoint_progress,
+    get_backfill_runner,
+    request_backfill,
+)
+from app.models.backfill_checkpoint import BackfillCheckpoint
+from app.config import settings
 from app.schemas.response import APIResponse
 from app.exceptions import NotFoundException, BadRequestException
 import logging
@@ -20,21 +35,53 @@ import logging
 logger = logging.getLogger(__name__)
 
 router = APIRouter()
+# 수집 작업 상태 조회 라우터 (/api/data/jobs)
+jobs_router = APIRouter()
+# 과거 데이터 백필 라우터 (/api/data/backfill)
+backfill_router = APIRouter()
 
 
-@router.post("/prices/{ticker}", response_model=APIResponse)
+def _ensure_stock_exists(db: Session, ticker: str) -> None:
+    """종목 존재 확인"""
+    stock = db.query(Stock).filter(Stock.ticker == ticker).first()
+    if not stock:
+        raise NotFoundException(detail=f"Stock with ticker '{ticker}' not found")
+
+
+def _enqueue_collection(job_type: str, ticker: str, params: dict) -> JSONResponse:
+    """수집 작업을 등록하고 202 응답 반환"""
+    job = get_collection_job_queue().enqueue(job_type, ticker, params)
+    message = (
+        f"Collection job already in progress: {job['id']}" if job['coalesced']
+        else f"Collection job queued: {job['id']}"
+    )
+    return JSONResponse(
+        status_code=status.HTTP_202_ACCEPTED,
+        content=APIResponse(
+            success=True,
+            data=job,
+            message=message,
+            timestamp=datetime.now(),
+        ).model_dump(mode='json'),
+    )
+
+
+@router.post("/prices/{ticker}", response_model=APIResponse, status_code=status.HTTP_202_ACCEPTED)
 async def collect_prices(
     ticker: str,
     days: int = Query(10, ge=1, le=365, description="수집할 일수 (기본: 10일, 최대: 365일)"),
+    incremental: bool = Query(False, description="저장된 최신 날짜 이후만 수집 (기본: false, 전체 재동기화)"),
     db: Session = Depends(get_db),
 ):
     """
     가격 데이터 수집 API
     
-    Naver Finance에서 지정된 종목의 가격 데이터를 수집하여 데이터베이스에 저장합니다.
+    Naver Finance에서 지정된 종목의 가격 데이터를 수집하여 데이터베이스에 저장하는 작업을 등록합니다.
+    저장 건수는 GET /api/data/jobs/{job_id}의 result.saved_count로 확인합니다.
     
     - **ticker**: 종목 코드
     - **days**: 수집할 일수 (1-365일, 기본: 10일)
+    - **incremental**: true이면 저장된 최신 날짜 이후 행과 오늘 행만 수집
     
     **Example Request:**
     ```
@@ -46,59 +93,46 @@ async def collect_prices(
     {
       "success": true,
       "data": {
+        "id": "3f1c9a0e5b7d4e2a9c8b6d4f2e0a1b3c",
+        "type": "prices",
         "ticker": "487240",
-        "saved_count": 10,
-        "days": 10
+        "params": {"days": 10, "incremental": false},
+        "status": "queued",
+        "created_at": "2025-11-14T10:30:00",
+        "started_at": null,
+        "finished_at": null,
+        "result": null,
+        "error": null,
+        "coalesced": false
       },
-      "message": "Price data collected successfully",
+      "message": "Collection job queued: 3f1c9a0e5b7d4e2a9c8b6d4f2e0a1b3c",
       "timestamp": "2025-11-14T10:30:00"
     }
     ```
     
     **Status Codes:**
-    - 200: 성공
+    - 202: 작업 등록 (같은 요청이 진행 중이면 그 작업, coalesced: true)
     - 404: 종목을 찾을 수 없음
     - 400: 잘못된 파라미터
     - 500: 서버 오류
     """
     try:
-        # 종목 존재 확인
-        stock = db.query(Stock).filter(Stock.ticker == ticker).first()
-        if not stock:
-            raise NotFoundException(detail=f"Stock with ticker '{ticker}' not found")
-        
-        # 데이터 수집기 초기화
-        collector = FinanceCollector()
-        
-        # 가격 데이터 수집 및 저장
-        saved_count = collector.collect_and_save_prices(db, ticker, days)
-        
-        logger.info(f"Price data collection completed for {ticker}: {saved_count} records saved")
-        
-        return APIResponse(
-            success=True,
-            data={
-                "ticker": ticker,
-                "saved_count": saved_count,
-                "days": days
-            },
-            message=f"Price data collected successfully. {saved_count} records saved.",
-            timestamp=datetime.now(),
-        )
+        _ensure_stock_exists(db, ticker)
+        return _enqueue_collection(DATA_TYPE_PRICES, ticker, {"days": days, "incremental": incremental})
     
     except NotFoundException:
         raise
     except BadRequestException:
         raise
     except Exception as e:
-        logger.error(f"Error collecting price data for {ticker}: {e}", exc_info=True)
+        logger.error(f"Error queuing price data collection for {ticker}: {e}", exc_info=True)
         raise HTTPException(
             status_code=500,
-            detail=f"Failed to collect price data: {str(e)}"
+            detail=f"Failed to queue price data collection: {str(e)}"
         )
 
 
-@router.post("/trading/{ticker}", response_model=APIResponse)
+@router.post("/trading/{ticker}", response_model=APIResponse, status_code=status.HTTP_202_ACCEPTED)
 async def collect_trading_flow(
     ticker: str,
     days: int = Query(10, ge=1, le=365, description="수집할 일수 (기본: 10일, 최대: 365일)"),
@@ -109,7 +143,7 @@ async def collect_trading_flow(
     """
     매매 동향 데이터 수집 API
     
-    Naver Finance에서 지정된 종목의 매매 동향 데이터를 수집하여 데이터베이스에 저장합니다.
+    Naver Finance에서 지정된 종목의 매매 동향 데이터를 수집하여 데이터베이스에 저장하는 작업을 등록합니다.
     
     - **ticker**: 종목 코드
     - **days**: 수집할 일수 (1-365일, 기본: 10일)
@@ -126,26 +160,27 @@ async def collect_trading_flow(
     {
       "success": true,
       "data": {
+        "id": "8d2e4f6a0b1c3d5e7f9a2b4c6d8e0f1a",
+        "type": "trading",
         "ticker": "487240",
-        "saved_count": 10,
-        "days": 10
+        "params": {"days": 10, "start_date": null, "end_date": null},
+        "status": "queued",
+        "...": "...",
+        "coalesced": false
       },
-      "message": "Trading flow data collected successfully",
+      "message": "Collection job queued: 8d2e4f6a0b1c3d5e7f9a2b4c6d8e0f1a",
       "timestamp": "2025-11-14T10:30:00"
     }
     ```
     
     **Status Codes:**
-    - 200: 성공
+    - 202: 작업 등록 (같은 요청이 진행 중이면 그 작업, coalesced: true)
     - 404: 종목을 찾을 수 없음
     - 400: 잘못된 파라미터
     - 500: 서버 오류
     """
     try:
-        # 종목 존재 확인
-        stock = db.query(Stock).filter(Stock.ticker == ticker).first()
-        if not stock:
-            raise NotFoundException(detail=f"Stock with ticker '{ticker}' not found")
+        _ensure_stock_exists(db, ticker)
         
         # 날짜 파싱 및 검증
         start_date_obj = None
@@ -175,27 +210,14 @@ async def collect_trading_flow(
                 error_code="INVALID_DATE_RANGE",
             )
         
-        # 데이터 수집기 초기화
-        collector = FinanceCollector()
-        
-        # 매매 동향 데이터 수집 및 저장
-        saved_count = collector.collect_and_save_trading_flow(
-            db, ticker, days, start_date_obj, end_date_obj
-        )
-        
-        logger.info(f"Trading flow data collection completed for {ticker}: {saved_count} records saved")
-        
-        return APIResponse(
-            success=True,
-            data={
-                "ticker": ticker,
-                "saved_count": saved_count,
+        return _enqueue_collection(
+            DATA_TYPE_TRADING,
+            ticker,
+            {
                 "days": days,
-                "start_date": start_date,
-                "end_date": end_date
+                "start_date": start_date_obj.isoformat() if start_date_obj else None,
+                "end_date": end_date_obj.isoformat() if end_date_obj else None,
             },
-            message=f"Trading flow data collected successfully. {saved_count} records saved.",
-            timestamp=datetime.now(),
         )
     
     except NotFoundException:
@@ -203,14 +225,14 @@ async def collect_trading_flow(
     except BadRequestException:
         raise
     except Exception as e:
-        logger.error(f"Error collecting trading flow data for {ticker}: {e}", exc_info=True)
+        logger.error(f"Error queuing trading flow data collection for {ticker}: {e}", exc_info=True)
         raise HTTPException(
             status_code=500,
-            detail=f"Failed to collect trading flow data: {str(e)}"
+            detail=f"Failed to queue trading flow data collection: {str(e)}"
         )
 
 
-@router.post("/news/{ticker}", response_model=APIResponse)
+@router.post("/news/{ticker}", response_model=APIResponse, status_code=status.HTTP_202_ACCEPTED)
 async def collect_news(
     ticker: str,
     max_items: int = Query(50, ge=1, le=200, description="최대 수집할 뉴스 개수 (기본: 50개, 최대: 200개)"),
@@ -219,7 +241,7 @@ async def collect_news(
     """
     뉴스 데이터 수집 API
     
-    Naver Finance에서 지정된 종목의 뉴스 데이터를 수집하여 데이터베이스에 저장합니다.
+    Naver Finance에서 지정된 종목의 뉴스 데이터를 수집하여 데이터베이스에 저장하는 작업을 등록합니다.
     
     - **ticker**: 종목 코드
     - **max_items**: 최대 수집할 뉴스 개수 (1-200개, 기본: 50개)
@@ -234,54 +256,327 @@ async def collect_news(
     {
       "success": true,
       "data": {
+        "id": "c4b2a0e8d6f4b2a0c8e6d4f2b0a8c6e4",
+        "type": "news",
         "ticker": "487240",
-        "saved_count": 50,
-        "max_items": 50
+        "params": {"max_items": 50},
+        "status": "queued",
+        "...": "...",
+        "coalesced": false
       },
-      "message": "News data collected successfully",
+      "message": "Collection job queued: c4b2a0e8d6f4b2a0c8e6d4f2b0a8c6e4",
       "timestamp": "2025-11-14T10:30:00"
     }
     ```
     
+    **Status Codes:**
+    - 202: 작업 등록 (같은 요청이 진행 중이면 그 작업, coalesced: true)
+    - 404: 종목을 찾을 수 없음
+    - 400: 잘못된 파라미터
+    - 500: 서버 오류
+    """
+    try:
+        _ensure_stock_exists(db, ticker)
+        return _enqueue_collection(DATA_TYPE_NEWS, ticker, {"max_items": max_items})
+    
+    except NotFoundException:
+        raise
+    except BadRequestException:
+        raise
+    except Exception as e:
+        logger.error(f"Error queuing news data collection for {ticker}: {e}", exc_info=True)
+        raise HTTPException(
+            status_code=500,
+            detail=f"Failed to queue news data collection: {str(e)}"
+        )
+
+
+@jobs_router.get("/{job_id}", response_model=APIResponse)
+async def get_collection_job(job_id: str):
+    """
+    수집 작업 상태 조회 API
+    
+    status는 queued, running, succeeded, failed 중 하나이며, 성공하면 result에 저장 건수,
+    실패하면 error에 오류 메시지가 포함됩니다. 끝난 작업은 COLLECTION_JOB_TTL 동안 조회할 수 있습니다.
+    
+    **Example Request:**
+    ```
+    GET /api/data/jobs/3f1c9a0e5b7d4e2a9c8b6d4f2e0a1b3c
+    ```
+    
+    **Example Response:**
+    ```json
+    {
+      "success": true,
+      "data": {
+        "id": "3f1c9a0e5b7d4e2a9c8b6d4f2e0a1b3c",
+        "type": "prices",
+        "ticker": "487240",
+        "params": {"days": 10, "incremental": false},
+        "status": "succeeded",
+        "created_at": "2025-11-14T10:30:00",
+        "started_at": "2025-11-14T10:30:00",
+        "finished_at": "2025-11-14T10:30:02",
+        "result": {"saved_count": 10},
+        "error": null
+      },
+      "message": "Collection job status retrieved successfully",
+      "timestamp": "2025-11-14T10:30:05"
+    }
+    ```
+    
     **Status Codes:**
     - 200: 성공
+    - 404: 작업을 찾을 수 없음 (없는 ID 또는 보관 시간 경과)
+    - 500: 서버 오류
+    """
+    try:
+        job = get_collection_job_queue().get(job_id)
+        if job is None:
+            raise NotFoundException(detail=f"Collection job '{job_id}' not found")
+        
+        return APIResponse(
+            success=True,
+            data=job,
+            message="Collection job status retrieved successfully",
+            timestamp=datetime.now(),
+        )
+    
+    except NotFoundException:
+        raise
+    except Exception as e:
+        logger.error(f"Error getting collection job {job_id}: {e}", exc_info=True)
+        raise HTTPException(
+            status_code=500,
+            detail=f"Failed to get collection job: {str(e)}"
+        )
+
+
+def _backfill_progress(db: Session, checkpoints: list) -> list:
+    """체크포인트 진행 상태 리스트 (남은 시간은 수집 중인 체크포인트 수를 반영)"""
+    active_count = db.query(BackfillCheckpoint).filter(BackfillCheckpoint.status.in_(ACTIVE_STATUSES)).count()
+    return [checkpoint_progress(checkpoint, active_count) for checkpoint in checkpoints]
+
+
+@backfill_router.post("/{ticker}", response_model=APIResponse, status_code=status.HTTP_202_ACCEPTED)
+async def start_backfill(
+    ticker: str,
+    data_type: Optional[str] = Query(None, description="prices 또는 trading (기본: 둘 다)"),
+    years: int = Query(5, ge=1, le=30, description="오늘부터 수집할 햇수 (기본: 5년, 최대: 30년)"),
+    start_date: Optional[str] = Query(None, description="이 날짜까지 수집 (YYYY-MM-DD, 지정 시 years 무시)", example="2015-01-01"),
+    restart: bool = Query(False, description="체크포인트를 버리고 첫 페이지부터 다시 수집"),
+    db: Session = Depends(get_db),
+):
+    """
+    과거 데이터 백필 요청 API
+    
+    가격/매매동향 이력을 페이지 묶음 단위로 저장하고 묶음마다 체크포인트를 기록하는 백필을 등록합니다.
+    이미 체크포인트가 있으면 마지막으로 저장한 페이지 다음부터 이어서 수집하며(실패로 멈춘 백필도 재개),
+    더 과거의 start_date를 요청하면 완료된 백필도 이어서 수집합니다.
+    백필은 BACKFILL_PAGES_PER_MINUTE 예산으로 느리게 진행되며, 진행 상태는 GET /api/data/backfill/{ticker}로 조회합니다.
+    
+    - **ticker**: 종목 코드
+    - **data_type**: prices 또는 trading (기본: 둘 다)
+    - **years**: 오늘부터 수집할 햇수 (1-30년, 기본: 5년)
+    - **start_date**: 이 날짜까지 수집 (YYYY-MM-DD, 선택사항)
+    - **restart**: true이면 첫 페이지부터 다시 수집
+    
+    **Example Request:**
+    ```
+    POST /api/data/backfill/487240?data_type=prices&years=10
+    ```
+    
+    **Example Response:**
+    ```json
+    {
+      "success": true,
+      "data": [
+        {
+          "ticker": "487240", "data_type": "prices", "status": "pending",
+          "start_date": "2015-11-14", "oldest_date": null, "next_page": 1,
+          "pages_done": 0, "rows_saved": 0, "progress": 0.0, "eta_seconds": null,
+          "failures": 0, "last_error": null, "created_at": "2025-11-14T10:30:00",
+          "updated_at": "2025-11-14T10:30:00", "completed_at": null
+        }
+      ],
+      "message": "Backfill queued for 487240",
+      "timestamp": "2025-11-14T10:30:00"
+    }
+    ```
+    
+    **Status Codes:**
+    - 202: 백필 등록
     - 404: 종목을 찾을 수 없음
     - 400: 잘못된 파라미터
     - 500: 서버 오류
     """
     try:
-        # 종목 존재 확인
-        stock = db.query(Stock).filter(Stock.ticker == ticker).first()
-        if not stock:
-            raise NotFoundException(detail=f"Stock with ticker '{ticker}' not found")
+        _ensure_stock_exists(db, ticker)
         
-        # 데이터 수집기 초기화
-        collector = NewsCollector()
+        if data_type is not None and data_type not in BACKFILL_DATA_TYPES:
+            raise BadRequestException(
+                detail=f"Invalid data_type. Expected one of {', '.join(BACKFILL_DATA_TYPES)}, got: {data_type}",
+                error_code="INVALID_DATA_TYPE",
+            )
         
-        # 뉴스 데이터 수집 및 저장
-        saved_count = collector.collect_and_save_news(db, ticker, max_items)
+        if start_date:
+            try:
+                start_date_obj = datetime.strptime(start_date, "%Y-%m-%d").date()
+            except ValueError:
+                raise BadRequestException(
+                    detail=f"Invalid start_date format. Expected YYYY-MM-DD, got: {start_date}",
+                    error_code="INVALID_DATE_FORMAT",
+                )
+            if start_date_obj >= date.today():
+                raise BadRequestException(
+                    detail="start_date must be before today",
+                    error_code="INVALID_DATE_RANGE",
+                )
+        else:
+            today = date.today()
+            start_date_obj = today.replace(year=today.year - years, day=min(today.day, 28))
         
-        logger.info(f"News data collection completed for {ticker}: {saved_count} records saved")
+        data_types = [data_type] if data_type else list(BACKFILL_DATA_TYPES)
+        checkpoints = [
+            request_backfill(db, ticker, requested_type, start_date_obj, restart=restart)
+            for requested_type in data_types
+        ]
+        # 워커 모드에서는 워커의 백필 스레드가 체크포인트 테이블을 주기적으로 확인
+        if not settings.COLLECTION_WORKER_ENABLED:
+            get_backfill_runner().wake()
+        
+        return JSONResponse(
+            status_code=status.HTTP_202_ACCEPTED,
+            content=APIResponse(
+                success=True,
+                data=_backfill_progress(db, checkpoints),
+                message=f"Backfill queued for {ticker}",
+                timestamp=datetime.now(),
+            ).model_dump(mode='json'),
+        )
+    
+    except NotFoundException:
+        raise
+    except BadRequestException:
+        raise
+    except Exception as e:
+        logger.error(f"Error queuing backfill for {ticker}: {e}", exc_info=True)
+        raise HTTPException(
+            status_code=500,
+            detail=f"Failed to queue backfill: {str(e)}"
+        )
+
+
+@backfill_router.get("", response_model=APIResponse)
+async def list_backfills(db: Session = Depends(get_db)):
+    """
+    전체 백필 진행 상태 조회 API
+    
+    모든 백필 체크포인트의 진행률과 남은 시간, 이 프로세스의 백필 실행기 상태를 조회합니다.
+    
+    **Example Response:**
+    ```json
+    {
+      "success": true,
+      "data": {
+        "runner": {
+          "is_running": true, "owner": "api-1:4120", "pages_per_minute": 30.0, "chunk_pages": 5,
+          "chunks": 42, "pages": 210, "rows": 2100, "completed": 1, "failures": 0
+        },
+        "checkpoints": [{"ticker": "487240", "data_type": "prices", "status": "running", "progress": 0.42, "...": "..."}]
+      },
+      "message": "Backfill status retrieved successfully",
+      "timestamp": "2025-11-14T10:30:00"
+    }
+    ```
+    
+    **Status Codes:**
+    - 200: 성공
+    - 500: 서버 오류
+    """
+    try:
+        checkpoints = (
+            db.query(BackfillCheckpoint)
+            .order_by(BackfillCheckpoint.ticker, BackfillCheckpoint.data_type)
+            .all()
+        )
         
         return APIResponse(
             success=True,
             data={
-                "ticker": ticker,
-                "saved_count": saved_count,
-                "max_items": max_items
+                'runner': get_backfill_runner().get_status(),
+                'checkpoints': _backfill_progress(db, checkpoints),
             },
-            message=f"News data collected successfully. {saved_count} records saved.",
+            message="Backfill status retrieved successfully",
+            timestamp=datetime.now(),
+        )
+    
+    except Exception as e:
+        logger.error(f"Error getting backfill status: {e}", exc_info=True)
+        raise HTTPException(
+            status_code=500,
+            detail=f"Failed to get backfill status: {str(e)}"
+        )
+
+
+@backfill_router.get("/{ticker}", response_model=APIResponse)
+async def get_backfill(ticker: str, db: Session = Depends(get_db)):
+    """
+    종목 백필 진행 상태 조회 API
+    
+    progress는 목표 기간 중 수집한 가장 과거 날짜까지의 비율(0-1)이고, eta_seconds는 지금까지의
+    수집 속도로 추정한 남은 시간(초)입니다. 수집 중인 다른 백필과 번갈아 수집하는 시간도 반영합니다.
+    
+    **Example Request:**
+    ```
+    GET /api/data/backfill/487240
+    ```
+    
+    **Example Response:**
+    ```json
+    {
+      "success": true,
+      "data": [
+        {
+          "ticker": "487240", "data_type": "prices", "status": "running",
+          "start_date": "2015-11-14", "oldest_date": "2021-08-02", "next_page": 106,
+          "pages_done": 105, "rows_saved": 1050, "progress": 0.4289, "eta_seconds": 312.6,
+          "failures": 0, "last_error": null, "created_at": "2025-11-14T10:30:00",
+          "updated_at": "2025-11-14T10:33:30", "completed_at": null
+        }
+      ],
+      "message": "Backfill status retrieved successfully",
+      "timestamp": "2025-11-14T10:33:35"
+    }
+    ```
+    
+    **Status Codes:**
+    - 200: 성공
+    - 404: 백필 요청이 없음
+    - 500: 서버 오류
+    """
+    try:
+        checkpoints = (
+            db.query(BackfillCheckpoint)
+            .filter(BackfillCheckpoint.ticker == ticker)
+            .order_by(BackfillCheckpoint.data_type)
+            .all()
+        )
+        if not checkpoints:
+            raise NotFoundException(detail=f"No backfill found for ticker '{ticker}'")
+        
+        return APIResponse(
+            success=True,
+            data=_backfill_progress(db, checkpoints),
+            message="Backfill status retrieved successfully",
             timestamp=datetime.now(),
         )
     
     except NotFoundException:
         raise
-    except BadRequestException:
-        raise
     except Exception as e:
-        logger.error(f"Error collecting news data for {ticker}: {e}", exc_info=True)
+        logger.error(f"Error getting backfill status for {ticker}: {e}", exc_info=True)
         raise HTTPException(
             status_code=500,
-            detail=f"Failed to collect news data: {str(e)}"
+            detail=f"Failed to get backfill status: {str(e)}"
         )
-
@@ -5,6 +5,7 @@ from sqlalchemy.orm import Session
 from typing import Optional
 
 from app.database import get_db
+from app.utils.access_heat import record_ticker_access
 
 router = APIRouter()
 
@@ -17,6 +18,7 @@ async def get_news(
     db: Session = Depends(get_db),
 ):
     """뉴스 목록 조회"""
+    record_ticker_access(ticker)
     # TODO: 구현 필요
     return {
         "success": True,
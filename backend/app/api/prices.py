@@ -12,6 +12,7 @@ from app.schemas.price import PriceResponse, PriceListResponse
 from app.schemas.response import APIResponse
 from app.exceptions import NotFoundException, BadRequestException
 from app.utils.cache import get_cache, set_cache
+from app.utils.access_heat import record_ticker_access
 
 router = APIRouter()
 
@@ -62,6 +63,9 @@ async def get_price(
     if not stock:
         raise NotFoundException(detail=f"Stock with ticker '{ticker}' not found")
     
+    # 조회 빈도 기록 (스케줄러 수집 우선순위)
+    record_ticker_access(ticker)
+    
     # 날짜 파싱 및 검증
     start_date_obj = None
     end_date_obj = None
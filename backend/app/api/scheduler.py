@@ -2,12 +2,17 @@
 스케줄러 관리 API 라우터
 
 데이터 수집 스케줄러의 상태 조회 및 제어를 제공합니다.
+COLLECTION_WORKER_ENABLED이면 스케줄러는 수집 워커 프로세스(python -m app.worker)에서 실행되므로
+상태는 워커가 게시한 값을 반환하고 시작/중지는 지원하지 않습니다.
 """
 
 from fastapi import APIRouter, HTTPException, Query
 from datetime import datetime
 from typing import Optional
 
+from app.config import settings
+from app.exceptions import BadRequestException
+from app.scheduler.collection_jobs import get_collection_job_queue
 from app.scheduler.data_scheduler import get_scheduler
 from app.schemas.response import APIResponse
 import logging
@@ -17,12 +22,31 @@ logger = logging.getLogger(__name__)
 router = APIRouter()
 
 
+def _ensure_scheduler_in_api() -> None:
+    """스케줄러가 수집 워커에서 실행되면 API에서 제어할 수 없음"""
+    if settings.COLLECTION_WORKER_ENABLED:
+        raise BadRequestException(
+            detail="Scheduler runs in the collection worker process (python -m app.worker)",
+            error_code="SCHEDULER_IN_WORKER",
+        )
+
+
 @router.get("/status", response_model=APIResponse)
 async def get_scheduler_status():
     """
     스케줄러 상태 조회 API
     
     현재 스케줄러의 실행 상태, 다음 실행 시간, 마지막 실행 결과 등을 조회합니다.
+    jobs에는 데이터 유형별(prices, trading, news) job의 간격, 다음 실행 시간, 마지막 실행 소요 시간(초)이 포함됩니다.
+    overruns는 실행 간격보다 오래 걸린 실행과 이전 실행이 끝나지 않아 건너뛴 실행의 합계입니다.
+    rate_limit은 모든 수집기가 공유하는 호스트별 토큰 버킷의 요청 수와 대기 시간입니다.
+    priority에는 장 중 가격 수집에서 조회 빈도로 고른 종목 수와 조회 빈도가 높은 종목이 포함됩니다.
+    장 시간 기반 수집이 켜져 있으면 market에 장 구분과 데이터 유형별 마지막 수집 시각이 포함됩니다.
+    (수집할 데이터 유형이 없는 실행은 last_run_status가 "skipped"입니다.)
+    SCHEDULER_COORDINATION이 leader/sharded이면 coordination에 리더 여부, fencing 토큰, 멤버 목록이 포함되며,
+    리더가 아니어서 수집하지 않은 실행은 last_run_status가 "standby"입니다.
+    COLLECTION_WORKER_ENABLED이면 수집 워커가 게시한 상태에 worker(워커 ID, 게시 시각, 대기 작업 수)가
+    추가되며, 워커가 실행 중이 아니면 {"is_running": false, "worker": null}입니다.
     
     **Example Response:**
     ```json
@@ -34,7 +58,67 @@ async def get_scheduler_status():
         "next_run_time": "2025-11-14T10:30:30",
         "last_run_time": "2025-11-14T10:30:00",
         "last_run_status": "success",
-        "last_run_error": null
+        "last_run_error": null,
+        "last_run_stats": {
+          "total_prices": 60, "total_trading": 60, "total_news": 300,
+          "unchanged_pages": 4, "unchanged_rows": 52, "page_retries": 1, "retries_denied": 0
+        },
+        "jobs": {
+          "prices": {
+            "enabled": true, "interval_seconds": 30,
+            "next_run_time": "2025-11-14T10:30:30+09:00",
+            "last_run_time": "2025-11-14T10:30:00", "last_run_status": "success",
+            "last_run_error": null, "last_duration": 4.812,
+            "last_run_stats": {"total_prices": 60, "total_trading": 0, "total_news": 0,
+                               "unchanged_pages": 4, "unchanged_rows": 52,
+                               "page_retries": 1, "retries_denied": 0},
+            "effective_interval_seconds": 30, "recent_durations": [4.812, 5.104],
+            "avg_duration": 4.958, "max_duration": 5.104, "last_latency_ms": 182.4,
+            "overruns": 0, "skipped_runs": 0, "missed_runs": 0
+          },
+          "trading": {"enabled": true, "interval_seconds": 600, "...": "..."},
+          "news": {"enabled": true, "interval_seconds": 300, "...": "..."}
+        },
+        "adaptive_interval": false,
+        "overruns": 0,
+        "http_connections": {
+          "finance.naver.com": {"requests": 18, "new_connections": 1, "reused_connections": 17}
+        },
+        "rate_limit": {
+          "total_requests": 18, "total_wait_time": 8.5, "avg_wait_time": 0.47, "current_concurrent": 0,
+          "backend": "local", "rate": 2.0, "burst": 1, "redis_fallbacks": 0,
+          "adaptive": {
+            "min_rate": 0.5, "max_rate": 2.0, "initial_rate": 2.0,
+            "hosts": {"finance.naver.com": {"rate": 1.0, "increases": 0, "decreases": 1}},
+            "decisions": [{"at": "2025-01-01T10:00:02", "host": "finance.naver.com", "action": "decrease",
+                           "reason": "status 429", "previous_rate": 2.0, "rate": 1.0}]
+          },
+          "hosts": {"finance.naver.com": {"requests": 18, "wait_time": 8.5}}
+        },
+        "circuit_breakers": {
+          "sise_day": {"state": "closed", "failure_rate": 0.0, "recent_requests": 20, "opened_at": null,
+                       "retry_at": null, "opens": 0, "rejected": 0},
+          "frgn": {"state": "open", "failure_rate": 0.0, "recent_requests": 0, "opened_at": "2025-11-14T10:29:40",
+                   "retry_at": "2025-11-14T10:30:40", "opens": 1, "rejected": 36}
+        },
+        "page_changes": {
+          "sise_day": {"checked": 6, "unchanged": 6, "not_modified": 0}
+        },
+        "market": {
+          "phase": "open",
+          "last_collected": {"prices": "2025-11-14T10:30:00+09:00", "news": "2025-11-14T10:25:00+09:00"},
+          "due": ["prices"]
+        },
+        "priority": {
+          "tick": 120, "tracked": 60, "budget": 0, "last_selected": 14, "last_deferred": 0,
+          "access_heat": {"backend": "memory", "half_life": 600.0, "tracked": 9, "recorded": 412,
+                          "top": [["487240", 6.214], ["466920", 2.031]]}
+        },
+        "coordination": {
+          "mode": "leader", "member_id": "api-1:4120", "healthy": true, "is_leader": true,
+          "fencing_token": 7, "members": [], "heartbeats": 360, "leadership_changes": 1,
+          "rebalances": 0, "fencing_rejections": 0
+        }
       },
       "message": "Scheduler status retrieved successfully",
       "timestamp": "2025-11-14T10:30:05"
@@ -46,8 +130,10 @@ async def get_scheduler_status():
     - 500: 서버 오류
     """
     try:
-        scheduler = get_scheduler()
-        status = scheduler.get_status()
+        if settings.COLLECTION_WORKER_ENABLED:
+            status = get_collection_job_queue().get_worker_status() or {'is_running': False, 'worker': None}
+        else:
+            status = get_scheduler().get_status()
         
         return APIResponse(
             success=True,
@@ -77,8 +163,10 @@ async def start_scheduler(
     스케줄러 시작 API
     
     데이터 수집 스케줄러를 시작합니다. 이미 실행 중인 경우 재시작합니다.
+    가격, 매매동향, 뉴스 job은 각각의 간격으로 실행되며, 사용 여부와 매매동향/뉴스 간격은
+    SCHEDULER_*_ENABLED, SCHEDULER_*_INTERVAL 설정으로 정합니다.
     
-    - **interval_seconds**: 데이터 수집 간격 (초 단위, 선택사항, 기본: 30초)
+    - **interval_seconds**: 가격 수집 간격 (초 단위, 선택사항, 기본: 30초)
     
     **Example Request:**
     ```
@@ -92,6 +180,11 @@ async def start_scheduler(
       "data": {
         "is_running": true,
         "interval_seconds": 30,
+        "jobs": {
+          "prices": {"enabled": true, "interval_seconds": 30, "next_run_time": "2025-11-14T10:30:30+09:00", "...": "..."},
+          "trading": {"enabled": true, "interval_seconds": 600, "next_run_time": "2025-11-14T10:40:00+09:00", "...": "..."},
+          "news": {"enabled": true, "interval_seconds": 300, "next_run_time": "2025-11-14T10:35:00+09:00", "...": "..."}
+        },
         "message": "Scheduler started successfully"
       },
       "message": "Scheduler started successfully",
@@ -101,9 +194,11 @@ async def start_scheduler(
     
     **Status Codes:**
     - 200: 성공
+    - 400: 스케줄러가 수집 워커에서 실행 중 (COLLECTION_WORKER_ENABLED)
     - 500: 서버 오류
     """
     try:
+        _ensure_scheduler_in_api()
         scheduler = get_scheduler()
         
         # 간격이 지정된 경우 새로 생성
@@ -128,12 +223,15 @@ async def start_scheduler(
             data={
                 "is_running": scheduler.is_running,
                 "interval_seconds": scheduler.interval_seconds,
+                "jobs": scheduler.get_jobs_status(),
                 "message": "Scheduler started successfully"
             },
             message="Scheduler started successfully",
             timestamp=datetime.now(),
         )
     
+    except BadRequestException:
+        raise
     except Exception as e:
         logger.error(f"Error starting scheduler: {e}", exc_info=True)
         raise HTTPException(
@@ -169,9 +267,11 @@ async def stop_scheduler():
     
     **Status Codes:**
     - 200: 성공
+    - 400: 스케줄러가 수집 워커에서 실행 중 (COLLECTION_WORKER_ENABLED)
     - 500: 서버 오류
     """
     try:
+        _ensure_scheduler_in_api()
         scheduler = get_scheduler()
         scheduler.stop()
         
@@ -187,6 +287,8 @@ async def stop_scheduler():
             timestamp=datetime.now(),
         )
     
+    except BadRequestException:
+        raise
     except Exception as e:
         logger.error(f"Error stopping scheduler: {e}", exc_info=True)
         raise HTTPException(
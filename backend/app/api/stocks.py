@@ -12,6 +12,7 @@ from app.schemas.stock import StockResponse, StockListResponse, StockCreate, Sto
 from app.schemas.response import APIResponse
 from app.exceptions import NotFoundException, BadRequestException
 from app.utils.cache import get_cache, set_cache, invalidate_stock_cache, invalidate_all_stocks_cache, clear_cache_pattern
+from app.utils.access_heat import record_ticker_access
 
 router = APIRouter()
 
@@ -108,6 +109,7 @@ async def get_stock(ticker: str, db: Session = Depends(get_db)):
     # 캐시에서 조회 시도
     cached_data = get_cache(cache_key)
     if cached_data is not None:
+        record_ticker_access(ticker)
         return APIResponse(
             success=True,
             data=cached_data,
@@ -121,6 +123,9 @@ async def get_stock(ticker: str, db: Session = Depends(get_db)):
     if not stock:
         raise NotFoundException(detail=f"Stock with ticker '{ticker}' not found")
     
+    # 조회 빈도 기록 (스케줄러 수집 우선순위)
+    record_ticker_access(ticker)
+    
     # 스키마로 변환
     stock_response = StockResponse.model_validate(stock)
     
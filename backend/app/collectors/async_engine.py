@@ -0,0 +1,174 @@
+"""
+asyncio 기반 수집 엔진
+
+여러 종목의 가격, 매매동향, 뉴스 페이지를 동시에 요청합니다.
+요청 속도는 동기 수집기와 공유하는 호스트별 예산(AsyncRateLimiter)이 제한하고,
+요청마다 같은 재시도 정책, Circuit Breaker, 조건부 GET을 적용하므로
+수집 경로와 관계없이 upstream에 보내는 요청 규칙이 같습니다.
+"""
+
+import asyncio
+import copy
+import logging
+from collections import Counter
+from datetime import date
+from typing import Callable, Collection, Dict, List, Optional, Tuple
+
+from app.collectors.finance_collector import FinanceCollector
+from app.collectors.news_collector import NewsCollector
+from app.utils.async_http_client import AsyncHttpClient
+from app.utils.page_tracker import PageNotModified
+from app.utils.rate_limiter import AsyncRateLimiter
+
+logger = logging.getLogger(__name__)
+
+
+class AsyncCollectionEngine:
+    """
+    비동기 수집 엔진
+
+    수집(네트워크)만 담당하고, 결과는 종목별 딕셔너리로 반환합니다.
+    데이터베이스 저장은 호출 측에서 기존 save_* 메서드로 수행합니다.
+
+    Example:
+        engine = AsyncCollectionEngine()
+        results = engine.run(["487240", "466920"])
+        prices = results["487240"]["prices"]
+    """
+
+    def __init__(
+        self,
+        finance_collector: Optional[FinanceCollector] = None,
+        news_collector: Optional[NewsCollector] = None,
+        client_factory: Optional[Callable[[], AsyncHttpClient]] = None,
+    ):
+        """
+        Args:
+            finance_collector: 파싱에 사용할 FinanceCollector (None이면 생성)
+            news_collector: 파싱에 사용할 NewsCollector (None이면 생성)
+            client_factory: 실행마다 AsyncHttpClient를 생성하는 함수
+                (None이면 finance_collector의 RateLimiter 예산을 공유하는 클라이언트)
+        """
+        self.finance_collector = finance_collector or FinanceCollector()
+        self.news_collector = news_collector or NewsCollector()
+        self.client_factory = client_factory or self._create_client
+        self.last_client_stats: dict = {}
+
+    def _create_client(self) -> AsyncHttpClient:
+        """동기 수집기와 같은 호스트 예산을 쓰는 클라이언트 생성 (asyncio 세마포어가 루프에 묶이므로 실행마다 생성)"""
+        return AsyncHttpClient.from_settings(rate_limiter=AsyncRateLimiter(self.finance_collector.rate_limiter))
+
+    def _ticker_collectors(self, fetch_errors: Counter) -> Tuple[FinanceCollector, NewsCollector]:
+        """
+        종목별 수집 실패 횟수를 따로 세는 수집기 생성
+
+        동시에 수집하는 종목끼리 fetch_errors를 공유하지 않도록 얕은 복사본에 종목 전용 Counter를 붙입니다.
+        (HTTP 클라이언트, Rate Limiter, 재시도 예산, 페이지 변경 추적은 원본과 공유)
+        """
+        finance_collector = copy.copy(self.finance_collector)
+        finance_collector.fetch_errors = fetch_errors
+        news_collector = copy.copy(self.news_collector)
+        news_collector.fetch_errors = fetch_errors
+        return finance_collector, news_collector
+
+    async def collect_ticker(
+        self,
+        client: AsyncHttpClient,
+        ticker: str,
+        price_days: int = 10,
+        trading_days: int = 10,
+        news_items: int = 50,
+        price_since: Optional[date] = None,
+        data_types: Optional[Collection[str]] = None,
+    ) -> dict:
+        """
+        한 종목의 가격, 매매동향, 뉴스를 동시에 수집
+
+        Args:
+            price_since: 가격 증분 수집 기준 날짜 (선택)
+            data_types: 수집할 데이터 유형 ('prices', 'trading', 'news', None이면 모두)
+
+        Returns:
+            {'ticker', 'prices', 'trading', 'news', 'errors', 'fetch_errors'} 딕셔너리
+            (fetch_errors: 이 종목의 엔드포인트별 수집 실패 횟수)
+        """
+        result = {
+            'ticker': ticker,
+            'prices': [],
+            'trading': [],
+            'news': [],
+            'errors': [],
+            'fetch_errors': {},
+        }
+
+        fetch_errors = Counter()
+        finance_collector, news_collector = self._ticker_collectors(fetch_errors)
+        fetchers = {
+            'prices': lambda: finance_collector.fetch_prices_async(client, ticker, price_days, price_since),
+            'trading': lambda: finance_collector.fetch_naver_trading_flow_async(client, ticker, trading_days),
+            'news': lambda: news_collector.fetch_naver_news_async(client, ticker, news_items),
+        }
+        keys = [key for key in fetchers if data_types is None or key in data_types]
+        values = await asyncio.gather(*(fetchers[key]() for key in keys), return_exceptions=True)
+
+        for key, value in zip(keys, values):
+            if isinstance(value, PageNotModified):
+                # 일괄 조회 응답이 이전 수집과 같음: 오류가 아니라 저장할 데이터 없음
+                logger.debug(f"Skipping {key} for {ticker}: {value}")
+            elif isinstance(value, Exception):
+                error_msg = f"Error collecting {key} for {ticker}: {value}"
+                logger.error(error_msg)
+                result['errors'].append(error_msg)
+            else:
+                result[key] = value
+
+        result['fetch_errors'] = dict(fetch_errors)
+        return result
+
+    async def collect(
+        self,
+        tickers: List[str],
+        price_days: int = 10,
+        trading_days: int = 10,
+        news_items: int = 50,
+        price_since: Optional[Dict[str, date]] = None,
+        data_types: Optional[Collection[str]] = None,
+    ) -> Dict[str, dict]:
+        """
+        여러 종목을 동시에 수집
+
+        Args:
+            tickers: 종목 코드 리스트
+            price_days: 가격 데이터 수집 일수
+            trading_days: 매매동향 수집 일수
+            news_items: 최대 뉴스 개수
+            price_since: 종목별 가격 증분 수집 기준 날짜 (선택)
+            data_types: 수집할 데이터 유형 (None이면 모두)
+
+        Returns:
+            {ticker: collect_ticker 결과} 딕셔너리
+        """
+        logger.info(f"Async collection started for {len(tickers)} tickers")
+
+        async with self.client_factory() as client:
+            results = await asyncio.gather(
+                *(
+                    self.collect_ticker(
+                        client, ticker, price_days, trading_days, news_items,
+                        (price_since or {}).get(ticker), data_types,
+                    )
+                    for ticker in tickers
+                )
+            )
+            self.last_client_stats = client.get_stats()
+
+        logger.info(f"Async collection finished for {len(tickers)} tickers: {self.last_client_stats}")
+        return {result['ticker']: result for result in results}
+
+    def run(self, tickers: List[str], **kwargs) -> Dict[str, dict]:
+        """
+        동기 코드(스케줄러 스레드)에서 수집 실행
+
+        실행 중인 이벤트 루프가 없는 스레드에서 호출해야 합니다.
+        """
+        return asyncio.run(self.collect(tickers, **kwargs))
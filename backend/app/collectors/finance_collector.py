@@ -4,49 +4,288 @@ Naver Finance 데이터 수집기
 가격 데이터 및 매매 동향 데이터를 Naver Finance에서 수집합니다.
 """
 
-from typing import List, Optional, Dict
+import asyncio
+from collections import Counter
+from functools import partial
+from typing import List, Optional, Dict, Tuple, Union
 from datetime import date, datetime, timedelta
 from sqlalchemy.orm import Session
-from sqlalchemy import and_
+from sqlalchemy import func
 
+from app.config import settings
+from app.collectors.parsers import PageParser, get_parser
 from app.database import get_db
-from app.models import Stock, Price, TradingTrend
-from app.utils.retry import retry_with_backoff
-from app.utils.rate_limiter import RateLimiter
+from app.models import Stock, Price, TradingTrend, DataCheck
+from app.utils.retry import RetryBudget, async_request_with_retry, is_retryable_error, request_with_retry
+from app.utils.circuit_breaker import CircuitOpenError, get_circuit_breaker
+from app.utils.deadline import DeadlineExceeded
+from app.utils.upsert import UpsertResult, bulk_upsert
+from app.utils.rate_limiter import RateLimiter, get_rate_limiter, host_of
+from app.utils.http_client import get_http_client
+from app.utils.ingest_buffer import IngestBuffer
+from app.utils.async_http_client import AsyncHttpClient
+from app.utils.page_archive import PageArchive, get_page_archive
+from app.utils.page_tracker import PageChangeTracker, PageNotModified
 from app.utils.validators import validate_price_data, validate_trading_flow_data
+import httpx
 import logging
 import requests
-from bs4 import BeautifulSoup
 import re
 
 logger = logging.getLogger(__name__)
 
-# 기본 Rate Limiter 설정 (0.5초 간격)
-DEFAULT_RATE_LIMITER_INTERVAL = 0.5
+# 가격 데이터 수집 소스
+PRICE_SOURCE_CHART = "chart"  # fchart 일괄 조회 (1회 요청)
+PRICE_SOURCE_HTML = "html"  # sise_day 페이지 순회
+
+# fchart 응답의 <item data="YYYYMMDD|시가|고가|저가|종가|거래량" /> 항목
+CHART_ITEM_PATTERN = re.compile(r'<item\s+data="([^"]+)"')
+
+# 페이지 변경 추적 엔드포인트 이름
+PAGE_ENDPOINT_SISE_DAY = "sise_day"
+PAGE_ENDPOINT_FRGN = "frgn"
+PAGE_ENDPOINT_CHART = "chart"
+PRICE_PAGE_ENDPOINTS = (PAGE_ENDPOINT_CHART, PAGE_ENDPOINT_SISE_DAY)
+
+# 데이터 유형 (마지막 확인 시각 기록용)
+DATA_TYPE_PRICES = "prices"
+DATA_TYPE_TRADING = "trading"
 
 
 class FinanceCollector:
     """Naver Finance 데이터 수집기"""
     
-    def __init__(self):
+    def __init__(
+        self,
+        parser: Optional[PageParser] = None,
+        page_tracker: Optional[PageChangeTracker] = None,
+        archive: Optional[PageArchive] = None,
+        write_stats: Optional[Counter] = None,
+        ingest_buffer: Optional[IngestBuffer] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        retry_budget: Optional[RetryBudget] = None,
+        fetch_errors: Optional[Counter] = None,
+    ):
+        """
+        Args:
+            parser: HTML 파서 백엔드 (None이면 설정값 HTML_PARSER_BACKEND 사용)
+            page_tracker: 페이지 변경 추적기 (None이면 변경 여부와 관계없이 항상 처리)
+            archive: 원본 페이지 아카이브 (None이면 설정값 PAGE_ARCHIVE_ENABLED에 따라 사용)
+            write_stats: 저장 통계를 누적할 Counter (inserted/updated/unchanged 행 수,
+                None이면 수집기마다 새로 생성)
+            ingest_buffer: 수집 데이터 버퍼 (주어지면 collect_and_save_*가 직접 저장하지 않고
+                버퍼에 넣어 여러 종목을 모아 저장)
+            rate_limiter: 요청 간격 제한기 (별도 예산을 쓸 때 전달,
+                None이면 모든 수집기가 공유하는 전역 제한기 get_rate_limiter() 사용)
+            retry_budget: 실행별 페이지 재시도 예산 (여러 수집기가 한 실행의 예산을 공유할 때 전달,
+                None이면 수집기마다 설정값 PAGE_RETRY_BUDGET으로 생성)
+            fetch_errors: 엔드포인트별 수집 실패 횟수를 누적할 Counter (재시도 후에도 실패했거나 차단 중이라
+                건너뛴 횟수, None이면 수집기마다 새로 생성)
+        """
         self.headers = {
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
         }
-        # Rate Limiter 초기화
-        self.rate_limiter = RateLimiter(min_interval=DEFAULT_RATE_LIMITER_INTERVAL)
+        # Rate Limiter (기본: 모든 수집기가 공유하는 호스트별 전역 예산)
+        self.rate_limiter = rate_limiter or get_rate_limiter()
+        # 공유 HTTP 클라이언트 (호스트별 커넥션 풀, Keep-Alive)
+        self.http_client = get_http_client()
+        # HTML 파서 백엔드
+        self.parser = parser or get_parser()
+        # 페이지 변경 추적 (이전 수집과 같은 페이지는 파싱/저장 생략)
+        self.page_tracker = page_tracker
+        # 원본 페이지 아카이브 (비활성화 시 None)
+        self.archive = archive if archive is not None else get_page_archive()
+        # 저장된 값과 같은 행은 다시 쓰지 않음
+        self.skip_unchanged_rows = settings.SKIP_UNCHANGED_ROWS_ENABLED
+        # 저장 통계 (삽입/갱신/변경 없음 행 수)
+        self.write_stats = write_stats if write_stats is not None else Counter()
+        # 수집 데이터 버퍼 (None이면 수집 직후 직접 저장)
+        self.ingest_buffer = ingest_buffer
+        # 페이지 재시도 예산 (upstream 장애 시 재시도로 요청 수가 늘어나지 않도록 실행별 상한)
+        self.retry_budget = retry_budget if retry_budget is not None else RetryBudget.from_settings()
+        # 엔드포인트별 수집 실패 횟수 (재시도 후에도 실패했거나 차단 중이라 건너뜀, 스케줄러가 수집 완료 판단에 사용)
+        self.fetch_errors = fetch_errors if fetch_errors is not None else Counter()
+
+    def _save_rows(self, db: Session, model, data_type: str, rows: List[dict]) -> UpsertResult:
+        """
+        (ticker, date) 기준 벌크 upsert 후 마지막 확인 시각 기록 (커밋은 호출 측에서 수행)
+
+        skip_unchanged_rows이면 저장된 값과 같은 행은 쓰지 않고(수집 시각 timestamp는 비교에서 제외),
+        확인했다는 사실은 종목마다 data_checks 한 행에만 기록합니다.
+        """
+        result = bulk_upsert(
+            db,
+            model,
+            rows,
+            conflict_columns=('ticker', 'date'),
+            skip_unchanged=self.skip_unchanged_rows,
+            ignore_columns=('timestamp',),
+        )
+
+        # 실제로 행을 쓴 종목만 last_changed_at 갱신 (배치의 다른 종목은 확인 시각만 기록)
+        now = datetime.now()
+        changed_tickers = {ticker for ticker, _ in result.written_keys}
+        tickers = sorted({row['ticker'] for row in rows})
+        for changed in (True, False):
+            checks = [
+                {
+                    'ticker': ticker,
+                    'data_type': data_type,
+                    'last_checked_at': now,
+                    'last_changed_at': now if changed else None,
+                }
+                for ticker in tickers
+                if (ticker in changed_tickers) == changed
+            ]
+            update_columns = ['last_checked_at', 'last_changed_at'] if changed else ['last_checked_at']
+            # 삽입/갱신 개수는 필요 없으므로 기존 키 조회 생략
+            bulk_upsert(
+                db, DataCheck, checks, conflict_columns=('ticker', 'data_type'),
+                update_columns=update_columns, existing_keys=set(),
+            )
+
+        self.write_stats['inserted'] += result.inserted
+        self.write_stats['updated'] += result.updated
+        self.write_stats['unchanged'] += result.unchanged
+        return result
+
+    def _commit_rows(self, db: Session, model, data_type: str, rows: List[dict], commit: bool) -> UpsertResult:
+        """_save_rows 후 커밋 (commit=False이면 호출 측 트랜잭션에 쓰기만 함)"""
+        result = self._save_rows(db, model, data_type, rows)
+        if commit:
+            db.commit()
+        return result
+
+    def _get_page(self, endpoint: str, url: str, headers: dict) -> requests.Response:
+        """
+        페이지 하나 요청 (실패한 요청만 재시도)
+
+        재시도도 호스트별 요청 예산을 거치고, 실행별 재시도 예산을 차감합니다.
+        재시도 후에도 남은 실패는 엔드포인트의 Circuit Breaker에 기록하고, 차단 중이면 요청하지 않습니다.
+
+        Raises:
+            CircuitOpenError: 엔드포인트 차단 중
+            requests.exceptions.RequestException: 재시도할 수 없거나 재시도를 소진한 실패
+        """
+        def send() -> requests.Response:
+            with self.rate_limiter.limit(host_of(url)):
+                response = self.http_client.get(url, headers=headers)
+                response.raise_for_status()
+                return response
+
+        breaker = get_circuit_breaker(endpoint)
+        if breaker is None:
+            return request_with_retry(send, endpoint, budget=self.retry_budget)
+
+        # 차단 중이면 요청하지 않고 바로 CircuitOpenError
+        breaker.before_request()
+        try:
+            response = request_with_retry(send, endpoint, budget=self.retry_budget)
+        except requests.exceptions.RequestException as e:
+            if is_retryable_error(e):
+                breaker.record_failure()
+            else:
+                breaker.record_success()
+            raise
+        except BaseException:
+            # 요청 결과를 알 수 없는 오류: 기록 없이 확인 요청 슬롯만 반납 (반납하지 않으면 half-open에 계속 갇힘)
+            breaker.release()
+            raise
+        breaker.record_success()
+        return response
+
+    async def _get_page_async(self, client: AsyncHttpClient, endpoint: str, url: str, headers: dict) -> httpx.Response:
+        """
+        페이지 하나 비동기 요청 (_get_page와 같은 재시도 정책과 Circuit Breaker 적용)
+
+        요청 속도는 client의 AsyncRateLimiter(동기 수집과 공유하는 호스트 예산)가 제한합니다.
+
+        Raises:
+            CircuitOpenError: 엔드포인트 차단 중
+            requests.exceptions.RequestException: 재시도할 수 없거나 재시도를 소진한 실패
+        """
+        async def send() -> httpx.Response:
+            return await client.get(url, headers=headers)
+
+        breaker = get_circuit_breaker(endpoint)
+        if breaker is None:
+            return await async_request_with_retry(send, endpoint, budget=self.retry_budget)
+
+        # 차단 중이면 요청하지 않고 바로 CircuitOpenError
+        breaker.before_request()
+        try:
+            response = await async_request_with_retry(send, endpoint, budget=self.retry_budget)
+        except requests.exceptions.RequestException as e:
+            if is_retryable_error(e):
+                breaker.record_failure()
+            else:
+                breaker.record_success()
+            raise
+        except BaseException:
+            # 요청 결과를 알 수 없는 오류(취소 등): 기록 없이 확인 요청 슬롯만 반납
+            breaker.release()
+            raise
+        breaker.record_success()
+        return response
+
+    async def _get_pages_async(
+        self, client: AsyncHttpClient, endpoint: str, ticker: str, urls: Dict[int, str]
+    ) -> List[Union[httpx.Response, Exception]]:
+        """여러 페이지를 조건부 GET 헤더와 함께 동시에 요청 (페이지 순서대로 응답 또는 발생한 예외)"""
+        return await asyncio.gather(
+            *(
+                self._get_page_async(client, endpoint, url, self._request_headers(endpoint, ticker, page))
+                for page, url in urls.items()
+            ),
+            return_exceptions=True,
+        )
+
+    def _archive_page(self, endpoint: str, ticker: str, page: int, url: str, body: str) -> None:
+        """원본 페이지를 아카이브에 저장 (실패해도 수집은 계속)"""
+        if self.archive is None:
+            return
+        try:
+            self.archive.store(ticker, endpoint, page, url, body)
+        except Exception as e:
+            logger.warning(f"Failed to archive {endpoint} page {page} for {ticker}: {e}")
+
+    def _request_headers(self, endpoint: str, ticker: str, page: int) -> dict:
+        """요청 헤더 (페이지 변경 추적 시 조건부 GET 헤더 포함)"""
+        if self.page_tracker is None:
+            return self.headers
+        return self.page_tracker.request_headers(endpoint, ticker, page, self.headers)
+
+    def _is_unchanged(self, endpoint: str, ticker: str, page: int, response) -> bool:
+        """응답 페이지가 이전 수집과 같은지 확인 (추적하지 않으면 항상 False)"""
+        return self.page_tracker is not None and self.page_tracker.is_unchanged(endpoint, ticker, page, response)
+
+    def finish_pages(self, endpoints: Tuple[str, ...], ticker: str, success: bool) -> None:
+        """
+        저장 결과에 따라 스테이징된 페이지 지문 확정 또는 폐기
+
+        Args:
+            endpoints: 엔드포인트 이름 튜플
+            ticker: 종목 코드
+            success: 저장 성공 여부 (실패 시 다음 수집에서 다시 처리)
+        """
+        if self.page_tracker is None:
+            return
+        for endpoint in endpoints:
+            if success:
+                self.page_tracker.commit(endpoint, ticker)
+            else:
+                self.page_tracker.discard(endpoint, ticker)
     
-    @retry_with_backoff(
-        max_retries=3,
-        base_delay=1.0,
-        exceptions=(requests.exceptions.RequestException, requests.exceptions.Timeout)
-    )
-    def fetch_naver_finance_prices(self, ticker: str, days: int = 10) -> List[dict]:
+    def fetch_naver_finance_prices(self, ticker: str, days: int = 10, since: Optional[date] = None) -> List[dict]:
         """
         Naver Finance에서 가격 데이터 수집
 
         Args:
             ticker: 종목 코드 (예: "487240")
             days: 수집할 일수 (기본: 10일)
+            since: 증분 수집 기준 날짜 (선택, 이미 저장된 최신 날짜).
+                지정 시 이후 날짜와 오늘 행만 반환하고, 기준 날짜가 포함된
+                페이지에서 페이징을 멈춥니다.
 
         Returns:
             수집된 가격 데이터 리스트
@@ -56,98 +295,487 @@ class FinanceCollector:
         max_pages = (days // 10) + 2  # 한 페이지당 10개씩, 여유있게 +2
 
         try:
-            logger.info(f"Fetching up to {days} days of data from Naver Finance for {ticker}")
+            logger.info(f"Fetching up to {days} days of data from Naver Finance for {ticker} (since: {since})")
 
             while len(price_data) < days and page <= max_pages:
                 url = f"https://finance.naver.com/item/sise_day.naver?code={ticker}&page={page}"
                 logger.debug(f"Fetching page {page} for {ticker}")
 
-                with self.rate_limiter:
-                    response = requests.get(url, headers=self.headers, timeout=10)
-                    response.raise_for_status()
-
-                soup = BeautifulSoup(response.text, 'html.parser')
+                response = self._get_page(
+                    PAGE_ENDPOINT_SISE_DAY, url, self._request_headers(PAGE_ENDPOINT_SISE_DAY, ticker, page)
+                )
 
-                # 시세 테이블 찾기
-                table = soup.find('table', {'class': 'type2'})
-                if not table:
-                    logger.warning(f"Price table not found for {ticker} on page {page}")
+                # 이전 수집과 같은 페이지면 이후(과거) 페이지도 바뀌지 않았으므로 중단
+                if self._is_unchanged(PAGE_ENDPOINT_SISE_DAY, ticker, page, response):
+                    logger.debug(f"Price page {page} unchanged for {ticker}, stopping pagination")
                     break
 
-                # 데이터 행 추출
-                rows = table.find_all('tr')
-                rows_parsed_this_page = 0
-
-                for row in rows:
-                    # 이미 충분한 데이터를 수집했으면 종료
-                    if len(price_data) >= days:
-                        break
-
-                    cols = row.find_all('td')
-                    if len(cols) >= 7:  # 날짜, 종가, 전일비, 시가, 고가, 저가, 거래량
-                        date_cell = cols[0].get_text(strip=True)
-
-                        # 날짜 형식 확인 (YYYY.MM.DD)
-                        if date_cell and '.' in date_cell:
-                            try:
-                                # 데이터 파싱
-                                date_str = date_cell  # 2025.11.07
-                                close_price = self._parse_number(cols[1].get_text(strip=True))
-                                change_str = cols[2].get_text(strip=True)  # 예: "상승205" 또는 "하락1,375"
-                                open_price = self._parse_number(cols[3].get_text(strip=True))
-                                high_price = self._parse_number(cols[4].get_text(strip=True))
-                                low_price = self._parse_number(cols[5].get_text(strip=True))
-                                volume = self._parse_number(cols[6].get_text(strip=True))
-
-                                # 등락률 계산
-                                change_rate = self._parse_change(change_str, close_price)
-                                
-                                # 등락액 계산
-                                change_amount = None
-                                if change_rate is not None and close_price is not None:
-                                    # change_rate는 %이므로 이전 가격을 역산
-                                    prev_price = close_price / (1 + change_rate / 100) if change_rate != 0 else close_price
-                                    change_amount = close_price - prev_price
-
-                                # 날짜 변환 (YYYY.MM.DD → YYYY-MM-DD)
-                                date_obj = datetime.strptime(date_str, '%Y.%m.%d').date()
-
-                                price_data.append({
-                                    'ticker': ticker,
-                                    'date': date_obj,
-                                    'timestamp': datetime.now(),
-                                    'current_price': close_price,
-                                    'change_rate': change_rate,
-                                    'change_amount': change_amount,
-                                    'open_price': open_price,
-                                    'high_price': high_price,
-                                    'low_price': low_price,
-                                    'volume': volume,
-                                    'previous_close': None  # 전일 종가는 별도로 계산 필요
-                                })
-                                rows_parsed_this_page += 1
-
-                            except Exception as e:
-                                logger.warning(f"Failed to parse row for {ticker} on page {page}: {e}")
-                                continue
+                self._archive_page(PAGE_ENDPOINT_SISE_DAY, ticker, page, url, response.text)
+                page_rows = self._parse_price_page(response.text, ticker, page)
+                if page_rows is None:
+                    break
 
                 # 이번 페이지에서 아무 데이터도 파싱하지 못했으면 더 이상 페이지가 없는 것
-                if rows_parsed_this_page == 0:
+                if not page_rows:
                     logger.info(f"No more data available for {ticker} after page {page}")
                     break
 
+                page_rows, reached_watermark = self._filter_since(page_rows, since)
+
+                # 이미 충분한 데이터를 수집했으면 나머지 행은 버림
+                price_data.extend(page_rows[:days - len(price_data)])
+
                 page += 1
 
+                # 이미 저장된 날짜가 나오면 이후 페이지는 모두 저장된 데이터
+                if reached_watermark:
+                    logger.debug(f"Reached stored date {since} for {ticker} on page {page-1}, stopping pagination")
+                    break
+
             logger.info(f"Collected {len(price_data)} price records for {ticker} from {page-1} pages")
             return price_data
 
+        except CircuitOpenError as e:
+            logger.debug(f"Skipping price pages for {ticker}: {e}")
+            self.fetch_errors[PAGE_ENDPOINT_SISE_DAY] += 1
+            return price_data
         except requests.exceptions.RequestException as e:
             logger.error(f"Network error while fetching {ticker}: {e}")
+            self.fetch_errors[PAGE_ENDPOINT_SISE_DAY] += 1
             return price_data  # 수집된 데이터라도 반환
+        except DeadlineExceeded:
+            # 마감이 지난 작업은 일부 데이터도 반환하지 않고 중단
+            raise
         except Exception as e:
             logger.error(f"Unexpected error while fetching {ticker}: {e}")
+            self.fetch_errors[PAGE_ENDPOINT_SISE_DAY] += 1
             return price_data  # 수집된 데이터라도 반환
-    
+
+    async def fetch_naver_finance_prices_async(
+        self,
+        client: AsyncHttpClient,
+        ticker: str,
+        days: int = 10,
+        since: Optional[date] = None,
+    ) -> List[dict]:
+        """
+        Naver Finance에서 가격 데이터 비동기 수집
+
+        필요한 페이지 수만큼 요청을 동시에 보내고, 부족한 경우에만
+        다음 페이지를 하나씩 추가로 요청합니다. 요청마다 동기 수집과 같은
+        호스트 예산, 재시도 정책, Circuit Breaker, 조건부 GET을 적용합니다.
+
+        Args:
+            client: 비동기 HTTP 클라이언트
+            ticker: 종목 코드
+            days: 수집할 일수 (기본: 10일)
+            since: 증분 수집 기준 날짜 (선택, fetch_naver_finance_prices 참고)
+
+        Returns:
+            수집된 가격 데이터 리스트 (실패 시 수집된 데이터까지만 반환)
+        """
+        price_data = []
+        page = 1
+        max_pages = (days // 10) + 2
+        # 첫 요청에서 동시에 가져올 페이지 수 (증분 수집은 대부분 첫 페이지로 충분)
+        wave = 1 if since else -(-days // 10)
+
+        while len(price_data) < days and page <= max_pages:
+            urls = {
+                p: f"https://finance.naver.com/item/sise_day.naver?code={ticker}&page={p}"
+                for p in range(page, min(page + wave, max_pages + 1))
+            }
+            responses = await self._get_pages_async(client, PAGE_ENDPOINT_SISE_DAY, ticker, urls)
+            wave = 1
+
+            for url, response in zip(urls.values(), responses):
+                if isinstance(response, CircuitOpenError):
+                    logger.debug(f"Skipping price pages for {ticker}: {response}")
+                    self.fetch_errors[PAGE_ENDPOINT_SISE_DAY] += 1
+                    return price_data
+                if isinstance(response, Exception):
+                    logger.error(f"Network error while fetching {ticker} page {page}: {response}")
+                    self.fetch_errors[PAGE_ENDPOINT_SISE_DAY] += 1
+                    return price_data
+
+                if self._is_unchanged(PAGE_ENDPOINT_SISE_DAY, ticker, page, response):
+                    return price_data
+
+                self._archive_page(PAGE_ENDPOINT_SISE_DAY, ticker, page, url, response.text)
+                page_rows = self._parse_price_page(response.text, ticker, page)
+                if not page_rows:
+                    return price_data
+
+                page_rows, reached_watermark = self._filter_since(page_rows, since)
+                price_data.extend(page_rows[:days - len(price_data)])
+                page += 1
+                if reached_watermark:
+                    return price_data
+                if len(price_data) >= days:
+                    break
+
+        logger.info(f"Collected {len(price_data)} price records for {ticker} from {page-1} pages (async)")
+        return price_data
+
+    def fetch_prices(
+        self,
+        ticker: str,
+        days: int = 10,
+        since: Optional[date] = None,
+        source: Optional[str] = None,
+    ) -> List[dict]:
+        """
+        설정된 소스에서 가격 데이터 수집
+
+        chart 소스는 fchart 일괄 조회로 한 번에 수집하고, 실패하거나 응답이
+        비어 있으면 sise_day HTML 페이지 순회로 대체합니다. 일괄 조회 응답이
+        이전 수집과 같으면 대체하지 않고 PageNotModified를 그대로 전파합니다.
+
+        Args:
+            ticker: 종목 코드
+            days: 수집할 일수
+            since: 증분 수집 기준 날짜 (선택)
+            source: "chart" 또는 "html" (None이면 설정값 사용)
+
+        Returns:
+            수집된 가격 데이터 리스트 (최신순)
+
+        Raises:
+            PageNotModified: 일괄 조회 응답이 이전 수집과 같음
+        """
+        source = source or settings.PRICE_SOURCE
+
+        if source == PRICE_SOURCE_CHART:
+            price_data = self.fetch_naver_chart_prices(ticker, days, since=since)
+            if price_data is not None:
+                return price_data
+            logger.info(f"Chart source unavailable for {ticker}, falling back to HTML paging")
+
+        return self.fetch_naver_finance_prices(ticker, days, since=since)
+
+    async def fetch_prices_async(
+        self,
+        client: AsyncHttpClient,
+        ticker: str,
+        days: int = 10,
+        since: Optional[date] = None,
+        source: Optional[str] = None,
+    ) -> List[dict]:
+        """
+        설정된 소스에서 가격 데이터 비동기 수집 (fetch_prices와 같은 소스 선택과 대체 규칙)
+
+        Raises:
+            PageNotModified: 일괄 조회 응답이 이전 수집과 같음
+        """
+        source = source or settings.PRICE_SOURCE
+
+        if source == PRICE_SOURCE_CHART:
+            price_data = await self.fetch_naver_chart_prices_async(client, ticker, days, since=since)
+            if price_data is not None:
+                return price_data
+            logger.info(f"Chart source unavailable for {ticker}, falling back to HTML paging")
+
+        return await self.fetch_naver_finance_prices_async(client, ticker, days, since)
+
+    def fetch_history_page(self, data_type: str, ticker: str, page: int) -> Optional[List[dict]]:
+        """
+        sise_day 또는 frgn 페이지 하나 수집 (과거 데이터 백필용)
+
+        페이지 변경 추적을 적용하지 않고, 재시도 후에도 남은 네트워크 오류는 호출 측에서
+        처리하도록 그대로 전파합니다.
+
+        Args:
+            data_type: DATA_TYPE_PRICES 또는 DATA_TYPE_TRADING
+            ticker: 종목 코드
+            page: 페이지 번호 (1: 최신)
+
+        Returns:
+            파싱된 행 리스트 (최신순), 테이블이 없으면 None
+
+        Raises:
+            requests.exceptions.RequestException: 요청 실패
+        """
+        if data_type == DATA_TYPE_PRICES:
+            endpoint = PAGE_ENDPOINT_SISE_DAY
+            url = f"https://finance.naver.com/item/sise_day.naver?code={ticker}&page={page}"
+        elif data_type == DATA_TYPE_TRADING:
+            endpoint = PAGE_ENDPOINT_FRGN
+            url = f"https://finance.naver.com/item/frgn.naver?code={ticker}&page={page}"
+        else:
+            raise ValueError(f"Unknown history data type: {data_type}")
+
+        response = self._get_page(endpoint, url, self.headers)
+
+        self._archive_page(endpoint, ticker, page, url, response.text)
+        if data_type == DATA_TYPE_PRICES:
+            return self._parse_price_page(response.text, ticker, page)
+        return self._parse_trading_flow_page(response.text, ticker, page)
+
+    def fetch_naver_chart_prices(self, ticker: str, days: int = 10, since: Optional[date] = None) -> Optional[List[dict]]:
+        """
+        Naver fchart 일괄 조회로 가격 데이터 수집 (1회 요청)
+
+        sise_day 페이지를 10행씩 순회하는 대신 N일치 OHLCV를 한 번에 받아
+        fetch_naver_finance_prices와 같은 형식의 행으로 변환합니다.
+
+        Args:
+            ticker: 종목 코드
+            days: 수집할 일수
+            since: 증분 수집 기준 날짜 (선택)
+
+        Returns:
+            수집된 가격 데이터 리스트 (최신순), 요청/파싱 실패 시 None
+
+        Raises:
+            PageNotModified: 응답이 이전 수집과 같음 (304 또는 같은 본문)
+        """
+        count, url = self._chart_request(ticker, days, since)
+        try:
+            logger.info(f"Fetching {count} days of chart data for {ticker}")
+            response = self._get_page(PAGE_ENDPOINT_CHART, url, self._request_headers(PAGE_ENDPOINT_CHART, ticker, 1))
+        except CircuitOpenError as e:
+            logger.debug(f"Skipping chart request for {ticker}: {e}")
+            return None
+        except requests.exceptions.RequestException as e:
+            logger.warning(f"Chart request failed for {ticker}: {e}")
+            return None
+
+        return self._chart_rows(ticker, url, response, count, since)
+
+    async def fetch_naver_chart_prices_async(
+        self,
+        client: AsyncHttpClient,
+        ticker: str,
+        days: int = 10,
+        since: Optional[date] = None,
+    ) -> Optional[List[dict]]:
+        """
+        Naver fchart 일괄 조회로 가격 데이터 비동기 수집 (fetch_naver_chart_prices 참고)
+
+        Returns:
+            수집된 가격 데이터 리스트 (최신순), 요청/파싱 실패 시 None
+
+        Raises:
+            PageNotModified: 응답이 이전 수집과 같음 (304 또는 같은 본문)
+        """
+        count, url = self._chart_request(ticker, days, since)
+        try:
+            logger.info(f"Fetching {count} days of chart data for {ticker} (async)")
+            response = await self._get_page_async(
+                client, PAGE_ENDPOINT_CHART, url, self._request_headers(PAGE_ENDPOINT_CHART, ticker, 1)
+            )
+        except CircuitOpenError as e:
+            logger.debug(f"Skipping chart request for {ticker}: {e}")
+            return None
+        except requests.exceptions.RequestException as e:
+            logger.warning(f"Chart request failed for {ticker}: {e}")
+            return None
+
+        return self._chart_rows(ticker, url, response, count, since)
+
+    def _chart_request(self, ticker: str, days: int, since: Optional[date]) -> Tuple[int, str]:
+        """fchart 요청 행 수와 URL (가장 오래된 행의 전일 종가 계산을 위해 1개 더 요청)"""
+        count = days
+        if since is not None:
+            # 기준 날짜 이후 달력 일수만큼만 요청 (거래일 수보다 항상 크거나 같음)
+            count = min(days, max((date.today() - since).days, 0) + 1)
+        url = (
+            f"{settings.NAVER_CHART_BASE_URL}/sise.nhn"
+            f"?symbol={ticker}&timeframe=day&count={count + 1}&requestType=0"
+        )
+        return count, url
+
+    def _chart_rows(
+        self, ticker: str, url: str, response, count: int, since: Optional[date]
+    ) -> Optional[List[dict]]:
+        """
+        fchart 응답을 가격 데이터 행으로 변환 (동기/비동기 공통)
+
+        Raises:
+            PageNotModified: 응답이 이전 수집과 같음
+        """
+        if self._is_unchanged(PAGE_ENDPOINT_CHART, ticker, 1, response):
+            raise PageNotModified(PAGE_ENDPOINT_CHART, ticker)
+
+        self._archive_page(PAGE_ENDPOINT_CHART, ticker, 1, url, response.text)
+
+        # 항목 데이터는 ASCII이므로 응답 인코딩(EUC-KR)과 무관하게 파싱 가능
+        try:
+            price_data = self._parse_chart_data(response.text, ticker)
+        except Exception as e:
+            logger.warning(f"Failed to parse chart data for {ticker}: {e}")
+            return None
+
+        if not price_data:
+            logger.warning(f"No chart items found for {ticker}")
+            return None
+
+        price_data, _ = self._filter_since(price_data[:count], since)
+        logger.info(f"Collected {len(price_data)} price records for {ticker} from chart data (1 request)")
+        return price_data
+
+    def _parse_chart_data(self, body: str, ticker: str) -> List[dict]:
+        """
+        fchart 응답을 가격 데이터 행으로 변환
+
+        Args:
+            body: fchart sise.nhn 응답 본문
+            ticker: 종목 코드
+
+        Returns:
+            가격 데이터 리스트 (최신순). 가장 오래된 항목은 전일 종가 계산에만 사용
+        """
+        items = []
+        for match in CHART_ITEM_PATTERN.finditer(body):
+            fields = match.group(1).split('|')
+            if len(fields) < 6:
+                continue
+            try:
+                items.append((
+                    datetime.strptime(fields[0], '%Y%m%d').date(),
+                    *(self._parse_number(value) for value in fields[1:6]),
+                ))
+            except ValueError as e:
+                logger.warning(f"Failed to parse chart item for {ticker}: {e}")
+
+        # 응답은 오래된 순 → 전일 종가를 이용해 등락률/등락액 계산 후 최신순으로 반환
+        price_data = []
+        now = datetime.now()
+        for previous, current in zip(items, items[1:]):
+            trade_date, open_price, high_price, low_price, close_price, volume = current
+            price_data.append(self._price_row(
+                ticker, trade_date, now, close_price, previous[4], open_price, high_price, low_price, volume,
+            ))
+
+        price_data.reverse()
+        return price_data
+
+    def _price_row(
+        self,
+        ticker: str,
+        trade_date: date,
+        timestamp: datetime,
+        close_price: Optional[float],
+        previous_close: Optional[float],
+        open_price: Optional[float],
+        high_price: Optional[float],
+        low_price: Optional[float],
+        volume: Optional[float],
+    ) -> dict:
+        """
+        가격 데이터 행 생성 (chart와 HTML 소스가 같은 형식의 행을 만들도록 공통 사용)
+
+        등락액과 등락률은 전일 종가로 계산합니다.
+        """
+        change_amount = None
+        change_rate = None
+        if close_price is not None and previous_close:
+            change_amount = close_price - previous_close
+            change_rate = round(change_amount / previous_close * 100, 2)
+
+        return {
+            'ticker': ticker,
+            'date': trade_date,
+            'timestamp': timestamp,
+            'current_price': close_price,
+            'change_rate': change_rate,
+            'change_amount': change_amount,
+            'open_price': open_price,
+            'high_price': high_price,
+            'low_price': low_price,
+            'volume': volume,
+            'previous_close': previous_close,
+        }
+
+    def _filter_since(self, page_rows: List[dict], since: Optional[date]) -> Tuple[List[dict], bool]:
+        """
+        증분 수집 기준 날짜 이후의 행만 남김
+
+        기준 날짜보다 새로운 행과, 장중에 값이 바뀌는 오늘 행은 유지합니다.
+
+        Args:
+            page_rows: 한 페이지의 가격 데이터 (최신순)
+            since: 이미 저장된 최신 날짜 (None이면 필터링하지 않음)
+
+        Returns:
+            (남은 행 리스트, 기준 날짜 도달 여부) 튜플
+        """
+        if since is None:
+            return page_rows, False
+
+        today = date.today()
+        reached = any(row['date'] <= since for row in page_rows)
+        kept = [row for row in page_rows if row['date'] > since or row['date'] >= today]
+        return kept, reached
+
+    def get_latest_price_date(self, db: Session, ticker: str) -> Optional[date]:
+        """
+        저장된 가격 데이터의 최신 날짜(워터마크) 조회
+
+        Args:
+            db: 데이터베이스 세션
+            ticker: 종목 코드
+
+        Returns:
+            최신 거래일, 저장된 데이터가 없으면 None
+        """
+        return db.query(func.max(Price.date)).filter(Price.ticker == ticker).scalar()
+
+    def _parse_price_page(self, html: str, ticker: str, page: int = 1) -> Optional[List[dict]]:
+        """
+        sise_day 페이지 HTML을 가격 데이터 행으로 변환
+
+        Args:
+            html: sise_day.naver 응답 본문
+            ticker: 종목 코드
+            page: 페이지 번호 (로그용)
+
+        Returns:
+            파싱된 가격 데이터 리스트, 시세 테이블이 없으면 None
+        """
+        # 시세 테이블의 행별 셀 텍스트
+        rows = self.parser.price_rows(html)
+        if rows is None:
+            logger.warning(f"Price table not found for {ticker} on page {page}")
+            return None
+
+        page_rows = []
+        for cols in rows:
+            if len(cols) >= 7:  # 날짜, 종가, 전일비, 시가, 고가, 저가, 거래량
+                date_cell = cols[0]
+
+                # 날짜 형식 확인 (YYYY.MM.DD)
+                if date_cell and '.' in date_cell:
+                    try:
+                        # 데이터 파싱
+                        date_str = date_cell  # 2025.11.07
+                        close_price = self._parse_number(cols[1])
+                        change_str = cols[2]  # 예: "상승205" 또는 "하락1,375"
+                        open_price = self._parse_number(cols[3])
+                        high_price = self._parse_number(cols[4])
+                        low_price = self._parse_number(cols[5])
+                        volume = self._parse_number(cols[6])
+
+                        # 전일 종가 = 종가 - 전일비 (등락액/등락률은 chart 소스와 같은 방식으로 계산)
+                        change_amount = self._parse_change_amount(change_str)
+                        previous_close = None
+                        if close_price is not None and change_amount is not None:
+                            previous_close = close_price - change_amount
+
+                        # 날짜 변환 (YYYY.MM.DD → YYYY-MM-DD)
+                        date_obj = datetime.strptime(date_str, '%Y.%m.%d').date()
+
+                        page_rows.append(self._price_row(
+                            ticker, date_obj, datetime.now(), close_price, previous_close,
+                            open_price, high_price, low_price, volume,
+                        ))
+
+                    except Exception as e:
+                        logger.warning(f"Failed to parse row for {ticker} on page {page}: {e}")
+                        continue
+
+        return page_rows
+
     def _parse_number(self, text: str) -> Optional[float]:
         """숫자 문자열을 float로 변환 (쉼표 제거)"""
         if not text or not text.strip():
@@ -173,6 +801,32 @@ class FinanceCollector:
         if not change_str or not close_price or close_price == 0:
             return None
         
+        change_amount = self._parse_change_amount(change_str)
+        if change_amount is None:
+            return None
+        if change_amount == 0:
+            return 0.0
+        
+        # 등락률 계산: (전일비 / (종가 - 전일비)) * 100
+        prev_price = close_price - change_amount
+        if prev_price != 0:
+            return round((change_amount / prev_price) * 100, 2)
+        
+        return None
+    
+    def _parse_change_amount(self, change_str: str) -> Optional[float]:
+        """
+        전일비 문자열을 등락액으로 변환
+        
+        Args:
+            change_str: "상승205", "하락1,375", "보합0" 형식
+        
+        Returns:
+            등락액 (하락이면 음수) 또는 None
+        """
+        if not change_str:
+            return None
+        
         try:
             # "상승", "하락", "보합" 제거하고 숫자만 추출
             number_str = re.sub(r'[^0-9,-]', '', change_str)
@@ -185,25 +839,53 @@ class FinanceCollector:
             if '하락' in change_str:
                 change_amount = -change_amount
             
-            # 등락률 계산: (전일비 / (종가 - 전일비)) * 100
-            prev_price = close_price - change_amount
-            if prev_price != 0:
-                return round((change_amount / prev_price) * 100, 2)
-            
-            return None
+            return change_amount
         except Exception as e:
             logger.warning(f"Failed to parse change string '{change_str}': {e}")
             return None
     
-    def save_price_data(self, db: Session, price_data: List[dict]) -> int:
+    def _valid_price_rows(self, price_data: List[dict]) -> List[dict]:
+        """가격 데이터 검증 및 정제 (유효하지 않은 행은 경고 후 제외)"""
+        valid_data = []
+        for data in price_data:
+            # 데이터 검증
+            is_valid, error_msg = validate_price_data(data)
+            if not is_valid:
+                logger.warning(f"Skipping invalid data for {data.get('ticker')} on {data.get('date')}: {error_msg}")
+                continue
+
+            # 데이터 정제
+            valid_data.append(self.clean_price_data(data))
+        return valid_data
+
+    def write_price_data(self, db: Session, price_data: List[dict]) -> UpsertResult:
+        """
+        가격 데이터 검증/정제 후 저장 (커밋하지 않음, 수집 데이터 버퍼 writer용)
+
+        Args:
+            db: 데이터베이스 세션
+            price_data: 저장할 가격 데이터 리스트
+
+        Returns:
+            UpsertResult
+        """
+        valid_data = self._valid_price_rows(price_data)
+        if not valid_data:
+            return UpsertResult()
+        return self._save_rows(db, Price, DATA_TYPE_PRICES, valid_data)
+
+    def save_price_data(self, db: Session, price_data: List[dict], commit: bool = True) -> int:
         """
         가격 데이터를 데이터베이스에 저장 (검증 및 정제 포함)
         
-        벌크 insert를 사용하여 성능 최적화
+        (ticker, date) 기준 벌크 upsert 한 문장으로 삽입/갱신하며,
+        저장된 값과 같은 행은 쓰지 않습니다 (반환값에는 포함).
 
         Args:
             db: 데이터베이스 세션
             price_data: 저장할 가격 데이터 리스트
+            commit: False이면 커밋하지 않고 호출 측 트랜잭션에 저장. DB 오류는 0을 반환하지 않고
+                다시 발생시키므로 호출 측이 트랜잭션 전체를 롤백
 
         Returns:
             저장된 레코드 수
@@ -211,94 +893,134 @@ class FinanceCollector:
         if not price_data:
             return 0
 
-        # 모든 데이터를 먼저 검증하고 정제
-        valid_data = []
-        for data in price_data:
-            # 데이터 검증
-            is_valid, error_msg = validate_price_data(data)
-            if not is_valid:
-                logger.warning(f"Skipping invalid data for {data.get('ticker')} on {data.get('date')}: {error_msg}")
-                continue
-
-            # 데이터 정제
-            cleaned_data = self.clean_price_data(data)
-            valid_data.append(cleaned_data)
-
+        valid_data = self._valid_price_rows(price_data)
         if not valid_data:
             logger.warning("No valid price data to save after validation")
             return 0
 
-        # 벌크 insert 수행
+        # 벌크 upsert 수행
         saved_count = 0
         try:
-            for data in valid_data:
-                # 기존 데이터 확인 (ticker, date 기준)
-                existing = db.query(Price).filter(
-                    and_(
-                        Price.ticker == data['ticker'],
-                        Price.date == data['date']
-                    )
-                ).first()
-                
-                if existing:
-                    # 업데이트
-                    existing.timestamp = data['timestamp']
-                    existing.current_price = data['current_price']
-                    existing.change_rate = data['change_rate']
-                    existing.change_amount = data['change_amount']
-                    existing.open_price = data['open_price']
-                    existing.high_price = data['high_price']
-                    existing.low_price = data['low_price']
-                    existing.volume = data['volume']
-                    existing.previous_close = data.get('previous_close')
-                else:
-                    # 새로 추가
-                    price = Price(**data)
-                    db.add(price)
-                
-                saved_count += 1
-            
-            db.commit()
-            logger.info(f"Saved {saved_count} price records to database (bulk insert)")
+            result = self._commit_rows(db, Price, DATA_TYPE_PRICES, valid_data, commit)
+            saved_count = result.total
+            logger.info(
+                f"Saved {saved_count} price records to database "
+                f"({result.inserted} inserted, {result.updated} updated, {result.unchanged} unchanged)"
+            )
 
         except Exception as e:
-            db.rollback()
             logger.error(f"Database error while saving price data: {e}")
+            if not commit:
+                raise
+            db.rollback()
             saved_count = 0  # 롤백 시 저장된 레코드 없음
 
         return saved_count
     
-    def collect_and_save_prices(self, db: Session, ticker: str, days: int = 10) -> int:
+    def collect_and_save_prices(
+        self,
+        db: Session,
+        ticker: str,
+        days: int = 10,
+        incremental: bool = False,
+        source: Optional[str] = None,
+        commit: bool = True,
+    ) -> int:
         """
         Naver Finance에서 데이터 수집 후 데이터베이스에 저장
         
         Args:
             db: 데이터베이스 세션
             ticker: 종목 코드
-            days: 수집할 일수
+            days: 수집할 일수 (증분 수집 시에는 최대 일수)
+            incremental: 증분 수집 여부. True이면 저장된 최신 날짜 이후 행과
+                오늘 행만 수집하고, False이면 days 전체를 다시 수집(전체 재동기화)
+            source: 가격 데이터 소스 ("chart" 또는 "html", None이면 설정값 사용)
+            commit: False이면 커밋하지 않고 호출 측 트랜잭션에 저장. 저장한 페이지 지문도
+                확정하지 않으므로 호출 측이 커밋 후 finish_pages를 호출
         
         Returns:
-            저장된 레코드 수
+            저장된 레코드 수 (버퍼 사용 시 저장 대기열에 넣은 레코드 수)
         """
-        logger.info(f"Starting price collection for {ticker} (last {days} days)")
+        since = self.get_latest_price_date(db, ticker) if incremental else None
+        logger.info(f"Starting price collection for {ticker} (last {days} days, since: {since})")
         
-        # 데이터 수집
-        price_data = self.fetch_naver_finance_prices(ticker, days)
+        # 데이터 수집 (응답이 이전 수집과 같으면 "데이터 없음"과 구분해 저장 생략)
+        try:
+            price_data = self.fetch_prices(ticker, days, since=since, source=source)
+        except PageNotModified as e:
+            logger.debug(f"Skipping price save for {ticker}: {e}")
+            self.finish_pages(PRICE_PAGE_ENDPOINTS, ticker, success=True)
+            return 0
         
         if not price_data:
-            logger.warning(f"No data collected for {ticker}")
+            if since is not None:
+                logger.debug(f"No new price data for {ticker} since {since}")
+            else:
+                logger.warning(f"No data collected for {ticker}")
+            self.finish_pages(PRICE_PAGE_ENDPOINTS, ticker, success=True)
             return 0
         
-        # 데이터 저장
-        saved_count = self.save_price_data(db, price_data)
+        # 버퍼 사용 시 대기열에 넣고, 페이지 지문은 버퍼가 저장을 마친 뒤 확정
+        if self.ingest_buffer is not None:
+            return self.ingest_buffer.submit(
+                DATA_TYPE_PRICES, price_data, callback=partial(self.finish_pages, PRICE_PAGE_ENDPOINTS, ticker)
+            )
+
+        # 데이터 저장 (성공한 경우에만 페이지 지문 확정, 커밋하지 않으면 호출 측이 확정)
+        saved_count = self.save_price_data(db, price_data, commit=commit)
+        if commit or saved_count == 0:
+            self.finish_pages(PRICE_PAGE_ENDPOINTS, ticker, success=saved_count > 0)
         
         return saved_count
+
+    def replay_prices(
+        self,
+        db: Session,
+        archive: PageArchive,
+        ticker: str,
+        start: Optional[datetime] = None,
+        end: Optional[datetime] = None,
+    ) -> int:
+        """
+        아카이브의 원본 페이지를 다시 파싱하여 가격 데이터 저장 (네트워크 요청 없음)
+
+        sise_day와 chart 페이지를 수집 시각 순으로 파싱하며, 같은 날짜는
+        가장 나중에 수집한 페이지의 값을 사용합니다.
+
+        Args:
+            db: 데이터베이스 세션
+            archive: 원본 페이지 아카이브
+            ticker: 종목 코드
+            start: 수집 시각 하한 (선택)
+            end: 수집 시각 상한 (선택)
+
+        Returns:
+            저장된 레코드 수
+        """
+        entries = sorted(
+            archive.entries(PAGE_ENDPOINT_SISE_DAY, ticker, start, end)
+            + archive.entries(PAGE_ENDPOINT_CHART, ticker, start, end),
+            key=lambda entry: entry.fetched_at,
+        )
+
+        rows_by_date = {}
+        for entry in entries:
+            body = archive.read(entry)
+            if entry.endpoint == PAGE_ENDPOINT_CHART:
+                page_rows = self._parse_chart_data(body, ticker)
+            else:
+                page_rows = self._parse_price_page(body, ticker, entry.page) or []
+            for row in page_rows:
+                row['timestamp'] = entry.fetched_at
+                rows_by_date[row['date']] = row
+
+        logger.info(f"Replayed {len(entries)} archived price pages for {ticker} ({len(rows_by_date)} dates)")
+        if not rows_by_date:
+            return 0
+
+        return self.save_price_data(db, sorted(rows_by_date.values(), key=lambda row: row['date'], reverse=True))
     
-    @retry_with_backoff(
-        max_retries=3,
-        base_delay=1.0,
-        exceptions=(requests.exceptions.RequestException, requests.exceptions.Timeout)
-    )
     def fetch_naver_trading_flow(self, ticker: str, days: int = 10, start_date: Optional[date] = None, end_date: Optional[date] = None) -> List[dict]:
         """
         Naver Finance에서 투자자별 매매동향 데이터 수집 (다중 페이지 지원)
@@ -332,93 +1054,23 @@ class FinanceCollector:
                 url = f"https://finance.naver.com/item/frgn.naver?code={ticker}&page={page}"
                 logger.info(f"Fetching trading flow page {page} for {ticker}")
 
-                with self.rate_limiter:
-                    response = requests.get(url, headers=self.headers, timeout=10)
-                    response.raise_for_status()
+                response = self._get_page(
+                    PAGE_ENDPOINT_FRGN, url, self._request_headers(PAGE_ENDPOINT_FRGN, ticker, page)
+                )
 
-                soup = BeautifulSoup(response.text, 'html.parser')
-
-                # 매매동향 테이블 찾기 (두 번째 type2 테이블)
-                # 첫 번째는 증권사별 매매, 두 번째가 투자자별 매매동향
-                tables = soup.find_all('table', {'class': 'type2'})
-                if len(tables) < 2:
-                    logger.warning(f"Trading flow table not found for {ticker} on page {page}")
+                # 이전 수집과 같은 페이지면 이후(과거) 페이지도 바뀌지 않았으므로 중단
+                if self._is_unchanged(PAGE_ENDPOINT_FRGN, ticker, page, response):
+                    logger.debug(f"Trading flow page {page} unchanged for {ticker}, stopping pagination")
                     break
 
-                table = tables[1]  # 두 번째 테이블 선택
-
-                # 데이터 행 추출
-                rows = table.find_all('tr')
-                page_data_count = 0
-
-                for row in rows:
-                    # 이미 충분한 데이터를 수집했으면 중단
-                    if len(trading_data) >= target_count:
-                        break
+                self._archive_page(PAGE_ENDPOINT_FRGN, ticker, page, url, response.text)
+                page_rows = self._parse_trading_flow_page(response.text, ticker, page)
+                if page_rows is None:
+                    break
 
-                    cols = row.find_all('td')
-                    # 실제 데이터 행은 7개 이상의 컬럼을 가짐
-                    # [0]날짜 [1]종가 [2]전일비 [3]등락률 [4]거래량 [5]기관 [6]외국인 [7]외국인보유 [8]지분율
-                    if len(cols) < 7:
-                        continue
-
-                    try:
-                        # 날짜 추출
-                        date_text = cols[0].get_text(strip=True)
-                        if not date_text or date_text == '날짜' or '.' not in date_text:
-                            continue
-
-                        # 날짜 파싱 (YYYY.MM.DD 형식)
-                        trade_date = datetime.strptime(date_text, '%Y.%m.%d').date()
-
-                        # 날짜 범위 필터링 (지정된 경우)
-                        if start_date and trade_date < start_date:
-                            # 시작 날짜 이전 데이터를 만나면 더 이상 필요한 데이터가 없음
-                            # (Naver Finance는 최신순으로 데이터 제공)
-                            if len(trading_data) > 0:
-                                # 이미 일부 데이터를 수집했으면 전체 루프 종료
-                                should_stop = True
-                                break
-                            continue  # 시작 날짜 이전 데이터는 건너뜀
-                        if end_date and trade_date > end_date:
-                            continue  # 종료 날짜 이후 데이터는 건너뜀 (더 오래된 데이터가 나올 수 있으므로 계속 진행)
-
-                        # 투자자별 순매수 추출 (천주 단위)
-                        # 기관 (5번 컬럼)
-                        institutional_text = cols[5].get_text(strip=True)
-                        institutional_net = self._parse_trading_volume(institutional_text)
-
-                        # 외국인 (6번 컬럼)
-                        foreign_text = cols[6].get_text(strip=True)
-                        foreign_net = self._parse_trading_volume(foreign_text)
-
-                        # 개인 = -(기관 + 외국인)
-                        # None 처리: 기관이나 외국인이 None이면 개인도 None
-                        if institutional_net is not None and foreign_net is not None:
-                            individual_net = -(institutional_net + foreign_net)
-                        else:
-                            individual_net = None
-
-                        # 총 거래량 계산
-                        total = None
-                        if individual_net is not None and institutional_net is not None and foreign_net is not None:
-                            total = abs(individual_net) + abs(institutional_net) + abs(foreign_net)
-
-                        trading_data.append({
-                            'ticker': ticker,
-                            'date': trade_date,
-                            'timestamp': datetime.now(),
-                            'individual': individual_net,
-                            'institution': institutional_net,
-                            'foreign_investor': foreign_net,
-                            'total': total
-                        })
-
-                        page_data_count += 1
-
-                    except (ValueError, AttributeError, IndexError) as e:
-                        logger.warning(f"Failed to parse trading flow row for {ticker} on page {page}: {e}")
-                        continue
+                page_data_count, should_stop = self._append_trading_rows(
+                    trading_data, page_rows, target_count, start_date, end_date
+                )
 
                 logger.info(f"Collected {page_data_count} trading flow records from page {page} for {ticker} (total: {len(trading_data)})")
 
@@ -429,19 +1081,208 @@ class FinanceCollector:
 
                 page += 1
 
+            except CircuitOpenError as e:
+                logger.debug(f"Skipping trading flow pages for {ticker}: {e}")
+                self.fetch_errors[PAGE_ENDPOINT_FRGN] += 1
+                break
             except requests.exceptions.Timeout:
                 logger.error(f"Timeout fetching trading flow page {page} for {ticker}")
+                self.fetch_errors[PAGE_ENDPOINT_FRGN] += 1
                 break
             except requests.exceptions.RequestException as e:
                 logger.error(f"Request error fetching trading flow page {page} for {ticker}: {e}")
+                self.fetch_errors[PAGE_ENDPOINT_FRGN] += 1
                 break
+            except DeadlineExceeded:
+                # 마감이 지난 작업은 일부 데이터도 반환하지 않고 중단
+                raise
             except Exception as e:
                 logger.error(f"Unexpected error fetching trading flow page {page} for {ticker}: {e}")
+                self.fetch_errors[PAGE_ENDPOINT_FRGN] += 1
                 break
 
         logger.info(f"Collected total {len(trading_data)} trading flow records for {ticker} from {page-1} pages")
         return trading_data
-    
+
+    async def fetch_naver_trading_flow_async(
+        self,
+        client: AsyncHttpClient,
+        ticker: str,
+        days: int = 10,
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None,
+    ) -> List[dict]:
+        """
+        Naver Finance에서 투자자별 매매동향 데이터 비동기 수집
+
+        Args:
+            client: 비동기 HTTP 클라이언트
+            ticker: 종목 코드
+            days: 수집할 일수 (기본: 10일)
+            start_date: 시작 날짜 (선택)
+            end_date: 종료 날짜 (선택)
+
+        Returns:
+            수집된 매매동향 데이터 리스트 (실패 시 수집된 데이터까지만 반환)
+        """
+        trading_data = []
+        page = 1
+        max_pages = (days // 10) + 2
+        wave = -(-days // 10)
+
+        while len(trading_data) < days and page <= max_pages:
+            urls = {
+                p: f"https://finance.naver.com/item/frgn.naver?code={ticker}&page={p}"
+                for p in range(page, min(page + wave, max_pages + 1))
+            }
+            responses = await self._get_pages_async(client, PAGE_ENDPOINT_FRGN, ticker, urls)
+            wave = 1
+
+            for url, response in zip(urls.values(), responses):
+                if isinstance(response, CircuitOpenError):
+                    logger.debug(f"Skipping trading flow pages for {ticker}: {response}")
+                    self.fetch_errors[PAGE_ENDPOINT_FRGN] += 1
+                    return trading_data
+                if isinstance(response, Exception):
+                    logger.error(f"Request error fetching trading flow page {page} for {ticker}: {response}")
+                    self.fetch_errors[PAGE_ENDPOINT_FRGN] += 1
+                    return trading_data
+
+                if self._is_unchanged(PAGE_ENDPOINT_FRGN, ticker, page, response):
+                    return trading_data
+
+                self._archive_page(PAGE_ENDPOINT_FRGN, ticker, page, url, response.text)
+                page_rows = self._parse_trading_flow_page(response.text, ticker, page)
+                if page_rows is None:
+                    return trading_data
+
+                page_data_count, should_stop = self._append_trading_rows(
+                    trading_data, page_rows, days, start_date, end_date
+                )
+                page += 1
+                if page_data_count == 0 or should_stop or len(trading_data) >= days:
+                    return trading_data
+
+        logger.info(f"Collected total {len(trading_data)} trading flow records for {ticker} from {page-1} pages (async)")
+        return trading_data
+
+    def _parse_trading_flow_page(self, html: str, ticker: str, page: int = 1) -> Optional[List[dict]]:
+        """
+        frgn 페이지 HTML을 매매동향 데이터 행으로 변환
+
+        Args:
+            html: frgn.naver 응답 본문
+            ticker: 종목 코드
+            page: 페이지 번호 (로그용)
+
+        Returns:
+            파싱된 매매동향 데이터 리스트 (최신순), 매매동향 테이블이 없으면 None
+        """
+        # 매매동향 테이블(두 번째 type2 테이블)의 행별 셀 텍스트
+        # 첫 번째는 증권사별 매매, 두 번째가 투자자별 매매동향
+        rows = self.parser.trading_rows(html)
+        if rows is None:
+            logger.warning(f"Trading flow table not found for {ticker} on page {page}")
+            return None
+
+        page_rows = []
+        for cols in rows:
+            # 실제 데이터 행은 7개 이상의 컬럼을 가짐
+            # [0]날짜 [1]종가 [2]전일비 [3]등락률 [4]거래량 [5]기관 [6]외국인 [7]외국인보유 [8]지분율
+            if len(cols) < 7:
+                continue
+
+            try:
+                # 날짜 추출
+                date_text = cols[0]
+                if not date_text or date_text == '날짜' or '.' not in date_text:
+                    continue
+
+                # 날짜 파싱 (YYYY.MM.DD 형식)
+                trade_date = datetime.strptime(date_text, '%Y.%m.%d').date()
+
+                # 투자자별 순매수 추출 (천주 단위)
+                # 기관 (5번 컬럼)
+                institutional_text = cols[5]
+                institutional_net = self._parse_trading_volume(institutional_text)
+
+                # 외국인 (6번 컬럼)
+                foreign_text = cols[6]
+                foreign_net = self._parse_trading_volume(foreign_text)
+
+                # 개인 = -(기관 + 외국인)
+                # None 처리: 기관이나 외국인이 None이면 개인도 None
+                if institutional_net is not None and foreign_net is not None:
+                    individual_net = -(institutional_net + foreign_net)
+                else:
+                    individual_net = None
+
+                # 총 거래량 계산
+                total = None
+                if individual_net is not None and institutional_net is not None and foreign_net is not None:
+                    total = abs(individual_net) + abs(institutional_net) + abs(foreign_net)
+
+                page_rows.append({
+                    'ticker': ticker,
+                    'date': trade_date,
+                    'timestamp': datetime.now(),
+                    'individual': individual_net,
+                    'institution': institutional_net,
+                    'foreign_investor': foreign_net,
+                    'total': total
+                })
+
+            except (ValueError, AttributeError, IndexError) as e:
+                logger.warning(f"Failed to parse trading flow row for {ticker} on page {page}: {e}")
+                continue
+
+        return page_rows
+
+    def _append_trading_rows(
+        self,
+        trading_data: List[dict],
+        page_rows: List[dict],
+        target_count: int,
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None,
+    ) -> Tuple[int, bool]:
+        """
+        날짜 범위를 적용하여 페이지 행을 수집 결과에 추가
+
+        Args:
+            trading_data: 누적 수집 결과 (제자리에서 추가)
+            page_rows: 한 페이지의 매매동향 행 (최신순)
+            target_count: 목표 수집 개수
+            start_date: 시작 날짜 (선택)
+            end_date: 종료 날짜 (선택)
+
+        Returns:
+            (이번 페이지에서 추가된 개수, 페이징 중단 여부) 튜플
+        """
+        added = 0
+        for row in page_rows:
+            # 이미 충분한 데이터를 수집했으면 중단
+            if len(trading_data) >= target_count:
+                break
+
+            trade_date = row['date']
+
+            # 날짜 범위 필터링 (지정된 경우)
+            if start_date and trade_date < start_date:
+                # 시작 날짜 이전 데이터를 만나면 더 이상 필요한 데이터가 없음
+                # (Naver Finance는 최신순으로 데이터 제공)
+                if len(trading_data) > 0:
+                    # 이미 일부 데이터를 수집했으면 전체 루프 종료
+                    return added, True
+                continue  # 시작 날짜 이전 데이터는 건너뜀
+            if end_date and trade_date > end_date:
+                continue  # 종료 날짜 이후 데이터는 건너뜀 (더 오래된 데이터가 나올 수 있으므로 계속 진행)
+
+            trading_data.append(row)
+            added += 1
+
+        return added, False
+
     def _parse_trading_volume(self, text: str) -> Optional[int]:
         """
         거래량 텍스트를 정수로 변환 (천주 단위)
@@ -468,13 +1309,33 @@ class FinanceCollector:
         except (ValueError, AttributeError):
             return None
     
-    def save_trading_flow_data(self, db: Session, trading_data: List[dict]) -> int:
+    def write_trading_flow_data(self, db: Session, trading_data: List[dict]) -> UpsertResult:
+        """
+        매매동향 데이터 검증 후 저장 (커밋하지 않음, 수집 데이터 버퍼 writer용)
+
+        Args:
+            db: 데이터베이스 세션
+            trading_data: 매매동향 데이터 리스트
+
+        Returns:
+            UpsertResult
+        """
+        valid_data = [data for data in trading_data if validate_trading_flow_data(data)]
+        if not valid_data:
+            return UpsertResult()
+        return self._save_rows(db, TradingTrend, DATA_TYPE_TRADING, valid_data)
+
+    def save_trading_flow_data(self, db: Session, trading_data: List[dict], commit: bool = True) -> int:
         """
         매매동향 데이터를 데이터베이스에 저장
 
+        (ticker, date) 기준 벌크 upsert 한 문장으로 삽입/갱신하며,
+        저장된 값과 같은 행은 쓰지 않습니다 (반환값에는 포함).
+
         Args:
             db: 데이터베이스 세션
             trading_data: 매매동향 데이터 리스트
+            commit: False이면 커밋하지 않고 호출 측 트랜잭션에 저장 (save_price_data 참고)
 
         Returns:
             저장된 레코드 수
@@ -484,52 +1345,40 @@ class FinanceCollector:
             return 0
 
         # 데이터 검증
-        valid_data = []
-        for data in trading_data:
-            if validate_trading_flow_data(data):
-                valid_data.append(data)
+        valid_data = [data for data in trading_data if validate_trading_flow_data(data)]
 
         if not valid_data:
             logger.warning("No valid trading flow data after validation")
             return 0
 
-        # 벌크 insert 수행
+        # 벌크 upsert 수행
         saved_count = 0
         try:
-            for data in valid_data:
-                # 기존 데이터 확인 (ticker, date 기준)
-                existing = db.query(TradingTrend).filter(
-                    and_(
-                        TradingTrend.ticker == data['ticker'],
-                        TradingTrend.date == data['date']
-                    )
-                ).first()
-                
-                if existing:
-                    # 업데이트
-                    existing.timestamp = data['timestamp']
-                    existing.individual = data['individual']
-                    existing.institution = data['institution']
-                    existing.foreign_investor = data['foreign_investor']
-                    existing.total = data.get('total')
-                else:
-                    # 새로 추가
-                    trading_trend = TradingTrend(**data)
-                    db.add(trading_trend)
-                
-                saved_count += 1
-
-            db.commit()
-            logger.info(f"Saved {saved_count} trading flow records (bulk insert)")
+            result = self._commit_rows(db, TradingTrend, DATA_TYPE_TRADING, valid_data, commit)
+            saved_count = result.total
+            logger.info(
+                f"Saved {saved_count} trading flow records "
+                f"({result.inserted} inserted, {result.updated} updated, {result.unchanged} unchanged)"
+            )
 
         except Exception as e:
             logger.error(f"Database error saving trading flow: {e}")
+            if not commit:
+                raise
             db.rollback()
             saved_count = 0  # 롤백 시 저장된 레코드 없음
 
         return saved_count
 
-    def collect_and_save_trading_flow(self, db: Session, ticker: str, days: int = 10, start_date: Optional[date] = None, end_date: Optional[date] = None) -> int:
+    def collect_and_save_trading_flow(
+        self,
+        db: Session,
+        ticker: str,
+        days: int = 10,
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None,
+        commit: bool = True,
+    ) -> int:
         """
         매매동향 데이터를 수집하고 저장
         
@@ -539,9 +1388,10 @@ class FinanceCollector:
             days: 수집할 일수
             start_date: 시작 날짜 (선택)
             end_date: 종료 날짜 (선택)
+            commit: False이면 커밋하지 않음 (collect_and_save_prices 참고)
         
         Returns:
-            저장된 레코드 수
+            저장된 레코드 수 (버퍼 사용 시 저장 대기열에 넣은 레코드 수)
         """
         logger.info(f"Starting trading flow collection for {ticker} (last {days} days, date range: {start_date} to {end_date})")
         
@@ -550,12 +1400,56 @@ class FinanceCollector:
         
         if not trading_data:
             logger.warning(f"No trading flow data collected for {ticker}")
+            self.finish_pages((PAGE_ENDPOINT_FRGN,), ticker, success=True)
             return 0
         
-        # 데이터 저장
-        saved_count = self.save_trading_flow_data(db, trading_data)
+        # 버퍼 사용 시 대기열에 넣고, 페이지 지문은 버퍼가 저장을 마친 뒤 확정
+        if self.ingest_buffer is not None:
+            return self.ingest_buffer.submit(
+                DATA_TYPE_TRADING, trading_data, callback=partial(self.finish_pages, (PAGE_ENDPOINT_FRGN,), ticker)
+            )
+
+        # 데이터 저장 (성공한 경우에만 페이지 지문 확정, 커밋하지 않으면 호출 측이 확정)
+        saved_count = self.save_trading_flow_data(db, trading_data, commit=commit)
+        if commit or saved_count == 0:
+            self.finish_pages((PAGE_ENDPOINT_FRGN,), ticker, success=saved_count > 0)
         
         return saved_count
+
+    def replay_trading_flow(
+        self,
+        db: Session,
+        archive: PageArchive,
+        ticker: str,
+        start: Optional[datetime] = None,
+        end: Optional[datetime] = None,
+    ) -> int:
+        """
+        아카이브의 frgn 페이지를 다시 파싱하여 매매동향 데이터 저장 (네트워크 요청 없음)
+
+        Args:
+            db: 데이터베이스 세션
+            archive: 원본 페이지 아카이브
+            ticker: 종목 코드
+            start: 수집 시각 하한 (선택)
+            end: 수집 시각 상한 (선택)
+
+        Returns:
+            저장된 레코드 수
+        """
+        entries = archive.entries(PAGE_ENDPOINT_FRGN, ticker, start, end)
+
+        rows_by_date = {}
+        for entry in entries:
+            for row in self._parse_trading_flow_page(archive.read(entry), ticker, entry.page) or []:
+                row['timestamp'] = entry.fetched_at
+                rows_by_date[row['date']] = row
+
+        logger.info(f"Replayed {len(entries)} archived trading flow pages for {ticker} ({len(rows_by_date)} dates)")
+        if not rows_by_date:
+            return 0
+
+        return self.save_trading_flow_data(db, sorted(rows_by_date.values(), key=lambda row: row['date'], reverse=True))
     
     
     def clean_price_data(self, data: dict) -> dict:
@@ -4,43 +4,193 @@ Naver News 데이터 수집기
 뉴스 데이터를 Naver Finance에서 수집합니다.
 """
 
-from typing import List, Optional
+import asyncio
+from collections import Counter
+from functools import partial
+from typing import List, Optional, Set
 from datetime import datetime, date
 from sqlalchemy.orm import Session
-from sqlalchemy import and_
+from sqlalchemy import select
 import hashlib
 import uuid
 
+from app.collectors.parsers import PageParser, get_parser
 from app.models import Stock, News
-from app.utils.retry import retry_with_backoff
-from app.utils.rate_limiter import RateLimiter
+from app.utils.retry import RetryBudget, async_request_with_retry, is_retryable_error, request_with_retry
+from app.utils.circuit_breaker import CircuitOpenError, get_circuit_breaker
+from app.utils.deadline import DeadlineExceeded
+from app.utils.rate_limiter import RateLimiter, get_rate_limiter, host_of
+from app.utils.http_client import get_http_client
+from app.utils.ingest_buffer import IngestBuffer
+from app.utils.async_http_client import AsyncHttpClient
+from app.utils.bloom_filter import BloomFilter, get_news_bloom_filter
+from app.utils.page_archive import PageArchive, get_page_archive
+from app.utils.page_tracker import PageChangeTracker
+from app.utils.upsert import UpsertResult, bulk_upsert
 from app.utils.validators import validate_news_data
+import httpx
 import logging
 import requests
-from bs4 import BeautifulSoup
 import re
 
 logger = logging.getLogger(__name__)
 
-# 기본 Rate Limiter 설정 (0.5초 간격)
-DEFAULT_RATE_LIMITER_INTERVAL = 0.5
+# 페이지 변경 추적 엔드포인트 이름
+PAGE_ENDPOINT_NEWS = "news"
+
+# 데이터 유형 (수집 데이터 버퍼 writer 키)
+DATA_TYPE_NEWS = "news"
+
+# 이미 저장된 뉴스를 다시 수집했을 때 갱신할 컬럼
+NEWS_UPDATE_COLUMNS = ['title', 'source', 'published_at', 'collected_at']
 
 
 class NewsCollector:
     """Naver News 데이터 수집기"""
     
-    def __init__(self):
+    def __init__(
+        self,
+        parser: Optional[PageParser] = None,
+        page_tracker: Optional[PageChangeTracker] = None,
+        archive: Optional[PageArchive] = None,
+        bloom_filter: Optional[BloomFilter] = None,
+        ingest_buffer: Optional[IngestBuffer] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        retry_budget: Optional[RetryBudget] = None,
+        fetch_errors: Optional[Counter] = None,
+    ):
+        """
+        Args:
+            parser: HTML 파서 백엔드 (None이면 설정값 HTML_PARSER_BACKEND 사용)
+            page_tracker: 페이지 변경 추적기 (None이면 변경 여부와 관계없이 항상 처리)
+            archive: 원본 페이지 아카이브 (None이면 설정값 PAGE_ARCHIVE_ENABLED에 따라 사용)
+            bloom_filter: 뉴스 중복 확인 Bloom 필터 (None이면 설정값 NEWS_BLOOM_BACKEND 사용)
+            ingest_buffer: 수집 데이터 버퍼 (주어지면 collect_and_save_news가 직접 저장하지 않고 버퍼에 넣음)
+            rate_limiter: 요청 간격 제한기 (별도 예산을 쓸 때 전달,
+                None이면 모든 수집기가 공유하는 전역 제한기 get_rate_limiter() 사용)
+            retry_budget: 실행별 페이지 재시도 예산 (None이면 설정값 PAGE_RETRY_BUDGET으로 생성)
+            fetch_errors: 엔드포인트별 수집 실패 횟수를 누적할 Counter (재시도 후에도 실패했거나 차단 중이라
+                건너뛴 횟수, None이면 수집기마다 새로 생성)
+        """
         self.headers = {
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
         }
-        # Rate Limiter 초기화
-        self.rate_limiter = RateLimiter(min_interval=DEFAULT_RATE_LIMITER_INTERVAL)
+        # Rate Limiter (기본: 모든 수집기가 공유하는 호스트별 전역 예산)
+        self.rate_limiter = rate_limiter or get_rate_limiter()
+        # 공유 HTTP 클라이언트 (호스트별 커넥션 풀, Keep-Alive)
+        self.http_client = get_http_client()
+        # HTML 파서 백엔드
+        self.parser = parser or get_parser()
+        # 페이지 변경 추적 (이전 수집과 같은 페이지는 파싱/저장 생략)
+        self.page_tracker = page_tracker
+        # 원본 페이지 아카이브 (비활성화 시 None)
+        self.archive = archive if archive is not None else get_page_archive()
+        # 저장된 url_hash Bloom 필터 (새 뉴스는 중복 조회 생략)
+        self.bloom_filter = bloom_filter or get_news_bloom_filter()
+        # 수집 데이터 버퍼 (None이면 수집 직후 직접 저장)
+        self.ingest_buffer = ingest_buffer
+        # 페이지 재시도 예산 (upstream 장애 시 재시도로 요청 수가 늘어나지 않도록 실행별 상한)
+        self.retry_budget = retry_budget if retry_budget is not None else RetryBudget.from_settings()
+        # 엔드포인트별 수집 실패 횟수 (FinanceCollector.fetch_errors 참고)
+        self.fetch_errors = fetch_errors if fetch_errors is not None else Counter()
+
+    def _get_page(self, url: str, headers: dict) -> requests.Response:
+        """
+        뉴스 페이지 하나 요청 (실패한 요청만 재시도, Circuit Breaker 적용, FinanceCollector._get_page 참고)
+
+        Raises:
+            CircuitOpenError: news 엔드포인트 차단 중
+            requests.exceptions.RequestException: 재시도할 수 없거나 재시도를 소진한 실패
+        """
+        def send() -> requests.Response:
+            with self.rate_limiter.limit(host_of(url)):
+                response = self.http_client.get(url, headers=headers)
+                response.raise_for_status()
+                return response
+
+        breaker = get_circuit_breaker(PAGE_ENDPOINT_NEWS)
+        if breaker is None:
+            return request_with_retry(send, PAGE_ENDPOINT_NEWS, budget=self.retry_budget)
+
+        # 차단 중이면 요청하지 않고 바로 CircuitOpenError
+        breaker.before_request()
+        try:
+            response = request_with_retry(send, PAGE_ENDPOINT_NEWS, budget=self.retry_budget)
+        except requests.exceptions.RequestException as e:
+            if is_retryable_error(e):
+                breaker.record_failure()
+            else:
+                breaker.record_success()
+            raise
+        except BaseException:
+            # 요청 결과를 알 수 없는 오류: 기록 없이 확인 요청 슬롯만 반납 (반납하지 않으면 half-open에 계속 갇힘)
+            breaker.release()
+            raise
+        breaker.record_success()
+        return response
+
+    async def _get_page_async(self, client: AsyncHttpClient, url: str, headers: dict) -> httpx.Response:
+        """
+        뉴스 페이지 하나 비동기 요청 (FinanceCollector._get_page_async 참고)
+
+        Raises:
+            CircuitOpenError: news 엔드포인트 차단 중
+            requests.exceptions.RequestException: 재시도할 수 없거나 재시도를 소진한 실패
+        """
+        async def send() -> httpx.Response:
+            return await client.get(url, headers=headers)
+
+        breaker = get_circuit_breaker(PAGE_ENDPOINT_NEWS)
+        if breaker is None:
+            return await async_request_with_retry(send, PAGE_ENDPOINT_NEWS, budget=self.retry_budget)
+
+        # 차단 중이면 요청하지 않고 바로 CircuitOpenError
+        breaker.before_request()
+        try:
+            response = await async_request_with_retry(send, PAGE_ENDPOINT_NEWS, budget=self.retry_budget)
+        except requests.exceptions.RequestException as e:
+            if is_retryable_error(e):
+                breaker.record_failure()
+            else:
+                breaker.record_success()
+            raise
+        except BaseException:
+            # 요청 결과를 알 수 없는 오류(취소 등): 기록 없이 확인 요청 슬롯만 반납
+            breaker.release()
+            raise
+        breaker.record_success()
+        return response
+
+    def _request_headers(self, ticker: str, page: int) -> dict:
+        """요청 헤더 (페이지 변경 추적 시 조건부 GET 헤더 포함)"""
+        if self.page_tracker is None:
+            return self.headers
+        return self.page_tracker.request_headers(PAGE_ENDPOINT_NEWS, ticker, page, self.headers)
+
+    def _archive_page(self, ticker: str, page: int, url: str, body: str) -> None:
+        """원본 뉴스 페이지를 아카이브에 저장 (실패해도 수집은 계속)"""
+        if self.archive is None:
+            return
+        try:
+            self.archive.store(ticker, PAGE_ENDPOINT_NEWS, page, url, body)
+        except Exception as e:
+            logger.warning(f"Failed to archive news page {page} for {ticker}: {e}")
+
+    def finish_pages(self, ticker: str, success: bool) -> None:
+        """
+        저장 결과에 따라 스테이징된 뉴스 페이지 지문 확정 또는 폐기
+
+        Args:
+            ticker: 종목 코드
+            success: 저장 성공 여부 (실패 시 다음 수집에서 다시 처리)
+        """
+        if self.page_tracker is None:
+            return
+        if success:
+            self.page_tracker.commit(PAGE_ENDPOINT_NEWS, ticker)
+        else:
+            self.page_tracker.discard(PAGE_ENDPOINT_NEWS, ticker)
     
-    @retry_with_backoff(
-        max_retries=3,
-        base_delay=1.0,
-        exceptions=(requests.exceptions.RequestException, requests.exceptions.Timeout)
-    )
     def fetch_naver_news(self, ticker: str, max_items: int = 50) -> List[dict]:
         """
         Naver Finance에서 뉴스 데이터 수집
@@ -63,86 +213,23 @@ class NewsCollector:
                 url = f"https://finance.naver.com/item/news.naver?code={ticker}&page={page}"
                 logger.debug(f"Fetching news page {page} for {ticker}")
 
-                with self.rate_limiter:
-                    response = requests.get(url, headers=self.headers, timeout=10)
-                    response.raise_for_status()
+                response = self._get_page(url, self._request_headers(ticker, page))
 
-                soup = BeautifulSoup(response.text, 'html.parser')
+                # 이전 수집과 같은 페이지면 이후(과거) 페이지도 바뀌지 않았으므로 중단
+                if self.page_tracker is not None and self.page_tracker.is_unchanged(PAGE_ENDPOINT_NEWS, ticker, page, response):
+                    logger.debug(f"News page {page} unchanged for {ticker}, stopping pagination")
+                    break
 
-                # 뉴스 리스트 찾기
-                news_list = soup.find('div', {'class': 'news_area'})
-                if not news_list:
-                    # 다른 형식의 뉴스 리스트 찾기
-                    news_list = soup.find('table', {'class': 'type_1'})
-                
-                if not news_list:
-                    logger.warning(f"News list not found for {ticker} on page {page}")
+                self._archive_page(ticker, page, url, response.text)
+                page_items = self._parse_news_page(response.text, ticker, page)
+                if page_items is None:
                     break
 
-                # 뉴스 항목 추출
-                news_items = news_list.find_all('tr') or news_list.find_all('li')
-                items_parsed_this_page = 0
-
-                for item in news_items:
-                    # 이미 충분한 데이터를 수집했으면 종료
-                    if len(news_data) >= max_items:
-                        break
-
-                    try:
-                        # 제목과 링크 추출
-                        title_link = item.find('a')
-                        if not title_link:
-                            continue
-
-                        title = title_link.get_text(strip=True)
-                        url = title_link.get('href', '')
-                        
-                        # 상대 URL을 절대 URL로 변환
-                        if url and not url.startswith('http'):
-                            if url.startswith('/'):
-                                url = f"https://finance.naver.com{url}"
-                            else:
-                                url = f"https://finance.naver.com/item/{url}"
-
-                        if not title or not url:
-                            continue
-
-                        # 출처 추출
-                        source = None
-                        source_elem = item.find('span', {'class': 'press'}) or item.find('span', {'class': 'info'})
-                        if source_elem:
-                            source = source_elem.get_text(strip=True)
-
-                        # 발행 날짜 추출
-                        published_at = None
-                        date_elem = item.find('span', {'class': 'date'}) or item.find('td', {'class': 'date'})
-                        if date_elem:
-                            date_text = date_elem.get_text(strip=True)
-                            published_at = self._parse_date(date_text)
-
-                        # 고유 ID 생성 (URL 기반 해시)
-                        news_id = self._generate_news_id(url, ticker)
-                        # URL 해시 생성 (UNIQUE 제약조건용)
-                        url_hash = self._generate_url_hash(url)
-
-                        news_data.append({
-                            'id': news_id,
-                            'ticker': ticker,
-                            'title': title,
-                            'url': url,
-                            'url_hash': url_hash,
-                            'source': source,
-                            'published_at': published_at,
-                            'timestamp': datetime.now(),
-                        })
-                        items_parsed_this_page += 1
-
-                    except Exception as e:
-                        logger.warning(f"Failed to parse news item for {ticker} on page {page}: {e}")
-                        continue
+                # 이미 충분한 데이터를 수집했으면 나머지 항목은 버림
+                news_data.extend(page_items[:max_items - len(news_data)])
 
                 # 이번 페이지에서 아무 데이터도 파싱하지 못했으면 더 이상 페이지가 없는 것
-                if items_parsed_this_page == 0:
+                if not page_items:
                     logger.info(f"No more news available for {ticker} after page {page}")
                     break
 
@@ -151,13 +238,143 @@ class NewsCollector:
             logger.info(f"Collected {len(news_data)} news items for {ticker} from {page-1} pages")
             return news_data
 
+        except CircuitOpenError as e:
+            logger.debug(f"Skipping news pages for {ticker}: {e}")
+            self.fetch_errors[PAGE_ENDPOINT_NEWS] += 1
+            return news_data
         except requests.exceptions.RequestException as e:
             logger.error(f"Network error while fetching news for {ticker}: {e}")
+            self.fetch_errors[PAGE_ENDPOINT_NEWS] += 1
             return news_data  # 수집된 데이터라도 반환
+        except DeadlineExceeded:
+            # 마감이 지난 작업은 일부 데이터도 반환하지 않고 중단
+            raise
         except Exception as e:
             logger.error(f"Unexpected error while fetching news for {ticker}: {e}")
+            self.fetch_errors[PAGE_ENDPOINT_NEWS] += 1
             return news_data  # 수집된 데이터라도 반환
-    
+
+    async def fetch_naver_news_async(self, client: AsyncHttpClient, ticker: str, max_items: int = 50) -> List[dict]:
+        """
+        Naver Finance에서 뉴스 데이터 비동기 수집
+
+        요청마다 동기 수집과 같은 호스트 예산, 재시도 정책, Circuit Breaker, 조건부 GET을 적용합니다.
+
+        Args:
+            client: 비동기 HTTP 클라이언트
+            ticker: 종목 코드
+            max_items: 최대 수집할 뉴스 개수 (기본: 50개)
+
+        Returns:
+            수집된 뉴스 데이터 리스트 (실패 시 수집된 데이터까지만 반환)
+        """
+        news_data = []
+        page = 1
+        max_pages = (max_items // 20) + 2
+        wave = -(-max_items // 20)
+
+        while len(news_data) < max_items and page <= max_pages:
+            urls = {
+                p: f"https://finance.naver.com/item/news.naver?code={ticker}&page={p}"
+                for p in range(page, min(page + wave, max_pages + 1))
+            }
+            responses = await asyncio.gather(
+                *(self._get_page_async(client, url, self._request_headers(ticker, p)) for p, url in urls.items()),
+                return_exceptions=True,
+            )
+            wave = 1
+
+            for url, response in zip(urls.values(), responses):
+                if isinstance(response, CircuitOpenError):
+                    logger.debug(f"Skipping news pages for {ticker}: {response}")
+                    self.fetch_errors[PAGE_ENDPOINT_NEWS] += 1
+                    return news_data
+                if isinstance(response, Exception):
+                    logger.error(f"Network error while fetching news for {ticker} page {page}: {response}")
+                    self.fetch_errors[PAGE_ENDPOINT_NEWS] += 1
+                    return news_data
+
+                if self.page_tracker is not None and self.page_tracker.is_unchanged(PAGE_ENDPOINT_NEWS, ticker, page, response):
+                    return news_data
+
+                self._archive_page(ticker, page, url, response.text)
+                page_items = self._parse_news_page(response.text, ticker, page)
+                if not page_items:
+                    return news_data
+
+                news_data.extend(page_items[:max_items - len(news_data)])
+                page += 1
+                if len(news_data) >= max_items:
+                    break
+
+        logger.info(f"Collected {len(news_data)} news items for {ticker} from {page-1} pages (async)")
+        return news_data
+
+    def _parse_news_page(self, html: str, ticker: str, page: int = 1) -> Optional[List[dict]]:
+        """
+        뉴스 목록 페이지 HTML을 뉴스 데이터로 변환
+
+        Args:
+            html: news.naver 응답 본문
+            ticker: 종목 코드
+            page: 페이지 번호 (로그용)
+
+        Returns:
+            파싱된 뉴스 데이터 리스트, 뉴스 목록이 없으면 None
+        """
+        # 뉴스 목록 항목 (제목, 링크, 출처, 날짜 텍스트)
+        news_items = self.parser.news_items(html)
+        if news_items is None:
+            logger.warning(f"News list not found for {ticker} on page {page}")
+            return None
+
+        page_items = []
+
+        for item in news_items:
+            try:
+                title = item['title']
+                url = item['href']
+
+                # 상대 URL을 절대 URL로 변환
+                if url and not url.startswith('http'):
+                    if url.startswith('/'):
+                        url = f"https://finance.naver.com{url}"
+                    else:
+                        url = f"https://finance.naver.com/item/{url}"
+
+                if not title or not url:
+                    continue
+
+                # 출처
+                source = item['source'] or None
+
+                # 발행 날짜
+                published_at = None
+                if item['date']:
+                    published_at = self._parse_date(item['date'])
+
+                # 고유 ID 생성 (URL 기반 해시)
+                news_id = self._generate_news_id(url, ticker)
+                # URL 해시 생성 (UNIQUE 제약조건용)
+                url_hash = self._generate_url_hash(url)
+
+                page_items.append({
+                    'id': news_id,
+                    'ticker': ticker,
+                    'title': title,
+                    'url': url,
+                    'url_hash': url_hash,
+                    'source': source,
+                    'published_at': published_at,
+                    'timestamp': datetime.now(),
+                })
+
+            except Exception as e:
+                logger.warning(f"Failed to parse news item for {ticker} on page {page}: {e}")
+                continue
+
+        return page_items
+
     def _parse_date(self, date_text: str) -> Optional[datetime]:
         """
         날짜 문자열을 datetime으로 변환
@@ -219,21 +436,37 @@ class NewsCollector:
         hash_obj = hashlib.sha256(url.encode('utf-8'))
         return hash_obj.hexdigest()
     
-    def save_news_data(self, db: Session, news_data: List[dict]) -> int:
+    def _find_existing_hashes(self, db: Session, url_hashes: List[str]) -> Set[str]:
         """
-        뉴스 데이터를 데이터베이스에 저장 (검증 및 정제 포함)
+        이미 저장된 url_hash 조회
+
+        Bloom 필터가 확실히 없다고 판별한 해시는 건너뛰고,
+        있을 수 있는 해시만 한 번의 IN 쿼리로 확인합니다.
 
         Args:
             db: 데이터베이스 세션
-            news_data: 저장할 뉴스 데이터 리스트
+            url_hashes: 확인할 url_hash 리스트
 
         Returns:
-            저장된 레코드 수
+            데이터베이스에 있는 url_hash 집합
         """
-        if not news_data:
-            return 0
-
-        # 모든 데이터를 먼저 검증하고 정제
+        if self.bloom_filter.needs_warmup():
+            # 프로세스(또는 Redis 키)마다 한 번 기존 해시로 필터를 채움
+            count = self.bloom_filter.add_many(row[0] for row in db.execute(select(News.url_hash)))
+            self.bloom_filter.mark_warmed()
+            logger.info(f"Warmed news bloom filter with {count} url hashes")
+
+        maybe_seen = [
+            url_hash for url_hash, seen in zip(url_hashes, self.bloom_filter.contains_many(url_hashes)) if seen
+        ]
+        if not maybe_seen:
+            return set()
+
+        rows = db.execute(select(News.url_hash).where(News.url_hash.in_(maybe_seen)))
+        return {row[0] for row in rows}
+
+    def _valid_news_rows(self, news_data: List[dict]) -> List[dict]:
+        """뉴스 데이터 검증 및 정제 (유효하지 않은 행은 경고 후 제외)"""
         valid_data = []
         for data in news_data:
             # 데이터 검증
@@ -244,62 +477,85 @@ class NewsCollector:
 
             # 데이터 정제
             cleaned_data = self.clean_news_data(data)
+            if not cleaned_data.get('url_hash'):
+                cleaned_data['url_hash'] = self._generate_url_hash(cleaned_data['url'])
+            cleaned_data.setdefault('collected_at', datetime.now())
             valid_data.append(cleaned_data)
+        return valid_data
+
+    def _write_rows(self, db: Session, valid_data: List[dict]) -> UpsertResult:
+        """url_hash 기준 벌크 upsert (기존 뉴스는 제목/출처/시각만 갱신, 커밋하지 않음)"""
+        existing_hashes = self._find_existing_hashes(db, [data['url_hash'] for data in valid_data])
+        result = bulk_upsert(
+            db,
+            News,
+            valid_data,
+            conflict_columns=('url_hash',),
+            update_columns=NEWS_UPDATE_COLUMNS,
+            existing_keys={(url_hash,) for url_hash in existing_hashes},
+        )
+        # 커밋 전에 추가해도 롤백 시 거짓 양성(IN 쿼리 1회 추가)만 생기므로 안전
+        self.bloom_filter.add_many(data['url_hash'] for data in valid_data)
+        return result
+
+    def write_news_data(self, db: Session, news_data: List[dict]) -> UpsertResult:
+        """
+        뉴스 데이터 검증/정제 후 저장 (커밋하지 않음, 수집 데이터 버퍼 writer용)
+
+        Args:
+            db: 데이터베이스 세션
+            news_data: 저장할 뉴스 데이터 리스트
 
+        Returns:
+            UpsertResult
+        """
+        valid_data = self._valid_news_rows(news_data)
+        if not valid_data:
+            return UpsertResult()
+        return self._write_rows(db, valid_data)
+
+    def save_news_data(self, db: Session, news_data: List[dict], commit: bool = True) -> int:
+        """
+        뉴스 데이터를 데이터베이스에 저장 (검증 및 정제 포함)
+
+        Args:
+            db: 데이터베이스 세션
+            news_data: 저장할 뉴스 데이터 리스트
+            commit: False이면 커밋하지 않고 호출 측 트랜잭션에 저장, DB 오류는 다시 발생
+                (FinanceCollector.save_price_data 참고)
+
+        Returns:
+            저장된 레코드 수
+        """
+        if not news_data:
+            return 0
+
+        valid_data = self._valid_news_rows(news_data)
         if not valid_data:
             logger.warning("No valid news data to save after validation")
             return 0
 
-        # 벌크 insert 수행
         saved_count = 0
         try:
-            for data in valid_data:
-                # 기존 데이터 확인 (url_hash 기준 - 가장 빠름)
-                existing = db.query(News).filter(
-                    News.url_hash == data.get('url_hash')
-                ).first()
-                
-                if not existing:
-                    # id로도 확인 (하위 호환성)
-                    existing = db.query(News).filter(
-                        News.id == data['id']
-                    ).first()
-                
-                if not existing:
-                    # URL로도 확인 (id가 다른 경우 대비)
-                    existing = db.query(News).filter(
-                        News.url == data['url']
-                    ).first()
-                
-                if existing:
-                    # 업데이트
-                    existing.title = data['title']
-                    existing.source = data.get('source')
-                    existing.published_at = data.get('published_at')
-                    existing.collected_at = data.get('collected_at', data.get('timestamp', datetime.now()))
-                    # url_hash가 없으면 추가
-                    if not existing.url_hash and data.get('url_hash'):
-                        existing.url_hash = data['url_hash']
-                else:
-                    # 새로 추가 (url_hash가 없으면 생성)
-                    if 'url_hash' not in data or not data.get('url_hash'):
-                        data['url_hash'] = self._generate_url_hash(data['url'])
-                    news = News(**data)
-                    db.add(news)
-                
-                saved_count += 1
-            
-            db.commit()
-            logger.info(f"Saved {saved_count} news records to database (bulk insert)")
+            result = self._write_rows(db, valid_data)
+            if commit:
+                db.commit()
+            saved_count = result.total
+            logger.info(
+                f"Saved {saved_count} news records to database "
+                f"({result.inserted} inserted, {result.updated} updated)"
+            )
 
         except Exception as e:
-            db.rollback()
             logger.error(f"Database error while saving news data: {e}")
+            if not commit:
+                raise
+            db.rollback()
             saved_count = 0  # 롤백 시 저장된 레코드 없음
 
         return saved_count
     
-    def collect_and_save_news(self, db: Session, ticker: str, max_items: int = 50) -> int:
+    def collect_and_save_news(self, db: Session, ticker: str, max_items: int = 50, commit: bool = True) -> int:
         """
         Naver Finance에서 뉴스 데이터 수집 후 데이터베이스에 저장
         
@@ -307,9 +563,11 @@ class NewsCollector:
             db: 데이터베이스 세션
             ticker: 종목 코드
             max_items: 최대 수집할 뉴스 개수
+            commit: False이면 커밋하지 않고 호출 측 트랜잭션에 저장. 페이지 지문도 호출 측이
+                커밋 후 finish_pages로 확정
         
         Returns:
-            저장된 레코드 수
+            저장된 레코드 수 (버퍼 사용 시 저장 대기열에 넣은 레코드 수)
         """
         logger.info(f"Starting news collection for {ticker} (max {max_items} items)")
         
@@ -318,12 +576,54 @@ class NewsCollector:
         
         if not news_data:
             logger.warning(f"No news data collected for {ticker}")
+            self.finish_pages(ticker, success=True)
             return 0
         
-        # 데이터 저장
-        saved_count = self.save_news_data(db, news_data)
+        # 버퍼 사용 시 대기열에 넣고, 페이지 지문은 버퍼가 저장을 마친 뒤 확정
+        if self.ingest_buffer is not None:
+            return self.ingest_buffer.submit(DATA_TYPE_NEWS, news_data, callback=partial(self.finish_pages, ticker))
+
+        # 데이터 저장 (성공한 경우에만 페이지 지문 확정, 커밋하지 않으면 호출 측이 확정)
+        saved_count = self.save_news_data(db, news_data, commit=commit)
+        if commit or saved_count == 0:
+            self.finish_pages(ticker, success=saved_count > 0)
         
         return saved_count
+
+    def replay_news(
+        self,
+        db: Session,
+        archive: PageArchive,
+        ticker: str,
+        start: Optional[datetime] = None,
+        end: Optional[datetime] = None,
+    ) -> int:
+        """
+        아카이브의 뉴스 페이지를 다시 파싱하여 뉴스 데이터 저장 (네트워크 요청 없음)
+
+        Args:
+            db: 데이터베이스 세션
+            archive: 원본 페이지 아카이브
+            ticker: 종목 코드
+            start: 수집 시각 하한 (선택)
+            end: 수집 시각 상한 (선택)
+
+        Returns:
+            저장된 레코드 수
+        """
+        entries = archive.entries(PAGE_ENDPOINT_NEWS, ticker, start, end)
+
+        items_by_hash = {}
+        for entry in entries:
+            for item in self._parse_news_page(archive.read(entry), ticker, entry.page) or []:
+                item['timestamp'] = entry.fetched_at
+                items_by_hash[item['url_hash']] = item
+
+        logger.info(f"Replayed {len(entries)} archived news pages for {ticker} ({len(items_by_hash)} items)")
+        if not items_by_hash:
+            return 0
+
+        return self.save_news_data(db, list(items_by_hash.values()))
     
     def clean_news_data(self, data: dict) -> dict:
         """
@@ -0,0 +1,220 @@
+"""
+HTML 파서 백엔드
+
+Naver Finance 페이지(sise_day 시세 테이블, frgn 매매동향 테이블, 뉴스 목록)에서
+셀 텍스트만 추출하는 파서 인터페이스와 구현을 제공합니다.
+수집기는 추출된 텍스트를 행 데이터로 변환하므로 백엔드에 관계없이
+같은 결과를 얻습니다.
+
+- lxml: libxml2 기반 C 구현 (기본값)
+- bs4: BeautifulSoup + html.parser (순수 Python, 기준 구현)
+"""
+
+from abc import ABC, abstractmethod
+from typing import Dict, List, Optional
+import logging
+
+from bs4 import BeautifulSoup
+
+from app.config import settings
+
+try:
+    from lxml import etree as lxml_etree
+    from lxml import html as lxml_html
+except ImportError:  # pragma: no cover - lxml 미설치 환경
+    lxml_etree = None
+    lxml_html = None
+
+logger = logging.getLogger(__name__)
+
+PARSER_LXML = "lxml"
+PARSER_BS4 = "bs4"
+
+
+class PageParser(ABC):
+    """
+    Naver Finance 페이지 파서 인터페이스
+
+    모든 메서드는 대상 요소를 찾지 못하면 None을 반환합니다.
+    셀 텍스트는 BeautifulSoup의 get_text(strip=True)와 같은 규칙
+    (각 텍스트 조각을 strip한 뒤 이어붙임)으로 추출합니다.
+    """
+
+    name: str = ""
+
+    @abstractmethod
+    def price_rows(self, html: str) -> Optional[List[List[str]]]:
+        """sise_day 첫 번째 type2 테이블의 행별 td 텍스트"""
+
+    @abstractmethod
+    def trading_rows(self, html: str) -> Optional[List[List[str]]]:
+        """frgn 두 번째 type2 테이블의 행별 td 텍스트"""
+
+    @abstractmethod
+    def news_items(self, html: str) -> Optional[List[Dict[str, Optional[str]]]]:
+        """
+        뉴스 목록 항목
+
+        Returns:
+            링크가 있는 항목별 {'title', 'href', 'source', 'date'} 리스트
+        """
+
+
+class BeautifulSoupParser(PageParser):
+    """BeautifulSoup(html.parser) 기반 파서"""
+
+    name = PARSER_BS4
+
+    def _table_rows(self, table) -> List[List[str]]:
+        return [
+            [col.get_text(strip=True) for col in row.find_all('td')]
+            for row in table.find_all('tr')
+        ]
+
+    def price_rows(self, html: str) -> Optional[List[List[str]]]:
+        soup = BeautifulSoup(html, 'html.parser')
+        table = soup.find('table', {'class': 'type2'})
+        if not table:
+            return None
+        return self._table_rows(table)
+
+    def trading_rows(self, html: str) -> Optional[List[List[str]]]:
+        soup = BeautifulSoup(html, 'html.parser')
+        tables = soup.find_all('table', {'class': 'type2'})
+        if len(tables) < 2:
+            return None
+        return self._table_rows(tables[1])
+
+    def news_items(self, html: str) -> Optional[List[Dict[str, Optional[str]]]]:
+        soup = BeautifulSoup(html, 'html.parser')
+        news_list = soup.find('div', {'class': 'news_area'}) or soup.find('table', {'class': 'type_1'})
+        if not news_list:
+            return None
+
+        items = []
+        for item in news_list.find_all('tr') or news_list.find_all('li'):
+            title_link = item.find('a')
+            if not title_link:
+                continue
+            source_elem = item.find('span', {'class': 'press'}) or item.find('span', {'class': 'info'})
+            date_elem = item.find('span', {'class': 'date'}) or item.find('td', {'class': 'date'})
+            items.append({
+                'title': title_link.get_text(strip=True),
+                'href': title_link.get('href', ''),
+                'source': source_elem.get_text(strip=True) if source_elem else None,
+                'date': date_elem.get_text(strip=True) if date_elem else None,
+            })
+        return items
+
+
+def _class_xpath(tag: str, class_name: str, prefix: str = './/') -> str:
+    """class 속성에 class_name이 포함된 요소를 찾는 XPath"""
+    return f"{prefix}{tag}[contains(concat(' ', normalize-space(@class), ' '), ' {class_name} ')]"
+
+
+class LxmlParser(PageParser):
+    """lxml(libxml2) 기반 파서"""
+
+    name = PARSER_LXML
+
+    _TYPE2_TABLES = _class_xpath('table', 'type2', '//')
+    _NEWS_AREA = _class_xpath('div', 'news_area', '//')
+    _NEWS_TABLE = _class_xpath('table', 'type_1', '//')
+    _PRESS = _class_xpath('span', 'press')
+    _INFO = _class_xpath('span', 'info')
+    _DATE_SPAN = _class_xpath('span', 'date')
+    _DATE_TD = _class_xpath('td', 'date')
+
+    def _document(self, html: str):
+        if not html or not html.strip():
+            return None
+        try:
+            return lxml_html.document_fromstring(html)
+        except (lxml_etree.ParserError, ValueError):
+            return None
+
+    @staticmethod
+    def _text(element) -> str:
+        # itertext는 주석을 건너뛰므로 BeautifulSoup의 get_text(strip=True)와 결과가 같음
+        return ''.join(text.strip() for text in element.itertext())
+
+    def _table_rows(self, table) -> List[List[str]]:
+        return [[self._text(col) for col in row.iter('td')] for row in table.iter('tr')]
+
+    def price_rows(self, html: str) -> Optional[List[List[str]]]:
+        doc = self._document(html)
+        tables = doc.xpath(self._TYPE2_TABLES) if doc is not None else []
+        if not tables:
+            return None
+        return self._table_rows(tables[0])
+
+    def trading_rows(self, html: str) -> Optional[List[List[str]]]:
+        doc = self._document(html)
+        tables = doc.xpath(self._TYPE2_TABLES) if doc is not None else []
+        if len(tables) < 2:
+            return None
+        return self._table_rows(tables[1])
+
+    def news_items(self, html: str) -> Optional[List[Dict[str, Optional[str]]]]:
+        doc = self._document(html)
+        if doc is None:
+            return None
+        lists = doc.xpath(self._NEWS_AREA) or doc.xpath(self._NEWS_TABLE)
+        if not lists:
+            return None
+        news_list = lists[0]
+
+        items = []
+        for item in list(news_list.iter('tr')) or list(news_list.iter('li')):
+            title_link = next(item.iter('a'), None)
+            if title_link is None:
+                continue
+            source_elem = self._first(item, self._PRESS, self._INFO)
+            date_elem = self._first(item, self._DATE_SPAN, self._DATE_TD)
+            items.append({
+                'title': self._text(title_link),
+                'href': title_link.get('href', ''),
+                'source': self._text(source_elem) if source_elem is not None else None,
+                'date': self._text(date_elem) if date_elem is not None else None,
+            })
+        return items
+
+    @staticmethod
+    def _first(element, *xpaths: str):
+        """XPath를 순서대로 시도하여 처음 찾은 요소 반환
+
+        lxml 요소는 자식이 없으면 거짓으로 평가되므로 `or`로 대체 경로를 연결하면 안 됨
+        """
+        for xpath in xpaths:
+            found = element.xpath(xpath)
+            if found:
+                return found[0]
+        return None
+
+
+_parsers: Dict[str, PageParser] = {}
+
+
+def get_parser(name: Optional[str] = None) -> PageParser:
+    """
+    파서 백엔드 조회
+
+    Args:
+        name: "lxml" 또는 "bs4" (None이면 설정값 HTML_PARSER_BACKEND 사용)
+
+    Returns:
+        PageParser 인스턴스 (lxml 미설치 시 bs4로 대체)
+    """
+    name = name or settings.HTML_PARSER_BACKEND
+
+    if name == PARSER_LXML and lxml_html is None:
+        logger.warning("lxml is not installed, falling back to BeautifulSoup parser")
+        name = PARSER_BS4
+
+    if name not in (PARSER_LXML, PARSER_BS4):
+        raise ValueError(f"Unknown HTML parser backend: {name}")
+
+    if name not in _parsers:
+        _parsers[name] = LxmlParser() if name == PARSER_LXML else BeautifulSoupParser()
+
+    return _parsers[name]
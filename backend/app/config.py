@@ -50,6 +50,119 @@ class Settings(BaseSettings):
     AUTO_REFRESH_INTERVAL: int = 30
     NAVER_FINANCE_BASE_URL: str = "https://finance.naver.com"
     NAVER_NEWS_BASE_URL: str = "https://search.naver.com"
+    NAVER_CHART_BASE_URL: str = "https://fchart.stock.naver.com"
+    PRICE_SOURCE: str = "chart"  # 가격 수집 소스 (chart: fchart 일괄 조회, html: sise_day 페이지 순회)
+    PRICE_INCREMENTAL_ENABLED: bool = True  # 스케줄러 가격 수집 시 저장된 최신 날짜 이후만 수집 (False: 매번 전체 재동기화)
+    HTML_PARSER_BACKEND: str = "lxml"  # HTML 파서 백엔드 (lxml: libxml2 기반, bs4: BeautifulSoup html.parser)
+    PAGE_SKIP_UNCHANGED_ENABLED: bool = True  # 스케줄러 수집 시 이전과 같은 페이지의 파싱/저장 생략
+    PAGE_HASH_STORE: str = "redis"  # 페이지 해시 저장소 (redis: Redis + 메모리, memory: 프로세스 메모리)
+    PAGE_HASH_TTL: int = 86400  # Redis 페이지 해시 TTL (초)
+    PAGE_ARCHIVE_ENABLED: bool = False  # 수집한 원본 페이지를 압축 아카이브에 저장 (replay용)
+    PAGE_ARCHIVE_DIR: str = "./data/page_archive"  # 아카이브 디렉토리
+    PAGE_ARCHIVE_COMPRESSION_LEVEL: int = 3  # 압축 레벨 (zstd 1-22, zlib 1-9)
+    SKIP_UNCHANGED_ROWS_ENABLED: bool = True  # 가격/매매동향 저장 시 저장된 값과 같은 행은 쓰지 않음 (확인 시각만 data_checks에 기록)
+    NEWS_BLOOM_BACKEND: str = "memory"  # 뉴스 중복 확인 Bloom 필터 (memory: 프로세스 메모리, redis: 프로세스 간 공유)
+    NEWS_BLOOM_CAPACITY: int = 1_000_000  # Bloom 필터 예상 최대 뉴스 수
+    NEWS_BLOOM_ERROR_RATE: float = 0.001  # Bloom 필터 거짓 양성 비율
+
+    # 스케줄러 종목별 병렬 수집
+    SCHEDULER_MAX_WORKERS: int = 8  # 종목별 수집 워커 스레드 수 (종목마다 전용 DB 세션 사용)
+    SCHEDULER_TASK_TIMEOUT: float = 25.0  # 종목 하나의 수집/저장 최대 시간 (초, 수집 간격보다 짧게)
+
+    # upstream 요청 예산 (모든 수집기가 공유하는 호스트별 토큰 버킷)
+    RATE_LIMIT_HOST_RATE: float = 2.0  # 호스트별 초당 최대 요청 수 (스케줄러, 수집 작업, 수집 API가 공유, 기존 0.5초 간격과 같음)
+    RATE_LIMIT_BURST: int = 1  # 쉬고 있던 호스트에 바로 보낼 수 있는 요청 수 (버킷 용량, 1이면 항상 일정 간격)
+    RATE_LIMIT_BACKEND: str = "local"  # local: 프로세스 안에서 공유, redis: 모든 워커 프로세스/노드가 공유 (Lua 스크립트)
+    RATE_LIMIT_REDIS_RETRY_INTERVAL: float = 30.0  # redis 백엔드 장애 시 프로세스 내 버킷만 쓰다가 Redis를 다시 시도하는 간격 (초)
+    RATE_LIMIT_ADAPTIVE_ENABLED: bool = True  # upstream 응답에 따라 호스트별 속도 자동 조절 (AIMD, RATE_LIMIT_HOST_RATE에서 시작)
+    RATE_LIMIT_MIN_RATE: float = 0.5  # 조절 하한 (초당 요청 수)
+    RATE_LIMIT_MAX_RATE: float = 2.0  # 조절 상한 (초당 요청 수, 기본은 RATE_LIMIT_HOST_RATE를 넘지 않음 - 더 빠른 수집은 명시적으로 올려야 함)
+    RATE_LIMIT_INCREASE_STEP: float = 0.5  # 정상 응답이 이어질 때 올리는 폭 (초당 요청 수)
+    RATE_LIMIT_DECREASE_FACTOR: float = 0.5  # 429/5xx·타임아웃·느린 응답 시 곱하는 비율
+    RATE_LIMIT_LATENCY_TARGET: float = 2.0  # 이보다 느린 응답은 제한 신호로 간주 (초, 0이면 사용 안 함)
+    PAGE_RETRY_MAX_RETRIES: int = 3  # 페이지 요청 하나의 최대 재시도 횟수 (타임아웃, 연결 오류, 408/429/5xx)
+    PAGE_RETRY_BASE_DELAY: float = 1.0  # 재시도 기본 대기 시간 (초, full jitter로 0 ~ 지수 대기 시간)
+    PAGE_RETRY_MAX_DELAY: float = 10.0  # 재시도 최대 대기 시간 (초)
+    PAGE_RETRY_AFTER_MAX: float = 60.0  # 따를 수 있는 최대 Retry-After (초, 더 길면 재시도하지 않음)
+    PAGE_RETRY_BUDGET: int = 50  # 수집 실행 하나(스케줄러 job 실행, 백필 묶음, 수집 작업)에서 허용하는 재시도 횟수
+    CIRCUIT_BREAKER_ENABLED: bool = True  # 엔드포인트(sise_day, frgn, news, chart)별 Circuit Breaker
+    CIRCUIT_BREAKER_FAILURE_RATE: float = 0.5  # 최근 요청 중 이 비율 이상 실패하면 차단
+    CIRCUIT_BREAKER_MIN_REQUESTS: int = 10  # 실패 비율을 판단할 최소 요청 수
+    CIRCUIT_BREAKER_WINDOW: int = 20  # 실패 비율을 계산할 최근 요청 수
+    CIRCUIT_BREAKER_OPEN_SECONDS: float = 60.0  # 차단 후 확인 요청을 보내기까지의 시간 (초)
+    CIRCUIT_BREAKER_HALF_OPEN_PROBES: int = 2  # half-open에서 보낼 확인 요청 수 (모두 성공하면 차단 해제)
+
+    # 스케줄러 데이터 유형별 수집 job (가격 job 간격은 스케줄러 interval_seconds)
+    SCHEDULER_PRICES_ENABLED: bool = True  # 가격 수집 job 사용 여부
+    SCHEDULER_TRADING_ENABLED: bool = True  # 매매동향 수집 job 사용 여부
+    SCHEDULER_TRADING_INTERVAL: int = 600  # 매매동향 수집 간격 (초, 하루 한 번 바뀌므로 길게)
+    SCHEDULER_NEWS_ENABLED: bool = True  # 뉴스 수집 job 사용 여부
+    SCHEDULER_NEWS_INTERVAL: int = 300  # 뉴스 수집 간격 (초)
+    SCHEDULER_DURATION_HISTORY: int = 20  # job별로 기록하는 최근 실행 소요 시간 개수
+    SCHEDULER_ADAPTIVE_INTERVAL_ENABLED: bool = False  # 실행 시간/upstream 지연에 맞춰 job 실행 간격 자동 조정
+    SCHEDULER_ADAPTIVE_HEADROOM: float = 1.5  # 실행 간격을 최근 실행 시간의 몇 배 이상으로 유지할지
+    SCHEDULER_ADAPTIVE_MAX_FACTOR: float = 4.0  # 실행 간격 최대 배율 (설정 간격 기준)
+    SCHEDULER_ADAPTIVE_LATENCY_TARGET: float = 1.0  # upstream 평균 응답 지연 목표 (초, 넘으면 간격 늘림)
+
+    # 장 시간 기반 수집 주기 (KRX 거래 일정)
+    MARKET_CALENDAR_ENABLED: bool = True  # 장 시간에 따라 데이터 유형별로 수집 (False: 매 실행마다 모두 수집)
+    MARKET_CALENDAR_PATH: str = ""  # 거래 일정 데이터 파일 (비어 있으면 config/krx_calendar.json)
+    MARKET_PRICE_INTERVAL: int = 30  # 정규장 가격 수집 간격 (초)
+    MARKET_PRICE_FINAL_DELAY: int = 300  # 장 마감 후 종가 확정분 수집까지 대기 시간 (초)
+    MARKET_TRADING_FINAL_DELAY: int = 1800  # 장 마감 후 매매동향(frgn) 수집까지 대기 시간 (초)
+    MARKET_NEWS_INTERVAL_OPEN: int = 300  # 정규장 뉴스 수집 간격 (초)
+    MARKET_NEWS_INTERVAL_CLOSED: int = 1800  # 장외 시간 뉴스 수집 간격 (초)
+
+    # 조회 빈도 기반 수집 우선순위 (자주 조회되는 종목을 더 자주 갱신)
+    ACCESS_HEAT_ENABLED: bool = True  # API 종목 조회 빈도 기록
+    ACCESS_HEAT_BACKEND: str = "memory"  # 조회 빈도 저장소 (memory: 프로세스 메모리, redis: 여러 API 워커/노드와 수집 워커가 공유, COLLECTION_WORKER_ENABLED이면 redis)
+    ACCESS_HEAT_HALF_LIFE: float = 600.0  # 조회 빈도가 절반으로 줄어드는 시간 (초)
+    SCHEDULER_PRIORITY_ENABLED: bool = True  # 장 중 가격 수집 시 조회 빈도에 따라 종목별 수집 간격 조정
+    SCHEDULER_PRIORITY_HOT_HEAT: float = 1.0  # 이 값 이상이면 매 실행마다 수집
+    SCHEDULER_PRIORITY_MAX_BACKOFF: int = 8  # 조회되지 않는 종목의 최대 수집 간격 (실행 횟수)
+    SCHEDULER_TICK_BUDGET: int = 0  # 가격 수집 실행당 최대 종목 수 (0: 제한 없음, 넘는 종목은 다음 실행으로)
+
+    # 여러 API 워커/노드 간 수집 조정 (Redis)
+    SCHEDULER_COORDINATION: str = "none"  # none: 프로세스마다 모두 수집, leader: 리더 락을 가진 프로세스만 수집, sharded: 종목을 멤버끼리 나눠 수집
+    SCHEDULER_LOCK_TTL: int = 30  # 리더 락/멤버십 만료 시간 (초, heartbeat가 없으면 다른 프로세스가 이어받음)
+    SCHEDULER_HEARTBEAT_INTERVAL: int = 10  # 리더 락/멤버십 갱신 간격 (초, SCHEDULER_LOCK_TTL보다 충분히 짧게)
+    SCHEDULER_MEMBER_ID: str = ""  # 멤버 식별자 (비어 있으면 호스트명:PID)
+    SCHEDULER_HASH_REPLICAS: int = 64  # consistent hashing 멤버당 가상 노드 수
+
+    # 수집 워커 프로세스 (python -m app.worker)
+    COLLECTION_WORKER_ENABLED: bool = False  # True: API는 수집 작업을 Redis 큐에 넣기만 하고 스케줄러는 워커에서 실행
+    COLLECTION_JOB_TTL: int = 86400  # 수집 작업 상태 보관 시간 (초)
+    COLLECTION_JOB_MAX_WORKERS: int = 2  # 워커 없이 API 프로세스에서 수집 작업을 실행할 스레드 수
+    COLLECTION_JOB_LEASE_SECONDS: int = 120  # 워커가 실행 중인 작업의 임대 시간 (초, 연장이 없으면 워커가 죽은 것으로 보고 회수)
+    COLLECTION_JOB_MAX_ATTEMPTS: int = 3  # 임대가 만료된 작업을 다시 실행하는 최대 횟수 (처음 실행 포함)
+    COLLECTION_JOB_CLAIM_GRACE_SECONDS: float = 30.0  # 꺼냈지만 아직 임대가 없는 작업을 회수하기 전 기다리는 시간 (초)
+    WORKER_CONCURRENCY: int = 2  # 워커가 큐 작업을 동시에 실행할 스레드 수
+    WORKER_STATUS_INTERVAL: int = 10  # 워커가 스케줄러 상태를 게시하는 간격 (초)
+
+    # 과거 데이터 백필 (체크포인트 기반, /api/data/backfill)
+    BACKFILL_ENABLED: bool = True  # 백필 스레드 실행 여부 (COLLECTION_WORKER_ENABLED이면 워커에서 실행)
+    BACKFILL_PAGES_PER_MINUTE: float = 30.0  # 백필 분당 최대 페이지 요청 수 (실시간 수집 예산을 잠식하지 않도록 낮게)
+    BACKFILL_CHUNK_PAGES: int = 5  # 한 번에 저장하고 체크포인트를 기록할 페이지 수
+    BACKFILL_MAX_FAILURES: int = 5  # 연속 실패가 이 횟수에 이르면 failed로 멈춤 (다시 요청하면 체크포인트부터 재개)
+    BACKFILL_LEASE_SECONDS: int = 120  # 묶음 수집 중 체크포인트 점유 시간 (초, 중단된 프로세스의 체크포인트는 만료 후 이어받음)
+    BACKFILL_POLL_INTERVAL: float = 30.0  # 수집할 체크포인트가 없거나 실패한 뒤 다시 확인하는 간격 (초)
+
+    # 수집 데이터 버퍼 (write-behind, 여러 종목을 큰 트랜잭션으로 저장)
+    INGEST_BUFFER_ENABLED: bool = False  # 스케줄러 수집 데이터를 버퍼에 모아 단일 writer 스레드로 저장
+    INGEST_BUFFER_BATCH_ROWS: int = 5000  # 대기 행 수가 이 값에 도달하면 저장
+    INGEST_BUFFER_MAX_AGE: float = 2.0  # 가장 오래된 대기 행의 최대 대기 시간 (초)
+    INGEST_BUFFER_MAX_PENDING_ROWS: int = 50000  # 대기 행 수 상한 (도달하면 수집이 저장을 기다림)
+    INGEST_BUFFER_SUBMIT_TIMEOUT: float = 60.0  # 대기열 공간을 기다리는 최대 시간 (초)
+
+    # HTTP Client (수집기 공유 커넥션 풀)
+    HTTP_POOL_CONNECTIONS: int = 10  # 캐시할 호스트별 커넥션 풀 개수
+    HTTP_POOL_MAXSIZE: int = 10  # 호스트당 최대 유지 연결 수
+    HTTP_CONNECT_TIMEOUT: float = 3.05  # 연결 타임아웃 (초)
+    HTTP_READ_TIMEOUT: float = 10.0  # 읽기 타임아웃 (초)
+
+    # Async Collection Engine
+    ASYNC_COLLECTION_ENABLED: bool = False  # 스케줄러에서 asyncio 수집 엔진 사용 여부
+    ASYNC_MAX_CONNECTIONS: int = 32  # 전체 최대 연결 수 (요청 속도는 RATE_LIMIT_* 호스트 예산을 동기 수집과 공유)
 
     # Logging
     LOG_LEVEL: str = "INFO"
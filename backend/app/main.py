@@ -11,6 +11,10 @@ from app.config import settings
 from app.database import init_db, engine
 from app.api import stocks, prices, trading, news, refresh, chart, data_collection, scheduler
 from app.utils.redis import test_redis_connection, close_redis_client
+from app.utils.http_client import close_http_client
+from app.utils.page_archive import close_page_archive
+from app.scheduler.collection_jobs import close_collection_job_queue
+from app.scheduler.backfill import close_backfill_runner, get_backfill_runner
 from app.exceptions import BaseAPIException
 from app.schemas.response import ErrorResponse
 
@@ -83,6 +87,8 @@ app.include_router(news.router, prefix="/api/stocks", tags=["news"])
 app.include_router(chart.router, prefix="/api/stocks", tags=["chart"])
 app.include_router(refresh.router, tags=["refresh"])
 app.include_router(data_collection.router, prefix="/api/data/collect", tags=["data-collection"])
+app.include_router(data_collection.jobs_router, prefix="/api/data/jobs", tags=["data-collection"])
+app.include_router(data_collection.backfill_router, prefix="/api/data/backfill", tags=["data-collection"])
 app.include_router(scheduler.router, prefix="/api/scheduler", tags=["scheduler"])
 
 
@@ -95,6 +101,9 @@ async def startup_event():
         print("✅ Redis 연결 성공")
     else:
         print("⚠️ Redis 연결 실패 (캐싱 기능이 제한될 수 있습니다)")
+    # 과거 데이터 백필 (수집 워커를 사용하면 워커에서 실행)
+    if settings.BACKFILL_ENABLED and not settings.COLLECTION_WORKER_ENABLED:
+        get_backfill_runner().start()
 
 
 @app.on_event("shutdown")
@@ -110,7 +119,11 @@ async def shutdown_event():
     except Exception as e:
         print(f"⚠️ 스케줄러 종료 중 오류: {e}")
     
+    close_collection_job_queue()
+    close_backfill_runner()
     close_redis_client()
+    close_http_client()
+    close_page_archive()
 
 
 @app.get("/")
@@ -4,6 +4,9 @@ from app.models.stock import Stock
 from app.models.price import Price
 from app.models.trading_trend import TradingTrend
 from app.models.news import News
+from app.models.data_check import DataCheck
+from app.models.backfill_checkpoint import BackfillCheckpoint
+from app.models.scheduler_fence import SchedulerFence
 
-__all__ = ["Stock", "Price", "TradingTrend", "News"]
+__all__ = ["Stock", "Price", "TradingTrend", "News", "DataCheck", "BackfillCheckpoint", "SchedulerFence"]
 
@@ -0,0 +1,39 @@
+"""과거 데이터 백필 체크포인트 모델"""
+
+from sqlalchemy import Column, String, Integer, Float, Date, DateTime, ForeignKey
+
+from app.db_base import Base
+
+
+class BackfillCheckpoint(Base):
+    """
+    종목·데이터 유형별 과거 데이터 백필 진행 상태 테이블
+
+    페이지 묶음(chunk)을 저장할 때마다 같은 트랜잭션에서 다음 페이지를 기록하므로,
+    프로세스가 중단되어도 마지막으로 커밋된 페이지 다음부터 이어서 수집합니다.
+    """
+
+    __tablename__ = "backfill_checkpoints"
+
+    ticker = Column(String(10), ForeignKey("stocks.ticker", ondelete="CASCADE"), primary_key=True, comment="종목 코드")
+    data_type = Column(String(20), primary_key=True, comment="데이터 유형 (prices/trading)")
+    status = Column(String(20), nullable=False, comment="상태 (pending/running/completed/failed)")
+    start_date = Column(Date, nullable=False, comment="백필 목표 시작 날짜 (이 날짜까지 과거로 수집)")
+    next_page = Column(Integer, nullable=False, default=1, comment="다음에 수집할 페이지 번호")
+    pages_done = Column(Integer, nullable=False, default=0, comment="수집 완료한 페이지 수")
+    rows_saved = Column(Integer, nullable=False, default=0, comment="저장한 행 수")
+    oldest_date = Column(Date, nullable=True, comment="지금까지 수집한 가장 과거 날짜")
+    active_seconds = Column(Float, nullable=False, default=0.0, comment="수집에 걸린 누적 시간 (초, 남은 시간 추정용)")
+    failures = Column(Integer, nullable=False, default=0, comment="연속 실패 횟수")
+    last_error = Column(String(500), nullable=True, comment="마지막 오류 메시지")
+    owner = Column(String(100), nullable=True, comment="수집 중인 프로세스 (호스트명:PID)")
+    lease_until = Column(DateTime, nullable=True, comment="owner의 점유 만료 시각 (지나면 다른 프로세스가 이어받음)")
+    created_at = Column(DateTime, nullable=False, comment="요청 시각")
+    updated_at = Column(DateTime, nullable=False, comment="마지막 갱신 시각")
+    completed_at = Column(DateTime, nullable=True, comment="완료 시각")
+
+    def __repr__(self):
+        return (
+            f"<BackfillCheckpoint(ticker={self.ticker}, data_type={self.data_type}, "
+            f"status={self.status}, next_page={self.next_page})>"
+        )
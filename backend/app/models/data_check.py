@@ -0,0 +1,24 @@
+"""데이터 확인 시각 모델"""
+
+from sqlalchemy import Column, String, DateTime, ForeignKey
+
+from app.db_base import Base
+
+
+class DataCheck(Base):
+    """
+    종목·데이터 유형별 마지막 확인 시각 테이블
+
+    값이 바뀌지 않은 행은 다시 쓰지 않으므로(가격/매매동향의 timestamp는 마지막 변경 시각),
+    마지막으로 수집해 확인한 시각은 종목마다 이 테이블의 한 행에만 기록합니다.
+    """
+
+    __tablename__ = "data_checks"
+
+    ticker = Column(String(10), ForeignKey("stocks.ticker", ondelete="CASCADE"), primary_key=True, comment="종목 코드")
+    data_type = Column(String(20), primary_key=True, comment="데이터 유형 (prices/trading)")
+    last_checked_at = Column(DateTime, nullable=False, comment="마지막 확인 시각")
+    last_changed_at = Column(DateTime, nullable=True, comment="마지막으로 행이 삽입/갱신된 시각")
+
+    def __repr__(self):
+        return f"<DataCheck(ticker={self.ticker}, data_type={self.data_type}, last_checked_at={self.last_checked_at})>"
@@ -1,6 +1,6 @@
 """가격 데이터 모델"""
 
-from sqlalchemy import Column, BigInteger, Integer, String, Numeric, DateTime, Date, ForeignKey, Index
+from sqlalchemy import Column, BigInteger, Integer, String, Numeric, DateTime, Date, ForeignKey, Index, UniqueConstraint
 from sqlalchemy.sql import func
 from datetime import datetime
 
@@ -28,7 +28,8 @@ class Price(Base):
     previous_close = Column(Numeric(12, 2), nullable=True, comment="전일 종가")
 
     __table_args__ = (
-        Index("idx_price_ticker_date", "ticker", "date"),
+        # 종목·거래일당 한 행 (벌크 upsert 충돌 키)
+        UniqueConstraint("ticker", "date", name="uq_price_ticker_date"),
         Index("idx_price_ticker_timestamp", "ticker", "timestamp"),
     )
 
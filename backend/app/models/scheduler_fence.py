@@ -0,0 +1,23 @@
+"""스케줄러 fencing 토큰 모델"""
+
+from sqlalchemy import Column, String, BigInteger, DateTime
+
+from app.db_base import Base
+
+
+class SchedulerFence(Base):
+    """
+    리더 락별로 지금까지 커밋된 가장 큰 fencing 토큰 테이블
+
+    리더는 종목 트랜잭션마다 자기 토큰이 이 값 이상일 때만 갱신하고 같은 트랜잭션에서 커밋하므로,
+    새 리더가 더 큰 토큰으로 한 번이라도 커밋한 뒤에는 이전 리더의 트랜잭션은 커밋되지 않습니다.
+    """
+
+    __tablename__ = "scheduler_fences"
+
+    name = Column(String(50), primary_key=True, comment="락 이름")
+    token = Column(BigInteger, nullable=False, comment="커밋된 가장 큰 fencing 토큰")
+    updated_at = Column(DateTime, nullable=False, comment="마지막 갱신 시각")
+
+    def __repr__(self):
+        return f"<SchedulerFence(name={self.name}, token={self.token})>"
@@ -1,6 +1,6 @@
 """매매 동향 모델"""
 
-from sqlalchemy import Column, BigInteger, Integer, String, Numeric, DateTime, Date, ForeignKey, Index
+from sqlalchemy import Column, BigInteger, Integer, String, Numeric, DateTime, Date, ForeignKey, Index, UniqueConstraint
 from datetime import datetime
 
 from app.db_base import Base
@@ -22,7 +22,8 @@ class TradingTrend(Base):
     total = Column(Numeric(20, 0), nullable=True, comment="총 거래량")
 
     __table_args__ = (
-        Index("idx_trading_ticker_date", "ticker", "date"),
+        # 종목·거래일당 한 행 (벌크 upsert 충돌 키)
+        UniqueConstraint("ticker", "date", name="uq_trading_ticker_date"),
         Index("idx_trading_ticker_timestamp", "ticker", "timestamp"),
     )
 
@@ -0,0 +1,485 @@
+"""
+과거 데이터 백필
+
+수집 API의 days<=365 제한 없이 여러 해의 가격/매매동향 이력을 채웁니다.
+sise_day/frgn 페이지를 chunk_pages개씩 묶어 저장하고, 같은 트랜잭션에서 backfill_checkpoints에
+다음 페이지를 기록하므로 실패하거나 프로세스가 재시작되어도 마지막으로 커밋된 묶음 다음부터 이어서 수집합니다.
+
+- 요청마다 모든 수집 경로가 공유하는 호스트 예산(get_rate_limiter())에서 토큰을 얻고, 실시간 스케줄러의 몫을
+  잠식하지 않도록 그 안에서 하위 제한(BACKFILL_PAGES_PER_MINUTE)으로 더 느리게 수집하며,
+  한 번에 묶음 하나만 처리하고 가장 오래전에 갱신된 체크포인트부터 돌아가며 진행합니다.
+- 묶음을 수집하는 동안 체크포인트를 owner/lease_until로 점유하므로 여러 프로세스가 실행해도 같은 체크포인트를
+  동시에 수집하지 않고, 중단된 프로세스가 점유한 체크포인트는 점유가 만료되면 다른(또는 재시작한) 프로세스가 이어받습니다.
+- 묶음 수집이 실패하면 그 묶음만 롤백하고 poll_interval 뒤에 같은 페이지부터 다시 시도하며,
+  max_failures번 연속 실패하면 failed로 멈춥니다 (다시 요청하면 체크포인트부터 재개).
+"""
+
+import logging
+import threading
+import time
+from collections import Counter
+from datetime import date, datetime, timedelta
+from typing import Callable, List, Optional
+
+from sqlalchemy import or_
+from sqlalchemy.orm import Session
+
+from app.collectors.finance_collector import DATA_TYPE_PRICES, DATA_TYPE_TRADING, FinanceCollector
+from app.config import settings
+from app.database import SessionLocal
+from app.models.backfill_checkpoint import BackfillCheckpoint
+from app.scheduler.coordination import default_member_id
+from app.utils.rate_limiter import RateLimiter, get_rate_limiter
+
+logger = logging.getLogger(__name__)
+
+# 백필 상태
+BACKFILL_PENDING = "pending"
+BACKFILL_RUNNING = "running"
+BACKFILL_COMPLETED = "completed"
+BACKFILL_FAILED = "failed"
+
+# 수집 중인 상태 (점유 대상)
+ACTIVE_STATUSES = (BACKFILL_PENDING, BACKFILL_RUNNING)
+
+BACKFILL_DATA_TYPES = (DATA_TYPE_PRICES, DATA_TYPE_TRADING)
+
+# 체크포인트에 기록하는 오류 메시지 최대 길이
+MAX_ERROR_LENGTH = 500
+
+
+def checkpoint_progress(checkpoint: BackfillCheckpoint, active_count: int = 1, today: Optional[date] = None) -> dict:
+    """
+    체크포인트 진행률과 남은 시간 추정
+
+    진행률은 목표 기간(start_date~오늘) 중 수집한 가장 과거 날짜까지의 비율이며,
+    남은 시간은 지금까지의 수집 속도(active_seconds)로 추정합니다. 수집 중인 체크포인트는
+    묶음을 돌아가며 처리하므로 남은 시간에 active_count를 곱합니다.
+
+    Args:
+        checkpoint: 백필 체크포인트
+        active_count: 수집 중인 체크포인트 수
+        today: 기준 날짜 (기본: 오늘)
+
+    Returns:
+        진행 상태 딕셔너리
+    """
+    today = today or date.today()
+    span = max((today - checkpoint.start_date).days, 1)
+    if checkpoint.status == BACKFILL_COMPLETED:
+        progress = 1.0
+    elif checkpoint.oldest_date is not None:
+        progress = min(max((today - checkpoint.oldest_date).days / span, 0.0), 1.0)
+    else:
+        progress = 0.0
+
+    eta_seconds = None
+    if checkpoint.status == BACKFILL_COMPLETED:
+        eta_seconds = 0.0
+    elif checkpoint.status in ACTIVE_STATUSES and progress > 0 and checkpoint.active_seconds:
+        eta_seconds = round(checkpoint.active_seconds * (1 - progress) / progress * max(active_count, 1), 1)
+
+    return {
+        'ticker': checkpoint.ticker,
+        'data_type': checkpoint.data_type,
+        'status': checkpoint.status,
+        'start_date': checkpoint.start_date.isoformat(),
+        'oldest_date': checkpoint.oldest_date.isoformat() if checkpoint.oldest_date else None,
+        'next_page': checkpoint.next_page,
+        'pages_done': checkpoint.pages_done,
+        'rows_saved': checkpoint.rows_saved,
+        'progress': round(progress, 4),
+        'eta_seconds': eta_seconds,
+        'failures': checkpoint.failures,
+        'last_error': checkpoint.last_error,
+        'created_at': checkpoint.created_at.isoformat(),
+        'updated_at': checkpoint.updated_at.isoformat(),
+        'completed_at': checkpoint.completed_at.isoformat() if checkpoint.completed_at else None,
+    }
+
+
+def request_backfill(
+    db: Session,
+    ticker: str,
+    data_type: str,
+    start_date: date,
+    restart: bool = False,
+) -> BackfillCheckpoint:
+    """
+    백필 요청 (체크포인트 생성 또는 재개)
+
+    체크포인트가 이미 있으면 저장된 페이지부터 이어서 수집하고, 더 과거의 start_date를 요청하면
+    완료된 체크포인트도 이어서 수집합니다. restart이면 첫 페이지부터 다시 수집합니다.
+
+    Args:
+        db: 데이터베이스 세션
+        ticker: 종목 코드
+        data_type: DATA_TYPE_PRICES 또는 DATA_TYPE_TRADING
+        start_date: 이 날짜까지 과거로 수집
+        restart: 체크포인트를 버리고 처음부터 수집할지 여부
+
+    Returns:
+        BackfillCheckpoint
+    """
+    if data_type not in BACKFILL_DATA_TYPES:
+        raise ValueError(f"Unknown backfill data type: {data_type}")
+
+    now = datetime.now()
+    checkpoint = db.get(BackfillCheckpoint, (ticker, data_type))
+    if checkpoint is None:
+        checkpoint = BackfillCheckpoint(ticker=ticker, data_type=data_type, created_at=now)
+        db.add(checkpoint)
+        restart = True
+
+    if restart:
+        checkpoint.start_date = start_date
+        checkpoint.next_page = 1
+        checkpoint.pages_done = 0
+        checkpoint.rows_saved = 0
+        checkpoint.oldest_date = None
+        checkpoint.active_seconds = 0.0
+        checkpoint.status = BACKFILL_PENDING
+    elif start_date < checkpoint.start_date:
+        checkpoint.start_date = start_date
+        checkpoint.status = BACKFILL_PENDING
+    elif checkpoint.status == BACKFILL_FAILED:
+        checkpoint.status = BACKFILL_PENDING
+
+    if checkpoint.status == BACKFILL_PENDING:
+        checkpoint.failures = 0
+        checkpoint.last_error = None
+        checkpoint.completed_at = None
+    checkpoint.updated_at = now
+    db.commit()
+
+    logger.info(
+        f"Backfill requested: {data_type} {ticker} back to {checkpoint.start_date} "
+        f"(status: {checkpoint.status}, next page: {checkpoint.next_page})"
+    )
+    return checkpoint
+
+
+class BackfillRunner:
+    """
+    과거 데이터 백필 실행기
+
+    Example:
+        request_backfill(db, "487240", DATA_TYPE_PRICES, date(2015, 1, 1))
+        runner = get_backfill_runner()
+        runner.start()    # 백그라운드 스레드에서 체크포인트를 돌아가며 수집
+    """
+
+    def __init__(
+        self,
+        pages_per_minute: float = 30.0,
+        chunk_pages: int = 5,
+        max_failures: int = 5,
+        lease_seconds: int = 120,
+        poll_interval: float = 30.0,
+        collector: Optional[FinanceCollector] = None,
+        session_factory: Callable[[], Session] = SessionLocal,
+        owner: Optional[str] = None,
+    ):
+        """
+        Args:
+            pages_per_minute: 분당 최대 페이지 요청 수 (실시간 수집보다 낮게)
+            chunk_pages: 한 번에 저장하고 체크포인트를 기록할 페이지 수
+            max_failures: 연속 실패가 이 횟수에 이르면 failed로 멈춤
+            lease_seconds: 묶음 수집 중 체크포인트 점유 시간 (초, 묶음 수집 시간보다 길게)
+            poll_interval: 수집할 체크포인트가 없거나 실패한 뒤 다시 확인하는 간격 (초)
+            collector: 페이지 수집기 (None이면 전역 호스트 예산 안에서 pages_per_minute로 더 제한하는
+                FinanceCollector 생성)
+            session_factory: 묶음마다 새 DB 세션을 만드는 함수
+            owner: 점유자 식별자 (None이면 호스트명:PID)
+        """
+        self.pages_per_minute = pages_per_minute
+        self.chunk_pages = max(1, chunk_pages)
+        self.max_failures = max(1, max_failures)
+        self.lease_seconds = lease_seconds
+        self.poll_interval = poll_interval
+        self.collector = collector or FinanceCollector(
+            rate_limiter=RateLimiter(min_interval=60.0 / pages_per_minute, parent=get_rate_limiter())
+        )
+        self.session_factory = session_factory
+        self.owner = owner or default_member_id()
+        self._stats_lock = threading.Lock()
+        self._stats: Counter = Counter()
+        self._wake_event = threading.Event()
+        self._stop_event = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    @classmethod
+    def from_settings(cls) -> 'BackfillRunner':
+        """설정값으로 생성"""
+        return cls(
+            pages_per_minute=settings.BACKFILL_PAGES_PER_MINUTE,
+            chunk_pages=settings.BACKFILL_CHUNK_PAGES,
+            max_failures=settings.BACKFILL_MAX_FAILURES,
+            lease_seconds=settings.BACKFILL_LEASE_SECONDS,
+            poll_interval=settings.BACKFILL_POLL_INTERVAL,
+        )
+
+    def _claim(self, db: Session) -> Optional[BackfillCheckpoint]:
+        """
+        다음에 수집할 체크포인트 점유 (가장 오래전에 갱신된 것부터)
+
+        Returns:
+            점유한 체크포인트, 수집할 체크포인트가 없으면 None
+        """
+        now = datetime.now()
+        claimable = or_(
+            BackfillCheckpoint.owner.is_(None),
+            BackfillCheckpoint.owner == self.owner,
+            BackfillCheckpoint.lease_until < now,
+        )
+        candidates = (
+            db.query(BackfillCheckpoint.ticker, BackfillCheckpoint.data_type)
+            .filter(BackfillCheckpoint.status.in_(ACTIVE_STATUSES), claimable)
+            .order_by(BackfillCheckpoint.updated_at)
+            .limit(10)
+            .all()
+        )
+        for ticker, data_type in candidates:
+            # 조건부 UPDATE로 점유 (다른 프로세스가 먼저 점유했으면 0행)
+            claimed = (
+                db.query(BackfillCheckpoint)
+                .filter(
+                    BackfillCheckpoint.ticker == ticker,
+                    BackfillCheckpoint.data_type == data_type,
+                    BackfillCheckpoint.status.in_(ACTIVE_STATUSES),
+                    claimable,
+                )
+                .update(
+                    {
+                        'owner': self.owner,
+                        'lease_until': now + timedelta(seconds=self.lease_seconds),
+                        'status': BACKFILL_RUNNING,
+                    },
+                    synchronize_session=False,
+                )
+            )
+            db.commit()
+            if claimed:
+                return db.get(BackfillCheckpoint, (ticker, data_type), populate_existing=True)
+        return None
+
+    def _write(self, db: Session, data_type: str, rows: List[dict]) -> int:
+        """페이지 행 저장 (커밋하지 않음)"""
+        if data_type == DATA_TYPE_PRICES:
+            return self.collector.write_price_data(db, rows).total
+        return self.collector.write_trading_flow_data(db, rows).total
+
+    def run_chunk(self, db: Session, checkpoint: BackfillCheckpoint) -> bool:
+        """
+        점유한 체크포인트의 다음 묶음 수집
+
+        묶음의 행 저장과 체크포인트 갱신을 한 트랜잭션으로 커밋하고, 실패하면 묶음 전체를 롤백한 뒤
+        실패 횟수와 오류만 기록합니다. 다음 조건에서 완료합니다.
+        - 페이지가 비어 있거나 테이블이 없음 (이력의 끝)
+        - 페이지의 가장 과거 날짜가 이미 저장한 가장 과거 날짜보다 과거가 아님 (마지막 페이지를 넘으면 같은 페이지 반환)
+        - start_date보다 과거 행이 나옴 (그 페이지는 다음 확장 요청에서 다시 수집하도록 next_page 유지)
+
+        Args:
+            db: 데이터베이스 세션
+            checkpoint: _claim()으로 점유한 체크포인트
+
+        Returns:
+            묶음 수집 성공 여부
+        """
+        started = time.monotonic()
+        # 묶음이 재시도 예산의 실행 단위 (실패한 페이지는 그 페이지만 재시도하고, 소진되면 다음 묶음에서 재개)
+        retry_budget = self.collector.retry_budget
+        retry_budget.reset()
+        page = checkpoint.next_page
+        oldest = checkpoint.oldest_date
+        pages = 0
+        rows_saved = 0
+        done = False
+
+        try:
+            for _ in range(self.chunk_pages):
+                page_rows = self.collector.fetch_history_page(checkpoint.data_type, checkpoint.ticker, page)
+                if not page_rows:
+                    done = True
+                    break
+
+                page_oldest = min(row['date'] for row in page_rows)
+                if oldest is not None and page_oldest >= oldest:
+                    done = True
+                    break
+
+                kept = [row for row in page_rows if row['date'] >= checkpoint.start_date]
+                if kept:
+                    rows_saved += self._write(db, checkpoint.data_type, kept)
+                    kept_oldest = min(row['date'] for row in kept)
+                    oldest = kept_oldest if oldest is None else min(oldest, kept_oldest)
+                pages += 1
+                if len(kept) < len(page_rows):
+                    done = True
+                    break
+                page += 1
+
+            now = datetime.now()
+            checkpoint.next_page = page
+            checkpoint.pages_done += pages
+            checkpoint.rows_saved += rows_saved
+            checkpoint.oldest_date = oldest
+            checkpoint.active_seconds += time.monotonic() - started
+            checkpoint.failures = 0
+            checkpoint.last_error = None
+            checkpoint.status = BACKFILL_COMPLETED if done else BACKFILL_RUNNING
+            checkpoint.completed_at = now if done else None
+            checkpoint.owner = None
+            checkpoint.lease_until = None
+            checkpoint.updated_at = now
+            db.commit()
+        except Exception as e:
+            db.rollback()
+            logger.warning(f"Backfill chunk failed for {checkpoint.data_type} {checkpoint.ticker} at page {page}: {e}")
+            self._record_failure(db, checkpoint, e, time.monotonic() - started)
+            self._count(page_retries=retry_budget.used)
+            return False
+
+        self._count(chunks=1, pages=pages, rows=rows_saved, completed=int(done), page_retries=retry_budget.used)
+        if done:
+            logger.info(
+                f"Backfill completed: {checkpoint.data_type} {checkpoint.ticker} "
+                f"({checkpoint.pages_done} pages, {checkpoint.rows_saved} rows, oldest: {checkpoint.oldest_date})"
+            )
+        return True
+
+    def _record_failure(self, db: Session, checkpoint: BackfillCheckpoint, error: Exception, elapsed: float) -> None:
+        """묶음 실패 기록 (체크포인트의 페이지는 그대로 두고 점유 해제)"""
+        try:
+            checkpoint.failures += 1
+            checkpoint.last_error = str(error)[:MAX_ERROR_LENGTH]
+            checkpoint.active_seconds += elapsed
+            if checkpoint.failures >= self.max_failures:
+                checkpoint.status = BACKFILL_FAILED
+                logger.error(
+                    f"Backfill failed {checkpoint.failures} times in a row for "
+                    f"{checkpoint.data_type} {checkpoint.ticker}, giving up at page {checkpoint.next_page}"
+                )
+            checkpoint.owner = None
+            checkpoint.lease_until = None
+            checkpoint.updated_at = datetime.now()
+            db.commit()
+        except Exception as e:
+            db.rollback()
+            logger.error(f"Failed to record backfill failure for {checkpoint.ticker}: {e}")
+        self._count(failures=1)
+
+    def run_pending(self, max_chunks: Optional[int] = None) -> int:
+        """
+        수집할 체크포인트를 묶음 단위로 돌아가며 수집
+
+        수집할 체크포인트가 없거나, 묶음이 실패하거나(재시도는 다음 호출에서), stop()이 호출될 때까지 실행합니다.
+
+        Args:
+            max_chunks: 최대 묶음 수 (None이면 제한 없음)
+
+        Returns:
+            처리한 묶음 수
+        """
+        chunks = 0
+        while not self._stop_event.is_set() and (max_chunks is None or chunks < max_chunks):
+            db = self.session_factory()
+            try:
+                checkpoint = self._claim(db)
+                if checkpoint is None:
+                    break
+                chunks += 1
+                if not self.run_chunk(db, checkpoint):
+                    break
+            finally:
+                db.close()
+        return chunks
+
+    def _count(self, **counts: int) -> None:
+        with self._stats_lock:
+            self._stats.update(counts)
+
+    def _loop(self) -> None:
+        """백필 스레드 본문"""
+        while not self._stop_event.is_set():
+            try:
+                self.run_pending()
+            except Exception as e:
+                logger.error(f"Backfill runner error: {e}", exc_info=True)
+            self._wake_event.wait(self.poll_interval)
+            self._wake_event.clear()
+
+    def wake(self) -> None:
+        """대기 중인 백필 스레드를 깨움 (새 요청 즉시 처리)"""
+        self._wake_event.set()
+
+    def start(self) -> None:
+        """백필 스레드 시작 (이미 실행 중이면 무시)"""
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._stop_event.clear()
+        self._thread = threading.Thread(target=self._loop, name="backfill", daemon=True)
+        self._thread.start()
+        logger.info(f"Backfill runner started ({self.pages_per_minute} pages/min, {self.chunk_pages} pages/chunk)")
+
+    def stop(self, timeout: float = 10.0) -> None:
+        """백필 스레드 중지 (수집 중인 묶음은 커밋되지 않으면 다음 실행에서 다시 수집)"""
+        self._stop_event.set()
+        self._wake_event.set()
+        if self._thread is not None:
+            self._thread.join(timeout=timeout)
+            self._thread = None
+
+    @property
+    def is_running(self) -> bool:
+        """백필 스레드 실행 여부"""
+        return self._thread is not None and self._thread.is_alive()
+
+    def get_status(self) -> dict:
+        """실행기 상태와 누적 통계"""
+        with self._stats_lock:
+            stats = dict(self._stats)
+        return {
+            'is_running': self.is_running,
+            'owner': self.owner,
+            'pages_per_minute': self.pages_per_minute,
+            'chunk_pages': self.chunk_pages,
+            'chunks': stats.get('chunks', 0),
+            'pages': stats.get('pages', 0),
+            'rows': stats.get('rows', 0),
+            'completed': stats.get('completed', 0),
+            'failures': stats.get('failures', 0),
+            'page_retries': stats.get('page_retries', 0),
+        }
+
+
+# 전역 백필 실행기 인스턴스
+_backfill_runner: Optional[BackfillRunner] = None
+_backfill_runner_lock = threading.Lock()
+
+
+def get_backfill_runner() -> BackfillRunner:
+    """
+    전역 백필 실행기 반환 (싱글톤 패턴)
+
+    Returns:
+        BackfillRunner 인스턴스
+    """
+    global _backfill_runner
+
+    if _backfill_runner is None:
+        with _backfill_runner_lock:
+            if _backfill_runner is None:
+                _backfill_runner = BackfillRunner.from_settings()
+
+    return _backfill_runner
+
+
+def close_backfill_runner() -> None:
+    """전역 백필 실행기 중지"""
+    global _backfill_runner
+
+    with _backfill_runner_lock:
+        if _backfill_runner is not None:
+            _backfill_runner.stop()
+        _backfill_runner = None
@@ -0,0 +1,488 @@
+"""
+온디맨드 수집 작업 큐
+
+API는 수집 요청을 작업으로 만들어 큐에 넣고 작업 ID를 바로 반환하며, 작업 상태는 ID로 조회합니다.
+같은 종목/유형/파라미터의 작업이 대기 중이거나 실행 중이면 새 작업을 만들지 않고 그 작업을 반환합니다.
+
+- CollectionJobQueue: Redis 큐. 별도 수집 워커 프로세스(python -m app.worker)가 꺼내 실행
+  (큐는 Redis 리스트, 작업 상태는 작업마다 JSON 문자열 키로 job_ttl 동안 보관)
+  꺼낸 작업은 처리 중 리스트로 옮기고 임대(lease) 키를 두며, 워커가 실행 중 임대를 연장합니다.
+  워커가 죽어 임대가 만료된 작업은 reclaim_expired()가 다시 큐에 넣습니다 (최대 max_attempts번).
+- LocalCollectionJobQueue: API 프로세스의 스레드 풀에서 실행 (COLLECTION_WORKER_ENABLED=false)
+"""
+
+import hashlib
+import json
+import logging
+import threading
+import time
+import uuid
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, datetime
+from typing import Callable, Deque, Dict, Iterable, Optional, Tuple
+
+from app.collectors.finance_collector import DATA_TYPE_PRICES, DATA_TYPE_TRADING, FinanceCollector
+from app.collectors.news_collector import DATA_TYPE_NEWS, NewsCollector
+from app.config import settings
+from app.database import SessionLocal
+from app.utils.redis import get_redis_client
+
+logger = logging.getLogger(__name__)
+
+# 작업 상태
+JOB_QUEUED = "queued"
+JOB_RUNNING = "running"
+JOB_SUCCEEDED = "succeeded"
+JOB_FAILED = "failed"
+
+JOB_TYPES = (DATA_TYPE_PRICES, DATA_TYPE_TRADING, DATA_TYPE_NEWS)
+
+# Redis 키
+JOB_QUEUE_KEY = "collection_jobs:queue"
+# 워커가 꺼내 실행 중인 작업 ID 리스트
+JOB_PROCESSING_KEY = "collection_jobs:processing"
+# 실행 중인 작업의 임대 (만료되면 워커가 죽은 것으로 간주)
+JOB_LEASE_PREFIX = "collection_jobs:lease"
+# 처리 중 리스트에서 임대 없이 처음 발견한 시각 (꺼낸 직후 임대를 잡기 전인 작업을 회수하지 않도록)
+JOB_UNLEASED_PREFIX = "collection_jobs:unleased"
+JOB_KEY_PREFIX = "collection_job"
+# 같은 요청의 진행 중인 작업 ID
+JOB_INFLIGHT_PREFIX = "collection_jobs:inflight"
+# 수집 워커가 게시하는 스케줄러 상태
+WORKER_STATUS_KEY = "collection_worker:status"
+
+
+def run_collection_job(job_type: str, ticker: str, params: dict) -> dict:
+    """
+    수집 작업 하나를 전용 세션으로 실행
+
+    Args:
+        job_type: DATA_TYPE_PRICES, DATA_TYPE_TRADING, DATA_TYPE_NEWS
+        ticker: 종목 코드
+        params: 작업 파라미터 (prices: days, incremental / trading: days, start_date, end_date / news: max_items)
+
+    Returns:
+        {'saved_count': 저장된 레코드 수}
+    """
+    db = SessionLocal()
+    try:
+        if job_type == DATA_TYPE_PRICES:
+            saved_count = FinanceCollector().collect_and_save_prices(
+                db, ticker, params['days'], incremental=params.get('incremental', False)
+            )
+        elif job_type == DATA_TYPE_TRADING:
+            start_date = params.get('start_date')
+            end_date = params.get('end_date')
+            saved_count = FinanceCollector().collect_and_save_trading_flow(
+                db,
+                ticker,
+                params['days'],
+                date.fromisoformat(start_date) if start_date else None,
+                date.fromisoformat(end_date) if end_date else None,
+            )
+        elif job_type == DATA_TYPE_NEWS:
+            saved_count = NewsCollector().collect_and_save_news(db, ticker, params['max_items'])
+        else:
+            raise ValueError(f"Unknown collection job type: {job_type}")
+        db.commit()
+        return {'saved_count': saved_count}
+    except Exception:
+        db.rollback()
+        raise
+    finally:
+        db.close()
+
+
+def job_dedup_key(job_type: str, ticker: str, params: dict) -> str:
+    """같은 요청인지 판단하는 키 (유형, 종목, 파라미터)"""
+    canonical = json.dumps([job_type, ticker, params], sort_keys=True)
+    return hashlib.sha1(canonical.encode('utf-8')).hexdigest()
+
+
+def _new_job(job_type: str, ticker: str, params: dict) -> dict:
+    """대기 상태의 작업 레코드 생성"""
+    if job_type not in JOB_TYPES:
+        raise ValueError(f"Unknown collection job type: {job_type}")
+    return {
+        'id': uuid.uuid4().hex,
+        'type': job_type,
+        'ticker': ticker,
+        'params': params,
+        'status': JOB_QUEUED,
+        'created_at': datetime.now().isoformat(),
+        'started_at': None,
+        'finished_at': None,
+        'result': None,
+        'error': None,
+    }
+
+
+def _finish_job(job: dict, result: Optional[dict], error: Optional[str]) -> None:
+    """작업 레코드에 완료/실패 기록"""
+    job['status'] = JOB_FAILED if error is not None else JOB_SUCCEEDED
+    job['finished_at'] = datetime.now().isoformat()
+    job['result'] = result
+    job['error'] = error
+
+
+class CollectionJobQueue:
+    """
+    Redis 수집 작업 큐
+
+    Example:
+        queue = get_collection_job_queue()
+        job = queue.enqueue("prices", "487240", {"days": 10})   # API
+        job = queue.dequeue(timeout=5)                           # 수집 워커
+        queue.extend_leases([job['id']])                         # 실행 중 주기적으로
+        queue.finish(job['id'], result={'saved_count': 10})
+        queue.reclaim_expired()                                  # 주기적으로 (죽은 워커의 작업 회수)
+    """
+
+    def __init__(
+        self,
+        client=None,
+        job_ttl: int = 86400,
+        lease_seconds: int = 120,
+        max_attempts: int = 3,
+        claim_grace_seconds: float = 0.0,
+    ):
+        """
+        Args:
+            client: Redis 클라이언트 (None이면 get_redis_client() 사용)
+            job_ttl: 작업 상태 보관 시간 (초)
+            lease_seconds: 실행 중인 작업의 임대 시간 (초, 이 시간 동안 연장이 없으면 회수)
+            max_attempts: 임대가 만료된 작업을 다시 실행하는 최대 횟수 (처음 실행 포함)
+            claim_grace_seconds: 처리 중 리스트로 옮겨졌지만 아직 임대가 없는 작업을 회수하기 전 기다리는 시간 (초)
+        """
+        self._client = client
+        self.job_ttl = job_ttl
+        self.lease_seconds = lease_seconds
+        self.max_attempts = max(1, max_attempts)
+        self.claim_grace_seconds = claim_grace_seconds
+
+    @classmethod
+    def from_settings(cls, **kwargs) -> 'CollectionJobQueue':
+        """설정값으로 Redis 작업 큐 생성"""
+        options = {
+            'job_ttl': settings.COLLECTION_JOB_TTL,
+            'lease_seconds': settings.COLLECTION_JOB_LEASE_SECONDS,
+            'max_attempts': settings.COLLECTION_JOB_MAX_ATTEMPTS,
+            'claim_grace_seconds': settings.COLLECTION_JOB_CLAIM_GRACE_SECONDS,
+        }
+        options.update(kwargs)
+        return cls(**options)
+
+    @property
+    def client(self):
+        if self._client is None:
+            self._client = get_redis_client()
+        return self._client
+
+    @staticmethod
+    def _key(job_id: str) -> str:
+        return f"{JOB_KEY_PREFIX}:{job_id}"
+
+    @staticmethod
+    def _lease_key(job_id: str) -> str:
+        return f"{JOB_LEASE_PREFIX}:{job_id}"
+
+    @staticmethod
+    def _unleased_key(job_id: str) -> str:
+        return f"{JOB_UNLEASED_PREFIX}:{job_id}"
+
+    def _save(self, job: dict) -> None:
+        self.client.set(self._key(job['id']), json.dumps(job), ex=self.job_ttl)
+
+    def get(self, job_id: str) -> Optional[dict]:
+        """작업 상태 조회 (없거나 만료되었으면 None)"""
+        raw = self.client.get(self._key(job_id))
+        return json.loads(raw) if raw else None
+
+    def enqueue(self, job_type: str, ticker: str, params: dict) -> dict:
+        """
+        수집 작업 등록 (같은 요청의 작업이 진행 중이면 그 작업 반환)
+
+        진행 중인 작업 ID는 SET NX 키로 기록하며, 작업이 끝나면 finish()가 지웁니다.
+        실행 중이지만 임대가 만료된 작업(워커가 죽음)에는 합치지 않고 새 작업을 만듭니다.
+
+        Args:
+            job_type: DATA_TYPE_PRICES, DATA_TYPE_TRADING, DATA_TYPE_NEWS
+            ticker: 종목 코드
+            params: 작업 파라미터 (JSON으로 저장 가능한 값)
+
+        Returns:
+            작업 상태 딕셔너리 (coalesced: 진행 중인 작업을 반환했는지 여부)
+        """
+        job = _new_job(job_type, ticker, params)
+        job['dedup_key'] = f"{JOB_INFLIGHT_PREFIX}:{job_dedup_key(job_type, ticker, params)}"
+        self._save(job)
+
+        # 진행 중인 작업 ID 키가 이미 끝난 작업을 가리키면 한 번 지우고 다시 시도
+        for _ in range(2):
+            if self.client.set(job['dedup_key'], job['id'], nx=True, ex=self.job_ttl):
+                break
+            existing_id = self.client.get(job['dedup_key'])
+            existing = self.get(existing_id) if existing_id else None
+            if existing is not None and not self._is_stale(existing) and existing['status'] in (JOB_QUEUED, JOB_RUNNING):
+                self.client.delete(self._key(job['id']))
+                logger.info(f"Collection job coalesced: {job_type} {ticker} ({existing['id']})")
+                return {**existing, 'coalesced': True}
+            self.client.delete(job['dedup_key'])
+
+        self.client.lpush(JOB_QUEUE_KEY, job['id'])
+        logger.info(f"Collection job queued: {job_type} {ticker} ({job['id']})")
+        return {**job, 'coalesced': False}
+
+    def _is_stale(self, job: dict) -> bool:
+        """실행 중으로 표시되었지만 임대가 만료된 작업인지 여부 (실행하던 워커가 죽음)"""
+        return job['status'] == JOB_RUNNING and not self.client.exists(self._lease_key(job['id']))
+
+    def dequeue(self, timeout: int = 5) -> Optional[dict]:
+        """
+        다음 작업을 처리 중 리스트로 옮기고 임대를 잡은 뒤 실행 중으로 표시 (수집 워커에서 호출)
+
+        Args:
+            timeout: 작업이 없을 때 기다리는 시간 (초)
+
+        Returns:
+            작업 상태 딕셔너리 (기다려도 없으면 None)
+        """
+        # 꺼내는 것과 동시에 처리 중 리스트에 남겨 워커가 죽어도 작업을 잃지 않음
+        job_id = self.client.blmove(JOB_QUEUE_KEY, JOB_PROCESSING_KEY, timeout, src='RIGHT', dest='LEFT')
+        if job_id is None:
+            return None
+        self.client.set(self._lease_key(job_id), 1, ex=self.lease_seconds)
+        job = self.get(job_id)
+        if job is None:
+            logger.warning(f"Collection job {job_id} expired before it was run")
+            self._release(job_id)
+            return None
+        job['status'] = JOB_RUNNING
+        job['started_at'] = datetime.now().isoformat()
+        job['attempts'] = job.get('attempts', 0) + 1
+        self._save(job)
+        return job
+
+    def extend_leases(self, job_ids: Iterable[str]) -> None:
+        """실행 중인 작업의 임대 연장 (수집 워커가 lease_seconds보다 짧은 간격으로 호출)"""
+        for job_id in job_ids:
+            self.client.set(self._lease_key(job_id), 1, ex=self.lease_seconds)
+
+    def _release(self, job_id: str) -> None:
+        """처리 중 리스트와 임대에서 작업 제거"""
+        self.client.lrem(JOB_PROCESSING_KEY, 0, job_id)
+        self.client.delete(self._lease_key(job_id))
+        self.client.delete(self._unleased_key(job_id))
+
+    def _claim_grace_passed(self, job_id: str) -> bool:
+        """
+        임대 없이 처리 중 리스트에 있는 대기 작업을 회수해도 되는지 여부
+
+        dequeue()는 BLMOVE로 옮긴 뒤 임대를 잡으므로 그 사이의 작업에는 임대가 없습니다.
+        처음 발견한 시각을 기록하고 claim_grace_seconds가 지난 뒤에만 회수합니다.
+        """
+        if self.claim_grace_seconds <= 0:
+            return True
+        key = self._unleased_key(job_id)
+        self.client.set(key, time.time(), nx=True, ex=self.job_ttl)
+        first_seen = self.client.get(key)
+        return first_seen is not None and time.time() - float(first_seen) >= self.claim_grace_seconds
+
+    def reclaim_expired(self) -> int:
+        """
+        임대가 만료된 작업 회수 (워커가 죽어 끝나지 않은 작업)
+
+        같은 요청이 아직 이 작업을 가리키고 시도 횟수가 max_attempts 미만이면 큐 앞쪽에 다시 넣고,
+        아니면 실패로 기록합니다. 여러 워커가 동시에 호출해도 처리 중 리스트에서 제거에 성공한
+        워커 하나만 회수합니다. 아직 실행 중으로 표시되지 않은 작업(다른 워커가 꺼내는 중일 수 있음)은
+        임대 없이 claim_grace_seconds 동안 남아 있어야 회수합니다.
+
+        Returns:
+            다시 큐에 넣은 작업 수
+        """
+        requeued = 0
+        for job_id in self.client.lrange(JOB_PROCESSING_KEY, 0, -1):
+            if self.client.exists(self._lease_key(job_id)):
+                continue
+            job = self.get(job_id)
+            # dequeue()는 임대를 잡은 뒤 실행 중으로 표시하므로, 대기 상태면 임대를 잡기 전일 수 있음
+            if job is not None and job['status'] == JOB_QUEUED and not self._claim_grace_passed(job_id):
+                continue
+            if not self.client.lrem(JOB_PROCESSING_KEY, 1, job_id):
+                continue  # 다른 워커가 먼저 회수했거나 방금 끝남
+            self.client.delete(self._unleased_key(job_id))
+            job = self.get(job_id)
+            if job is None or job['status'] not in (JOB_QUEUED, JOB_RUNNING):
+                continue
+            dedup_key = job.get('dedup_key')
+            current = dedup_key is not None and self.client.get(dedup_key) == job_id
+            if current and job.get('attempts', 0) < self.max_attempts:
+                job['status'] = JOB_QUEUED
+                job['started_at'] = None
+                self._save(job)
+                # 꺼내는 쪽(오른쪽)에 넣어 다음 작업으로 실행
+                self.client.rpush(JOB_QUEUE_KEY, job_id)
+                requeued += 1
+                logger.warning(f"Collection job {job_id} lease expired, requeued (attempt {job.get('attempts', 0)})")
+            else:
+                self.finish(job_id, error="Collection worker stopped before the job finished (lease expired)")
+                logger.warning(f"Collection job {job_id} lease expired, marked failed")
+        return requeued
+
+    def finish(self, job_id: str, result: Optional[dict] = None, error: Optional[str] = None) -> Optional[dict]:
+        """작업 완료/실패 기록"""
+        job = self.get(job_id)
+        if job is None:
+            return None
+        _finish_job(job, result, error)
+        self._save(job)
+        self._release(job_id)
+        # 같은 요청이 다시 오면 새 작업을 만들도록 진행 중 표시 제거
+        dedup_key = job.get('dedup_key')
+        if dedup_key and self.client.get(dedup_key) == job_id:
+            self.client.delete(dedup_key)
+        return job
+
+    def pending(self) -> int:
+        """대기 중인 작업 수"""
+        return int(self.client.llen(JOB_QUEUE_KEY))
+
+    def publish_worker_status(self, status: dict, ttl: int) -> None:
+        """수집 워커의 스케줄러 상태 게시 (ttl초 동안 갱신이 없으면 워커가 없는 것으로 간주)"""
+        self.client.set(WORKER_STATUS_KEY, json.dumps(status, default=str), ex=ttl)
+
+    def get_worker_status(self) -> Optional[dict]:
+        """수집 워커가 게시한 스케줄러 상태 (워커가 없으면 None)"""
+        raw = self.client.get(WORKER_STATUS_KEY)
+        return json.loads(raw) if raw else None
+
+
+class LocalCollectionJobQueue:
+    """
+    프로세스 내 수집 작업 큐
+
+    수집 워커 없이 API 서버만 실행할 때 사용합니다. 작업은 스레드 풀에서 실행되므로
+    API 이벤트 루프를 막지 않으며, 작업 상태는 프로세스 메모리에 job_ttl 동안 보관합니다.
+    """
+
+    def __init__(
+        self,
+        max_workers: int = 2,
+        job_ttl: int = 86400,
+        runner: Callable[[str, str, dict], dict] = run_collection_job,
+    ):
+        """
+        Args:
+            max_workers: 작업을 동시에 실행할 스레드 수
+            job_ttl: 끝난 작업 상태 보관 시간 (초)
+            runner: 작업 실행 함수 (기본: run_collection_job)
+        """
+        self.job_ttl = job_ttl
+        self.runner = runner
+        self._executor = ThreadPoolExecutor(max_workers=max(1, max_workers), thread_name_prefix="collection-job")
+        self._lock = threading.Lock()
+        self._jobs: Dict[str, dict] = {}
+        # dedup 키 -> 진행 중인 작업 ID
+        self._inflight: Dict[str, str] = {}
+        # (만료 시각, 작업 ID) - 끝난 순서
+        self._expiry: Deque[Tuple[float, str]] = deque()
+
+    def _prune(self) -> None:
+        """보관 시간이 지난 끝난 작업 제거 (잠금 안에서 호출)"""
+        now = time.monotonic()
+        while self._expiry and self._expiry[0][0] <= now:
+            self._jobs.pop(self._expiry.popleft()[1], None)
+
+    def get(self, job_id: str) -> Optional[dict]:
+        """작업 상태 조회 (없거나 만료되었으면 None)"""
+        with self._lock:
+            self._prune()
+            job = self._jobs.get(job_id)
+            return dict(job) if job is not None else None
+
+    def enqueue(self, job_type: str, ticker: str, params: dict) -> dict:
+        """수집 작업 등록 (같은 요청의 작업이 진행 중이면 그 작업 반환)"""
+        dedup_key = job_dedup_key(job_type, ticker, params)
+        with self._lock:
+            self._prune()
+            existing_id = self._inflight.get(dedup_key)
+            if existing_id is not None:
+                logger.info(f"Collection job coalesced: {job_type} {ticker} ({existing_id})")
+                return {**self._jobs[existing_id], 'coalesced': True}
+            job = _new_job(job_type, ticker, params)
+            self._jobs[job['id']] = job
+            self._inflight[dedup_key] = job['id']
+            queued = dict(job)
+
+        self._executor.submit(self._run, job['id'], dedup_key)
+        logger.info(f"Collection job queued: {job_type} {ticker} ({job['id']})")
+        return {**queued, 'coalesced': False}
+
+    def _run(self, job_id: str, dedup_key: str) -> None:
+        """작업 실행 (스레드 풀에서 실행)"""
+        with self._lock:
+            job = self._jobs[job_id]
+            job['status'] = JOB_RUNNING
+            job['started_at'] = datetime.now().isoformat()
+
+        result, error = None, None
+        try:
+            result = self.runner(job['type'], job['ticker'], job['params'])
+        except Exception as e:
+            logger.error(f"Collection job {job_id} failed: {e}", exc_info=True)
+            error = str(e)
+
+        with self._lock:
+            _finish_job(job, result, error)
+            self._inflight.pop(dedup_key, None)
+            self._expiry.append((time.monotonic() + self.job_ttl, job_id))
+
+    def pending(self) -> int:
+        """대기 중인 작업 수"""
+        with self._lock:
+            return sum(job['status'] == JOB_QUEUED for job in self._jobs.values())
+
+    def close(self) -> None:
+        """스레드 풀 종료 (대기 중인 작업은 취소)"""
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+
+# 전역 작업 큐 인스턴스
+_collection_job_queue = None
+_collection_job_queue_lock = threading.Lock()
+
+
+def get_collection_job_queue():
+    """
+    전역 수집 작업 큐 반환 (싱글톤 패턴)
+
+    COLLECTION_WORKER_ENABLED이면 수집 워커가 실행하는 Redis 큐, 아니면 프로세스 내 큐를 생성합니다.
+
+    Returns:
+        CollectionJobQueue 또는 LocalCollectionJobQueue 인스턴스
+    """
+    global _collection_job_queue
+
+    if _collection_job_queue is None:
+        with _collection_job_queue_lock:
+            if _collection_job_queue is None:
+                if settings.COLLECTION_WORKER_ENABLED:
+                    _collection_job_queue = CollectionJobQueue.from_settings()
+                else:
+                    _collection_job_queue = LocalCollectionJobQueue(
+                        max_workers=settings.COLLECTION_JOB_MAX_WORKERS,
+                        job_ttl=settings.COLLECTION_JOB_TTL,
+                    )
+
+    return _collection_job_queue
+
+
+def close_collection_job_queue() -> None:
+    """전역 수집 작업 큐 종료 (프로세스 내 큐의 스레드 풀 정리)"""
+    global _collection_job_queue
+
+    with _collection_job_queue_lock:
+        if isinstance(_collection_job_queue, LocalCollectionJobQueue):
+            _collection_job_queue.close()
+        _collection_job_queue = None
@@ -0,0 +1,145 @@
+"""
+장 시간 기반 수집 주기 정책
+
+데이터 유형별로 언제 수집해야 하는지 KRX 거래 일정으로 판단합니다.
+
+- 가격: 정규장에는 price_interval마다, 장 마감 후 price_final_delay가 지나면
+  종가 확정분을 한 번 더 수집합니다. 그 밖의 시간(휴장일, 개장 전)에는 수집하지 않습니다.
+- 매매동향: 장 마감 후 trading_final_delay가 지나 frgn 수치가 확정되면 거래일마다 한 번 수집합니다.
+- 뉴스: 정규장에는 news_interval_open, 그 밖의 시간에는 news_interval_closed 간격으로 수집합니다.
+
+어떤 유형도 한 번도 수집하지 않았으면(프로세스 시작 직후) 바로 수집합니다.
+"""
+
+import logging
+import threading
+from datetime import datetime, timedelta
+from typing import Dict, Iterable, List, Optional
+
+from app.collectors.finance_collector import DATA_TYPE_PRICES, DATA_TYPE_TRADING
+from app.collectors.news_collector import DATA_TYPE_NEWS
+from app.config import settings
+from app.utils.market_calendar import MarketCalendar, PHASE_OPEN, get_market_calendar
+
+logger = logging.getLogger(__name__)
+
+DATA_TYPES = (DATA_TYPE_PRICES, DATA_TYPE_TRADING, DATA_TYPE_NEWS)
+
+# 스케줄러 실행 시각의 오차 허용 범위 (초)
+# 30초 간격 job이 29.99초 만에 실행되어도 30초 주기 수집이 밀리지 않도록 함
+DUE_TOLERANCE_SECONDS = 1.0
+
+
+class CollectionPolicy:
+    """
+    데이터 유형별 수집 시점 판단
+
+    Example:
+        policy = CollectionPolicy.from_settings()
+        now = policy.calendar.now()
+        data_types = policy.due_data_types(now)
+        if data_types:
+            ... 수집 ...
+            policy.mark_collected(data_types, now)
+    """
+
+    def __init__(
+        self,
+        calendar: MarketCalendar,
+        price_interval: float = 30,
+        price_final_delay: float = 300,
+        trading_final_delay: float = 1800,
+        news_interval_open: float = 300,
+        news_interval_closed: float = 1800,
+    ):
+        """
+        Args:
+            calendar: KRX 거래 일정
+            price_interval: 정규장 가격 수집 간격 (초)
+            price_final_delay: 장 마감 후 종가 확정분을 수집하기까지 대기 시간 (초)
+            trading_final_delay: 장 마감 후 매매동향을 수집하기까지 대기 시간 (초)
+            news_interval_open: 정규장 뉴스 수집 간격 (초)
+            news_interval_closed: 장외 시간 뉴스 수집 간격 (초)
+        """
+        self.calendar = calendar
+        self.price_interval = price_interval
+        self.price_final_delay = timedelta(seconds=price_final_delay)
+        self.trading_final_delay = timedelta(seconds=trading_final_delay)
+        self.news_interval_open = news_interval_open
+        self.news_interval_closed = news_interval_closed
+        self._lock = threading.Lock()
+        self._last_collected: Dict[str, datetime] = {}
+
+    @classmethod
+    def from_settings(cls, calendar: Optional[MarketCalendar] = None) -> 'CollectionPolicy':
+        """설정값으로 정책 생성"""
+        return cls(
+            calendar or get_market_calendar(),
+            price_interval=settings.MARKET_PRICE_INTERVAL,
+            price_final_delay=settings.MARKET_PRICE_FINAL_DELAY,
+            trading_final_delay=settings.MARKET_TRADING_FINAL_DELAY,
+            news_interval_open=settings.MARKET_NEWS_INTERVAL_OPEN,
+            news_interval_closed=settings.MARKET_NEWS_INTERVAL_CLOSED,
+        )
+
+    def _final_time(self, now: datetime, delay: timedelta) -> Optional[datetime]:
+        """now 이전에 확정된 가장 최근 장 마감 데이터의 확정 시각 (장 마감 + delay)"""
+        last_close = self.calendar.last_close(now - delay)
+        return last_close + delay if last_close is not None else None
+
+    def _elapsed(self, last: datetime, now: datetime, interval: float) -> bool:
+        return (now - last).total_seconds() >= interval - DUE_TOLERANCE_SECONDS
+
+    def is_due(self, data_type: str, now: datetime) -> bool:
+        """
+        해당 데이터 유형을 지금 수집해야 하는지 여부
+
+        Args:
+            data_type: DATA_TYPE_PRICES, DATA_TYPE_TRADING, DATA_TYPE_NEWS
+            now: 현재 시각
+        """
+        if data_type not in DATA_TYPES:
+            raise ValueError(f"Unknown data type: {data_type}")
+
+        now = self.calendar.localize(now)
+        with self._lock:
+            last = self._last_collected.get(data_type)
+        if last is None:
+            return True
+
+        is_open = self.calendar.phase(now) == PHASE_OPEN
+        if data_type == DATA_TYPE_NEWS:
+            interval = self.news_interval_open if is_open else self.news_interval_closed
+            return self._elapsed(last, now, interval)
+
+        if data_type == DATA_TYPE_PRICES and is_open and self._elapsed(last, now, self.price_interval):
+            return True
+
+        # 장 마감 후 확정 데이터를 아직 수집하지 않았으면 수집
+        delay = self.price_final_delay if data_type == DATA_TYPE_PRICES else self.trading_final_delay
+        final_time = self._final_time(now, delay)
+        return final_time is not None and last < final_time
+
+    def due_data_types(self, now: datetime) -> List[str]:
+        """지금 수집해야 하는 데이터 유형 리스트"""
+        return [data_type for data_type in DATA_TYPES if self.is_due(data_type, now)]
+
+    def mark_collected(self, data_types: Iterable[str], now: datetime) -> None:
+        """수집 완료 기록 (다음 수집 시점 판단 기준)"""
+        now = self.calendar.localize(now)
+        with self._lock:
+            for data_type in data_types:
+                self._last_collected[data_type] = now
+
+    def get_status(self, now: Optional[datetime] = None) -> dict:
+        """정책 상태 (장 구분, 유형별 마지막 수집 시각, 현재 수집 대상)"""
+        now = self.calendar.localize(now) if now is not None else self.calendar.now()
+        with self._lock:
+            last_collected = {
+                data_type: collected_at.isoformat() for data_type, collected_at in self._last_collected.items()
+            }
+        return {
+            'phase': self.calendar.phase(now),
+            'last_collected': last_collected,
+            'due': self.due_data_types(now),
+        }
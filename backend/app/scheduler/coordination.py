@@ -0,0 +1,347 @@
+"""
+여러 프로세스/노드 간 수집 조정
+
+uvicorn 워커나 파드를 여러 개 띄워도 같은 종목을 중복 수집하지 않도록 Redis로 조정합니다.
+
+- leader: Redis 리더 락을 가진 프로세스 하나만 수집합니다. 락을 얻을 때마다 증가하는
+  fencing 토큰을 발급하고, 종목별 트랜잭션 안에서 scheduler_fences 테이블의 토큰을
+  "저장된 토큰 이하일 때만" 갱신하여 락을 잃은(예: 긴 GC 일시 정지) 이전 리더가 새 리더의
+  커밋 뒤에 늦게 쓰지 못하게 합니다. (Redis 락 확인만으로는 확인과 커밋 사이에 틈이 있음)
+- sharded: 살아 있는 모든 멤버가 수집하되, 종목을 consistent hashing으로 나눠
+  멤버마다 자기 몫만 수집합니다. 멤버가 추가/제거되면 해당 구간의 종목만 옮겨갑니다.
+
+멤버십과 락은 heartbeat()가 주기적으로 갱신하며, Redis에 접근할 수 없으면 중복 수집을
+피하기 위해 수집하지 않습니다.
+"""
+
+import bisect
+import hashlib
+import logging
+import os
+import socket
+import threading
+import time
+from datetime import datetime
+from typing import Dict, Iterable, List, Optional
+
+from sqlalchemy import insert, select, update
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+
+from app.config import settings
+from app.models import SchedulerFence
+from app.utils.redis import get_redis_client
+
+logger = logging.getLogger(__name__)
+
+COORDINATION_NONE = "none"
+COORDINATION_LEADER = "leader"
+COORDINATION_SHARDED = "sharded"
+
+# Redis 키
+LEADER_LOCK_KEY = "scheduler:leader"
+LEADER_FENCE_KEY = "scheduler:leader:fence"
+MEMBERS_KEY = "scheduler:members"
+
+# scheduler_fences 테이블의 리더 락 행 이름
+LEADER_FENCE_NAME = "scheduler:leader"
+
+# 토큰이 같을 때만 락 만료 연장
+RENEW_SCRIPT = """
+if redis.call('get', KEYS[1]) == ARGV[1] then
+    return redis.call('pexpire', KEYS[1], ARGV[2])
+end
+return 0
+"""
+
+# 토큰이 같을 때만 락 해제
+RELEASE_SCRIPT = """
+if redis.call('get', KEYS[1]) == ARGV[1] then
+    return redis.call('del', KEYS[1])
+end
+return 0
+"""
+
+
+def default_member_id() -> str:
+    """프로세스 식별자 (호스트명:PID)"""
+    return f"{socket.gethostname()}:{os.getpid()}"
+
+
+class LeadershipLostError(RuntimeError):
+    """리더 락을 잃어 수집 결과를 커밋하면 안 되는 경우"""
+
+
+class ConsistentHashRing:
+    """
+    consistent hashing 링
+
+    멤버마다 replicas개의 가상 노드를 링에 두고, 키는 시계 방향으로 처음 만나는
+    가상 노드의 멤버에게 배정됩니다.
+    """
+
+    def __init__(self, members: Iterable[str] = (), replicas: int = 64):
+        self.replicas = replicas
+        self.members = sorted(set(members))
+        self._ring: List[int] = []
+        self._owners: Dict[int, str] = {}
+        for member in self.members:
+            for replica in range(replicas):
+                point = self._hash(f"{member}#{replica}")
+                self._owners[point] = member
+                self._ring.append(point)
+        self._ring.sort()
+
+    @staticmethod
+    def _hash(key: str) -> int:
+        return int.from_bytes(hashlib.md5(key.encode('utf-8')).digest()[:8], 'big')
+
+    def owner(self, key: str) -> Optional[str]:
+        """키를 담당하는 멤버 (멤버가 없으면 None)"""
+        if not self._ring:
+            return None
+        index = bisect.bisect(self._ring, self._hash(key)) % len(self._ring)
+        return self._owners[self._ring[index]]
+
+
+class ClusterCoordinator:
+    """
+    수집 조정기
+
+    Example:
+        coordinator = ClusterCoordinator.from_settings()
+        coordinator.heartbeat()                   # 주기적으로 (스케줄러 job)
+
+        if coordinator.can_run():
+            tickers = coordinator.assign(all_tickers)
+            ... 수집 ...
+            coordinator.verify(db)                # 커밋 직전, 같은 세션으로 (leader 모드)
+    """
+
+    def __init__(
+        self,
+        mode: str,
+        member_id: Optional[str] = None,
+        lock_ttl: float = 30.0,
+        member_ttl: float = 30.0,
+        replicas: int = 64,
+        client=None,
+        clock=time.time,
+    ):
+        """
+        Args:
+            mode: COORDINATION_LEADER 또는 COORDINATION_SHARDED
+            member_id: 멤버 식별자 (None이면 호스트명:PID)
+            lock_ttl: 리더 락 만료 시간 (초, heartbeat 간격보다 충분히 길게)
+            member_ttl: heartbeat가 이 시간(초) 동안 없으면 멤버에서 제외
+            replicas: consistent hashing 멤버당 가상 노드 수
+            client: Redis 클라이언트 (None이면 get_redis_client() 사용)
+            clock: 현재 시각 함수 (초, 테스트용)
+        """
+        if mode not in (COORDINATION_LEADER, COORDINATION_SHARDED):
+            raise ValueError(f"Unknown coordination mode: {mode}")
+        self.mode = mode
+        self.member_id = member_id or default_member_id()
+        self.lock_ttl = lock_ttl
+        self.member_ttl = member_ttl
+        self.replicas = replicas
+        self.clock = clock
+        self._client = client
+        self._lock = threading.Lock()
+        self._token: Optional[str] = None
+        self._fencing_token: Optional[int] = None
+        self._members: List[str] = []
+        self._ring = ConsistentHashRing(replicas=replicas)
+        self._healthy = False
+        self._stats = {'heartbeats': 0, 'leadership_changes': 0, 'rebalances': 0, 'fencing_rejections': 0}
+
+    @classmethod
+    def from_settings(cls) -> 'ClusterCoordinator':
+        """설정값으로 조정기 생성"""
+        return cls(
+            settings.SCHEDULER_COORDINATION,
+            member_id=settings.SCHEDULER_MEMBER_ID or None,
+            lock_ttl=settings.SCHEDULER_LOCK_TTL,
+            member_ttl=settings.SCHEDULER_LOCK_TTL,
+            replicas=settings.SCHEDULER_HASH_REPLICAS,
+        )
+
+    @property
+    def client(self):
+        if self._client is None:
+            self._client = get_redis_client()
+        return self._client
+
+    @property
+    def is_leader(self) -> bool:
+        return self._token is not None
+
+    @property
+    def fencing_token(self) -> Optional[int]:
+        return self._fencing_token
+
+    def heartbeat(self) -> None:
+        """리더 락 획득/연장 또는 멤버십 갱신 (주기적으로 호출)"""
+        try:
+            if self.mode == COORDINATION_LEADER:
+                self._heartbeat_leader()
+            else:
+                self._heartbeat_member()
+            self._healthy = True
+        except Exception as e:
+            logger.warning(f"Scheduler coordination heartbeat failed: {e}")
+            self._healthy = False
+            self._lose_leadership()
+        with self._lock:
+            self._stats['heartbeats'] += 1
+
+    def _heartbeat_leader(self) -> None:
+        ttl_ms = int(self.lock_ttl * 1000)
+        if self._token is not None:
+            if self.client.eval(RENEW_SCRIPT, 1, LEADER_LOCK_KEY, self._token, ttl_ms):
+                return
+            logger.warning(f"Scheduler leader lock lost by {self.member_id}")
+            self._lose_leadership()
+
+        fencing_token = int(self.client.incr(LEADER_FENCE_KEY))
+        token = f"{self.member_id}:{fencing_token}"
+        if self.client.set(LEADER_LOCK_KEY, token, nx=True, px=ttl_ms):
+            with self._lock:
+                self._token = token
+                self._fencing_token = fencing_token
+                self._stats['leadership_changes'] += 1
+            logger.info(f"Scheduler leader lock acquired by {self.member_id} (fencing token {fencing_token})")
+
+    def _heartbeat_member(self) -> None:
+        now = self.clock()
+        pipe = self.client.pipeline(transaction=False)
+        pipe.zadd(MEMBERS_KEY, {self.member_id: now})
+        pipe.zremrangebyscore(MEMBERS_KEY, '-inf', now - self.member_ttl)
+        pipe.zrange(MEMBERS_KEY, 0, -1)
+        members = sorted(pipe.execute()[-1])
+
+        with self._lock:
+            if members == self._members:
+                return
+            previous = self._members
+            self._members = members
+            self._ring = ConsistentHashRing(members, replicas=self.replicas)
+            self._stats['rebalances'] += 1
+        logger.info(f"Scheduler members changed: {previous} -> {members}")
+
+    def _lose_leadership(self) -> None:
+        with self._lock:
+            if self._token is not None:
+                self._stats['leadership_changes'] += 1
+            self._token = None
+            self._fencing_token = None
+
+    def can_run(self) -> bool:
+        """이 프로세스가 이번 실행에서 수집해야 하는지 여부"""
+        if not self._healthy:
+            return False
+        if self.mode == COORDINATION_LEADER:
+            return self.is_leader
+        return self.member_id in self._members
+
+    def assign(self, tickers: List[str]) -> List[str]:
+        """이 프로세스가 담당하는 종목 (leader 모드는 전체)"""
+        if self.mode == COORDINATION_LEADER:
+            return list(tickers)
+        with self._lock:
+            ring = self._ring
+        return [ticker for ticker in tickers if ring.owner(ticker) == self.member_id]
+
+    def verify(self, db: Optional[Session] = None) -> None:
+        """
+        커밋 직전 리더 자격 확인 (leader 모드)
+
+        Redis 리더 락이 여전히 같은 토큰인지 확인하고, db가 있으면 같은 트랜잭션에서
+        fencing 토큰을 조건부로 갱신합니다. Redis 확인만으로는 확인 직후 락을 잃고 커밋하는 틈을
+        막을 수 없지만, 조건부 갱신은 데이터베이스가 판단하므로 더 큰 토큰이 이미 커밋되었으면
+        실패합니다. 갱신한 행은 커밋까지 잠기므로 커밋 직전에 호출해야 합니다.
+
+        Args:
+            db: 커밋할 세션 (None이면 Redis 락만 확인하는 최선 노력 검사)
+
+        Raises:
+            LeadershipLostError: 락을 잃었거나 더 큰 fencing 토큰이 이미 커밋됨
+        """
+        if self.mode != COORDINATION_LEADER:
+            return
+        with self._lock:
+            token = self._token
+            fencing_token = self._fencing_token
+        try:
+            current = self.client.get(LEADER_LOCK_KEY) if token is not None else None
+        except Exception as e:
+            raise LeadershipLostError(f"Cannot verify leader lock: {e}") from e
+        if token is None or current != token:
+            with self._lock:
+                self._stats['fencing_rejections'] += 1
+            raise LeadershipLostError(f"Leader lock is held by {current}, not {token}")
+        if db is not None and not self._write_fence(db, fencing_token):
+            with self._lock:
+                self._stats['fencing_rejections'] += 1
+            raise LeadershipLostError(f"A newer fencing token than {fencing_token} has been committed")
+
+    @staticmethod
+    def _write_fence(db: Session, fencing_token: int) -> bool:
+        """
+        트랜잭션 안에서 저장된 fencing 토큰이 이 토큰 이하일 때만 갱신
+
+        Returns:
+            갱신했으면 True, 더 큰 토큰이 이미 커밋되었으면 False
+        """
+        now = datetime.now()
+        for _ in range(2):
+            updated = db.execute(
+                update(SchedulerFence)
+                .where(SchedulerFence.name == LEADER_FENCE_NAME, SchedulerFence.token <= fencing_token)
+                .values(token=fencing_token, updated_at=now)
+            ).rowcount
+            if updated:
+                return True
+            exists = db.execute(
+                select(SchedulerFence.name).where(SchedulerFence.name == LEADER_FENCE_NAME)
+            ).first()
+            if exists is not None:
+                return False
+            # 첫 커밋: 행 추가 (다른 프로세스가 먼저 추가했으면 조건부 갱신을 다시 시도)
+            try:
+                with db.begin_nested():
+                    db.execute(
+                        insert(SchedulerFence).values(name=LEADER_FENCE_NAME, token=fencing_token, updated_at=now)
+                    )
+                return True
+            except IntegrityError:
+                continue
+        return False
+
+    def release(self) -> None:
+        """리더 락 해제 또는 멤버십에서 제거 (종료 시)"""
+        try:
+            if self.mode == COORDINATION_LEADER and self._token is not None:
+                self.client.eval(RELEASE_SCRIPT, 1, LEADER_LOCK_KEY, self._token)
+            elif self.mode == COORDINATION_SHARDED:
+                self.client.zrem(MEMBERS_KEY, self.member_id)
+        except Exception as e:
+            logger.warning(f"Failed to release scheduler coordination: {e}")
+        self._lose_leadership()
+        with self._lock:
+            self._members = []
+            self._ring = ConsistentHashRing(replicas=self.replicas)
+        self._healthy = False
+
+    def get_status(self) -> dict:
+        """조정 상태"""
+        with self._lock:
+            return {
+                'mode': self.mode,
+                'member_id': self.member_id,
+                'healthy': self._healthy,
+                'is_leader': self.is_leader,
+                'fencing_token': self._fencing_token,
+                'members': list(self._members),
+                **self._stats,
+            }
@@ -2,48 +2,239 @@
 데이터 수집 스케줄러
 
 APScheduler를 사용하여 주기적으로 데이터를 수집합니다.
+가격, 매매동향, 뉴스는 각각 별도의 job으로 등록되어 데이터 유형마다 수집 간격과 사용 여부를 정할 수 있습니다.
+
+job은 동시에 하나만 실행되며(max_instances=1), 실행이 간격보다 길어져 밀린 실행은 한 번으로
+합쳐집니다(coalesce). 건너뛴 실행과 간격을 넘긴 실행(overrun)은 get_status()에 집계되고,
+적응형 간격을 켜면 최근 실행 시간과 upstream 응답 지연에 맞춰 실제 실행 간격을 늘리거나 줄입니다.
+
+여러 API 워커/노드에서 스케줄러를 띄우는 경우 SCHEDULER_COORDINATION으로 Redis 리더 락(leader)이나
+consistent hashing 종목 분할(sharded)을 사용해 같은 종목을 중복 수집하지 않도록 합니다.
 """
 
+from apscheduler.events import EVENT_JOB_MAX_INSTANCES, EVENT_JOB_MISSED
 from apscheduler.schedulers.background import BackgroundScheduler
 from apscheduler.triggers.interval import IntervalTrigger
 from sqlalchemy.orm import Session
-from typing import List, Optional
+from collections import Counter, deque
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
+from functools import partial
+from typing import Collection, Deque, Dict, List, Optional, Union
 from datetime import datetime
 import logging
 import atexit
+import time
 
 from app.database import SessionLocal
 from app.models.stock import Stock
-from app.collectors.finance_collector import FinanceCollector
-from app.collectors.news_collector import NewsCollector
+from app.collectors.finance_collector import (
+    FinanceCollector,
+    DATA_TYPE_PRICES,
+    DATA_TYPE_TRADING,
+    PAGE_ENDPOINT_CHART,
+    PAGE_ENDPOINT_FRGN,
+    PAGE_ENDPOINT_SISE_DAY,
+    PRICE_PAGE_ENDPOINTS,
+)
+from app.collectors.news_collector import NewsCollector, DATA_TYPE_NEWS, PAGE_ENDPOINT_NEWS
+from app.collectors.async_engine import AsyncCollectionEngine
+from app.config import settings
+from app.scheduler.collection_policy import CollectionPolicy, DATA_TYPES
+from app.scheduler.coordination import COORDINATION_NONE, ClusterCoordinator, LeadershipLostError
+from app.scheduler.priority import TickerPrioritizer
+from app.utils.circuit_breaker import get_circuit_breaker
+from app.utils.deadline import Deadline, DeadlineExceeded, deadline_scope
+from app.utils.http_client import get_http_client
+from app.utils.ingest_buffer import IngestBuffer
+from app.utils.page_tracker import get_page_tracker
+from app.utils.rate_limiter import get_rate_limiter
+from app.utils.retry import RetryBudget
+from app.utils.run_stats import RunStats, run_stats_scope
 
 logger = logging.getLogger(__name__)
 
 # 기본 수집 간격 (30초)
 DEFAULT_COLLECTION_INTERVAL = 30
 
+# 종목별 작업 완료/타임아웃 확인 간격 (초)
+TASK_POLL_INTERVAL = 0.5
+
+# 적응형 간격이 현재 실행 간격과 이 비율 이상 차이 날 때만 job 재등록
+ADAPTIVE_RESCHEDULE_THRESHOLD = 0.1
+
+# 상태에 표시할 upstream 엔드포인트 (Circuit Breaker)
+CIRCUIT_BREAKER_ENDPOINTS = (PAGE_ENDPOINT_SISE_DAY, PAGE_ENDPOINT_FRGN, PAGE_ENDPOINT_NEWS, PAGE_ENDPOINT_CHART)
+
+# 데이터 유형별 페이지 변경 추적 엔드포인트 (종목 커밋 후 지문 확정용)
+DATA_TYPE_PAGE_ENDPOINTS = {
+    DATA_TYPE_PRICES: PRICE_PAGE_ENDPOINTS,
+    DATA_TYPE_TRADING: (PAGE_ENDPOINT_FRGN,),
+    DATA_TYPE_NEWS: (PAGE_ENDPOINT_NEWS,),
+}
+
+# 데이터 유형별 요청 실패를 세는 엔드포인트 (failed_data_types 판단용)
+DATA_TYPE_FETCH_ENDPOINTS = {
+    DATA_TYPE_PRICES: PAGE_ENDPOINT_SISE_DAY,
+    DATA_TYPE_TRADING: PAGE_ENDPOINT_FRGN,
+    DATA_TYPE_NEWS: PAGE_ENDPOINT_NEWS,
+}
+
+# 리더 락/멤버십 갱신 job ID
+COORDINATION_JOB_ID = "coordination_heartbeat_job"
+
+
+@dataclass
+class CollectionJob:
+    """데이터 유형별 수집 job 설정과 마지막 실행 상태"""
+    
+    data_type: str
+    interval_seconds: int
+    enabled: bool = True
+    last_run_time: Optional[datetime] = None
+    last_run_status: Optional[str] = None
+    last_run_error: Optional[str] = None
+    last_duration: Optional[float] = None
+    last_run_stats: dict = field(default_factory=dict)
+    # 실제 실행 간격 (적응형 간격이 꺼져 있으면 interval_seconds와 같음)
+    effective_interval: float = 0.0
+    # 최근 실행 소요 시간 (초, 수집하지 않고 건너뛴 실행 제외)
+    durations: Deque[float] = field(default_factory=lambda: deque(maxlen=settings.SCHEDULER_DURATION_HISTORY))
+    # 최근 실행의 upstream 평균 응답 지연 (초)
+    last_latency: Optional[float] = None
+    overruns: int = 0       # 실행 간격보다 오래 걸린 실행 수
+    skipped_runs: int = 0   # 이전 실행이 끝나지 않아 건너뛴 실행 수 (max_instances)
+    missed_runs: int = 0    # 예정 시각을 놓친 실행 수 (misfire)
+    
+    def __post_init__(self):
+        if not self.effective_interval:
+            self.effective_interval = self.interval_seconds
+    
+    @property
+    def job_id(self) -> str:
+        return f"{self.data_type}_collection_job"
+    
+    @property
+    def name(self) -> str:
+        return f"{self.data_type.capitalize()} Collection Job"
+    
+    def typical_duration(self) -> Optional[float]:
+        """최근 실행 소요 시간의 90번째 백분위수"""
+        if not self.durations:
+            return None
+        ordered = sorted(self.durations)
+        return ordered[int(0.9 * (len(ordered) - 1))]
+
 
 class DataScheduler:
     """데이터 수집 스케줄러"""
     
-    def __init__(self, interval_seconds: int = DEFAULT_COLLECTION_INTERVAL):
+    def __init__(
+        self,
+        interval_seconds: int = DEFAULT_COLLECTION_INTERVAL,
+        use_async_engine: Optional[bool] = None,
+        max_workers: Optional[int] = None,
+    ):
         """
         스케줄러 초기화
         
         Args:
-            interval_seconds: 데이터 수집 간격 (초 단위, 기본: 30초)
+            interval_seconds: 가격 수집 간격 (초 단위, 기본: 30초, 매매동향/뉴스 간격은 설정값 사용)
+            use_async_engine: asyncio 수집 엔진 사용 여부 (None이면 설정값 사용)
+            max_workers: 종목별 수집 워커 스레드 수 (None이면 설정값 사용)
         """
         self.scheduler = BackgroundScheduler()
         self.interval_seconds = interval_seconds
+        self.use_async_engine = (
+            settings.ASYNC_COLLECTION_ENABLED if use_async_engine is None else use_async_engine
+        )
+        self.max_workers = settings.SCHEDULER_MAX_WORKERS if max_workers is None else max_workers
+        self.task_timeout = settings.SCHEDULER_TASK_TIMEOUT
+        # 최근 실행 시간과 upstream 응답 지연에 맞춰 job 실행 간격 조정
+        self.adaptive_interval = settings.SCHEDULER_ADAPTIVE_INTERVAL_ENABLED
+        # 워커 스레드와 다른 수집 경로가 공유하는 호스트별 요청 예산 (RATE_LIMIT_*)
+        self.host_rate_limiter = get_rate_limiter()
+        # 실행 중인 수집의 페이지 재시도 예산 (_run_key별, 한 실행의 모든 종목이 공유)
+        self._retry_budgets: Dict[str, RetryBudget] = {}
         self.is_running = False
-        self.job_id = "data_collection_job"
-        self.last_run_time: Optional[datetime] = None
-        self.last_run_status: Optional[str] = None
-        self.last_run_error: Optional[str] = None
+        # 데이터 유형별 수집 job (유형마다 간격과 사용 여부가 다름)
+        self.jobs: Dict[str, CollectionJob] = {
+            DATA_TYPE_PRICES: CollectionJob(DATA_TYPE_PRICES, interval_seconds, settings.SCHEDULER_PRICES_ENABLED),
+            DATA_TYPE_TRADING: CollectionJob(
+                DATA_TYPE_TRADING, settings.SCHEDULER_TRADING_INTERVAL, settings.SCHEDULER_TRADING_ENABLED
+            ),
+            DATA_TYPE_NEWS: CollectionJob(DATA_TYPE_NEWS, settings.SCHEDULER_NEWS_INTERVAL, settings.SCHEDULER_NEWS_ENABLED),
+        }
+        # 페이지 변경 추적 (이전 실행과 같은 페이지는 파싱/저장 생략)
+        self.page_tracker = get_page_tracker() if settings.PAGE_SKIP_UNCHANGED_ENABLED else None
+        # 장 시간 기반 수집 주기 (None이면 매 실행마다 모든 데이터 유형 수집)
+        self.collection_policy = CollectionPolicy.from_settings() if settings.MARKET_CALENDAR_ENABLED else None
+        # 조회 빈도 기반 종목 선택 (자주 조회되는 종목은 매 실행, 나머지는 점점 긴 간격으로 가격 수집)
+        self.ticker_prioritizer = TickerPrioritizer.from_settings() if settings.SCHEDULER_PRIORITY_ENABLED else None
+        # 여러 프로세스/노드 간 수집 조정 (None이면 이 프로세스가 모든 종목 수집)
+        self.coordinator = (
+            ClusterCoordinator.from_settings() if settings.SCHEDULER_COORDINATION != COORDINATION_NONE else None
+        )
+        # 수집 데이터 버퍼 (여러 종목의 행을 모아 큰 트랜잭션으로 저장)
+        self.ingest_buffer = self._create_ingest_buffer() if settings.INGEST_BUFFER_ENABLED else None
+        
+        # 이전 실행이 끝나지 않아 건너뛴 실행, 예정 시각을 놓친 실행 집계
+        self.scheduler.add_listener(self._on_job_event, EVENT_JOB_MAX_INSTANCES | EVENT_JOB_MISSED)
         
         # 종료 시 스케줄러 정리
         atexit.register(self.shutdown)
     
+    def _latest_job(self) -> Optional[CollectionJob]:
+        """가장 최근에 시작한 job (실행한 job이 없으면 None)"""
+        started = [job for job in self.jobs.values() if job.last_run_time is not None]
+        return max(started, key=lambda job: job.last_run_time) if started else None
+    
+    # 이전 단일 job 스케줄러와 호환되는 마지막 실행 상태 (가장 최근에 시작한 job 기준, 상태는 job별로만 기록)
+    @property
+    def last_run_time(self) -> Optional[datetime]:
+        job = self._latest_job()
+        return job.last_run_time if job is not None else None
+    
+    @property
+    def last_run_status(self) -> Optional[str]:
+        job = self._latest_job()
+        return job.last_run_status if job is not None else None
+    
+    @property
+    def last_run_error(self) -> Optional[str]:
+        job = self._latest_job()
+        return job.last_run_error if job is not None else None
+    
+    @property
+    def last_run_stats(self) -> dict:
+        """마지막 실행 저장 통계 (저장 건수, 변경 없어 생략한 페이지/행 수)"""
+        job = self._latest_job()
+        return job.last_run_stats if job is not None else {}
+    
+    def _create_ingest_buffer(self) -> IngestBuffer:
+        """
+        수집 데이터 버퍼 생성 (writer 스레드 전용 세션과 커밋하지 않는 저장 함수 사용)
+        
+        수집 조정 중이면 버퍼의 트랜잭션도 커밋 직전에 리더 자격을 확인합니다 (fencing).
+        리더 자격을 잃으면 제출 단위로 다시 저장하지 않고 배치 전체를 실패 처리합니다.
+        """
+        finance_writer = FinanceCollector()
+        news_writer = NewsCollector()
+        return IngestBuffer(
+            SessionLocal,
+            writers={
+                DATA_TYPE_PRICES: finance_writer.write_price_data,
+                DATA_TYPE_TRADING: finance_writer.write_trading_flow_data,
+                DATA_TYPE_NEWS: news_writer.write_news_data,
+            },
+            max_batch_rows=settings.INGEST_BUFFER_BATCH_ROWS,
+            max_age=settings.INGEST_BUFFER_MAX_AGE,
+            max_pending_rows=settings.INGEST_BUFFER_MAX_PENDING_ROWS,
+            submit_timeout=settings.INGEST_BUFFER_SUBMIT_TIMEOUT,
+            before_commit=self.coordinator.verify if self.coordinator is not None else None,
+            fatal_errors=(LeadershipLostError,),
+        )
+
     def _get_all_tickers(self, db: Session) -> List[str]:
         """
         데이터베이스에서 모든 종목 코드 조회
@@ -57,40 +248,84 @@ class DataScheduler:
         stocks = db.query(Stock).all()
         return [stock.ticker for stock in stocks]
     
-    def _collect_data_for_ticker(self, ticker: str, db: Session) -> dict:
+    @staticmethod
+    def _run_key(data_types: Optional[Collection[str]]) -> str:
+        """실행 구분 키 (데이터 유형별 job은 동시에 두 번 실행되지 않음)"""
+        return ",".join(sorted(data_types)) if data_types is not None else "all"
+    
+    def _collect_data_for_ticker(
+        self, ticker: str, db: Session, data_types: Optional[Collection[str]] = None
+    ) -> dict:
         """
         특정 종목에 대한 데이터 수집
         
         Args:
             ticker: 종목 코드
             db: 데이터베이스 세션
+            data_types: 수집할 데이터 유형 (None이면 가격, 매매동향, 뉴스 모두)
         
         Returns:
-            수집 결과 딕셔너리
+            수집 결과 딕셔너리 (failed_data_types: 요청이 실패해 수집하지 못한 데이터 유형)
         """
         result = {
             'ticker': ticker,
             'prices_count': 0,
             'trading_count': 0,
             'news_count': 0,
-            'errors': []
+            'unchanged_rows': 0,
+            'errors': [],
+            'failed_data_types': [],
         }
         
         try:
-            # 가격 데이터 수집 (최근 10일)
-            finance_collector = FinanceCollector()
-            prices_count = finance_collector.collect_and_save_prices(db, ticker, days=10)
-            result['prices_count'] = prices_count
+            # 이번 실행의 재시도 예산 (실행 밖에서 호출되면 수집기마다 새 예산)
+            retry_budget = self._retry_budgets.get(self._run_key(data_types))
+            
+            # 가격 데이터 수집 (최근 10일, 증분 수집 시 저장된 최신 날짜 이후만)
+            write_stats = Counter()
+            # 엔드포인트별 요청 실패 횟수 (실패한 데이터 유형은 수집 완료로 기록하지 않음)
+            fetch_errors = Counter()
+            finance_collector = FinanceCollector(
+                page_tracker=self.page_tracker,
+                write_stats=write_stats,
+                ingest_buffer=self.ingest_buffer,
+                rate_limiter=self.host_rate_limiter,
+                retry_budget=retry_budget,
+                fetch_errors=fetch_errors,
+            )
+            if data_types is None or DATA_TYPE_PRICES in data_types:
+                prices_count = finance_collector.collect_and_save_prices(
+                    db, ticker, days=10, incremental=settings.PRICE_INCREMENTAL_ENABLED, commit=False
+                )
+                result['prices_count'] = prices_count
+                if fetch_errors[PAGE_ENDPOINT_SISE_DAY]:
+                    result['failed_data_types'].append(DATA_TYPE_PRICES)
             
             # 매매 동향 데이터 수집 (최근 10일)
-            trading_count = finance_collector.collect_and_save_trading_flow(db, ticker, days=10)
-            result['trading_count'] = trading_count
+            if data_types is None or DATA_TYPE_TRADING in data_types:
+                trading_count = finance_collector.collect_and_save_trading_flow(db, ticker, days=10, commit=False)
+                result['trading_count'] = trading_count
+                if fetch_errors[PAGE_ENDPOINT_FRGN]:
+                    result['failed_data_types'].append(DATA_TYPE_TRADING)
+            result['unchanged_rows'] = write_stats['unchanged']
             
             # 뉴스 데이터 수집 (최근 50개)
-            news_collector = NewsCollector()
-            news_count = news_collector.collect_and_save_news(db, ticker, max_items=50)
-            result['news_count'] = news_count
+            if data_types is None or DATA_TYPE_NEWS in data_types:
+                news_collector = NewsCollector(
+                    page_tracker=self.page_tracker,
+                    ingest_buffer=self.ingest_buffer,
+                    rate_limiter=self.host_rate_limiter,
+                    retry_budget=retry_budget,
+                    fetch_errors=fetch_errors,
+                )
+                news_count = news_collector.collect_and_save_news(db, ticker, max_items=50, commit=False)
+                result['news_count'] = news_count
+                if fetch_errors[PAGE_ENDPOINT_NEWS]:
+                    result['failed_data_types'].append(DATA_TYPE_NEWS)
             
+        except DeadlineExceeded:
+            # 타임아웃된 종목은 오류로 기록하지 않고 _run_ticker_task가 롤백
+            raise
         except Exception as e:
             error_msg = f"Error collecting data for {ticker}: {str(e)}"
             logger.error(error_msg, exc_info=True)
@@ -98,12 +333,271 @@ class DataScheduler:
         
         return result
     
-    def _collect_all_data(self):
+    def _save_prefetched_data(self, ticker: str, fetched: dict, db: Session) -> dict:
+        """
+        비동기 엔진이 수집한 데이터를 저장
+        
+        Args:
+            ticker: 종목 코드
+            fetched: AsyncCollectionEngine.collect_ticker 결과
+            db: 데이터베이스 세션
+        
+        Returns:
+            _collect_data_for_ticker와 같은 형식의 결과 딕셔너리
+        """
+        result = {
+            'ticker': ticker,
+            'prices_count': 0,
+            'trading_count': 0,
+            'news_count': 0,
+            'unchanged_rows': 0,
+            'errors': list(fetched.get('errors', [])),
+            # 엔진이 종목별로 센 요청 실패를 데이터 유형으로 변환 (실패한 유형은 수집 완료로 기록하지 않음)
+            'failed_data_types': [
+                data_type for data_type, endpoint in DATA_TYPE_FETCH_ENDPOINTS.items()
+                if fetched.get('fetch_errors', {}).get(endpoint)
+            ],
+        }
+        
+        try:
+            prices = fetched.get('prices', [])
+            trading = fetched.get('trading', [])
+            news = fetched.get('news', [])
+            
+            if self.ingest_buffer is not None:
+                return self._submit_prefetched_data(ticker, prices, trading, news, result)
+            
+            # 커밋은 _run_ticker_task가 fencing 확인 후 한 번만 수행 (저장에 실패한 유형의 페이지 지문만 바로 폐기)
+            write_stats = Counter()
+            finance_collector = FinanceCollector(page_tracker=self.page_tracker, write_stats=write_stats)
+            result['prices_count'] = finance_collector.save_price_data(db, prices, commit=False)
+            if prices and result['prices_count'] == 0:
+                finance_collector.finish_pages(PRICE_PAGE_ENDPOINTS, ticker, success=False)
+            result['trading_count'] = finance_collector.save_trading_flow_data(db, trading, commit=False)
+            if trading and result['trading_count'] == 0:
+                finance_collector.finish_pages((PAGE_ENDPOINT_FRGN,), ticker, success=False)
+            result['unchanged_rows'] = write_stats['unchanged']
+            
+            news_collector = NewsCollector(page_tracker=self.page_tracker)
+            result['news_count'] = news_collector.save_news_data(db, news, commit=False)
+            if news and result['news_count'] == 0:
+                news_collector.finish_pages(ticker, success=False)
+            
+        except DeadlineExceeded:
+            raise
+        except Exception as e:
+            error_msg = f"Error saving data for {ticker}: {str(e)}"
+            logger.error(error_msg, exc_info=True)
+            result['errors'].append(error_msg)
+        
+        return result
+    
+    def _submit_prefetched_data(self, ticker: str, prices: list, trading: list, news: list, result: dict) -> dict:
+        """비동기 엔진이 수집한 데이터를 수집 데이터 버퍼에 넣음 (페이지 지문은 저장 후 확정)"""
+        finance_collector = FinanceCollector(page_tracker=self.page_tracker)
+        news_collector = NewsCollector(page_tracker=self.page_tracker)
+        
+        result['prices_count'] = self.ingest_buffer.submit(
+            DATA_TYPE_PRICES, prices, callback=partial(finance_collector.finish_pages, PRICE_PAGE_ENDPOINTS, ticker)
+        )
+        result['trading_count'] = self.ingest_buffer.submit(
+            DATA_TYPE_TRADING, trading, callback=partial(finance_collector.finish_pages, (PAGE_ENDPOINT_FRGN,), ticker)
+        )
+        result['news_count'] = self.ingest_buffer.submit(
+            DATA_TYPE_NEWS, news, callback=partial(news_collector.finish_pages, ticker)
+        )
+        return result
+    
+    def _run_ticker_task(
+        self,
+        ticker: str,
+        fetched: Optional[dict],
+        deadlines: Dict[str, Deadline],
+        data_types: Optional[Collection[str]] = None,
+        run_stats: Optional[RunStats] = None,
+    ) -> dict:
+        """
+        종목 하나를 전용 세션으로 수집/저장 (워커 스레드에서 실행)
+        
+        Args:
+            ticker: 종목 코드
+            fetched: 비동기 엔진이 미리 수집한 데이터 (None이면 직접 수집)
+            deadlines: 종목별 마감 시각 기록 (타임아웃 판단과 취소용)
+            data_types: 수집할 데이터 유형 (None이면 모두)
+            run_stats: 이번 실행의 통계 (변경 없는 페이지 수, 버퍼가 쓰지 않은 행 수)
+        
+        Returns:
+            _collect_data_for_ticker 결과 딕셔너리
+        """
+        deadline = deadlines[ticker] = Deadline(self.task_timeout)
+        db: Session = SessionLocal()
+        try:
+            # 요청마다 마감을 확인하고, 재시도 대기가 마감을 넘기면 재시도하지 않음
+            with deadline_scope(deadline), run_stats_scope(run_stats):
+                if fetched is not None:
+                    result = self._save_prefetched_data(ticker, fetched, db)
+                else:
+                    result = self._collect_data_for_ticker(ticker, db, data_types)
+            # 타임아웃으로 결과를 기다리지 않기로 한 작업은 커밋하지 않음
+            deadline.check(ticker)
+            # 리더 락을 잃었거나 새 리더가 이미 커밋했으면 커밋하지 않음 (fencing)
+            if self.coordinator is not None:
+                self.coordinator.verify(db)
+            # 트랜잭션 커밋 (각 종목마다 한 번, 수집기는 커밋하지 않고 이 트랜잭션에 저장)
+            db.commit()
+        except Exception:
+            db.rollback()
+            self._finish_ticker_pages(ticker, data_types, success=False)
+            raise
+        finally:
+            db.close()
+        self._finish_ticker_pages(ticker, data_types, success=True)
+        return result
+    
+    def _finish_ticker_pages(self, ticker: str, data_types: Optional[Collection[str]], success: bool) -> None:
+        """
+        종목 트랜잭션 결과에 따라 이번 실행이 스테이징한 페이지 지문 확정 또는 폐기
+        
+        직접 저장 경로에서만 사용합니다 (버퍼 경로는 버퍼가 저장 후 콜백으로 확정).
+        동시에 실행 중인 다른 데이터 유형 job의 지문은 건드리지 않도록 이번 실행의 유형만 처리합니다.
+        """
+        if self.page_tracker is None or self.ingest_buffer is not None:
+            return
+        for data_type in (data_types if data_types is not None else DATA_TYPES):
+            for endpoint in DATA_TYPE_PAGE_ENDPOINTS.get(data_type, ()):
+                if success:
+                    self.page_tracker.commit(endpoint, ticker)
+                else:
+                    self.page_tracker.discard(endpoint, ticker)
+    
+    def _run_ticker_tasks(
+        self,
+        tickers: List[str],
+        prefetched: Optional[dict],
+        data_types: Optional[Collection[str]] = None,
+        run_stats: Optional[RunStats] = None,
+    ) -> Dict[str, Union[dict, BaseException]]:
+        """
+        종목별 수집 작업을 워커 풀에서 실행하고 결과 수집
+        
+        시작 후 task_timeout을 넘긴 작업은 기다리지 않고 TimeoutError로 기록하며 취소합니다.
+        (실행 중인 스레드는 강제로 중단할 수 없지만, 취소된 작업은 다음 요청이나 커밋 전에
+        DeadlineExceeded로 멈추고 롤백합니다.)
+        
+        Args:
+            tickers: 종목 코드 리스트
+            prefetched: 비동기 엔진이 미리 수집한 종목별 데이터 (None이면 직접 수집)
+            data_types: 수집할 데이터 유형 (None이면 모두)
+            run_stats: 이번 실행의 통계 (작업 스레드의 컨텍스트에 둠)
+        
+        Returns:
+            종목 코드별 결과 딕셔너리 또는 예외
+        """
+        results: Dict[str, Union[dict, BaseException]] = {}
+        deadlines: Dict[str, Deadline] = {}
+        executor = ThreadPoolExecutor(
+            max_workers=max(1, min(self.max_workers, len(tickers))),
+            thread_name_prefix="collect",
+        )
+        futures = {
+            executor.submit(
+                self._run_ticker_task,
+                ticker,
+                prefetched[ticker] if prefetched is not None else None,
+                deadlines,
+                data_types,
+                run_stats,
+            ): ticker
+            for ticker in tickers
+        }
+        pending = set(futures)
+        try:
+            while pending:
+                done, pending = wait(pending, timeout=TASK_POLL_INTERVAL, return_when=FIRST_COMPLETED)
+                for future in done:
+                    try:
+                        results[futures[future]] = future.result()
+                    except Exception as e:
+                        results[futures[future]] = e
+                
+                for future in list(pending):
+                    ticker = futures[future]
+                    deadline = deadlines.get(ticker)
+                    if deadline is not None and deadline.expired:
+                        deadline.cancel()
+                        pending.discard(future)
+                        results[ticker] = TimeoutError(f"Collection timed out after {self.task_timeout}s")
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
+        
+        return results
+    
+    def _collect_all_data(self, data_types: Optional[Collection[str]] = None) -> dict:
         """
-        모든 종목에 대한 데이터 수집 (스케줄러에서 호출)
+        모든 종목에 대한 데이터 수집 (스케줄러 job에서 호출)
+        
+        실행 상태는 이번 실행이 맡은 데이터 유형의 job에만 기록하므로,
+        동시에 실행 중인 다른 유형의 job 상태를 덮어쓰지 않습니다.
+        
+        Args:
+            data_types: 수집할 데이터 유형 (None이면 가격, 매매동향, 뉴스 모두)
+        
+        Returns:
+            {'status', 'error', 'stats'} 실행 결과 딕셔너리
         """
-        logger.info("Starting scheduled data collection")
-        self.last_run_time = datetime.now()
+        run_jobs = [self.jobs[data_type] for data_type in (data_types or DATA_TYPES) if data_type in self.jobs]
+        started = datetime.now()
+        for job in run_jobs:
+            job.last_run_time = started
+        
+        outcome = self._collect(data_types)
+        
+        for job in run_jobs:
+            job.last_run_status = outcome['status']
+            job.last_run_error = outcome['error']
+            job.last_run_stats = outcome['stats']
+        return outcome
+    
+    def _collect(self, data_types: Optional[Collection[str]]) -> dict:
+        """
+        _collect_all_data의 수집 실행 (실행 상태는 반환값으로만 전달)
+        
+        Returns:
+            {'status', 'error', 'stats'} 실행 결과 딕셔너리
+        """
+        outcome = {'status': None, 'error': None, 'stats': {}}
+        
+        # 리더가 아니거나 멤버십을 갱신하지 못했으면 다른 프로세스에 맡김
+        if self.coordinator is not None and not self.coordinator.can_run():
+            logger.debug("Skipping data collection: another scheduler instance is collecting")
+            outcome['status'] = "standby"
+            return outcome
+        
+        # 장 시간 기준으로 이번 실행에서 수집할 데이터 유형 결정
+        market_now = None
+        if self.collection_policy is not None:
+            market_now = self.collection_policy.calendar.now()
+            data_types = [
+                data_type for data_type in (data_types or DATA_TYPES)
+                if self.collection_policy.is_due(data_type, market_now)
+            ]
+            if not data_types:
+                logger.debug(
+                    f"Skipping data collection: nothing due "
+                    f"(market {self.collection_policy.calendar.phase(market_now)})"
+                )
+                outcome['status'] = "skipped"
+                return outcome
+        
+        logger.info(f"Starting scheduled data collection ({', '.join(data_types) if data_types else 'all'})")
+        # 이번 실행의 통계 (페이지 변경 추적기와 버퍼는 동시에 실행 중인 job과 공유하므로 실행별로 따로 집계)
+        run_stats = RunStats()
+        if self.ingest_buffer is not None:
+            self.ingest_buffer.start()
+        
+        # 이번 실행의 모든 종목이 공유하는 페이지 재시도 예산
+        run_key = self._run_key(data_types)
+        retry_budget = self._retry_budgets[run_key] = RetryBudget.from_settings()
         
         db: Session = SessionLocal()
         try:
@@ -112,8 +606,22 @@ class DataScheduler:
             
             if not tickers:
                 logger.warning("No stocks found in database")
-                self.last_run_status = "no_stocks"
-                return
+                outcome['status'] = "no_stocks"
+                return outcome
+            
+            if self.coordinator is not None:
+                tickers = self.coordinator.assign(tickers)
+                if not tickers:
+                    logger.debug("Skipping data collection: no ticker assigned to this instance")
+                    outcome['status'] = "skipped"
+                    return outcome
+            
+            if self._should_prioritize(data_types, market_now):
+                tickers = self.ticker_prioritizer.select(tickers)
+                if not tickers:
+                    logger.debug("Skipping price collection: no ticker due by access priority")
+                    outcome['status'] = "skipped"
+                    return outcome
             
             logger.info(f"Collecting data for {len(tickers)} stocks")
             
@@ -124,80 +632,258 @@ class DataScheduler:
                 'total_prices': 0,
                 'total_trading': 0,
                 'total_news': 0,
+                'unchanged_rows': 0,
                 'errors': []
             }
             
-            # 각 종목에 대해 데이터 수집
+            # 비동기 엔진 사용 시 모든 종목의 페이지를 먼저 동시에 수집
+            prefetched = None
+            if self.use_async_engine:
+                price_since = None
+                if settings.PRICE_INCREMENTAL_ENABLED and (data_types is None or DATA_TYPE_PRICES in data_types):
+                    finance_collector = FinanceCollector()
+                    price_since = {
+                        ticker: finance_collector.get_latest_price_date(db, ticker) for ticker in tickers
+                    }
+                # 동기 수집과 같은 호스트 예산과 이번 실행의 재시도 예산 사용
+                engine = AsyncCollectionEngine(
+                    finance_collector=FinanceCollector(
+                        page_tracker=self.page_tracker,
+                        rate_limiter=self.host_rate_limiter,
+                        retry_budget=retry_budget,
+                    ),
+                    news_collector=NewsCollector(
+                        page_tracker=self.page_tracker,
+                        rate_limiter=self.host_rate_limiter,
+                        retry_budget=retry_budget,
+                    ),
+                )
+                with run_stats_scope(run_stats):
+                    prefetched = engine.run(tickers, price_since=price_since, data_types=data_types)
+            
+            # 종목별 수집을 워커 풀에서 동시에 실행 (종목마다 전용 세션)
+            ticker_results = self._run_ticker_tasks(tickers, prefetched, data_types, run_stats)
+            
+            # 데이터 유형별로 하나 이상의 종목에서 수집에 성공했는지 집계 (수집 완료 기록 기준)
+            run_data_types = list(data_types) if data_types is not None else list(DATA_TYPES)
+            succeeded_types = Counter()
             for ticker in tickers:
-                try:
-                    result = self._collect_data_for_ticker(ticker, db)
-                    
-                    total_results['total_prices'] += result['prices_count']
-                    total_results['total_trading'] += result['trading_count']
-                    total_results['total_news'] += result['news_count']
-                    
-                    if result['errors']:
-                        total_results['failed'] += 1
-                        total_results['errors'].extend(result['errors'])
-                    else:
-                        total_results['successful'] += 1
-                    
-                    # 트랜잭션 커밋 (각 종목마다)
-                    db.commit()
-                    
-                except Exception as e:
-                    db.rollback()
-                    error_msg = f"Failed to collect data for {ticker}: {str(e)}"
-                    logger.error(error_msg, exc_info=True)
+                result = ticker_results[ticker]
+                if isinstance(result, BaseException):
+                    error_msg = f"Failed to collect data for {ticker}: {str(result)}"
+                    logger.error(error_msg, exc_info=result)
                     total_results['failed'] += 1
                     total_results['errors'].append(error_msg)
+                    continue
+                
+                total_results['total_prices'] += result['prices_count']
+                total_results['total_trading'] += result['trading_count']
+                total_results['total_news'] += result['news_count']
+                total_results['unchanged_rows'] += result['unchanged_rows']
+                
+                # 오류가 난 종목은 어느 유형에서 났는지 알 수 없으므로 모든 유형을 실패로 봄
+                failed_types = set(run_data_types) if result['errors'] else set(result.get('failed_data_types', ()))
+                succeeded_types.update(data_type for data_type in run_data_types if data_type not in failed_types)
+                
+                if result['errors'] or failed_types:
+                    total_results['failed'] += 1
+                    total_results['errors'].extend(result['errors'])
+                else:
+                    total_results['successful'] += 1
             
-            self.last_run_status = "success"
+            # 버퍼에 남은 행을 저장한 뒤 이번 실행에서 변경 없어 쓰지 않은 행 수 집계
+            if self.ingest_buffer is not None:
+                if not self.ingest_buffer.flush(timeout=settings.INGEST_BUFFER_SUBMIT_TIMEOUT):
+                    logger.warning("Ingest buffer did not finish flushing before the end of the run")
+                total_results['unchanged_rows'] += run_stats.get('unchanged_rows')
+            
+            total_results['unchanged_pages'] = run_stats.get('unchanged_pages')
+            
+            # 모든 종목에서 실패한 유형은 수집 완료로 기록하지 않아 다음 실행에서 다시 수집
+            if self.collection_policy is not None:
+                collected_types = [data_type for data_type in data_types if succeeded_types[data_type]]
+                self.collection_policy.mark_collected(collected_types, market_now)
+                retry_types = [data_type for data_type in data_types if not succeeded_types[data_type]]
+                if retry_types:
+                    logger.warning(f"Collection failed for every ticker, will retry next run: {', '.join(retry_types)}")
+            total_results['page_retries'] = retry_budget.used
+            total_results['retries_denied'] = retry_budget.denied
+            outcome['stats'] = {
+                key: total_results[key]
+                for key in (
+                    'total_prices', 'total_trading', 'total_news', 'unchanged_pages', 'unchanged_rows',
+                    'page_retries', 'retries_denied',
+                )
+            }
+            outcome['status'] = "success"
             logger.info(
                 f"Data collection completed: {total_results['successful']} successful, "
                 f"{total_results['failed']} failed, "
                 f"{total_results['total_prices']} prices, "
                 f"{total_results['total_trading']} trading, "
-                f"{total_results['total_news']} news"
+                f"{total_results['total_news']} news, "
+                f"{total_results['unchanged_pages']} unchanged pages, "
+                f"{total_results['unchanged_rows']} unchanged rows, "
+                f"{total_results['page_retries']} page retries"
             )
+            logger.debug(f"HTTP connection stats: {get_http_client().get_stats()}")
             
         except Exception as e:
             db.rollback()
             error_msg = f"Error in scheduled data collection: {str(e)}"
             logger.error(error_msg, exc_info=True)
-            self.last_run_status = "error"
-            self.last_run_error = error_msg
+            outcome['status'] = "error"
+            outcome['error'] = error_msg
         finally:
+            self._retry_budgets.pop(run_key, None)
             db.close()
+        
+        return outcome
+    
+    def _should_prioritize(self, data_types: Optional[Collection[str]], market_now: Optional[datetime]) -> bool:
+        """
+        조회 빈도로 종목을 골라 수집할지 여부
+        
+        장 중 가격 job만 해당하며, 장 마감 후 종가 수집과 매매동향/뉴스 수집은 모든 종목을 수집합니다.
+        """
+        if self.ticker_prioritizer is None or data_types is None or list(data_types) != [DATA_TYPE_PRICES]:
+            return False
+        return market_now is None or self.collection_policy.calendar.is_open(market_now)
+    
+    def _run_job(self, data_type: str) -> None:
+        """
+        데이터 유형별 수집 job 실행 (APScheduler에서 호출)
+        
+        Args:
+            data_type: DATA_TYPE_PRICES, DATA_TYPE_TRADING, DATA_TYPE_NEWS
+        """
+        job = self.jobs[data_type]
+        job.last_run_time = datetime.now()
+        http_before = get_http_client().get_stats()
+        start = time.monotonic()
+        outcome = self._collect_all_data([data_type])
+        job.last_duration = time.monotonic() - start
+        job.last_run_status = outcome['status']
+        job.last_run_error = outcome['error']
+        job.last_run_stats = outcome['stats']
+        logger.info(f"{job.name} finished in {job.last_duration:.2f}s ({job.last_run_status})")
+        
+        if outcome['status'] in ("skipped", "standby"):
+            return
+        
+        job.durations.append(job.last_duration)
+        job.last_latency = self._average_latency(http_before, get_http_client().get_stats())
+        if job.last_duration > job.effective_interval:
+            job.overruns += 1
+            logger.warning(
+                f"{job.name} overran its interval: {job.last_duration:.2f}s > {job.effective_interval:.0f}s"
+            )
+        
+        if self.adaptive_interval:
+            self._adapt_interval(job)
+    
+    @staticmethod
+    def _average_latency(before: Dict[str, dict], after: Dict[str, dict]) -> Optional[float]:
+        """두 HTTP 통계 스냅샷 사이 요청의 평균 응답 지연 (초, 요청이 없으면 None)"""
+        requests_count = 0
+        latency = 0.0
+        for host, stats in after.items():
+            previous = before.get(host, {})
+            requests_count += stats['requests'] - previous.get('requests', 0)
+            latency += stats['latency_seconds'] - previous.get('latency_seconds', 0.0)
+        return latency / requests_count if requests_count > 0 else None
+    
+    def _adapt_interval(self, job: CollectionJob) -> None:
+        """
+        최근 실행 시간과 upstream 응답 지연에 맞춰 job 실행 간격 조정
+        
+        실행 시간(90번째 백분위수)에 여유 비율을 곱한 값이 설정 간격보다 길면 간격을 늘리고,
+        upstream 응답 지연이 목표보다 길면 그 비율만큼 늘립니다. 실행이 다시 빨라지면
+        설정 간격까지 줄어들며, 최대 설정 간격 x SCHEDULER_ADAPTIVE_MAX_FACTOR까지 늘어납니다.
+        """
+        base = job.interval_seconds
+        target = max(base, job.typical_duration() * settings.SCHEDULER_ADAPTIVE_HEADROOM)
+        if job.last_latency is not None and job.last_latency > settings.SCHEDULER_ADAPTIVE_LATENCY_TARGET:
+            target = max(target, base * job.last_latency / settings.SCHEDULER_ADAPTIVE_LATENCY_TARGET)
+        target = min(target, base * settings.SCHEDULER_ADAPTIVE_MAX_FACTOR)
+        
+        if abs(target - job.effective_interval) < job.effective_interval * ADAPTIVE_RESCHEDULE_THRESHOLD:
+            return
+        
+        logger.info(f"{job.name} interval adjusted: {job.effective_interval:.0f}s -> {target:.0f}s")
+        job.effective_interval = target
+        if self.scheduler.running and self.scheduler.get_job(job.job_id):
+            self.scheduler.reschedule_job(job.job_id, trigger=IntervalTrigger(seconds=target))
+    
+    def _on_job_event(self, event) -> None:
+        """APScheduler 이벤트 처리 (건너뛴 실행, 놓친 실행 집계)"""
+        job = next((job for job in self.jobs.values() if job.job_id == event.job_id), None)
+        if job is None:
+            return
+        if event.code == EVENT_JOB_MAX_INSTANCES:
+            job.skipped_runs += 1
+            logger.warning(f"{job.name} skipped: previous run is still in progress")
+        elif event.code == EVENT_JOB_MISSED:
+            job.missed_runs += 1
+            logger.warning(f"{job.name} missed its scheduled run time")
     
     def start(self):
         """
-        스케줄러 시작
+        스케줄러 시작 (사용하도록 설정된 데이터 유형별 job 등록)
         """
         if self.is_running:
             logger.warning("Scheduler is already running")
             return
         
         try:
+            if self.ingest_buffer is not None:
+                self.ingest_buffer.start()
+            
             # 기존 job이 있으면 제거
-            if self.scheduler.get_job(self.job_id):
-                self.scheduler.remove_job(self.job_id)
+            for job in self.jobs.values():
+                if self.scheduler.get_job(job.job_id):
+                    self.scheduler.remove_job(job.job_id)
             
             # 스케줄러 시작
             self.scheduler.start()
             
-            # 데이터 수집 job 추가 (30초 간격)
-            trigger = IntervalTrigger(seconds=self.interval_seconds)
-            self.scheduler.add_job(
-                func=self._collect_all_data,
-                trigger=trigger,
-                id=self.job_id,
-                name="Data Collection Job",
-                replace_existing=True,
-            )
+            # 첫 실행 전에 리더 락/멤버십을 확인하고 주기적으로 갱신
+            if self.coordinator is not None:
+                self.coordinator.heartbeat()
+                self.scheduler.add_job(
+                    func=self.coordinator.heartbeat,
+                    trigger=IntervalTrigger(seconds=settings.SCHEDULER_HEARTBEAT_INTERVAL),
+                    id=COORDINATION_JOB_ID,
+                    name="Coordination Heartbeat Job",
+                    replace_existing=True,
+                    max_instances=1,
+                    coalesce=True,
+                )
+            
+            # 데이터 유형별 수집 job 추가
+            # (동시에 하나만 실행, 밀린 실행은 한 번으로 합침)
+            for job in self.jobs.values():
+                if not job.enabled:
+                    continue
+                job.effective_interval = job.interval_seconds
+                self.scheduler.add_job(
+                    func=self._run_job,
+                    trigger=IntervalTrigger(seconds=job.interval_seconds),
+                    args=[job.data_type],
+                    id=job.job_id,
+                    name=job.name,
+                    replace_existing=True,
+                    max_instances=1,
+                    coalesce=True,
+                    misfire_grace_time=job.interval_seconds,
+                )
             
             self.is_running = True
-            logger.info(f"Scheduler started with {self.interval_seconds} second interval")
+            logger.info(
+                "Scheduler started with jobs: " + ", ".join(
+                    f"{job.data_type} every {job.interval_seconds}s" for job in self.jobs.values() if job.enabled
+                )
+            )
             
         except Exception as e:
             logger.error(f"Failed to start scheduler: {e}", exc_info=True)
@@ -213,12 +899,24 @@ class DataScheduler:
         
         try:
             # job 제거
-            if self.scheduler.get_job(self.job_id):
-                self.scheduler.remove_job(self.job_id)
+            for job in self.jobs.values():
+                if self.scheduler.get_job(job.job_id):
+                    self.scheduler.remove_job(job.job_id)
+            
+            if self.scheduler.get_job(COORDINATION_JOB_ID):
+                self.scheduler.remove_job(COORDINATION_JOB_ID)
             
             # 스케줄러 중지
             self.scheduler.shutdown(wait=False)
             
+            # 다른 프로세스가 바로 이어받도록 리더 락 해제/멤버십에서 제거
+            if self.coordinator is not None:
+                self.coordinator.release()
+            
+            # 버퍼에 남은 행 저장 후 writer 종료
+            if self.ingest_buffer is not None:
+                self.ingest_buffer.close()
+            
             self.is_running = False
             logger.info("Scheduler stopped")
             
@@ -233,22 +931,75 @@ class DataScheduler:
         if self.is_running:
             self.stop()
     
+    def get_jobs_status(self) -> Dict[str, dict]:
+        """
+        데이터 유형별 job 상태 조회
+        
+        Returns:
+            {data_type: job 상태 딕셔너리}
+        """
+        statuses = {}
+        for data_type, job in self.jobs.items():
+            scheduled = self.scheduler.get_job(job.job_id) if self.scheduler.running else None
+            statuses[data_type] = {
+                'enabled': job.enabled,
+                'interval_seconds': job.interval_seconds,
+                'next_run_time': (
+                    scheduled.next_run_time.isoformat() if scheduled and scheduled.next_run_time else None
+                ),
+                'last_run_time': job.last_run_time.isoformat() if job.last_run_time else None,
+                'last_run_status': job.last_run_status,
+                'last_run_error': job.last_run_error,
+                'last_duration': round(job.last_duration, 3) if job.last_duration is not None else None,
+                'last_run_stats': job.last_run_stats,
+                'effective_interval_seconds': round(job.effective_interval, 1),
+                'recent_durations': [round(duration, 3) for duration in job.durations],
+                'avg_duration': round(sum(job.durations) / len(job.durations), 3) if job.durations else None,
+                'max_duration': round(max(job.durations), 3) if job.durations else None,
+                'last_latency_ms': round(job.last_latency * 1000, 1) if job.last_latency is not None else None,
+                'overruns': job.overruns,
+                'skipped_runs': job.skipped_runs,
+                'missed_runs': job.missed_runs,
+            }
+        return statuses
+    
+    @staticmethod
+    def _circuit_breaker_states() -> Dict[str, dict]:
+        """엔드포인트별 Circuit Breaker 상태 (비활성화 시 빈 딕셔너리)"""
+        if not settings.CIRCUIT_BREAKER_ENABLED:
+            return {}
+        return {name: get_circuit_breaker(name).get_state() for name in CIRCUIT_BREAKER_ENDPOINTS}
+    
     def get_status(self) -> dict:
         """
         스케줄러 상태 조회
         
         Returns:
-            스케줄러 상태 딕셔너리
+            스케줄러 상태 딕셔너리 (next_run_time은 job 중 가장 빠른 다음 실행 시간)
         """
-        job = self.scheduler.get_job(self.job_id) if self.scheduler.running else None
+        jobs = self.get_jobs_status()
+        next_run_times = [job['next_run_time'] for job in jobs.values() if job['next_run_time']]
         
         return {
             'is_running': self.is_running,
             'interval_seconds': self.interval_seconds,
-            'next_run_time': job.next_run_time.isoformat() if job and job.next_run_time else None,
+            'next_run_time': min(next_run_times) if next_run_times else None,
             'last_run_time': self.last_run_time.isoformat() if self.last_run_time else None,
             'last_run_status': self.last_run_status,
             'last_run_error': self.last_run_error,
+            'last_run_stats': self.last_run_stats,
+            'jobs': jobs,
+            'adaptive_interval': self.adaptive_interval,
+            'overruns': sum(job['overruns'] + job['skipped_runs'] for job in jobs.values()),
+            'max_workers': self.max_workers,
+            'http_connections': get_http_client().get_stats(),
+            'rate_limit': self.host_rate_limiter.get_stats(),
+            'circuit_breakers': self._circuit_breaker_states(),
+            'page_changes': self.page_tracker.get_stats() if self.page_tracker is not None else {},
+            'ingest_buffer': self.ingest_buffer.get_stats() if self.ingest_buffer is not None else {},
+            'market': self.collection_policy.get_status() if self.collection_policy is not None else {},
+            'priority': self.ticker_prioritizer.get_stats() if self.ticker_prioritizer is not None else {},
+            'coordination': self.coordinator.get_status() if self.coordinator is not None else {},
         }
 
 
@@ -0,0 +1,149 @@
+"""
+조회 빈도 기반 종목 우선순위
+
+API 조회 빈도(access heat)가 높은 종목은 매 실행마다, 낮은 종목은 점점 긴 간격으로
+수집하도록 실행(tick)마다 수집할 종목을 고릅니다.
+
+종목마다 다음 수집 tick을 우선순위 큐(heap)에 두고, 수집할 차례가 된 종목 중
+heat가 높은 종목부터 tick당 예산(budget)만큼 꺼냅니다. 예산을 넘어 밀린 종목은
+다음 tick에 다시 후보가 됩니다.
+
+수집 간격(tick 단위)은 heat가 hot_heat 이상이면 1, 그보다 낮으면 hot_heat/heat를
+2의 거듭제곱으로 올린 값이며 max_backoff를 넘지 않습니다.
+"""
+
+import heapq
+import logging
+import math
+import threading
+from typing import Dict, List, Optional, Tuple
+
+from app.config import settings
+from app.utils.access_heat import AccessHeatTracker, get_access_heat_tracker
+
+logger = logging.getLogger(__name__)
+
+
+class TickerPrioritizer:
+    """
+    조회 빈도 기반 종목 선택기
+
+    Example:
+        prioritizer = TickerPrioritizer.from_settings()
+        tickers = prioritizer.select(all_tickers)  # 이번 tick에 수집할 종목
+    """
+
+    def __init__(
+        self,
+        tracker: AccessHeatTracker,
+        hot_heat: float = 1.0,
+        max_backoff: int = 8,
+        budget: int = 0,
+    ):
+        """
+        Args:
+            tracker: access heat 추적기
+            hot_heat: 매 tick 수집하는 heat 기준
+            max_backoff: 조회되지 않는 종목의 최대 수집 간격 (tick)
+            budget: tick당 최대 수집 종목 수 (0이면 제한 없음)
+        """
+        self.tracker = tracker
+        self.hot_heat = hot_heat
+        self.max_backoff = max(1, max_backoff)
+        self.budget = budget
+        self._lock = threading.Lock()
+        self._tick = 0
+        # (다음 수집 tick, 순번, ticker) 힙과 종목별 예약된 다음 수집 tick
+        self._heap: List[Tuple[int, int, str]] = []
+        self._next_tick: Dict[str, int] = {}
+        self._sequence = 0
+        self._last_selected = 0
+        self._last_deferred = 0
+
+    @classmethod
+    def from_settings(cls, tracker: Optional[AccessHeatTracker] = None) -> 'TickerPrioritizer':
+        """설정값으로 선택기 생성"""
+        return cls(
+            tracker or get_access_heat_tracker(),
+            hot_heat=settings.SCHEDULER_PRIORITY_HOT_HEAT,
+            max_backoff=settings.SCHEDULER_PRIORITY_MAX_BACKOFF,
+            budget=settings.SCHEDULER_TICK_BUDGET,
+        )
+
+    def backoff(self, heat: float) -> int:
+        """heat에 따른 수집 간격 (tick)"""
+        if heat >= self.hot_heat:
+            return 1
+        if heat <= 0:
+            return self.max_backoff
+        return min(self.max_backoff, 2 ** math.ceil(math.log2(self.hot_heat / heat)))
+
+    def _push(self, ticker: str, tick: int) -> None:
+        self._sequence += 1
+        self._next_tick[ticker] = tick
+        heapq.heappush(self._heap, (tick, self._sequence, ticker))
+
+    def select(self, tickers: List[str]) -> List[str]:
+        """
+        이번 tick에 수집할 종목 선택
+
+        처음 보는 종목은 바로 수집하고, 목록에서 빠진 종목은 큐에서 제거합니다.
+        heat를 조회하지 못하면 모든 종목을 수집합니다.
+
+        Args:
+            tickers: 전체 종목 코드 리스트
+
+        Returns:
+            수집할 종목 코드 리스트 (heat 내림차순)
+        """
+        heats = self.tracker.heats(tickers)
+        if heats is None:
+            return list(tickers)
+
+        with self._lock:
+            self._tick += 1
+            active = set(tickers)
+            for ticker in tickers:
+                if ticker not in self._next_tick:
+                    self._push(ticker, self._tick)
+
+            # 수집할 차례가 된 종목 (예약이 바뀐 오래된 힙 항목과 목록에서 빠진 종목은 버림)
+            due: List[str] = []
+            seen = set()
+            while self._heap and self._heap[0][0] <= self._tick:
+                tick, _, ticker = heapq.heappop(self._heap)
+                if ticker not in active:
+                    self._next_tick.pop(ticker, None)
+                    continue
+                if self._next_tick.get(ticker) == tick and ticker not in seen:
+                    seen.add(ticker)
+                    due.append(ticker)
+            for ticker in set(self._next_tick) - active:
+                del self._next_tick[ticker]
+
+            due.sort(key=lambda ticker: heats.get(ticker, 0.0), reverse=True)
+            selected = due[:self.budget] if self.budget > 0 else due
+            for ticker in selected:
+                self._push(ticker, self._tick + self.backoff(heats.get(ticker, 0.0)))
+            # 예산을 넘어 밀린 종목은 다음 tick에 다시 후보
+            for ticker in due[len(selected):]:
+                self._push(ticker, self._tick + 1)
+
+            self._last_selected = len(selected)
+            self._last_deferred = len(due) - len(selected)
+
+        if self._last_deferred:
+            logger.info(f"Ticker priority: {len(selected)} selected, {self._last_deferred} deferred by budget")
+        return selected
+
+    def get_stats(self) -> dict:
+        """선택기 통계"""
+        with self._lock:
+            return {
+                'tick': self._tick,
+                'tracked': len(self._next_tick),
+                'budget': self.budget,
+                'last_selected': self._last_selected,
+                'last_deferred': self._last_deferred,
+                'access_heat': self.tracker.get_stats(),
+            }
@@ -0,0 +1,270 @@
+"""
+종목 조회 빈도(access heat) 추적 유틸리티
+
+API에서 종목을 조회할 때마다 종목별 카운터를 올리고, 카운터는 반감기(half_life)마다
+절반으로 줄어듭니다. 최근 자주 조회된 종목일수록 heat가 높으며, 스케줄러는 이 값으로
+자주 조회되는 종목을 먼저, 자주 갱신합니다.
+
+- AccessHeatTracker: 프로세스 메모리 (API 서버와 스케줄러가 같은 프로세스일 때)
+- RedisAccessHeatTracker: Redis sorted set (여러 API 워커/노드가 공유)
+"""
+
+import logging
+import math
+import threading
+import time
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+from app.config import settings
+from app.utils.redis import get_redis_client
+
+logger = logging.getLogger(__name__)
+
+# Redis 키 접두사 (기준 시각 구간마다 별도 키)
+ACCESS_HEAT_REDIS_PREFIX = "access_heat"
+
+HEAT_BACKEND_MEMORY = "memory"
+HEAT_BACKEND_REDIS = "redis"
+
+# 메모리 추적기가 기록하는 최대 종목 수 (넘으면 heat가 거의 0인 종목 제거)
+MAX_TRACKED_TICKERS = 100_000
+# 제거 대상 heat 기준
+PRUNE_HEAT = 0.01
+
+# Redis 점수 기준 시각 구간 (초)
+# 점수를 기준 시각 대비 2^(경과/반감기)배로 저장하므로, 값이 너무 커지지 않도록 하루마다 새 키 사용
+REDIS_EPOCH_SECONDS = 86400
+
+
+class AccessHeatTracker:
+    """
+    프로세스 메모리 access heat 추적기
+
+    Example:
+        tracker = get_access_heat_tracker()
+        tracker.record("487240")              # API 조회 시
+        heats = tracker.heats(["487240", "466920"])  # 스케줄러에서
+    """
+
+    backend = HEAT_BACKEND_MEMORY
+
+    def __init__(self, half_life: float = 600.0, clock: Callable[[], float] = time.time):
+        """
+        Args:
+            half_life: heat가 절반으로 줄어드는 시간 (초)
+            clock: 현재 시각 함수 (초, 테스트용)
+        """
+        if half_life <= 0:
+            raise ValueError("half_life must be positive")
+        self.half_life = half_life
+        self.clock = clock
+        self._lock = threading.Lock()
+        # ticker -> (마지막 갱신 시점의 heat, 마지막 갱신 시각)
+        self._heats: Dict[str, Tuple[float, float]] = {}
+        self._recorded = 0
+
+    def _decay(self, elapsed: float) -> float:
+        return math.pow(0.5, max(elapsed, 0.0) / self.half_life)
+
+    def record(self, ticker: str, weight: float = 1.0) -> None:
+        """종목 조회 기록"""
+        now = self.clock()
+        with self._lock:
+            heat, updated_at = self._heats.get(ticker, (0.0, now))
+            self._heats[ticker] = (heat * self._decay(now - updated_at) + weight, now)
+            self._recorded += 1
+            if len(self._heats) > MAX_TRACKED_TICKERS:
+                self._prune(now)
+
+    def _prune(self, now: float) -> None:
+        """heat가 거의 0으로 줄어든 종목 제거 (잠금 안에서 호출)"""
+        for ticker, (heat, updated_at) in list(self._heats.items()):
+            if heat * self._decay(now - updated_at) < PRUNE_HEAT:
+                del self._heats[ticker]
+
+    def heats(self, tickers: Iterable[str]) -> Optional[Dict[str, float]]:
+        """
+        종목별 현재 heat
+
+        Returns:
+            {ticker: heat} 딕셔너리 (조회 기록이 없으면 0.0, 조회 실패 시 None)
+        """
+        now = self.clock()
+        with self._lock:
+            result = {}
+            for ticker in tickers:
+                heat, updated_at = self._heats.get(ticker, (0.0, now))
+                result[ticker] = heat * self._decay(now - updated_at)
+            return result
+
+    def heat(self, ticker: str) -> float:
+        """종목 하나의 현재 heat"""
+        return (self.heats([ticker]) or {}).get(ticker, 0.0)
+
+    def top(self, n: int = 10) -> List[Tuple[str, float]]:
+        """heat가 높은 종목 n개"""
+        with self._lock:
+            tickers = list(self._heats)
+        heats = self.heats(tickers) or {}
+        return sorted(heats.items(), key=lambda item: item[1], reverse=True)[:n]
+
+    def get_stats(self) -> dict:
+        """추적기 통계"""
+        with self._lock:
+            tracked = len(self._heats)
+            recorded = self._recorded
+        return {
+            'backend': self.backend,
+            'half_life': self.half_life,
+            'tracked': tracked,
+            'recorded': recorded,
+            'top': [(ticker, round(heat, 3)) for ticker, heat in self.top(5)],
+        }
+
+
+class RedisAccessHeatTracker(AccessHeatTracker):
+    """
+    Redis sorted set access heat 추적기
+
+    조회할 때마다 점수를 감소시키는 대신, 기준 시각(landmark) 대비 2^(경과/반감기)배로
+    키운 가중치를 ZINCRBY로 더하고(forward decay), 읽을 때 같은 비율로 나눕니다.
+    기준 시각은 REDIS_EPOCH_SECONDS마다 바뀌므로 현재 구간과 직전 구간 키를 함께 읽습니다.
+    Redis 조회에 실패하면 heats()가 None을 반환하므로 호출 측은 우선순위 없이 동작해야 합니다.
+    """
+
+    backend = HEAT_BACKEND_REDIS
+
+    def __init__(
+        self,
+        half_life: float = 600.0,
+        prefix: str = ACCESS_HEAT_REDIS_PREFIX,
+        client=None,
+        clock: Callable[[], float] = time.time,
+    ):
+        """
+        Args:
+            half_life: heat가 절반으로 줄어드는 시간 (초)
+            prefix: Redis 키 접두사
+            client: Redis 클라이언트 (None이면 get_redis_client() 사용)
+            clock: 현재 시각 함수 (초, 테스트용)
+        """
+        super().__init__(half_life=half_life, clock=clock)
+        self.prefix = prefix
+        self._client = client
+
+    @property
+    def client(self):
+        if self._client is None:
+            self._client = get_redis_client()
+        return self._client
+
+    def _epoch(self, now: float) -> int:
+        return int(now // REDIS_EPOCH_SECONDS)
+
+    def _key(self, epoch: int) -> str:
+        return f"{self.prefix}:{epoch}"
+
+    def _growth(self, now: float, epoch: int) -> float:
+        """기준 시각(epoch 시작) 대비 가중치 배율"""
+        return math.pow(2.0, (now - epoch * REDIS_EPOCH_SECONDS) / self.half_life)
+
+    def record(self, ticker: str, weight: float = 1.0) -> None:
+        now = self.clock()
+        epoch = self._epoch(now)
+        key = self._key(epoch)
+        try:
+            pipe = self.client.pipeline(transaction=False)
+            pipe.zincrby(key, weight * self._growth(now, epoch), ticker)
+            pipe.expire(key, REDIS_EPOCH_SECONDS * 2)
+            pipe.execute()
+            with self._lock:
+                self._recorded += 1
+        except Exception as e:
+            logger.warning(f"Access heat update failed (ticker: {ticker}): {e}")
+
+    def heats(self, tickers: Iterable[str]) -> Optional[Dict[str, float]]:
+        tickers = list(tickers)
+        now = self.clock()
+        epoch = self._epoch(now)
+        try:
+            pipe = self.client.pipeline(transaction=False)
+            for ticker in tickers:
+                pipe.zscore(self._key(epoch), ticker)
+                pipe.zscore(self._key(epoch - 1), ticker)
+            scores = pipe.execute()
+        except Exception as e:
+            logger.warning(f"Access heat lookup failed: {e}")
+            return None
+
+        current_growth = self._growth(now, epoch)
+        previous_growth = self._growth(now, epoch - 1)
+        current, previous = scores[0::2], scores[1::2]
+        return {
+            ticker: float(current[i] or 0.0) / current_growth + float(previous[i] or 0.0) / previous_growth
+            for i, ticker in enumerate(tickers)
+        }
+
+    def top(self, n: int = 10) -> List[Tuple[str, float]]:
+        try:
+            tickers = self.client.zrevrange(self._key(self._epoch(self.clock())), 0, n - 1)
+        except Exception as e:
+            logger.warning(f"Access heat lookup failed: {e}")
+            return []
+        heats = self.heats(tickers) or {}
+        return sorted(heats.items(), key=lambda item: item[1], reverse=True)[:n]
+
+    def get_stats(self) -> dict:
+        with self._lock:
+            recorded = self._recorded
+        return {
+            'backend': self.backend,
+            'half_life': self.half_life,
+            'recorded': recorded,
+            'top': [(ticker, round(heat, 3)) for ticker, heat in self.top(5)],
+        }
+
+
+# 전역 access heat 추적기 인스턴스
+_access_heat_tracker: Optional[AccessHeatTracker] = None
+_access_heat_tracker_lock = threading.Lock()
+
+
+def get_access_heat_tracker() -> AccessHeatTracker:
+    """
+    전역 access heat 추적기 반환 (싱글톤 패턴)
+
+    ACCESS_HEAT_BACKEND 설정에 따라 메모리 또는 Redis 추적기를 생성합니다.
+    수집 워커를 쓰는데(COLLECTION_WORKER_ENABLED) 메모리 추적기를 설정하면 경고합니다.
+
+    Returns:
+        AccessHeatTracker 인스턴스
+    """
+    global _access_heat_tracker
+
+    if _access_heat_tracker is None:
+        with _access_heat_tracker_lock:
+            if _access_heat_tracker is None:
+                if settings.ACCESS_HEAT_BACKEND == HEAT_BACKEND_REDIS:
+                    _access_heat_tracker = RedisAccessHeatTracker(half_life=settings.ACCESS_HEAT_HALF_LIFE)
+                elif settings.ACCESS_HEAT_BACKEND == HEAT_BACKEND_MEMORY:
+                    if settings.COLLECTION_WORKER_ENABLED:
+                        # API가 기록한 조회 빈도를 워커 프로세스의 스케줄러가 볼 수 없음
+                        logger.warning(
+                            "ACCESS_HEAT_BACKEND=memory with COLLECTION_WORKER_ENABLED=true: the collection worker "
+                            "cannot see API access heat, set ACCESS_HEAT_BACKEND=redis"
+                        )
+                    _access_heat_tracker = AccessHeatTracker(half_life=settings.ACCESS_HEAT_HALF_LIFE)
+                else:
+                    raise ValueError(f"Unknown access heat backend: {settings.ACCESS_HEAT_BACKEND}")
+
+    return _access_heat_tracker
+
+
+def record_ticker_access(ticker: str) -> None:
+    """API 종목 조회 기록 (ACCESS_HEAT_ENABLED일 때만, 실패해도 요청 처리는 계속)"""
+    if not settings.ACCESS_HEAT_ENABLED:
+        return
+    try:
+        get_access_heat_tracker().record(ticker)
+    except Exception as e:
+        logger.warning(f"Failed to record access for {ticker}: {e}")
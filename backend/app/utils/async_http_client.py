@@ -0,0 +1,148 @@
+"""
+비동기 HTTP 클라이언트 유틸리티
+
+asyncio 기반 수집 엔진에서 여러 페이지 요청을 동시에 처리합니다.
+요청 속도는 동기 수집기와 같은 호스트별 예산(AsyncRateLimiter → 전역 RateLimiter의 토큰 버킷)을
+따르므로, 동기/비동기 수집 경로가 하나의 upstream 예산을 공유합니다.
+"""
+
+import logging
+import time
+from collections import defaultdict
+from typing import Dict, Optional
+
+import httpx
+import requests
+
+from app.config import settings
+from app.utils.http_client import DEFAULT_HEADERS
+from app.utils.rate_limiter import AsyncRateLimiter, host_of
+
+logger = logging.getLogger(__name__)
+
+
+def _as_request_error(error: httpx.HTTPError) -> requests.exceptions.RequestException:
+    """httpx 전송 오류를 requests 예외로 변환 (재시도/Circuit Breaker가 동기 수집과 같은 규칙으로 판단)"""
+    if isinstance(error, httpx.TimeoutException):
+        return requests.exceptions.Timeout(str(error))
+    if isinstance(error, httpx.TransportError):
+        return requests.exceptions.ConnectionError(str(error))
+    return requests.exceptions.RequestException(str(error))
+
+
+class AsyncHttpClient:
+    """
+    비동기 HTTP 클라이언트
+
+    `httpx.AsyncClient` 위에 호스트별 요청 예산(AsyncRateLimiter)을 적용합니다.
+    커넥션은 이벤트 루프에 묶이므로 수집 실행 단위로 생성하고
+    `async with`로 종료합니다.
+
+    오류는 requests 예외로 변환합니다 (4xx/5xx는 requests.exceptions.HTTPError, 304는 그대로 반환).
+    재시도와 Circuit Breaker는 수집기의 _get_page_async가 적용합니다.
+
+    Example:
+        async with AsyncHttpClient.from_settings() as client:
+            response = await client.get(url, headers=headers)
+    """
+
+    def __init__(
+        self,
+        rate_limiter: Optional[AsyncRateLimiter] = None,
+        max_connections: int = 32,
+        connect_timeout: float = 3.05,
+        read_timeout: float = 10.0,
+        transport: Optional[httpx.AsyncBaseTransport] = None,
+    ):
+        """
+        Args:
+            rate_limiter: 호스트별 요청 예산 (None이면 전역 RateLimiter를 공유하는 AsyncRateLimiter)
+            max_connections: 전체 최대 연결 수
+            connect_timeout: 연결 타임아웃 (초)
+            read_timeout: 읽기 타임아웃 (초)
+            transport: 사용자 지정 전송 계층 (테스트용)
+        """
+        self.rate_limiter = rate_limiter or AsyncRateLimiter()
+        self._requests: Dict[str, int] = defaultdict(int)
+        self._errors: Dict[str, int] = defaultdict(int)
+        self._client = httpx.AsyncClient(
+            headers=DEFAULT_HEADERS,
+            timeout=httpx.Timeout(read_timeout, connect=connect_timeout),
+            limits=httpx.Limits(
+                max_connections=max_connections,
+                max_keepalive_connections=max_connections,
+            ),
+            follow_redirects=True,
+            transport=transport,
+        )
+
+    @classmethod
+    def from_settings(cls, **kwargs) -> 'AsyncHttpClient':
+        """설정값으로 클라이언트 생성"""
+        options = {
+            'max_connections': settings.ASYNC_MAX_CONNECTIONS,
+            'connect_timeout': settings.HTTP_CONNECT_TIMEOUT,
+            'read_timeout': settings.HTTP_READ_TIMEOUT,
+        }
+        options.update(kwargs)
+        return cls(**options)
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.aclose()
+        return False
+
+    async def get(self, url: str, headers: Optional[dict] = None) -> httpx.Response:
+        """
+        호스트 예산을 지키며 GET 요청
+
+        응답은 동기 HTTP 클라이언트처럼 Rate Limiter의 AIMD 조절기에도 반영합니다.
+
+        Args:
+            url: 요청 URL
+            headers: 추가 요청 헤더
+
+        Returns:
+            httpx.Response (2xx/3xx)
+
+        Raises:
+            requests.exceptions.HTTPError: 4xx/5xx 응답 (response에 httpx.Response)
+            requests.exceptions.RequestException: 타임아웃, 연결 오류 등
+        """
+        host = host_of(url)
+        async with self.rate_limiter.limit(host):
+            self._requests[host] += 1
+            started = time.monotonic()
+            try:
+                response = await self._client.get(url, headers=headers)
+            except httpx.HTTPError as e:
+                self._errors[host] += 1
+                error = _as_request_error(e)
+                self.rate_limiter.limiter.record_response(host, None, time.monotonic() - started, error)
+                raise error from e
+            self.rate_limiter.limiter.record_response(host, response.status_code, time.monotonic() - started)
+
+        if response.status_code >= 400:
+            self._errors[host] += 1
+            raise requests.exceptions.HTTPError(
+                f"{response.status_code} Error for url: {url}", response=response, request=None
+            )
+        return response
+
+    def get_stats(self) -> dict:
+        """
+        호스트별 요청 통계 조회 (대기 시간은 rate_limiter.get_stats() 참고)
+
+        Returns:
+            {host: {'requests', 'errors'}} 딕셔너리
+        """
+        return {
+            host: {'requests': count, 'errors': self._errors.get(host, 0)}
+            for host, count in self._requests.items()
+        }
+
+    async def aclose(self):
+        """클라이언트 및 커넥션 풀 종료"""
+        await self._client.aclose()
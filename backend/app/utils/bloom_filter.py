@@ -0,0 +1,266 @@
+"""
+Bloom 필터 유틸리티
+
+키가 "확실히 없음"인지를 데이터베이스 조회 없이 판별합니다.
+거짓 양성(있다고 답했지만 실제로는 없음)은 설정한 오차율 이하로 발생할 수 있지만,
+거짓 음성은 없으므로 "있을 수 있음"으로 판별된 키만 데이터베이스에서 확인하면 됩니다.
+
+- BloomFilter: 프로세스 메모리 비트 배열
+- RedisBloomFilter: Redis 비트맵 (SETBIT/GETBIT, 여러 프로세스가 공유)
+"""
+
+import hashlib
+import logging
+import math
+import threading
+from typing import Iterable, List, Optional
+
+from app.config import settings
+from app.utils.redis import get_redis_client
+
+logger = logging.getLogger(__name__)
+
+# 뉴스 url_hash 필터 Redis 키
+NEWS_BLOOM_REDIS_KEY = "bloom:news:url_hash"
+
+BLOOM_BACKEND_MEMORY = "memory"
+BLOOM_BACKEND_REDIS = "redis"
+
+
+class BloomFilter:
+    """
+    프로세스 메모리 Bloom 필터
+
+    Example:
+        bloom = BloomFilter(capacity=1_000_000, error_rate=0.001)
+        bloom.add_many(existing_hashes)
+
+        maybe_seen = [key for key, seen in zip(keys, bloom.contains_many(keys)) if seen]
+    """
+
+    backend = BLOOM_BACKEND_MEMORY
+
+    def __init__(self, capacity: int = 1_000_000, error_rate: float = 0.001):
+        """
+        Args:
+            capacity: 예상 최대 키 수 (넘으면 거짓 양성 비율이 오차율보다 커짐)
+            error_rate: capacity개를 넣었을 때의 목표 거짓 양성 비율
+        """
+        if capacity <= 0:
+            raise ValueError("capacity must be positive")
+        if not 0 < error_rate < 1:
+            raise ValueError("error_rate must be between 0 and 1")
+
+        self.capacity = capacity
+        self.error_rate = error_rate
+        # 최적 비트 수 m = -n·ln(p) / (ln 2)², 해시 함수 수 k = (m / n)·ln 2
+        self.num_bits = max(8, math.ceil(-capacity * math.log(error_rate) / (math.log(2) ** 2)))
+        self.num_hashes = max(1, round(self.num_bits / capacity * math.log(2)))
+        self.warmed = False
+
+        self._bits = bytearray((self.num_bits + 7) // 8)
+        self._lock = threading.Lock()
+        self._stats = {'added': 0, 'checked': 0, 'maybe_present': 0}
+
+    def _indices(self, key: str) -> List[int]:
+        """키의 비트 위치 k개 (이중 해싱: h1 + i·h2)"""
+        digest = hashlib.blake2b(key.encode('utf-8'), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], 'little')
+        h2 = int.from_bytes(digest[8:], 'little') | 1
+        return [(h1 + i * h2) % self.num_bits for i in range(self.num_hashes)]
+
+    def _set_bits(self, indices: List[int]) -> None:
+        with self._lock:
+            for index in indices:
+                self._bits[index >> 3] |= 1 << (index & 7)
+
+    def _get_bits(self, indices: List[int]) -> List[bool]:
+        with self._lock:
+            return [bool(self._bits[index >> 3] & (1 << (index & 7))) for index in indices]
+
+    def add(self, key: str) -> None:
+        """키 추가"""
+        self.add_many([key])
+
+    def add_many(self, keys: Iterable[str]) -> int:
+        """
+        여러 키 추가
+
+        Returns:
+            추가한 키 수
+        """
+        indices = []
+        count = 0
+        for key in keys:
+            indices.extend(self._indices(key))
+            count += 1
+        if indices:
+            self._set_bits(indices)
+        with self._lock:
+            self._stats['added'] += count
+        return count
+
+    def contains_many(self, keys: List[str]) -> List[bool]:
+        """
+        여러 키의 포함 여부 (False이면 확실히 없음, True이면 있을 수 있음)
+        """
+        if not keys:
+            return []
+
+        indices = [index for key in keys for index in self._indices(key)]
+        bits = self._get_bits(indices)
+        k = self.num_hashes
+        result = [all(bits[i * k:(i + 1) * k]) for i in range(len(keys))]
+
+        with self._lock:
+            self._stats['checked'] += len(keys)
+            self._stats['maybe_present'] += sum(result)
+        return result
+
+    def __contains__(self, key: str) -> bool:
+        return self.contains_many([key])[0]
+
+    def needs_warmup(self) -> bool:
+        """기존 키로 채워야 하는지 여부 (프로세스마다 한 번)"""
+        return not self.warmed
+
+    def mark_warmed(self) -> None:
+        """기존 키로 채웠음을 기록"""
+        self.warmed = True
+
+    def clear(self) -> None:
+        """모든 키 제거"""
+        with self._lock:
+            self._bits = bytearray(len(self._bits))
+        self.warmed = False
+
+    def get_stats(self) -> dict:
+        """필터 설정 및 조회 통계"""
+        with self._lock:
+            stats = dict(self._stats)
+        return {
+            'backend': self.backend,
+            'capacity': self.capacity,
+            'error_rate': self.error_rate,
+            'bits': self.num_bits,
+            'hashes': self.num_hashes,
+            **stats,
+        }
+
+
+class RedisBloomFilter(BloomFilter):
+    """
+    Redis 비트맵 Bloom 필터
+
+    여러 프로세스(API 서버, 스케줄러, 워커)가 같은 필터를 공유합니다.
+    Redis 조회에 실패하면 모든 키를 "있을 수 있음"으로 답하므로 호출 측은
+    데이터베이스 조회로 대체되어 결과가 틀리지 않습니다.
+    """
+
+    backend = BLOOM_BACKEND_REDIS
+
+    def __init__(self, key: str, capacity: int = 1_000_000, error_rate: float = 0.001, client=None):
+        """
+        Args:
+            key: Redis 비트맵 키
+            capacity: 예상 최대 키 수
+            error_rate: 목표 거짓 양성 비율
+            client: Redis 클라이언트 (None이면 get_redis_client() 사용)
+        """
+        super().__init__(capacity=capacity, error_rate=error_rate)
+        # 비트는 Redis에만 저장
+        self._bits = bytearray()
+        self.key = key
+        # 기존 키로 모두 채운 뒤에만 설정하는 표시 키 (비트맵 키는 채우는 도중에도 존재)
+        self.warmed_key = f"{key}:warmed"
+        self._client = client
+
+    @property
+    def client(self):
+        if self._client is None:
+            self._client = get_redis_client()
+        return self._client
+
+    def _set_bits(self, indices: List[int]) -> None:
+        try:
+            pipe = self.client.pipeline(transaction=False)
+            for index in indices:
+                pipe.setbit(self.key, index, 1)
+            pipe.execute()
+        except Exception as e:
+            logger.warning(f"Bloom filter update failed (key: {self.key}): {e}")
+
+    def _get_bits(self, indices: List[int]) -> List[bool]:
+        try:
+            pipe = self.client.pipeline(transaction=False)
+            for index in indices:
+                pipe.getbit(self.key, index)
+            return [bool(bit) for bit in pipe.execute()]
+        except Exception as e:
+            logger.warning(f"Bloom filter lookup failed (key: {self.key}): {e}")
+            return [True] * len(indices)
+
+    def needs_warmup(self) -> bool:
+        """
+        다른 프로세스가 채우기를 마치지 않았으면 채움
+
+        다른 프로세스가 채우는 중이면 이 프로세스도 함께 채웁니다 (같은 비트를 다시 켜므로 결과는 같음).
+        """
+        if self.warmed:
+            return False
+        try:
+            return not self.client.exists(self.warmed_key)
+        except Exception as e:
+            logger.warning(f"Bloom filter check failed (key: {self.key}): {e}")
+            return False
+
+    def mark_warmed(self) -> None:
+        """채우기를 마쳤음을 다른 프로세스에도 알림"""
+        try:
+            self.client.set(self.warmed_key, 1)
+        except Exception as e:
+            logger.warning(f"Bloom filter warm marker update failed (key: {self.key}): {e}")
+        self.warmed = True
+
+    def clear(self) -> None:
+        try:
+            self.client.delete(self.key, self.warmed_key)
+        except Exception as e:
+            logger.warning(f"Bloom filter clear failed (key: {self.key}): {e}")
+        self.warmed = False
+
+
+# 전역 뉴스 Bloom 필터 (싱글톤)
+_news_bloom_filter: Optional[BloomFilter] = None
+_news_bloom_filter_lock = threading.Lock()
+
+
+def get_news_bloom_filter() -> BloomFilter:
+    """
+    뉴스 url_hash Bloom 필터 반환 (싱글톤 패턴)
+
+    NEWS_BLOOM_BACKEND 설정에 따라 메모리 또는 Redis 필터를 생성합니다.
+
+    Returns:
+        BloomFilter 인스턴스
+    """
+    global _news_bloom_filter
+
+    if _news_bloom_filter is None:
+        with _news_bloom_filter_lock:
+            if _news_bloom_filter is None:
+                if settings.NEWS_BLOOM_BACKEND == BLOOM_BACKEND_REDIS:
+                    _news_bloom_filter = RedisBloomFilter(
+                        NEWS_BLOOM_REDIS_KEY,
+                        capacity=settings.NEWS_BLOOM_CAPACITY,
+                        error_rate=settings.NEWS_BLOOM_ERROR_RATE,
+                    )
+                elif settings.NEWS_BLOOM_BACKEND == BLOOM_BACKEND_MEMORY:
+                    _news_bloom_filter = BloomFilter(
+                        capacity=settings.NEWS_BLOOM_CAPACITY,
+                        error_rate=settings.NEWS_BLOOM_ERROR_RATE,
+                    )
+                else:
+                    raise ValueError(f"Unknown bloom filter backend: {settings.NEWS_BLOOM_BACKEND}")
+
+    return _news_bloom_filter
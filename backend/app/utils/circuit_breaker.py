@@ -0,0 +1,242 @@
+"""
+Circuit Breaker 유틸리티
+
+upstream 엔드포인트(sise_day, frgn, news 등)별로 최근 요청 결과를 보고 요청을 차단합니다.
+
+- closed: 정상. 최근 window개 요청 중 실패 비율이 failure_rate 이상이면(min_requests개 이상일 때) open
+- open: 요청을 보내지 않고 바로 CircuitOpenError. open_seconds가 지나면 half-open
+- half-open: half_open_probes개의 확인 요청만 보냄. 모두 성공하면 closed, 하나라도 실패하면 다시 open
+
+점검 중인 페이지 유형 하나 때문에 모든 종목이 실행마다 타임아웃과 재시도를 기다리지 않도록,
+열린 엔드포인트의 데이터 유형은 수집기가 바로 건너뜁니다.
+"""
+
+import logging
+import threading
+import time
+from collections import deque
+from datetime import datetime, timedelta
+from typing import Deque, Dict, Optional
+
+import requests
+
+from app.config import settings
+
+logger = logging.getLogger(__name__)
+
+CIRCUIT_CLOSED = "closed"
+CIRCUIT_OPEN = "open"
+CIRCUIT_HALF_OPEN = "half_open"
+
+
+class CircuitOpenError(requests.exceptions.RequestException):
+    """엔드포인트 차단 중이라 요청을 보내지 않음 (수집기의 네트워크 오류 처리로 해당 데이터 유형을 건너뜀)"""
+
+    def __init__(self, name: str, retry_in: float):
+        super().__init__(f"Circuit open for {name} (retry in {retry_in:.0f}s)")
+        self.name = name
+        self.retry_in = retry_in
+
+
+class CircuitBreaker:
+    """
+    엔드포인트 하나의 Circuit Breaker
+
+    Example:
+        breaker = CircuitBreaker("frgn")
+        breaker.before_request()  # open이면 CircuitOpenError
+        try:
+            response = fetch()
+        except requests.exceptions.Timeout:
+            breaker.record_failure()
+            raise
+        except BaseException:
+            breaker.release()
+            raise
+        breaker.record_success()
+    """
+
+    def __init__(
+        self,
+        name: str,
+        failure_rate: float = 0.5,
+        min_requests: int = 10,
+        window: int = 20,
+        open_seconds: float = 60.0,
+        half_open_probes: int = 2,
+        clock=time.monotonic,
+    ):
+        """
+        Args:
+            name: 엔드포인트 이름
+            failure_rate: 차단할 최근 실패 비율 (0~1)
+            min_requests: 실패 비율을 판단할 최소 요청 수
+            window: 실패 비율을 계산할 최근 요청 수
+            open_seconds: 차단 후 확인 요청을 보내기까지의 시간 (초)
+            half_open_probes: half-open에서 보낼 확인 요청 수 (모두 성공하면 closed)
+            clock: 단조 시계 (테스트용)
+        """
+        self.name = name
+        self.failure_rate = failure_rate
+        self.min_requests = max(1, min_requests)
+        self.open_seconds = open_seconds
+        self.half_open_probes = max(1, half_open_probes)
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._state = CIRCUIT_CLOSED
+        self._outcomes: Deque[bool] = deque(maxlen=max(window, self.min_requests))
+        self._opened_at: Optional[float] = None
+        self._opened_wall: Optional[datetime] = None
+        self._probes_in_flight = 0
+        self._probe_successes = 0
+        self._opens = 0
+        self._rejected = 0
+
+    @classmethod
+    def from_settings(cls, name: str) -> 'CircuitBreaker':
+        """설정값으로 생성"""
+        return cls(
+            name,
+            failure_rate=settings.CIRCUIT_BREAKER_FAILURE_RATE,
+            min_requests=settings.CIRCUIT_BREAKER_MIN_REQUESTS,
+            window=settings.CIRCUIT_BREAKER_WINDOW,
+            open_seconds=settings.CIRCUIT_BREAKER_OPEN_SECONDS,
+            half_open_probes=settings.CIRCUIT_BREAKER_HALF_OPEN_PROBES,
+        )
+
+    @property
+    def state(self) -> str:
+        """현재 상태 (open_seconds가 지난 open은 half_open)"""
+        with self._lock:
+            self._maybe_half_open()
+            return self._state
+
+    def _maybe_half_open(self) -> None:
+        """open_seconds가 지났으면 half-open으로 전환 (잠금 안에서 호출)"""
+        if self._state == CIRCUIT_OPEN and self._clock() - self._opened_at >= self.open_seconds:
+            self._state = CIRCUIT_HALF_OPEN
+            self._probes_in_flight = 0
+            self._probe_successes = 0
+            logger.info(f"Circuit half-open for {self.name}: sending up to {self.half_open_probes} probe requests")
+
+    def _open(self) -> None:
+        """차단 시작 (잠금 안에서 호출)"""
+        self._state = CIRCUIT_OPEN
+        self._opened_at = self._clock()
+        self._opened_wall = datetime.now()
+        self._opens += 1
+        self._outcomes.clear()
+
+    def before_request(self) -> None:
+        """
+        요청을 보내도 되는지 확인 (half-open이면 확인 요청 슬롯 차지)
+
+        Raises:
+            CircuitOpenError: 차단 중이거나 확인 요청 슬롯이 모두 사용 중
+        """
+        with self._lock:
+            self._maybe_half_open()
+            if self._state == CIRCUIT_CLOSED:
+                return
+            if self._state == CIRCUIT_HALF_OPEN and self._probes_in_flight < self.half_open_probes:
+                self._probes_in_flight += 1
+                return
+            self._rejected += 1
+            retry_in = max(0.0, self._opened_at + self.open_seconds - self._clock())
+        raise CircuitOpenError(self.name, retry_in)
+
+    def release(self) -> None:
+        """결과를 알 수 없이 끝난 요청의 확인 요청 슬롯 반납 (성공/실패로 기록하지 않음)"""
+        with self._lock:
+            if self._state == CIRCUIT_HALF_OPEN:
+                self._probes_in_flight = max(0, self._probes_in_flight - 1)
+
+    def record_success(self) -> None:
+        """요청 성공 기록 (upstream이 응답한 4xx 등도 성공으로 기록)"""
+        with self._lock:
+            if self._state == CIRCUIT_HALF_OPEN:
+                self._probes_in_flight = max(0, self._probes_in_flight - 1)
+                self._probe_successes += 1
+                if self._probe_successes >= self.half_open_probes:
+                    self._state = CIRCUIT_CLOSED
+                    self._outcomes.clear()
+                    logger.info(f"Circuit closed for {self.name}: probe requests succeeded")
+            elif self._state == CIRCUIT_CLOSED:
+                self._outcomes.append(True)
+
+    def record_failure(self) -> None:
+        """요청 실패 기록 (재시도 후에도 실패한 타임아웃, 연결 오류, 429/5xx)"""
+        with self._lock:
+            if self._state == CIRCUIT_HALF_OPEN:
+                self._open()
+                logger.warning(f"Circuit re-opened for {self.name}: probe request failed")
+                return
+            if self._state != CIRCUIT_CLOSED:
+                return
+            self._outcomes.append(False)
+            failures = self._outcomes.count(False)
+            if len(self._outcomes) >= self.min_requests and failures / len(self._outcomes) >= self.failure_rate:
+                requests_count = len(self._outcomes)
+                self._open()
+                logger.warning(
+                    f"Circuit opened for {self.name}: {failures}/{requests_count} recent requests failed, "
+                    f"skipping for {self.open_seconds:.0f}s"
+                )
+
+    def get_state(self) -> dict:
+        """상태와 통계"""
+        with self._lock:
+            self._maybe_half_open()
+            failures = self._outcomes.count(False)
+            retry_at = None
+            if self._state == CIRCUIT_OPEN:
+                retry_at = (self._opened_wall + timedelta(seconds=self.open_seconds)).isoformat(timespec='seconds')
+            return {
+                'state': self._state,
+                'failure_rate': round(failures / len(self._outcomes), 3) if self._outcomes else 0.0,
+                'recent_requests': len(self._outcomes),
+                'opened_at': self._opened_wall.isoformat(timespec='seconds') if self._opened_wall else None,
+                'retry_at': retry_at,
+                'opens': self._opens,
+                'rejected': self._rejected,
+            }
+
+
+# 엔드포인트별 전역 Circuit Breaker
+_circuit_breakers: Dict[str, CircuitBreaker] = {}
+_circuit_breakers_lock = threading.Lock()
+
+
+def get_circuit_breaker(name: str) -> Optional[CircuitBreaker]:
+    """
+    엔드포인트의 전역 Circuit Breaker 조회 (엔드포인트별 싱글톤, 모든 수집기가 공유)
+
+    Args:
+        name: 엔드포인트 이름 (예: "sise_day")
+
+    Returns:
+        CircuitBreaker 인스턴스 (CIRCUIT_BREAKER_ENABLED=false이면 None)
+    """
+    if not settings.CIRCUIT_BREAKER_ENABLED:
+        return None
+
+    breaker = _circuit_breakers.get(name)
+    if breaker is None:
+        with _circuit_breakers_lock:
+            breaker = _circuit_breakers.get(name)
+            if breaker is None:
+                breaker = _circuit_breakers[name] = CircuitBreaker.from_settings(name)
+    return breaker
+
+
+def get_circuit_breaker_states() -> Dict[str, dict]:
+    """생성된 모든 Circuit Breaker의 상태"""
+    with _circuit_breakers_lock:
+        breakers = list(_circuit_breakers.values())
+    return {breaker.name: breaker.get_state() for breaker in breakers}
+
+
+def reset_circuit_breakers() -> None:
+    """모든 Circuit Breaker 제거 (테스트용)"""
+    with _circuit_breakers_lock:
+        _circuit_breakers.clear()
@@ -0,0 +1,91 @@
+"""
+작업 마감 시각(deadline) 유틸리티
+
+스케줄러는 종목 작업마다 Deadline을 만들어 작업 스레드의 컨텍스트에 둡니다.
+페이지 요청 재시도(request_with_retry)는 요청마다 먼저 마감을 확인하고, 재시도 대기가 마감을 넘기면
+재시도하지 않습니다. 타임아웃으로 결과를 기다리지 않기로 한 작업은 cancel()로 표시되므로,
+스레드가 백그라운드에서 계속 실행되더라도 다음 요청이나 커밋 전에 중단됩니다.
+"""
+
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Iterator, Optional
+
+
+class DeadlineExceeded(TimeoutError):
+    """마감 시각이 지났거나 취소된 작업"""
+
+
+class Deadline:
+    """
+    작업 하나의 마감 시각
+
+    Example:
+        deadline = Deadline(25.0)
+        with deadline_scope(deadline):
+            ... 수집 (request_with_retry가 요청마다 확인) ...
+        deadline.check("commit")   # 커밋 직전
+        db.commit()
+    """
+
+    def __init__(self, timeout: float, clock=time.monotonic):
+        """
+        Args:
+            timeout: 지금부터 마감까지의 시간 (초)
+            clock: 단조 시계 (테스트용)
+        """
+        self.timeout = timeout
+        self._clock = clock
+        self._expires_at = clock() + timeout
+        self._cancelled = threading.Event()
+
+    def remaining(self) -> float:
+        """마감까지 남은 시간 (초, 취소되었으면 0)"""
+        if self._cancelled.is_set():
+            return 0.0
+        return max(0.0, self._expires_at - self._clock())
+
+    @property
+    def expired(self) -> bool:
+        return self.remaining() <= 0
+
+    @property
+    def cancelled(self) -> bool:
+        return self._cancelled.is_set()
+
+    def cancel(self) -> None:
+        """작업 취소 (다음 확인부터 DeadlineExceeded)"""
+        self._cancelled.set()
+
+    def check(self, label: str = "task") -> None:
+        """
+        마감 전인지 확인
+
+        Raises:
+            DeadlineExceeded: 마감 시각이 지났거나 취소됨
+        """
+        if self._cancelled.is_set():
+            raise DeadlineExceeded(f"{label}: cancelled after {self.timeout}s timeout")
+        if self._clock() >= self._expires_at:
+            raise DeadlineExceeded(f"{label}: deadline of {self.timeout}s exceeded")
+
+
+# 현재 작업의 마감 시각 (스레드/태스크별)
+_current_deadline: ContextVar[Optional[Deadline]] = ContextVar("deadline", default=None)
+
+
+def current_deadline() -> Optional[Deadline]:
+    """현재 컨텍스트의 마감 시각 (없으면 None)"""
+    return _current_deadline.get()
+
+
+@contextmanager
+def deadline_scope(deadline: Optional[Deadline]) -> Iterator[Optional[Deadline]]:
+    """블록 안에서 deadline을 현재 마감 시각으로 사용"""
+    token = _current_deadline.set(deadline)
+    try:
+        yield deadline
+    finally:
+        _current_deadline.reset(token)
@@ -0,0 +1,258 @@
+"""
+HTTP 클라이언트 유틸리티
+
+호스트별 커넥션 풀과 Keep-Alive를 사용하는 공유 HTTP 세션을 제공합니다.
+매 요청마다 TCP/TLS 핸드셰이크를 새로 하지 않도록 수집기와 스케줄러가
+하나의 세션을 공유합니다.
+"""
+
+import logging
+import time
+from collections import defaultdict
+from threading import Lock
+from typing import Callable, Dict, List, Optional, Tuple
+from urllib.parse import urlparse
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+from urllib3.util.request import ACCEPT_ENCODING
+
+from app.config import settings
+
+logger = logging.getLogger(__name__)
+
+# 응답 관찰 콜백 (호스트, 상태 코드, 응답 지연 초, 예외) - 요청이 실패하면 상태 코드 None
+ResponseListener = Callable[[Optional[str], Optional[int], float, Optional[BaseException]], None]
+
+# 기본 요청 헤더 (brotli 패키지가 설치된 경우 urllib3가 "br"을 자동으로 포함)
+DEFAULT_HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36',
+    'Accept-Encoding': ACCEPT_ENCODING,
+    'Connection': 'keep-alive',
+}
+
+
+class _CountingHTTPAdapter(HTTPAdapter):
+    """
+    새 연결 생성과 요청 수를 호스트별로 집계하는 HTTPAdapter
+
+    urllib3 커넥션 풀의 `_new_conn` 호출 횟수로 새 연결 수를 세고,
+    전체 요청 수에서 빼서 재사용된 연결 수를 구합니다.
+    """
+
+    def __init__(self, client: 'HttpClient', **kwargs):
+        self._client = client
+        super().__init__(**kwargs)
+
+    def init_poolmanager(self, *args, **kwargs):
+        super().init_poolmanager(*args, **kwargs)
+        on_new_conn = self._client._record_new_connection
+
+        class _CountingHTTPConnectionPool(HTTPConnectionPool):
+            def _new_conn(self):
+                on_new_conn(self.host)
+                return super()._new_conn()
+
+        class _CountingHTTPSConnectionPool(HTTPSConnectionPool):
+            def _new_conn(self):
+                on_new_conn(self.host)
+                return super()._new_conn()
+
+        self.poolmanager.pool_classes_by_scheme = {
+            'http': _CountingHTTPConnectionPool,
+            'https': _CountingHTTPSConnectionPool,
+        }
+
+    def send(self, request, *args, **kwargs):
+        # response.elapsed는 Session.send가 어댑터 반환 후에 설정하므로 직접 측정
+        host = urlparse(request.url).hostname
+        started = time.monotonic()
+        try:
+            response = super().send(request, *args, **kwargs)
+        except Exception as e:
+            self._client._notify(host, None, time.monotonic() - started, e)
+            raise
+        latency = time.monotonic() - started
+        self._client._record_request(host, latency)
+        self._client._notify(host, response.status_code, latency, None)
+        return response
+
+
+class HttpClient:
+    """
+    공유 HTTP 클라이언트
+
+    호스트별 커넥션 풀, Keep-Alive, gzip/brotli 압축 협상을 지원하는
+    `requests.Session` 래퍼입니다.
+
+    Example:
+        client = get_http_client()
+        response = client.get("https://finance.naver.com/item/sise_day.naver?code=487240")
+        response.raise_for_status()
+    """
+
+    def __init__(
+        self,
+        pool_connections: int = 10,
+        pool_maxsize: int = 10,
+        connect_timeout: float = 3.05,
+        read_timeout: float = 10.0,
+    ):
+        """
+        HTTP 클라이언트 초기화
+
+        Args:
+            pool_connections: 캐시할 호스트별 커넥션 풀 개수
+            pool_maxsize: 호스트당 최대 유지 연결 수
+            connect_timeout: 연결 타임아웃 (초)
+            read_timeout: 읽기 타임아웃 (초)
+        """
+        self.pool_connections = pool_connections
+        self.pool_maxsize = pool_maxsize
+        self.timeout: Tuple[float, float] = (connect_timeout, read_timeout)
+
+        self._lock = Lock()
+        self._new_connections: Dict[str, int] = defaultdict(int)
+        self._requests: Dict[str, int] = defaultdict(int)
+        self._latency: Dict[str, float] = defaultdict(float)
+        self._listeners: List[ResponseListener] = []
+
+        self.session = requests.Session()
+        self.session.headers.update(DEFAULT_HEADERS)
+        adapter = _CountingHTTPAdapter(
+            self,
+            pool_connections=pool_connections,
+            pool_maxsize=pool_maxsize,
+        )
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
+
+        logger.info(
+            f"HttpClient 초기화: pool_connections={pool_connections}, "
+            f"pool_maxsize={pool_maxsize}, timeout={self.timeout}"
+        )
+
+    def _record_new_connection(self, host: str):
+        """새 연결 생성 기록"""
+        with self._lock:
+            self._new_connections[host] += 1
+
+    def _record_request(self, host: Optional[str], latency: float = 0.0):
+        """요청 완료 기록 (latency: 요청부터 응답 헤더 수신까지 걸린 시간, 초)"""
+        with self._lock:
+            self._requests[host or 'unknown'] += 1
+            self._latency[host or 'unknown'] += latency
+
+    def add_response_listener(self, listener: ResponseListener) -> None:
+        """
+        응답 관찰 콜백 등록 (적응형 요청 속도 조절 등)
+
+        Args:
+            listener: (호스트, 상태 코드, 응답 지연 초, 예외)를 받는 함수. 요청이 실패하면 상태 코드는 None
+        """
+        with self._lock:
+            if listener not in self._listeners:
+                self._listeners.append(listener)
+
+    def _notify(self, host: Optional[str], status: Optional[int], latency: float, error: Optional[BaseException]):
+        """응답 관찰 콜백 호출 (콜백 오류는 요청에 영향을 주지 않음)"""
+        with self._lock:
+            listeners = list(self._listeners)
+        for listener in listeners:
+            try:
+                listener(host, status, latency, error)
+            except Exception as e:
+                logger.warning(f"Response listener failed for {host}: {e}")
+
+    def get(self, url: str, headers: Optional[dict] = None, timeout=None, **kwargs) -> requests.Response:
+        """
+        GET 요청
+
+        Args:
+            url: 요청 URL
+            headers: 추가 요청 헤더 (세션 기본 헤더에 병합)
+            timeout: 타임아웃 (None이면 설정값 사용)
+
+        Returns:
+            requests.Response
+        """
+        return self.session.get(
+            url,
+            headers=headers,
+            timeout=timeout if timeout is not None else self.timeout,
+            **kwargs
+        )
+
+    def get_stats(self) -> dict:
+        """
+        호스트별 연결 통계 조회
+
+        Returns:
+            {host: {'requests', 'new_connections', 'reused_connections', 'latency_seconds', 'avg_latency_ms'}} 딕셔너리
+        """
+        with self._lock:
+            stats = {}
+            for host in set(self._requests) | set(self._new_connections):
+                requests_count = self._requests.get(host, 0)
+                new_count = self._new_connections.get(host, 0)
+                stats[host] = {
+                    'requests': requests_count,
+                    'new_connections': new_count,
+                    'reused_connections': max(requests_count - new_count, 0),
+                    'latency_seconds': round(self._latency.get(host, 0.0), 3),
+                    'avg_latency_ms': round(self._latency.get(host, 0.0) * 1000 / requests_count, 1) if requests_count else 0.0,
+                }
+            return stats
+
+    def reset_stats(self):
+        """통계 초기화"""
+        with self._lock:
+            self._new_connections.clear()
+            self._requests.clear()
+            self._latency.clear()
+
+    def close(self):
+        """세션 및 모든 커넥션 풀 종료"""
+        self.session.close()
+
+
+# 전역 HTTP 클라이언트 인스턴스
+_http_client_instance: Optional[HttpClient] = None
+_http_client_lock = Lock()
+
+
+def get_http_client() -> HttpClient:
+    """
+    공유 HTTP 클라이언트 인스턴스 조회 (싱글톤 패턴)
+
+    Returns:
+        HttpClient 인스턴스
+    """
+    global _http_client_instance
+
+    if _http_client_instance is None:
+        with _http_client_lock:
+            if _http_client_instance is None:
+                _http_client_instance = HttpClient(
+                    pool_connections=settings.HTTP_POOL_CONNECTIONS,
+                    pool_maxsize=settings.HTTP_POOL_MAXSIZE,
+                    connect_timeout=settings.HTTP_CONNECT_TIMEOUT,
+                    read_timeout=settings.HTTP_READ_TIMEOUT,
+                )
+
+    return _http_client_instance
+
+
+def close_http_client() -> None:
+    """공유 HTTP 클라이언트 종료"""
+    global _http_client_instance
+
+    if _http_client_instance is not None:
+        try:
+            _http_client_instance.close()
+            logger.info("HttpClient 종료")
+        except Exception as e:
+            logger.error(f"HttpClient 종료 오류: {e}")
+        finally:
+            _http_client_instance = None
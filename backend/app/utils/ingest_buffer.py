@@ -0,0 +1,352 @@
+"""
+write-behind 수집 데이터 버퍼
+
+수집기는 파싱한 행을 버퍼에 넣기만 하고, 단일 writer 스레드가 여러 종목의 행을
+모아 크기 또는 대기 시간 기준으로 큰 트랜잭션 하나로 저장합니다.
+종목·데이터 유형마다 커밋(fsync)하던 작은 트랜잭션 수가 크게 줄어듭니다.
+
+- 역압(backpressure): 대기 행 수가 max_pending_rows에 도달하면 submit()이
+  writer가 따라잡을 때까지 블록되어 데이터베이스가 느릴 때 수집 속도가 맞춰집니다.
+- 장애 격리: 배치 트랜잭션이 실패하면 제출 단위로 나눠 다시 저장하므로
+  한 종목의 잘못된 행이 다른 종목의 저장을 막지 않습니다.
+- 종료: close()는 남은 행을 모두 저장한 뒤 writer를 멈춥니다.
+- 커밋 전 확인: before_commit이 주어지면 매 트랜잭션 커밋 직전에 호출하고,
+  예외가 나면 커밋하지 않습니다 (예: 리더 락을 잃은 스케줄러의 fencing).
+  fatal_errors에 속한 예외는 제출 단위로 다시 저장해도 같은 결과이므로 배치 전체를 바로 실패 처리합니다.
+- 실행별 통계: 제출 시점 컨텍스트의 실행 통계(run_stats_scope)를 제출과 함께 기억하고,
+  실행마다 따로 저장한 결과(변경 없어 쓰지 않은 행 수 등)를 그 실행의 통계에 더합니다.
+"""
+
+import logging
+import threading
+import time
+from collections import defaultdict, deque
+from dataclasses import dataclass, field
+from typing import Callable, Deque, Dict, List, Optional, Tuple, Type
+
+from sqlalchemy.orm import Session
+
+from app.utils.deadline import current_deadline
+from app.utils.run_stats import RunStats, current_run_stats
+from app.utils.upsert import UpsertResult
+
+logger = logging.getLogger(__name__)
+
+# (세션, 행 리스트) -> UpsertResult, 커밋하지 않는 저장 함수
+Writer = Callable[[Session, List[dict]], UpsertResult]
+# 저장 완료 콜백 (성공 여부)
+Callback = Callable[[bool], None]
+# 커밋 직전 확인 (세션) -> None, 예외를 던지면 롤백
+BeforeCommit = Callable[[Session], None]
+
+
+@dataclass
+class _Submission:
+    """submit() 한 번으로 들어온 행 묶음"""
+
+    kind: str
+    rows: List[dict]
+    callback: Optional[Callback] = None
+    # 제출한 수집 실행의 통계 (저장 결과를 실행별로 더함)
+    run_stats: Optional[RunStats] = None
+    submitted_at: float = field(default_factory=time.monotonic)
+
+
+class IngestBuffer:
+    """
+    write-behind 수집 데이터 버퍼
+
+    Example:
+        buffer = IngestBuffer(SessionLocal, writers={
+            "prices": finance_collector.write_price_data,
+            "news": news_collector.write_news_data,
+        })
+        buffer.start()
+
+        buffer.submit("prices", price_rows, callback=lambda ok: ...)
+        ...
+        buffer.flush()   # 지금까지 넣은 행을 모두 저장할 때까지 대기
+        buffer.close()   # 종료 시
+    """
+
+    def __init__(
+        self,
+        session_factory: Callable[[], Session],
+        writers: Dict[str, Writer],
+        max_batch_rows: int = 5000,
+        max_age: float = 2.0,
+        max_pending_rows: int = 50000,
+        submit_timeout: float = 60.0,
+        before_commit: Optional[BeforeCommit] = None,
+        fatal_errors: Tuple[Type[Exception], ...] = (),
+    ):
+        """
+        Args:
+            session_factory: writer 스레드 전용 세션 생성 함수 (예: SessionLocal)
+            writers: 데이터 유형별 저장 함수 (커밋하지 않아야 함)
+            max_batch_rows: 대기 행 수가 이 값에 도달하면 바로 저장
+            max_age: 가장 오래된 대기 행이 이 시간(초)을 넘으면 저장
+            max_pending_rows: 대기 행 수 상한 (도달하면 submit()이 블록)
+            submit_timeout: submit()이 역압으로 기다리는 최대 시간 (초)
+            before_commit: 트랜잭션마다 커밋 직전에 호출할 확인 함수 (예외를 던지면 롤백)
+            fatal_errors: 제출 단위로 다시 저장하지 않고 배치 전체를 실패 처리할 예외 유형
+        """
+        self.session_factory = session_factory
+        self.writers = writers
+        self.max_batch_rows = max_batch_rows
+        self.max_age = max_age
+        self.max_pending_rows = max_pending_rows
+        self.submit_timeout = submit_timeout
+        self.before_commit = before_commit
+        self.fatal_errors = fatal_errors
+
+        self._condition = threading.Condition()
+        self._pending: Deque[_Submission] = deque()
+        self._pending_rows = 0
+        self._in_flight = 0
+        self._flush_requested = False
+        self._stopping = False
+        self._thread: Optional[threading.Thread] = None
+        self._stats = {
+            'submitted_rows': 0,
+            'transactions': 0,
+            'failed_submissions': 0,
+            'backpressure_waits': 0,
+            'backpressure_seconds': 0.0,
+            'last_flush_rows': 0,
+            'last_flush_seconds': 0.0,
+        }
+        self._results = defaultdict(int)
+
+    @property
+    def is_running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self) -> None:
+        """writer 스레드 시작"""
+        with self._condition:
+            if self.is_running:
+                return
+            self._stopping = False
+            self._thread = threading.Thread(target=self._run, name="ingest-buffer-writer", daemon=True)
+            self._thread.start()
+        logger.info(
+            f"Ingest buffer started (batch {self.max_batch_rows} rows, max age {self.max_age}s, "
+            f"max pending {self.max_pending_rows} rows)"
+        )
+
+    def submit(self, kind: str, rows: List[dict], callback: Optional[Callback] = None) -> int:
+        """
+        행 묶음을 저장 대기열에 추가
+
+        대기 행이 max_pending_rows 이상이면 writer가 따라잡을 때까지 블록합니다.
+
+        Args:
+            kind: 데이터 유형 (writers 키)
+            rows: 저장할 행 리스트
+            callback: 저장 완료 시 writer 스레드에서 호출 (성공 여부 전달)
+
+        Returns:
+            대기열에 넣은 행 수
+
+        Raises:
+            ValueError: 등록되지 않은 데이터 유형
+            RuntimeError: writer 스레드가 실행 중이 아님
+            TimeoutError: submit_timeout 안에 대기열 공간이 나지 않음
+            DeadlineExceeded: 제출하는 작업의 마감 시각이 지났거나 작업이 취소됨
+        """
+        if kind not in self.writers:
+            raise ValueError(f"Unknown ingest data type: {kind}")
+        # 타임아웃으로 포기한 작업의 행은 넣지 않음 (버퍼를 쓰지 않을 때의 커밋 전 확인과 같음)
+        deadline = current_deadline()
+        if deadline is not None:
+            deadline.check(f"ingest {kind}")
+        if not rows:
+            if callback is not None:
+                callback(True)
+            return 0
+
+        with self._condition:
+            if not self.is_running or self._stopping:
+                raise RuntimeError("Ingest buffer is not running")
+
+            if not self._has_room():
+                self._stats['backpressure_waits'] += 1
+                wait_start = time.monotonic()
+                has_room = self._condition.wait_for(
+                    lambda: self._has_room() or self._stopping,
+                    timeout=self.submit_timeout,
+                )
+                self._stats['backpressure_seconds'] += time.monotonic() - wait_start
+                if not has_room:
+                    raise TimeoutError(f"Ingest buffer is full ({self._pending_rows} rows pending)")
+                if self._stopping:
+                    raise RuntimeError("Ingest buffer is shutting down")
+
+            self._pending.append(_Submission(kind, list(rows), callback, current_run_stats()))
+            self._pending_rows += len(rows)
+            self._stats['submitted_rows'] += len(rows)
+            self._condition.notify_all()
+
+        return len(rows)
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """
+        지금까지 넣은 행을 모두 저장할 때까지 대기
+
+        Returns:
+            timeout 안에 모두 저장되었는지 여부
+        """
+        with self._condition:
+            self._flush_requested = True
+            self._condition.notify_all()
+            return self._condition.wait_for(
+                lambda: (not self._pending and not self._in_flight) or not self.is_running,
+                timeout=timeout,
+            )
+
+    def close(self, timeout: Optional[float] = 30.0) -> None:
+        """남은 행을 모두 저장한 뒤 writer 스레드 종료"""
+        with self._condition:
+            if self._thread is None:
+                return
+            self._stopping = True
+            self._condition.notify_all()
+            thread = self._thread
+
+        thread.join(timeout)
+        if thread.is_alive():
+            logger.warning(f"Ingest buffer writer did not stop within {timeout}s ({self._pending_rows} rows pending)")
+            return
+        with self._condition:
+            self._thread = None
+        logger.info("Ingest buffer closed")
+
+    def _has_room(self) -> bool:
+        """저장 중인 행까지 포함한 대기 행 수가 상한 미만인지 여부"""
+        return self._pending_rows + self._in_flight < self.max_pending_rows
+
+    def _oldest_age(self) -> float:
+        return time.monotonic() - self._pending[0].submitted_at if self._pending else 0.0
+
+    def _should_flush(self) -> bool:
+        if not self._pending:
+            return False
+        return (
+            self._stopping
+            or self._flush_requested
+            or self._pending_rows >= self.max_batch_rows
+            or self._oldest_age() >= self.max_age
+        )
+
+    def _run(self) -> None:
+        """writer 스레드 루프"""
+        while True:
+            with self._condition:
+                while not self._should_flush():
+                    if self._stopping:
+                        return
+                    if self._flush_requested:
+                        # 대기 행이 없으면 flush 요청 완료
+                        self._flush_requested = False
+                        self._condition.notify_all()
+                    timeout = self.max_age - self._oldest_age() if self._pending else None
+                    self._condition.wait(timeout)
+
+                batch = list(self._pending)
+                self._pending.clear()
+                batch_rows = self._pending_rows
+                self._pending_rows = 0
+                self._in_flight = batch_rows
+
+            start = time.monotonic()
+            try:
+                self._write_batch(batch)
+            except Exception as e:
+                logger.error(f"Ingest buffer writer error: {e}", exc_info=True)
+            elapsed = time.monotonic() - start
+
+            with self._condition:
+                # 저장이 끝나야 대기열 공간이 생기므로 역압으로 블록된 submit()을 여기서 깨움
+                self._in_flight = 0
+                self._stats['last_flush_rows'] = batch_rows
+                self._stats['last_flush_seconds'] = elapsed
+                if not self._pending:
+                    self._flush_requested = False
+                self._condition.notify_all()
+
+            logger.debug(f"Ingest buffer flushed {batch_rows} rows from {len(batch)} submissions in {elapsed:.3f}s")
+
+    def _write(
+        self, db: Session, submissions: List[_Submission]
+    ) -> Dict[Tuple[str, Optional[RunStats]], UpsertResult]:
+        """데이터 유형과 수집 실행별로 행을 합쳐 저장 (커밋하지 않음)"""
+        rows_by_group: Dict[Tuple[str, Optional[RunStats]], List[dict]] = defaultdict(list)
+        for submission in submissions:
+            rows_by_group[(submission.kind, submission.run_stats)].extend(submission.rows)
+        return {group: self.writers[group[0]](db, rows) for group, rows in rows_by_group.items()}
+
+    def _commit(self, submissions: List[_Submission]) -> bool:
+        """제출 묶음을 한 트랜잭션으로 저장 (fatal_errors 예외는 롤백 후 다시 발생)"""
+        db = self.session_factory()
+        try:
+            results = self._write(db, submissions)
+            if self.before_commit is not None:
+                self.before_commit(db)
+            db.commit()
+        except Exception as e:
+            db.rollback()
+            if isinstance(e, self.fatal_errors):
+                raise
+            logger.warning(f"Ingest transaction failed ({len(submissions)} submissions): {e}")
+            return False
+        finally:
+            db.close()
+
+        with self._condition:
+            self._stats['transactions'] += 1
+            for result in results.values():
+                self._results['inserted'] += result.inserted
+                self._results['updated'] += result.updated
+                self._results['unchanged'] += result.unchanged
+        for (_, run_stats), result in results.items():
+            if run_stats is not None:
+                run_stats.add('unchanged_rows', result.unchanged)
+        return True
+
+    def _write_batch(self, batch: List[_Submission]) -> None:
+        """배치를 한 트랜잭션으로 저장하고, 실패하면 제출 단위로 나눠 다시 저장"""
+        outcomes: List[Tuple[_Submission, bool]] = []
+        try:
+            if self._commit(batch):
+                outcomes = [(submission, True) for submission in batch]
+            elif len(batch) == 1:
+                outcomes = [(batch[0], False)]
+            else:
+                for submission in batch:
+                    outcomes.append((submission, self._commit([submission])))
+        except self.fatal_errors as e:
+            # 아직 저장하지 않은 제출은 다시 시도하지 않고 모두 실패 처리
+            logger.warning(f"Ingest batch abandoned ({len(batch) - len(outcomes)} submissions): {e}")
+            outcomes += [(submission, False) for submission in batch[len(outcomes):]]
+
+        for submission, success in outcomes:
+            if not success:
+                with self._condition:
+                    self._stats['failed_submissions'] += 1
+                logger.error(f"Failed to save {len(submission.rows)} {submission.kind} rows from ingest buffer")
+            if submission.callback is not None:
+                try:
+                    submission.callback(success)
+                except Exception as e:
+                    logger.warning(f"Ingest callback error: {e}")
+
+    def get_stats(self) -> dict:
+        """버퍼 통계 (누적)"""
+        with self._condition:
+            return {
+                **self._stats,
+                **{key: self._results[key] for key in ('inserted', 'updated', 'unchanged')},
+                'pending_rows': self._pending_rows,
+                'running': self.is_running,
+            }
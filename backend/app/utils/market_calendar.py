@@ -0,0 +1,187 @@
+"""
+KRX 거래 일정 유틸리티
+
+로컬 데이터 파일(config/krx_calendar.json)의 정규장 시간, 휴장일, 개장 시간이
+바뀌는 특수일(연초 개장일, 수능일 등)로 한국거래소 거래일과 장 구분을 판별합니다.
+
+데이터 파일은 연도별로 관리하며 "years"에 포함되지 않은 연도는 주말만 휴장으로
+간주합니다(경고 로그 1회). 매년 KRX 휴장일 공지에 맞춰 파일을 갱신해야 합니다.
+"""
+
+import json
+import logging
+import threading
+from datetime import date, datetime, time, timedelta
+from pathlib import Path
+from typing import Dict, Optional, Set, Tuple
+from zoneinfo import ZoneInfo
+
+from app.config import settings
+
+logger = logging.getLogger(__name__)
+
+# 기본 데이터 파일 경로
+DEFAULT_CALENDAR_PATH = Path(__file__).parent.parent.parent / "config" / "krx_calendar.json"
+
+# 장 구분
+PHASE_PRE_OPEN = "pre_open"      # 거래일 개장 전
+PHASE_OPEN = "open"              # 정규장
+PHASE_POST_CLOSE = "post_close"  # 거래일 장 마감 후
+PHASE_CLOSED = "closed"          # 휴장일 (주말, 공휴일)
+
+# 직전 장 마감을 찾을 때 거슬러 올라가는 최대 일수 (설/추석 연휴 + 주말보다 충분히 길게)
+MAX_LOOKBACK_DAYS = 30
+
+
+def _parse_time(value: str) -> time:
+    hour, minute = value.split(":")
+    return time(int(hour), int(minute))
+
+
+class MarketCalendar:
+    """
+    KRX 거래 일정
+
+    시각 인자는 timezone 정보가 있으면 거래소 시간대로 변환하고, 없으면 거래소 현지 시각으로 간주합니다.
+
+    Example:
+        calendar = get_market_calendar()
+        now = calendar.now()
+        if calendar.phase(now) == PHASE_OPEN:
+            ...
+        last_close = calendar.last_close(now)
+    """
+
+    def __init__(
+        self,
+        timezone: str = "Asia/Seoul",
+        regular_session: Tuple[time, time] = (time(9, 0), time(15, 30)),
+        holidays: Optional[Set[date]] = None,
+        special_sessions: Optional[Dict[date, Tuple[time, time]]] = None,
+        years: Optional[Set[int]] = None,
+    ):
+        """
+        Args:
+            timezone: 거래소 시간대
+            regular_session: 정규장 (개장, 마감) 시각
+            holidays: 휴장일 (주말 제외)
+            special_sessions: 개장/마감 시각이 다른 날의 (개장, 마감) 시각
+            years: 휴장일 데이터가 있는 연도 (None이면 모든 연도)
+        """
+        self.tz = ZoneInfo(timezone)
+        self.regular_session = regular_session
+        self.holidays = set(holidays or ())
+        self.special_sessions = dict(special_sessions or {})
+        self.years = set(years) if years is not None else None
+        self._warned_years: Set[int] = set()
+
+    @classmethod
+    def from_file(cls, path: Path) -> 'MarketCalendar':
+        """JSON 데이터 파일로 거래 일정 생성"""
+        with open(path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+
+        regular = data.get('regular_session', {})
+        return cls(
+            timezone=data.get('timezone', "Asia/Seoul"),
+            regular_session=(
+                _parse_time(regular.get('open', "09:00")),
+                _parse_time(regular.get('close', "15:30")),
+            ),
+            holidays={date.fromisoformat(day) for day in data.get('holidays', {})},
+            special_sessions={
+                date.fromisoformat(day): (_parse_time(session['open']), _parse_time(session['close']))
+                for day, session in data.get('special_sessions', {}).items()
+            },
+            years=set(data['years']) if 'years' in data else None,
+        )
+
+    def now(self) -> datetime:
+        """거래소 현지 시각"""
+        return datetime.now(self.tz)
+
+    def localize(self, moment: datetime) -> datetime:
+        """거래소 시간대의 aware datetime으로 변환"""
+        if moment.tzinfo is None:
+            return moment.replace(tzinfo=self.tz)
+        return moment.astimezone(self.tz)
+
+    def _check_coverage(self, day: date) -> None:
+        if self.years is None or day.year in self.years or day.year in self._warned_years:
+            return
+        self._warned_years.add(day.year)
+        logger.warning(f"Market calendar has no holiday data for {day.year}; treating only weekends as closed")
+
+    def is_trading_day(self, day: date) -> bool:
+        """거래일 여부 (주말, 휴장일 제외)"""
+        self._check_coverage(day)
+        return day.weekday() < 5 and day not in self.holidays
+
+    def session(self, day: date) -> Optional[Tuple[datetime, datetime]]:
+        """해당 날짜의 (개장, 마감) 시각 (휴장일이면 None)"""
+        if not self.is_trading_day(day):
+            return None
+        open_time, close_time = self.special_sessions.get(day, self.regular_session)
+        return (
+            datetime.combine(day, open_time, tzinfo=self.tz),
+            datetime.combine(day, close_time, tzinfo=self.tz),
+        )
+
+    def phase(self, moment: datetime) -> str:
+        """장 구분 (PHASE_PRE_OPEN, PHASE_OPEN, PHASE_POST_CLOSE, PHASE_CLOSED)"""
+        moment = self.localize(moment)
+        session = self.session(moment.date())
+        if session is None:
+            return PHASE_CLOSED
+        open_at, close_at = session
+        if moment < open_at:
+            return PHASE_PRE_OPEN
+        if moment < close_at:
+            return PHASE_OPEN
+        return PHASE_POST_CLOSE
+
+    def is_open(self, moment: datetime) -> bool:
+        """정규장 시간 여부"""
+        return self.phase(moment) == PHASE_OPEN
+
+    def last_close(self, moment: datetime) -> Optional[datetime]:
+        """moment 이전(같은 시각 포함)의 가장 최근 장 마감 시각"""
+        moment = self.localize(moment)
+        for offset in range(MAX_LOOKBACK_DAYS + 1):
+            session = self.session(moment.date() - timedelta(days=offset))
+            if session is not None and session[1] <= moment:
+                return session[1]
+        return None
+
+    def next_open(self, moment: datetime) -> Optional[datetime]:
+        """moment 이후의 가장 가까운 개장 시각"""
+        moment = self.localize(moment)
+        for offset in range(MAX_LOOKBACK_DAYS + 1):
+            session = self.session(moment.date() + timedelta(days=offset))
+            if session is not None and session[0] > moment:
+                return session[0]
+        return None
+
+
+# 전역 거래 일정 인스턴스
+_market_calendar: Optional[MarketCalendar] = None
+_market_calendar_lock = threading.Lock()
+
+
+def get_market_calendar() -> MarketCalendar:
+    """
+    전역 거래 일정 반환 (싱글톤 패턴)
+
+    Returns:
+        MarketCalendar 인스턴스
+    """
+    global _market_calendar
+
+    if _market_calendar is None:
+        with _market_calendar_lock:
+            if _market_calendar is None:
+                path = Path(settings.MARKET_CALENDAR_PATH) if settings.MARKET_CALENDAR_PATH else DEFAULT_CALENDAR_PATH
+                _market_calendar = MarketCalendar.from_file(path)
+                logger.info(f"Loaded market calendar from {path}")
+
+    return _market_calendar
@@ -0,0 +1,294 @@
+"""
+원본 페이지 아카이브
+
+수집기가 가져온 페이지 본문을 내용 주소(SHA-256) 기반으로 압축 저장하고,
+종목·엔드포인트·페이지·수집 시각으로 조회할 수 있는 SQLite 인덱스를 유지합니다.
+파서가 바뀌거나 파싱 버그를 고친 뒤에는 네트워크 요청 없이 아카이브를
+다시 파싱하여 데이터를 재구성할 수 있습니다 (replay).
+
+디렉토리 구조:
+    {root}/index.db                 # 페이지 인덱스 (SQLite)
+    {root}/objects/ab/cdef....zst   # 압축된 본문 (zstd, 미설치 시 zlib)
+"""
+
+import hashlib
+import logging
+import os
+import sqlite3
+import threading
+import zlib
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple, Union
+
+from app.config import settings
+
+try:
+    import zstandard
+except ImportError:  # pragma: no cover - zstandard 미설치 환경
+    zstandard = None
+
+logger = logging.getLogger(__name__)
+
+CODEC_ZSTD = "zstd"
+CODEC_ZLIB = "zlib"
+
+_CODEC_EXTENSIONS = {CODEC_ZSTD: ".zst", CODEC_ZLIB: ".z"}
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS pages (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    ticker TEXT NOT NULL,
+    endpoint TEXT NOT NULL,
+    page INTEGER NOT NULL,
+    url TEXT,
+    fetched_at TEXT NOT NULL,
+    digest TEXT NOT NULL,
+    codec TEXT NOT NULL,
+    size INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_pages_endpoint_ticker_fetched ON pages (endpoint, ticker, fetched_at);
+"""
+
+
+@dataclass(frozen=True)
+class ArchivedPage:
+    """아카이브 인덱스 항목"""
+
+    ticker: str
+    endpoint: str
+    page: int
+    url: Optional[str]
+    fetched_at: datetime
+    digest: str
+    codec: str
+    size: int
+
+
+class PageArchive:
+    """
+    압축 원본 페이지 아카이브
+
+    같은 (종목, 엔드포인트, 페이지)의 직전 본문과 내용이 같으면 인덱스 항목을
+    추가하지 않으며, 같은 본문은 한 번만 저장됩니다.
+
+    Example:
+        archive = PageArchive("./data/page_archive")
+        archive.store("487240", "sise_day", 1, url, response.text)
+
+        for entry in archive.entries("sise_day", ticker="487240"):
+            html = archive.read(entry)
+    """
+
+    def __init__(self, root: Union[str, Path], compression_level: int = 3):
+        """
+        Args:
+            root: 아카이브 루트 디렉토리
+            compression_level: 압축 레벨 (zstd 1-22, zlib 1-9)
+        """
+        self.root = Path(root)
+        self.objects_dir = self.root / "objects"
+        self.objects_dir.mkdir(parents=True, exist_ok=True)
+        self.codec = CODEC_ZSTD if zstandard is not None else CODEC_ZLIB
+        self.compression_level = compression_level
+
+        self._lock = threading.Lock()
+        self._last_digests: Dict[Tuple[str, str, int], str] = {}
+        self._conn = sqlite3.connect(str(self.root / "index.db"), check_same_thread=False)
+        self._conn.executescript(_SCHEMA)
+        self._conn.commit()
+
+    def _object_path(self, digest: str, codec: str) -> Path:
+        return self.objects_dir / digest[:2] / f"{digest[2:]}{_CODEC_EXTENSIONS[codec]}"
+
+    def _compress(self, data: bytes) -> bytes:
+        if self.codec == CODEC_ZSTD:
+            return zstandard.ZstdCompressor(level=self.compression_level).compress(data)
+        return zlib.compress(data, min(self.compression_level, 9))
+
+    @staticmethod
+    def _decompress(data: bytes, codec: str) -> bytes:
+        if codec == CODEC_ZSTD:
+            if zstandard is None:
+                raise RuntimeError("zstandard is required to read zstd-compressed archive objects")
+            return zstandard.ZstdDecompressor().decompress(data)
+        return zlib.decompress(data)
+
+    def _last_digest(self, ticker: str, endpoint: str, page: int) -> Optional[str]:
+        """(종목, 엔드포인트, 페이지)의 직전 저장 본문 해시 (락 안에서 호출)"""
+        key = (ticker, endpoint, page)
+        if key not in self._last_digests:
+            row = self._conn.execute(
+                "SELECT digest FROM pages WHERE endpoint = ? AND ticker = ? AND page = ? "
+                "ORDER BY fetched_at DESC, id DESC LIMIT 1",
+                (endpoint, ticker, page),
+            ).fetchone()
+            self._last_digests[key] = row[0] if row else None
+        return self._last_digests[key]
+
+    def store(
+        self,
+        ticker: str,
+        endpoint: str,
+        page: int,
+        url: Optional[str],
+        body: str,
+        fetched_at: Optional[datetime] = None,
+    ) -> str:
+        """
+        페이지 본문 저장
+
+        Args:
+            ticker: 종목 코드
+            endpoint: 엔드포인트 이름 (예: "sise_day")
+            page: 페이지 번호
+            url: 요청 URL
+            body: 응답 본문
+            fetched_at: 수집 시각 (기본: 현재 시각)
+
+        Returns:
+            본문 해시 (SHA-256)
+        """
+        data = body.encode('utf-8')
+        digest = hashlib.sha256(data).hexdigest()
+        fetched_at = fetched_at or datetime.now()
+
+        with self._lock:
+            if self._last_digest(ticker, endpoint, page) == digest:
+                return digest
+
+            path = self._object_path(digest, self.codec)
+            if not path.exists():
+                path.parent.mkdir(exist_ok=True)
+                # 다른 프로세스가 읽는 중에도 불완전한 파일이 보이지 않도록 임시 파일 후 교체
+                tmp_path = path.with_suffix(path.suffix + f".{os.getpid()}.tmp")
+                tmp_path.write_bytes(self._compress(data))
+                os.replace(tmp_path, path)
+
+            self._conn.execute(
+                "INSERT INTO pages (ticker, endpoint, page, url, fetched_at, digest, codec, size) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                (ticker, endpoint, page, url, fetched_at.isoformat(), digest, self.codec, len(data)),
+            )
+            self._conn.commit()
+            self._last_digests[(ticker, endpoint, page)] = digest
+
+        return digest
+
+    def read(self, entry: ArchivedPage) -> str:
+        """아카이브 항목의 본문 읽기"""
+        data = self._object_path(entry.digest, entry.codec).read_bytes()
+        return self._decompress(data, entry.codec).decode('utf-8')
+
+    def entries(
+        self,
+        endpoint: str,
+        ticker: Optional[str] = None,
+        start: Optional[datetime] = None,
+        end: Optional[datetime] = None,
+    ) -> List[ArchivedPage]:
+        """
+        인덱스 조회 (수집 시각 오름차순)
+
+        Args:
+            endpoint: 엔드포인트 이름
+            ticker: 종목 코드 (None이면 전체)
+            start: 수집 시각 하한 (포함)
+            end: 수집 시각 상한 (포함)
+
+        Returns:
+            ArchivedPage 리스트
+        """
+        query = "SELECT ticker, endpoint, page, url, fetched_at, digest, codec, size FROM pages WHERE endpoint = ?"
+        params: list = [endpoint]
+        if ticker is not None:
+            query += " AND ticker = ?"
+            params.append(ticker)
+        if start is not None:
+            query += " AND fetched_at >= ?"
+            params.append(start.isoformat())
+        if end is not None:
+            query += " AND fetched_at <= ?"
+            params.append(end.isoformat())
+        query += " ORDER BY fetched_at, id"
+
+        with self._lock:
+            rows = self._conn.execute(query, params).fetchall()
+
+        return [
+            ArchivedPage(row[0], row[1], row[2], row[3], datetime.fromisoformat(row[4]), row[5], row[6], row[7])
+            for row in rows
+        ]
+
+    def tickers(self, endpoint: Optional[str] = None) -> List[str]:
+        """아카이브에 저장된 종목 코드 목록"""
+        query = "SELECT DISTINCT ticker FROM pages"
+        params: list = []
+        if endpoint is not None:
+            query += " WHERE endpoint = ?"
+            params.append(endpoint)
+        with self._lock:
+            return [row[0] for row in self._conn.execute(query + " ORDER BY ticker", params)]
+
+    def get_stats(self) -> dict:
+        """
+        아카이브 통계 조회
+
+        Returns:
+            {'pages', 'objects', 'raw_bytes', 'stored_bytes', 'codec'} 딕셔너리
+        """
+        with self._lock:
+            pages, raw_bytes = self._conn.execute("SELECT COUNT(*), COALESCE(SUM(size), 0) FROM pages").fetchone()
+        objects = [path for path in self.objects_dir.glob("*/*") if not path.name.endswith(".tmp")]
+        return {
+            'pages': pages,
+            'objects': len(objects),
+            'raw_bytes': raw_bytes,
+            'stored_bytes': sum(path.stat().st_size for path in objects),
+            'codec': self.codec,
+        }
+
+    def close(self):
+        """인덱스 연결 종료"""
+        with self._lock:
+            self._conn.close()
+
+
+# 전역 아카이브 인스턴스 (싱글톤 패턴)
+_page_archive: Optional[PageArchive] = None
+_page_archive_lock = threading.Lock()
+
+
+def get_page_archive() -> Optional[PageArchive]:
+    """
+    전역 페이지 아카이브 반환 (싱글톤 패턴)
+
+    Returns:
+        PageArchive 인스턴스, PAGE_ARCHIVE_ENABLED가 False이면 None
+    """
+    global _page_archive
+
+    if not settings.PAGE_ARCHIVE_ENABLED:
+        return None
+
+    if _page_archive is None:
+        with _page_archive_lock:
+            if _page_archive is None:
+                _page_archive = PageArchive(
+                    settings.PAGE_ARCHIVE_DIR,
+                    compression_level=settings.PAGE_ARCHIVE_COMPRESSION_LEVEL,
+                )
+                logger.info(f"Page archive opened at {settings.PAGE_ARCHIVE_DIR} ({_page_archive.codec})")
+
+    return _page_archive
+
+
+def close_page_archive() -> None:
+    """전역 페이지 아카이브 종료"""
+    global _page_archive
+
+    with _page_archive_lock:
+        if _page_archive is not None:
+            _page_archive.close()
+            _page_archive = None
@@ -0,0 +1,255 @@
+"""
+페이지 변경 추적 유틸리티
+
+수집한 페이지 본문의 해시(와 ETag/Last-Modified)를 종목·엔드포인트·페이지별로
+기록해 두고, 다음 수집에서 같은 페이지가 바뀌지 않았으면 파싱, 검증, 저장을
+건너뛸 수 있게 합니다.
+
+새 지문은 바로 기록하지 않고 스테이징했다가, 저장이 성공한 뒤 commit()으로
+확정합니다. 저장이 실패하면 이전 지문이 유지되어 다음 수집에서 다시 처리됩니다.
+
+통계는 프로세스 누적값이며, 현재 컨텍스트에 실행 통계(run_stats_scope)가 있으면
+변경 없는 페이지 수를 그 실행의 통계에도 더합니다.
+"""
+
+import hashlib
+import logging
+import threading
+from collections import defaultdict
+from typing import Dict, Optional, Tuple
+
+from app.config import settings
+from app.utils.cache import get_cache, set_cache
+from app.utils.run_stats import current_run_stats
+
+logger = logging.getLogger(__name__)
+
+# 캐시 키 접두사
+PAGE_HASH_CACHE_PREFIX = "page_hash"
+
+
+class PageNotModified(Exception):
+    """페이지가 이전 수집과 같아 새로 처리할 데이터가 없음 ("데이터 없음"과 구분)"""
+
+    def __init__(self, endpoint: str, ticker: str):
+        super().__init__(f"{endpoint} page unchanged for {ticker}")
+        self.endpoint = endpoint
+        self.ticker = ticker
+
+
+class PageChangeTracker:
+    """
+    페이지 변경 추적기
+
+    Example:
+        tracker = get_page_tracker()
+
+        headers = tracker.request_headers("sise_day", ticker, page)
+        response = http_client.get(url, headers=headers)
+        if tracker.is_unchanged("sise_day", ticker, page, response):
+            return  # 파싱/저장 생략
+
+        ... 파싱 및 저장 ...
+        tracker.commit("sise_day", ticker)
+    """
+
+    def __init__(self, use_redis: bool = True, ttl: int = 86400):
+        """
+        Args:
+            use_redis: Redis에 지문을 저장할지 여부 (False이면 프로세스 메모리만 사용)
+            ttl: Redis 지문 TTL (초)
+        """
+        self.use_redis = use_redis
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        self._fingerprints: Dict[str, dict] = {}
+        self._staged: Dict[Tuple[str, str], Dict[str, dict]] = defaultdict(dict)
+        self._stats: Dict[str, Dict[str, int]] = defaultdict(
+            lambda: {'checked': 0, 'unchanged': 0, 'not_modified': 0}
+        )
+
+    @staticmethod
+    def _key(endpoint: str, ticker: str, page: int) -> str:
+        return f"{PAGE_HASH_CACHE_PREFIX}:{endpoint}:{ticker}:{page}"
+
+    @staticmethod
+    def hash_body(body: str) -> str:
+        """페이지 본문 해시 (SHA-256)"""
+        return hashlib.sha256(body.encode('utf-8')).hexdigest()
+
+    def _get_fingerprint(self, key: str) -> Optional[dict]:
+        """기록된 지문 조회 (메모리 → Redis 순)"""
+        with self._lock:
+            fingerprint = self._fingerprints.get(key)
+        if fingerprint is None and self.use_redis:
+            fingerprint = get_cache(key)
+            if fingerprint is not None:
+                with self._lock:
+                    self._fingerprints[key] = fingerprint
+        return fingerprint
+
+    def request_headers(self, endpoint: str, ticker: str, page: int, headers: Optional[dict] = None) -> dict:
+        """
+        조건부 GET 요청 헤더 생성
+
+        이전 응답에 ETag/Last-Modified가 있었으면 If-None-Match/If-Modified-Since를 추가합니다.
+
+        Args:
+            endpoint: 엔드포인트 이름 (예: "sise_day")
+            ticker: 종목 코드
+            page: 페이지 번호
+            headers: 기본 요청 헤더
+
+        Returns:
+            요청 헤더 딕셔너리
+        """
+        request_headers = dict(headers or {})
+        fingerprint = self._get_fingerprint(self._key(endpoint, ticker, page))
+        if fingerprint:
+            if fingerprint.get('etag'):
+                request_headers['If-None-Match'] = fingerprint['etag']
+            if fingerprint.get('last_modified'):
+                request_headers['If-Modified-Since'] = fingerprint['last_modified']
+        return request_headers
+
+    def check(
+        self,
+        endpoint: str,
+        ticker: str,
+        page: int,
+        body: str,
+        etag: Optional[str] = None,
+        last_modified: Optional[str] = None,
+    ) -> bool:
+        """
+        페이지 본문이 이전 수집과 같은지 확인
+
+        바뀐 경우 새 지문을 스테이징합니다 (commit() 호출 시 확정).
+
+        Args:
+            endpoint: 엔드포인트 이름
+            ticker: 종목 코드
+            page: 페이지 번호
+            body: 응답 본문
+            etag: 응답 ETag 헤더 (선택)
+            last_modified: 응답 Last-Modified 헤더 (선택)
+
+        Returns:
+            변경되지 않았으면 True
+        """
+        key = self._key(endpoint, ticker, page)
+        body_hash = self.hash_body(body)
+        fingerprint = self._get_fingerprint(key)
+        unchanged = fingerprint is not None and fingerprint.get('hash') == body_hash
+
+        with self._lock:
+            self._stats[endpoint]['checked'] += 1
+            if unchanged:
+                self._stats[endpoint]['unchanged'] += 1
+            else:
+                self._staged[(endpoint, ticker)][key] = {
+                    'hash': body_hash,
+                    'etag': etag,
+                    'last_modified': last_modified,
+                }
+
+        if unchanged:
+            self._count_run_unchanged()
+            logger.debug(f"Page unchanged: {endpoint} {ticker} page {page}")
+        return unchanged
+
+    def is_unchanged(self, endpoint: str, ticker: str, page: int, response) -> bool:
+        """
+        HTTP 응답이 이전 수집과 같은지 확인 (304 Not Modified 포함)
+
+        Args:
+            endpoint: 엔드포인트 이름
+            ticker: 종목 코드
+            page: 페이지 번호
+            response: requests.Response
+
+        Returns:
+            변경되지 않았으면 True
+        """
+        if response.status_code == 304:
+            with self._lock:
+                self._stats[endpoint]['checked'] += 1
+                self._stats[endpoint]['unchanged'] += 1
+                self._stats[endpoint]['not_modified'] += 1
+            self._count_run_unchanged()
+            logger.debug(f"Page not modified: {endpoint} {ticker} page {page}")
+            return True
+
+        return self.check(
+            endpoint, ticker, page, response.text,
+            etag=response.headers.get('ETag'),
+            last_modified=response.headers.get('Last-Modified'),
+        )
+
+    @staticmethod
+    def _count_run_unchanged() -> None:
+        """현재 수집 실행의 변경 없는 페이지 수 증가 (실행 통계가 없으면 무시)"""
+        run_stats = current_run_stats()
+        if run_stats is not None:
+            run_stats.add('unchanged_pages')
+
+    def commit(self, endpoint: str, ticker: str) -> int:
+        """
+        스테이징된 지문 확정 (저장 성공 후 호출)
+
+        Returns:
+            확정된 페이지 수
+        """
+        with self._lock:
+            staged = self._staged.pop((endpoint, ticker), {})
+            self._fingerprints.update(staged)
+
+        if self.use_redis:
+            for key, fingerprint in staged.items():
+                set_cache(key, fingerprint, self.ttl)
+        return len(staged)
+
+    def discard(self, endpoint: str, ticker: str) -> None:
+        """스테이징된 지문 폐기 (저장 실패 시 호출)"""
+        with self._lock:
+            self._staged.pop((endpoint, ticker), None)
+
+    def get_stats(self) -> dict:
+        """
+        엔드포인트별 변경 확인 통계 조회
+
+        Returns:
+            {endpoint: {'checked', 'unchanged', 'not_modified'}} 딕셔너리
+        """
+        with self._lock:
+            return {endpoint: dict(stats) for endpoint, stats in self._stats.items()}
+
+    def reset_stats(self) -> None:
+        """누적 통계 초기화 (실행별 수치는 RunStats 사용)"""
+        with self._lock:
+            self._stats.clear()
+
+
+# 전역 페이지 변경 추적기 인스턴스 (싱글톤 패턴)
+_page_tracker: Optional[PageChangeTracker] = None
+_page_tracker_lock = threading.Lock()
+
+
+def get_page_tracker() -> PageChangeTracker:
+    """
+    전역 페이지 변경 추적기 반환 (싱글톤 패턴)
+
+    Returns:
+        PageChangeTracker 인스턴스
+    """
+    global _page_tracker
+
+    if _page_tracker is None:
+        with _page_tracker_lock:
+            if _page_tracker is None:
+                _page_tracker = PageChangeTracker(
+                    use_redis=settings.PAGE_HASH_STORE == "redis",
+                    ttl=settings.PAGE_HASH_TTL,
+                )
+
+    return _page_tracker
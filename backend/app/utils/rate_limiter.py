@@ -2,100 +2,601 @@
 Rate Limiter 유틸리티
 
 API 요청 빈도를 제어하여 서버 부하를 방지합니다.
+
+호스트별 토큰 버킷으로 초당 요청 수와 순간 허용량(burst)을 제한합니다. 토큰은 잠금 안에서
+예약만 하고(잔량이 음수가 되면 그만큼 뒤에 도착한 요청이 더 오래 기다림) 대기는 잠금 밖에서 하므로,
+한 스레드가 기다리는 동안 다른 스레드가 잠금에 막히지 않고 도착 순서대로 자기 슬롯을 예약합니다.
+
+- local: 프로세스 안의 모든 스레드가 호스트별 버킷을 공유
+- redis: Lua 스크립트로 Redis의 버킷에서 원자적으로 예약하여 모든 워커 프로세스/노드가 하나의
+  upstream 예산을 공유 (Redis 서버 시각 기준이라 노드 간 시계 차이의 영향을 받지 않음).
+  Redis에 접근할 수 없으면 프로세스 내 버킷으로 대체
+
+AimdController를 붙이면 호스트별 요청 속도를 upstream 응답에 맞춰 조절합니다 (AIMD).
+정상 응답이 이어지면 속도를 조금씩(가산) 올리고, 429/5xx·타임아웃·목표보다 느린 응답이
+오면 크게(승산) 낮춥니다. redis 백엔드에서는 각 프로세스의 조절기가 계산한 속도로 공유 버킷을
+채우므로, 한 노드가 받은 제한 신호가 다음 예약부터 버킷 전체의 보충 속도에 반영됩니다.
+
+AsyncRateLimiter는 같은 버킷·조절기·통계를 쓰면서 asyncio.sleep으로 기다리므로
+async 핸들러와 비동기 수집기에서 이벤트 루프를 막지 않습니다.
 """
 
+import asyncio
 import logging
+import threading
 import time
-from typing import Optional
-from threading import Lock
+from collections import defaultdict, deque
+from contextlib import asynccontextmanager, contextmanager
+from datetime import datetime
+from typing import AsyncIterator, Deque, Dict, Iterator, Optional, Union
+from urllib.parse import urlparse
+
+from app.config import settings
+from app.utils.http_client import get_http_client
+from app.utils.redis import get_redis_client
 
 logger = logging.getLogger(__name__)
 
+RATE_LIMIT_BACKEND_LOCAL = "local"
+RATE_LIMIT_BACKEND_REDIS = "redis"
+
+# Redis 버킷 키 접두사 (호스트별 rate_limit:{호스트})
+RATE_LIMIT_KEY_PREFIX = "rate_limit"
+
+# __enter__처럼 호스트를 지정하지 않은 요청의 버킷
+DEFAULT_HOST = "default"
+
+# 제한 신호로 보는 응답 상태 코드 (그 밖의 5xx도 포함)
+THROTTLE_STATUS_CODES = frozenset({429})
+
+AIMD_INCREASE = "increase"
+AIMD_DECREASE = "decrease"
+
+# 토큰 버킷 예약 (KEYS[1]: 버킷 키, ARGV: 초당 토큰, 용량, 요청 토큰 수, 키 만료 ms)
+# 반환값: 대기 시간 (마이크로초, 정수)
+TOKEN_BUCKET_SCRIPT = """
+if redis.replicate_commands then
+    redis.replicate_commands()
+end
+local now_parts = redis.call('TIME')
+local now = tonumber(now_parts[1]) + tonumber(now_parts[2]) / 1000000
+local rate = tonumber(ARGV[1])
+local capacity = tonumber(ARGV[2])
+local requested = tonumber(ARGV[3])
+local state = redis.call('HMGET', KEYS[1], 'tokens', 'ts')
+local tokens = tonumber(state[1])
+local ts = tonumber(state[2])
+if tokens == nil or ts == nil then
+    tokens = capacity
+    ts = now
+end
+tokens = math.min(capacity, tokens + math.max(0, now - ts) * rate) - requested
+redis.call('HMSET', KEYS[1], 'tokens', tostring(tokens), 'ts', tostring(now))
+redis.call('PEXPIRE', KEYS[1], ARGV[4])
+if tokens >= 0 then
+    return 0
+end
+return math.ceil(-tokens / rate * 1000000)
+"""
+
+
+def host_of(url: str) -> str:
+    """URL의 호스트 (버킷 키)"""
+    return urlparse(url).hostname or url
+
+
+class TokenBucket:
+    """
+    프로세스 내 토큰 버킷
+
+    Example:
+        bucket = TokenBucket(rate=10.0, capacity=5)
+        time.sleep(bucket.reserve())
+    """
+
+    def __init__(self, rate: float, capacity: float, clock=time.monotonic):
+        """
+        Args:
+            rate: 초당 채워지는 토큰 수 (0 이하이면 제한 없음)
+            capacity: 버킷 용량 (연속으로 바로 보낼 수 있는 요청 수)
+            clock: 단조 시계 (테스트용)
+        """
+        self.rate = rate
+        self.capacity = max(1.0, capacity)
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._tokens = self.capacity
+        self._updated = clock()
+
+    def reserve(self, tokens: float = 1.0) -> float:
+        """
+        토큰 예약
+
+        Returns:
+            예약한 토큰을 쓸 수 있을 때까지 기다려야 하는 시간 (초, 호출 측에서 잠금 없이 대기)
+        """
+        if self.rate <= 0:
+            return 0.0
+        with self._lock:
+            now = self._clock()
+            self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate) - tokens
+            self._updated = now
+            return max(0.0, -self._tokens / self.rate)
+
+    def set_rate(self, rate: float) -> None:
+        """보충 속도 변경 (지금까지 쌓인 토큰은 이전 속도로 계산)"""
+        with self._lock:
+            now = self._clock()
+            if self.rate > 0:
+                self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            self.rate = rate
+
+
+class RedisTokenBucket:
+    """
+    Redis 공유 토큰 버킷
+
+    같은 키를 쓰는 모든 프로세스가 하나의 버킷에서 토큰을 예약합니다.
+    """
+
+    def __init__(self, key: str, rate: float, capacity: float, client=None):
+        """
+        Args:
+            key: Redis 버킷 키
+            rate: 초당 채워지는 토큰 수 (0 이하이면 제한 없음)
+            capacity: 버킷 용량
+            client: Redis 클라이언트 (None이면 전역 클라이언트 사용)
+        """
+        self.key = key
+        self.rate = rate
+        self.capacity = max(1.0, capacity)
+        self._client = client
+        self.set_rate(rate)
+
+    def set_rate(self, rate: float) -> None:
+        """보충 속도 변경 (다음 예약부터 이 속도로 버킷을 채움)"""
+        self.rate = rate
+        # 버킷이 가득 찰 때까지의 시간이 지나면 키가 없어도 같은 상태
+        self.ttl_ms = int(max(1.0, self.capacity / rate if rate > 0 else 1.0) * 2000)
+
+    @property
+    def client(self):
+        if self._client is None:
+            self._client = get_redis_client()
+        return self._client
+
+    def reserve(self, tokens: float = 1.0) -> float:
+        """
+        토큰 예약 (TokenBucket.reserve 참고)
+
+        Raises:
+            redis.RedisError: Redis 명령 실패
+        """
+        if self.rate <= 0:
+            return 0.0
+        wait_us = self.client.eval(TOKEN_BUCKET_SCRIPT, 1, self.key, self.rate, self.capacity, tokens, self.ttl_ms)
+        return int(wait_us) / 1_000_000
+
+
+class AimdController:
+    """
+    호스트별 AIMD 요청 속도 조절기
+
+    정상 응답이 현재 속도만큼(약 1초 분량) 모일 때마다 increase_step씩 올리고,
+    제한 신호(429/5xx, 요청 실패, latency_target보다 느린 응답)를 받으면 decrease_factor를 곱합니다.
+    이미 보낸 요청들의 제한 신호가 한꺼번에 돌아와 여러 번 깎이지 않도록 cooldown 동안은 한 번만 낮춥니다.
+
+    Example:
+        controller = AimdController(initial_rate=10.0, min_rate=1.0, max_rate=20.0)
+        new_rate = controller.observe("finance.naver.com", status=429)  # 5.0
+    """
+
+    def __init__(
+        self,
+        initial_rate: float,
+        min_rate: float,
+        max_rate: float,
+        increase_step: float = 0.5,
+        decrease_factor: float = 0.5,
+        latency_target: float = 2.0,
+        cooldown: float = 1.0,
+        history: int = 20,
+        clock=time.monotonic,
+    ):
+        """
+        Args:
+            initial_rate: 처음 보는 호스트의 초당 요청 수
+            min_rate: 낮출 수 있는 최소 초당 요청 수
+            max_rate: 올릴 수 있는 최대 초당 요청 수
+            increase_step: 정상 구간마다 더하는 초당 요청 수
+            decrease_factor: 제한 신호를 받으면 곱하는 비율 (0~1)
+            latency_target: 이보다 느린 응답은 제한 신호로 간주 (초, 0이면 사용 안 함)
+            cooldown: 연속으로 낮추지 않는 최소 간격 (초)
+            history: 보관할 최근 조절 기록 수
+            clock: 단조 시계 (테스트용)
+        """
+        self.min_rate = min_rate
+        self.max_rate = max(min_rate, max_rate)
+        self.initial_rate = min(self.max_rate, max(self.min_rate, initial_rate))
+        self.increase_step = increase_step
+        self.decrease_factor = decrease_factor
+        self.latency_target = latency_target
+        self.cooldown = cooldown
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._rates: Dict[str, float] = {}
+        self._healthy: Dict[str, int] = defaultdict(int)
+        self._last_decrease: Dict[str, float] = {}
+        self._counts: Dict[str, Dict[str, int]] = defaultdict(lambda: {AIMD_INCREASE: 0, AIMD_DECREASE: 0})
+        self._decisions: Deque[dict] = deque(maxlen=history)
+
+    @classmethod
+    def from_settings(cls) -> 'AimdController':
+        """설정값으로 생성"""
+        return cls(
+            initial_rate=settings.RATE_LIMIT_HOST_RATE,
+            min_rate=settings.RATE_LIMIT_MIN_RATE,
+            max_rate=settings.RATE_LIMIT_MAX_RATE,
+            increase_step=settings.RATE_LIMIT_INCREASE_STEP,
+            decrease_factor=settings.RATE_LIMIT_DECREASE_FACTOR,
+            latency_target=settings.RATE_LIMIT_LATENCY_TARGET,
+        )
+
+    def rate(self, host: str) -> float:
+        """호스트의 현재 초당 요청 수"""
+        with self._lock:
+            return self._rates.get(host, self.initial_rate)
+
+    def _throttle_reason(
+        self, status: Optional[int], latency: float, error: Optional[BaseException]
+    ) -> Optional[str]:
+        """제한 신호이면 그 사유, 정상이면 None"""
+        if error is not None:
+            return f"error {type(error).__name__}"
+        if status is not None and (status in THROTTLE_STATUS_CODES or status >= 500):
+            return f"status {status}"
+        if self.latency_target > 0 and latency > self.latency_target:
+            return f"latency {latency:.2f}s"
+        return None
+
+    def observe(
+        self,
+        host: str,
+        status: Optional[int] = None,
+        latency: float = 0.0,
+        error: Optional[BaseException] = None,
+    ) -> Optional[float]:
+        """
+        응답 하나를 반영
+
+        Args:
+            host: 요청 호스트
+            status: 응답 상태 코드 (요청이 실패했으면 None)
+            latency: 응답 지연 (초)
+            error: 요청 실패 예외
+
+        Returns:
+            속도를 바꿨으면 새 초당 요청 수, 그대로이면 None
+        """
+        reason = self._throttle_reason(status, latency, error)
+        with self._lock:
+            current = self._rates.get(host, self.initial_rate)
+            now = self._clock()
+            if reason is not None:
+                self._healthy[host] = 0
+                last = self._last_decrease.get(host)
+                if last is not None and now - last < self.cooldown:
+                    return None
+                self._last_decrease[host] = now
+                new_rate = max(self.min_rate, current * self.decrease_factor)
+                action = AIMD_DECREASE
+            else:
+                if status is not None and status >= 400:
+                    # 404 등은 upstream 부하와 무관하므로 반영하지 않음
+                    return None
+                self._healthy[host] += 1
+                if self._healthy[host] < max(1, round(current)):
+                    return None
+                self._healthy[host] = 0
+                new_rate = min(self.max_rate, current + self.increase_step)
+                action = AIMD_INCREASE
+                reason = "healthy"
+
+            if new_rate == current:
+                return None
+            self._rates[host] = new_rate
+            self._counts[host][action] += 1
+            self._decisions.append({
+                'at': datetime.now().isoformat(timespec='seconds'),
+                'host': host,
+                'action': action,
+                'reason': reason,
+                'previous_rate': round(current, 3),
+                'rate': round(new_rate, 3),
+            })
+
+        log = logger.warning if action == AIMD_DECREASE else logger.debug
+        log(f"Adaptive rate {action} for {host}: {current:.2f} -> {new_rate:.2f} req/s ({reason})")
+        return new_rate
+
+    def get_stats(self) -> dict:
+        """호스트별 현재 속도와 최근 조절 기록"""
+        with self._lock:
+            return {
+                'min_rate': self.min_rate,
+                'max_rate': self.max_rate,
+                'initial_rate': round(self.initial_rate, 3),
+                'hosts': {
+                    host: {
+                        'rate': round(rate, 3),
+                        'increases': self._counts[host][AIMD_INCREASE],
+                        'decreases': self._counts[host][AIMD_DECREASE],
+                    }
+                    for host, rate in self._rates.items()
+                },
+                'decisions': list(self._decisions),
+            }
+
 
 class RateLimiter:
     """
     Rate Limiter 클래스
-    
-    요청 간 최소 대기 시간을 보장하고, 동시 요청 수를 제한합니다.
-    
+
+    호스트별 토큰 버킷으로 요청 빈도를 제한하고, 동시 요청 수를 제한합니다.
+
     Example:
         limiter = RateLimiter(min_interval=0.5)
-        
+
         for ticker in tickers:
             with limiter:
                 data = fetch_data(ticker)
+
+        # 호스트별 버킷
+        with limiter.limit(host_of(url)):
+            response = http_client.get(url)
     """
-    
+
     def __init__(
         self,
         min_interval: float = 0.5,
-        max_concurrent: Optional[int] = None
+        max_concurrent: Optional[int] = None,
+        burst: int = 1,
+        backend: str = RATE_LIMIT_BACKEND_LOCAL,
+        client=None,
+        key_prefix: str = RATE_LIMIT_KEY_PREFIX,
+        controller: Optional[AimdController] = None,
+        parent: Optional['RateLimiter'] = None,
+        redis_retry_interval: float = 0.0,
     ):
         """
         Rate Limiter 초기화
-        
+
         Args:
-            min_interval: 요청 간 최소 대기 시간 (초, 기본: 0.5초)
+            min_interval: 호스트별 평균 요청 간격 (초, 기본: 0.5초, 0이면 제한 없음)
             max_concurrent: 최대 동시 요청 수 (None이면 제한 없음)
+            burst: 쉬고 있던 호스트에 바로 보낼 수 있는 요청 수 (1이면 항상 min_interval 간격)
+            backend: "local" (프로세스 내 공유) 또는 "redis" (프로세스/노드 간 공유)
+            client: Redis 클라이언트 (redis 백엔드, None이면 전역 클라이언트 사용)
+            key_prefix: Redis 버킷 키 접두사 (redis 백엔드)
+            controller: 응답에 따라 호스트별 속도를 조절하는 AIMD 조절기 (None이면 고정 속도)
+            parent: 이 제한기의 토큰을 얻은 뒤 토큰을 한 번 더 얻을 상위 예산 (예: 백필이 전역 예산 안에서
+                더 느린 속도만 쓰도록 하는 하위 제한, None이면 이 제한기만 적용)
+            redis_retry_interval: Redis 버킷 요청이 실패한 뒤 프로세스 내 버킷만 쓰는 시간
+                (초, 이 시간이 지나야 Redis를 다시 시도, 0이면 요청마다 다시 시도)
         """
         self.min_interval = min_interval
         self.max_concurrent = max_concurrent
-        self._last_request_time: Optional[float] = None
-        self._lock = Lock()
+        self.burst = max(1, burst)
+        self.backend = backend
+        self.rate = 1.0 / min_interval if min_interval > 0 else 0.0
+        self._client = client
+        self._key_prefix = key_prefix
+        self.controller = controller
+        self.parent = parent
+        self.redis_retry_interval = redis_retry_interval
+        self._lock = threading.Lock()
+        self._buckets: Dict[str, Union[TokenBucket, RedisTokenBucket]] = {}
+        # redis 백엔드에서 Redis에 접근할 수 없을 때 쓰는 프로세스 내 버킷
+        self._fallback_buckets: Dict[str, TokenBucket] = {}
+        self._redis_available = True
+        # Redis를 다시 시도할 시각 (monotonic, 실패 후 redis_retry_interval 동안 요청마다 다시 연결하지 않음)
+        self._redis_retry_at = 0.0
+        self._semaphore = threading.BoundedSemaphore(max_concurrent) if max_concurrent is not None else None
         self._concurrent_count = 0
         self._total_requests = 0
         self._total_wait_time = 0.0
-        
+        self._fallbacks = 0
+        self._host_stats: Dict[str, Dict[str, float]] = defaultdict(lambda: {'requests': 0, 'wait_time': 0.0})
+
         logger.info(
-            f"RateLimiter 초기화: min_interval={min_interval}초, "
-            f"max_concurrent={max_concurrent}"
+            f"RateLimiter 초기화: min_interval={min_interval}초, burst={self.burst}, "
+            f"max_concurrent={max_concurrent}, backend={backend}, adaptive={controller is not None}"
         )
-    
+
+    @classmethod
+    def from_settings(cls) -> 'RateLimiter':
+        """설정값으로 생성 (모든 수집기가 공유하는 upstream 예산)"""
+        rate = settings.RATE_LIMIT_HOST_RATE
+        return cls(
+            min_interval=1.0 / rate if rate > 0 else 0.0,
+            burst=settings.RATE_LIMIT_BURST,
+            backend=settings.RATE_LIMIT_BACKEND,
+            controller=AimdController.from_settings() if settings.RATE_LIMIT_ADAPTIVE_ENABLED else None,
+            redis_retry_interval=settings.RATE_LIMIT_REDIS_RETRY_INTERVAL,
+        )
+
     def __enter__(self):
         """Context Manager 진입"""
-        self.wait_if_needed()
+        self.acquire()
         return self
-    
+
     def __exit__(self, exc_type, exc_val, exc_tb):
         """Context Manager 종료"""
-        with self._lock:
-            if self.max_concurrent is not None:
-                self._concurrent_count -= 1
+        self.release()
         return False
-    
-    def wait_if_needed(self):
+
+    @contextmanager
+    def limit(self, host: Optional[str] = None) -> Iterator['RateLimiter']:
+        """
+        호스트 버킷으로 요청 하나를 제한하는 Context Manager
+
+        Args:
+            host: 요청 호스트 (None이면 기본 버킷)
+        """
+        self.acquire(host)
+        try:
+            yield self
+        finally:
+            self.release()
+
+    def acquire(self, host: Optional[str] = None) -> None:
+        """동시 요청 슬롯을 얻고 호스트 버킷의 토큰을 기다림 (release()로 슬롯 반환)"""
+        if self._semaphore is not None:
+            self._semaphore.acquire()
+        self._enter()
+        try:
+            self.wait_if_needed(host)
+        except BaseException:
+            self.release()
+            raise
+
+    def release(self) -> None:
+        """동시 요청 슬롯 반환"""
+        self._exit()
+        if self._semaphore is not None:
+            self._semaphore.release()
+
+    def _enter(self) -> None:
+        """진행 중인 요청 수 증가"""
+        with self._lock:
+            self._concurrent_count += 1
+
+    def _exit(self) -> None:
+        """진행 중인 요청 수 감소"""
+        with self._lock:
+            self._concurrent_count -= 1
+
+    def host_rate(self, host: str) -> float:
+        """호스트의 현재 초당 요청 수 (조절기가 없으면 고정 속도)"""
+        if self.controller is None or self.rate <= 0:
+            return self.rate
+        return self.controller.rate(host)
+
+    def _bucket(self, host: str) -> Union[TokenBucket, RedisTokenBucket]:
+        """호스트 버킷 조회 (없으면 생성)"""
+        rate = self.host_rate(host)
+        with self._lock:
+            bucket = self._buckets.get(host)
+            if bucket is None:
+                if self.backend == RATE_LIMIT_BACKEND_REDIS:
+                    bucket = RedisTokenBucket(
+                        f"{self._key_prefix}:{host}", rate, self.burst, client=self._client
+                    )
+                else:
+                    bucket = TokenBucket(rate, self.burst)
+                self._buckets[host] = bucket
+            return bucket
+
+    def _fallback_bucket(self, host: str) -> TokenBucket:
+        """Redis를 쓸 수 없을 때의 프로세스 내 버킷"""
+        rate = self.host_rate(host)
+        with self._lock:
+            bucket = self._fallback_buckets.get(host)
+            if bucket is None:
+                bucket = TokenBucket(rate, self.burst)
+                self._fallback_buckets[host] = bucket
+            return bucket
+
+    def record_response(
+        self,
+        host: Optional[str],
+        status: Optional[int] = None,
+        latency: float = 0.0,
+        error: Optional[BaseException] = None,
+    ) -> None:
+        """
+        upstream 응답을 조절기에 반영하고, 속도가 바뀌면 호스트 버킷에 적용
+
+        HttpClient.add_response_listener에 등록해 모든 수집 요청의 응답을 받습니다.
+        속도 제한(rate 0)이면 조절하지 않습니다.
+        """
+        if self.controller is None or self.rate <= 0:
+            return
+        host = host or DEFAULT_HOST
+        new_rate = self.controller.observe(host, status, latency, error)
+        if new_rate is None:
+            return
+        with self._lock:
+            buckets = [b for b in (self._buckets.get(host), self._fallback_buckets.get(host)) if b is not None]
+        for bucket in buckets:
+            bucket.set_rate(new_rate)
+
+    def _reserve(self, host: str) -> float:
+        """
+        호스트 버킷에서 토큰 예약 (Redis 실패 시 프로세스 내 버킷으로 대체)
+
+        Redis가 실패하면 redis_retry_interval 동안은 Redis에 요청하지 않고 바로 프로세스 내 버킷을 씁니다.
+        """
+        bucket = self._bucket(host)
+        if not isinstance(bucket, RedisTokenBucket):
+            return bucket.reserve()
+        if not self._redis_available and time.monotonic() < self._redis_retry_at:
+            with self._lock:
+                self._fallbacks += 1
+            return self._fallback_bucket(host).reserve()
+        try:
+            wait_time = bucket.reserve()
+        except Exception as e:
+            if self._redis_available:
+                logger.warning(f"Redis rate limit unavailable, using process-local bucket for {host}: {e}")
+            self._redis_available = False
+            self._redis_retry_at = time.monotonic() + self.redis_retry_interval
+            with self._lock:
+                self._fallbacks += 1
+            return self._fallback_bucket(host).reserve()
+        if not self._redis_available:
+            logger.info(f"Redis rate limit restored for {host}")
+            self._redis_available = True
+        return wait_time
+
+    def wait_if_needed(self, host: Optional[str] = None) -> float:
         """
         필요한 경우 대기
-        
-        마지막 요청으로부터 min_interval이 경과하지 않았으면 대기합니다.
+
+        호스트 버킷에서 토큰을 예약하고, 토큰이 찰 때까지 잠금 없이 대기합니다.
+        상위 예산(parent)이 있으면 이어서 상위 예산의 같은 호스트 버킷에서도 토큰을 얻습니다.
+
+        Args:
+            host: 요청 호스트 (None이면 기본 버킷)
+
+        Returns:
+            대기한 시간 (초)
         """
+        host = host or DEFAULT_HOST
+        wait_time = self._reserve(host)
+        if wait_time > 0:
+            logger.debug(f"Rate limit: {host} {wait_time:.2f}초 대기")
+            time.sleep(wait_time)
+
+        self._record_wait(host, wait_time)
+        if self.parent is not None:
+            wait_time += self.parent.wait_if_needed(host)
+        return wait_time
+
+    def _record_wait(self, host: str, wait_time: float) -> None:
+        """요청 하나의 대기 시간 기록"""
         with self._lock:
-            # 동시 요청 수 제한 확인
-            if self.max_concurrent is not None:
-                while self._concurrent_count >= self.max_concurrent:
-                    time.sleep(0.1)
-                self._concurrent_count += 1
-            
-            # 최소 간격 확인
-            current_time = time.time()
-            
-            if self._last_request_time is not None:
-                elapsed = current_time - self._last_request_time
-                wait_time = self.min_interval - elapsed
-                
-                if wait_time > 0:
-                    logger.debug(f"Rate limit: {wait_time:.2f}초 대기")
-                    time.sleep(wait_time)
-                    current_time = time.time()
-                    self._total_wait_time += wait_time
-            
-            self._last_request_time = current_time
             self._total_requests += 1
-    
+            self._total_wait_time += wait_time
+            host_stats = self._host_stats[host]
+            host_stats['requests'] += 1
+            host_stats['wait_time'] += wait_time
+
     def get_stats(self) -> dict:
         """
         Rate Limiter 통계 조회
-        
+
         Returns:
             통계 딕셔너리
         """
@@ -107,42 +608,150 @@ class RateLimiter:
                     round(self._total_wait_time / self._total_requests, 2)
                     if self._total_requests > 0 else 0.0
                 ),
-                'current_concurrent': self._concurrent_count
+                'current_concurrent': self._concurrent_count,
+                'backend': self.backend,
+                'rate': round(self.rate, 3),
+                'burst': self.burst,
+                'redis_fallbacks': self._fallbacks,
+                'adaptive': self.controller.get_stats() if self.controller is not None else None,
+                'hosts': {
+                    host: {'requests': stats['requests'], 'wait_time': round(stats['wait_time'], 2)}
+                    for host, stats in self._host_stats.items()
+                },
             }
-    
+
     def reset_stats(self):
         """통계 초기화"""
         with self._lock:
             self._total_requests = 0
             self._total_wait_time = 0.0
+            self._fallbacks = 0
+            self._host_stats.clear()
             logger.info("RateLimiter 통계 초기화")
 
 
+class AsyncRateLimiter:
+    """
+    asyncio용 Rate Limiter
+
+    RateLimiter의 호스트 버킷·AIMD 조절기·통계를 그대로 쓰고, 대기만 asyncio.sleep으로 합니다.
+    토큰 예약은 잠금을 잠깐 잡는 계산이라 이벤트 루프에서 바로 호출하고,
+    Redis 버킷은 네트워크 왕복이 있으므로 스레드에서 예약합니다.
+    동시 요청 수 제한은 이벤트 루프 안의 asyncio.Semaphore로 합니다.
+
+    Example:
+        limiter = AsyncRateLimiter()  # 전역 RateLimiter와 예산 공유
+
+        async with limiter:
+            data = await fetch_data(ticker)
+
+        async with limiter.limit(host_of(url)):
+            response = await client.get(url)
+    """
+
+    def __init__(self, limiter: Optional[RateLimiter] = None, max_concurrent: Optional[int] = None):
+        """
+        Args:
+            limiter: 버킷과 통계를 공유할 RateLimiter (None이면 전역 인스턴스)
+            max_concurrent: 최대 동시 요청 수 (None이면 limiter의 설정)
+        """
+        self.limiter = limiter or get_rate_limiter()
+        self.max_concurrent = max_concurrent if max_concurrent is not None else self.limiter.max_concurrent
+        self._semaphore = asyncio.Semaphore(self.max_concurrent) if self.max_concurrent is not None else None
+
+    async def __aenter__(self):
+        """Async Context Manager 진입"""
+        await self.acquire()
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        """Async Context Manager 종료"""
+        self.release()
+        return False
+
+    @asynccontextmanager
+    async def limit(self, host: Optional[str] = None) -> AsyncIterator['AsyncRateLimiter']:
+        """
+        호스트 버킷으로 요청 하나를 제한하는 Async Context Manager
+
+        Args:
+            host: 요청 호스트 (None이면 기본 버킷)
+        """
+        await self.acquire(host)
+        try:
+            yield self
+        finally:
+            self.release()
+
+    async def acquire(self, host: Optional[str] = None) -> None:
+        """동시 요청 슬롯을 얻고 호스트 버킷의 토큰을 기다림 (release()로 슬롯 반환)"""
+        if self._semaphore is not None:
+            await self._semaphore.acquire()
+        self.limiter._enter()
+        try:
+            await self.wait_if_needed(host)
+        except BaseException:
+            self.release()
+            raise
+
+    def release(self) -> None:
+        """동시 요청 슬롯 반환"""
+        self.limiter._exit()
+        if self._semaphore is not None:
+            self._semaphore.release()
+
+    async def wait_if_needed(self, host: Optional[str] = None) -> float:
+        """
+        필요한 경우 이벤트 루프를 막지 않고 대기
+
+        Args:
+            host: 요청 호스트 (None이면 기본 버킷)
+
+        Returns:
+            대기한 시간 (초)
+        """
+        host = host or DEFAULT_HOST
+        if self.limiter.backend == RATE_LIMIT_BACKEND_REDIS:
+            wait_time = await asyncio.to_thread(self.limiter._reserve, host)
+        else:
+            wait_time = self.limiter._reserve(host)
+        if wait_time > 0:
+            logger.debug(f"Rate limit: {host} {wait_time:.2f}초 대기")
+            await asyncio.sleep(wait_time)
+
+        self.limiter._record_wait(host, wait_time)
+        return wait_time
+
+    def get_stats(self) -> dict:
+        """공유 RateLimiter 통계"""
+        return self.limiter.get_stats()
+
+
 # 전역 Rate Limiter 인스턴스
 _rate_limiter_instance: Optional[RateLimiter] = None
+_rate_limiter_lock = threading.Lock()
 
 
-def get_rate_limiter(
-    min_interval: float = 0.5,
-    max_concurrent: Optional[int] = None
-) -> RateLimiter:
+def get_rate_limiter() -> RateLimiter:
     """
-    Rate Limiter 인스턴스 조회 (싱글톤 패턴)
-    
-    Args:
-        min_interval: 요청 간 최소 대기 시간 (초)
-        max_concurrent: 최대 동시 요청 수
-    
+    전역 Rate Limiter 인스턴스 조회 (싱글톤 패턴)
+
+    수집기와 스케줄러 워커 스레드가 모두 이 인스턴스를 공유하므로 수집 경로와 관계없이
+    호스트별 upstream 예산(RATE_LIMIT_HOST_RATE, RATE_LIMIT_BURST)이 하나로 유지됩니다.
+    RATE_LIMIT_BACKEND=redis이면 프로세스/노드 간에도 공유합니다.
+    RATE_LIMIT_ADAPTIVE_ENABLED이면 전역 HTTP 클라이언트의 응답으로 호스트별 속도를 조절합니다.
+
     Returns:
         RateLimiter 인스턴스
     """
     global _rate_limiter_instance
-    
+
     if _rate_limiter_instance is None:
-        _rate_limiter_instance = RateLimiter(
-            min_interval=min_interval,
-            max_concurrent=max_concurrent
-        )
-    
-    return _rate_limiter_instance
+        with _rate_limiter_lock:
+            if _rate_limiter_instance is None:
+                limiter = RateLimiter.from_settings()
+                if limiter.controller is not None:
+                    get_http_client().add_response_listener(limiter.record_response)
+                _rate_limiter_instance = limiter
 
+    return _rate_limiter_instance
@@ -2,22 +2,165 @@
 재시도 로직 유틸리티
 
 Exponential Backoff를 사용한 재시도 데코레이터를 제공합니다.
+
+- retry_with_backoff: 동기 함수용 (time.sleep으로 대기)
+- async_retry_with_backoff: 코루틴 함수용 (asyncio.sleep으로 대기하여 이벤트 루프를 막지 않음)
+
+두 데코레이터는 같은 설정(max_retries, base_delay, max_delay, exponential_base, jitter)과
+재시도 통계(get_retry_stats)를 공유합니다.
+
+- request_with_retry: 페이지 요청 하나 단위 재시도 (full jitter, Retry-After, 실행별 재시도 예산)
+- async_request_with_retry: request_with_retry와 같은 정책의 코루틴용 (비동기 수집 엔진)
 """
 
+import asyncio
 import logging
+import random
+import threading
 import time
+from collections import defaultdict
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
 from functools import wraps
-from typing import Callable, Type, Tuple
+from typing import Awaitable, Callable, Dict, Optional, Type, Tuple, TypeVar
+
+import requests
+
+from app.config import settings
+from app.utils.deadline import Deadline, current_deadline
 
 logger = logging.getLogger(__name__)
 
+T = TypeVar('T')
+
+# 다시 요청하면 성공할 수 있는 HTTP 상태 코드 (그 밖의 5xx도 포함)
+RETRYABLE_STATUS_CODES = frozenset({408, 429})
+
+
+class RetryStats:
+    """재시도 통계 (동기/비동기 데코레이터가 공유)"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._retries = 0
+        self._failures = 0
+        self._total_delay = 0.0
+        self._functions: Dict[str, Dict[str, float]] = defaultdict(
+            lambda: {'retries': 0, 'failures': 0, 'delay': 0.0}
+        )
+
+    def record_retry(self, name: str, delay: float):
+        """재시도 한 번 기록"""
+        with self._lock:
+            self._retries += 1
+            self._total_delay += delay
+            stats = self._functions[name]
+            stats['retries'] += 1
+            stats['delay'] += delay
+
+    def record_failure(self, name: str):
+        """재시도를 모두 소진한 실패 기록"""
+        with self._lock:
+            self._failures += 1
+            self._functions[name]['failures'] += 1
+
+    def get_stats(self) -> dict:
+        """통계 조회"""
+        with self._lock:
+            return {
+                'retries': self._retries,
+                'failures': self._failures,
+                'total_delay': round(self._total_delay, 2),
+                'functions': {
+                    name: {
+                        'retries': stats['retries'],
+                        'failures': stats['failures'],
+                        'delay': round(stats['delay'], 2),
+                    }
+                    for name, stats in self._functions.items()
+                },
+            }
+
+    def reset(self):
+        """통계 초기화"""
+        with self._lock:
+            self._retries = 0
+            self._failures = 0
+            self._total_delay = 0.0
+            self._functions.clear()
+
+
+_retry_stats = RetryStats()
+
+
+def get_retry_stats() -> dict:
+    """동기/비동기 재시도 데코레이터의 누적 통계"""
+    return _retry_stats.get_stats()
+
+
+def reset_retry_stats():
+    """재시도 통계 초기화"""
+    _retry_stats.reset()
+
+
+def backoff_delay(
+    retry_count: int,
+    base_delay: float = 1.0,
+    max_delay: float = 10.0,
+    exponential_base: float = 2.0,
+    jitter: bool = False,
+) -> float:
+    """
+    재시도 대기 시간 계산
+
+    Args:
+        retry_count: 몇 번째 재시도인지 (1부터)
+        jitter: True이면 0 ~ 지수 대기 시간에서 균등 추출 (full jitter, 여러 호출이 동시에 재시도하지 않도록)
+
+    Returns:
+        대기 시간 (초)
+    """
+    delay = min(base_delay * (exponential_base ** (retry_count - 1)), max_delay)
+    if jitter:
+        return random.uniform(0, delay)
+    return delay
+
+
+def _next_delay(
+    func: Callable,
+    error: Exception,
+    retry_count: int,
+    max_retries: int,
+    base_delay: float,
+    max_delay: float,
+    exponential_base: float,
+    jitter: bool,
+) -> Optional[float]:
+    """실패 하나를 기록하고 다음 재시도까지의 대기 시간 반환 (재시도 소진 시 None)"""
+    if retry_count > max_retries:
+        _retry_stats.record_failure(func.__qualname__)
+        logger.error(
+            f"[재시도 실패] {func.__name__}: "
+            f"{max_retries}회 재시도 후 실패 - {type(error).__name__}: {error}"
+        )
+        return None
+
+    delay = backoff_delay(retry_count, base_delay, max_delay, exponential_base, jitter)
+    _retry_stats.record_retry(func.__qualname__, delay)
+    logger.warning(
+        f"[재시도 {retry_count}/{max_retries}] {func.__name__}: "
+        f"{type(error).__name__}: {error} - {delay:.1f}초 후 재시도"
+    )
+    return delay
+
 
 def retry_with_backoff(
     max_retries: int = 3,
     base_delay: float = 1.0,
     max_delay: float = 10.0,
     exponential_base: float = 2.0,
-    exceptions: Tuple[Type[Exception], ...] = (Exception,)
+    exceptions: Tuple[Type[Exception], ...] = (Exception,),
+    jitter: bool = False,
 ):
     """
     Exponential Backoff를 사용한 재시도 데코레이터
@@ -28,6 +171,7 @@ def retry_with_backoff(
         max_delay: 최대 대기 시간 (초, 기본: 10.0초)
         exponential_base: 지수 베이스 (기본: 2.0)
         exceptions: 재시도할 예외 타입 튜플 (기본: 모든 Exception)
+        jitter: 대기 시간을 0 ~ 지수 대기 시간에서 무작위로 선택 (기본: False)
     
     Example:
         @retry_with_backoff(max_retries=3, base_delay=1.0)
@@ -53,23 +197,12 @@ def retry_with_backoff(
                 except exceptions as e:
                     retry_count += 1
                     
-                    if retry_count > max_retries:
-                        logger.error(
-                            f"[재시도 실패] {func.__name__}: "
-                            f"{max_retries}회 재시도 후 실패 - {type(e).__name__}: {e}"
-                        )
-                        raise
-                    
                     # Exponential Backoff 계산
-                    delay = min(
-                        base_delay * (exponential_base ** (retry_count - 1)),
-                        max_delay
-                    )
-                    
-                    logger.warning(
-                        f"[재시도 {retry_count}/{max_retries}] {func.__name__}: "
-                        f"{type(e).__name__}: {e} - {delay:.1f}초 후 재시도"
+                    delay = _next_delay(
+                        func, e, retry_count, max_retries, base_delay, max_delay, exponential_base, jitter
                     )
+                    if delay is None:
+                        raise
                     
                     time.sleep(delay)
             
@@ -79,3 +212,295 @@ def retry_with_backoff(
         return wrapper
     return decorator
 
+
+def async_retry_with_backoff(
+    max_retries: int = 3,
+    base_delay: float = 1.0,
+    max_delay: float = 10.0,
+    exponential_base: float = 2.0,
+    exceptions: Tuple[Type[Exception], ...] = (Exception,),
+    jitter: bool = True,
+):
+    """
+    코루틴 함수용 Exponential Backoff 재시도 데코레이터
+
+    retry_with_backoff와 같은 설정을 받지만 asyncio.sleep으로 대기하므로 재시도 대기 중에도
+    이벤트 루프의 다른 요청이 처리됩니다. 기본으로 jitter를 적용합니다.
+
+    Example:
+        @async_retry_with_backoff(max_retries=3, base_delay=1.0)
+        async def fetch_data():
+            # 비동기 네트워크 요청
+            pass
+    """
+    def decorator(func: Callable) -> Callable:
+        if not asyncio.iscoroutinefunction(func):
+            raise TypeError(f"{func.__name__} is not a coroutine function")
+
+        @wraps(func)
+        async def wrapper(*args, **kwargs):
+            retry_count = 0
+
+            while True:
+                try:
+                    return await func(*args, **kwargs)
+
+                except exceptions as e:
+                    retry_count += 1
+
+                    delay = _next_delay(
+                        func, e, retry_count, max_retries, base_delay, max_delay, exponential_base, jitter
+                    )
+                    if delay is None:
+                        raise
+
+                    await asyncio.sleep(delay)
+
+        return wrapper
+    return decorator
+
+
+
+class RetryBudget:
+    """
+    수집 실행 하나의 재시도 예산
+
+    upstream이 계속 실패할 때 페이지마다 재시도가 쌓여 요청 수가 몇 배로 늘지 않도록
+    한 실행(스케줄러 job 실행, 백필 묶음 등)에서 쓸 수 있는 재시도 횟수를 제한합니다.
+    여러 워커 스레드가 같은 예산을 공유합니다.
+    """
+
+    def __init__(self, max_retries: int):
+        """
+        Args:
+            max_retries: 실행 전체에서 허용하는 재시도 횟수 (0이면 재시도 안 함)
+        """
+        self.max_retries = max_retries
+        self._lock = threading.Lock()
+        self._used = 0
+        self._denied = 0
+
+    @classmethod
+    def from_settings(cls) -> 'RetryBudget':
+        """설정값으로 생성"""
+        return cls(settings.PAGE_RETRY_BUDGET)
+
+    def try_spend(self) -> bool:
+        """재시도 한 번을 예산에서 차감 (예산이 없으면 False)"""
+        with self._lock:
+            if self._used >= self.max_retries:
+                self._denied += 1
+                return False
+            self._used += 1
+            return True
+
+    @property
+    def used(self) -> int:
+        """사용한 재시도 횟수"""
+        with self._lock:
+            return self._used
+
+    @property
+    def denied(self) -> int:
+        """예산이 없어 재시도하지 않은 횟수"""
+        with self._lock:
+            return self._denied
+
+    def reset(self):
+        """새 실행을 위해 예산 초기화"""
+        with self._lock:
+            self._used = 0
+            self._denied = 0
+
+
+def is_retryable_error(error: BaseException) -> bool:
+    """다시 요청하면 성공할 수 있는 요청 실패인지 (타임아웃, 연결 오류, 408/429/5xx)"""
+    if isinstance(error, (requests.exceptions.Timeout, requests.exceptions.ConnectionError,
+                          requests.exceptions.ChunkedEncodingError)):
+        return True
+    if isinstance(error, requests.exceptions.HTTPError) and error.response is not None:
+        status = error.response.status_code
+        return status in RETRYABLE_STATUS_CODES or status >= 500
+    return False
+
+
+def retry_after_seconds(error: BaseException) -> Optional[float]:
+    """
+    응답의 Retry-After 헤더 (초 또는 HTTP 날짜)
+
+    Returns:
+        기다려야 하는 시간 (초), 헤더가 없거나 해석할 수 없으면 None
+    """
+    response = getattr(error, 'response', None)
+    if response is None:
+        return None
+    value = response.headers.get('Retry-After')
+    if not value:
+        return None
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
+
+
+def _next_request_delay(
+    error: requests.exceptions.RequestException,
+    label: str,
+    retry_count: int,
+    budget: Optional[RetryBudget],
+    deadline: Optional[Deadline],
+    max_retries: int,
+    base_delay: float,
+    max_delay: float,
+    max_retry_after: float,
+) -> Optional[float]:
+    """실패한 요청 하나를 기록하고 다음 재시도까지의 대기 시간 반환 (재시도하지 않으면 None)"""
+    if not is_retryable_error(error):
+        return None
+    if retry_count > max_retries:
+        _retry_stats.record_failure(label)
+        logger.error(f"[재시도 실패] {label}: {max_retries}회 재시도 후 실패 - {type(error).__name__}: {error}")
+        return None
+
+    retry_after = retry_after_seconds(error)
+    if retry_after is not None and retry_after > max_retry_after:
+        _retry_stats.record_failure(label)
+        logger.warning(f"[재시도 안 함] {label}: Retry-After {retry_after:.0f}초가 상한 {max_retry_after:.0f}초 초과")
+        return None
+
+    delay = retry_after if retry_after is not None else backoff_delay(
+        retry_count, base_delay, max_delay, jitter=True
+    )
+    # 대기 후 다시 요청할 시간이 없으면 마감을 넘겨 기다리지 않음 (Retry-After가 작업 타임아웃보다 길 수 있음)
+    if deadline is not None and delay >= deadline.remaining():
+        _retry_stats.record_failure(label)
+        logger.warning(
+            f"[재시도 안 함] {label}: 대기 {delay:.1f}초가 작업 마감까지 남은 {deadline.remaining():.1f}초 이상"
+        )
+        return None
+    if budget is not None and not budget.try_spend():
+        _retry_stats.record_failure(label)
+        logger.warning(f"[재시도 안 함] {label}: 이번 실행의 재시도 예산({budget.max_retries}회) 소진 - {error}")
+        return None
+
+    _retry_stats.record_retry(label, delay)
+    logger.warning(
+        f"[재시도 {retry_count}/{max_retries}] {label}: "
+        f"{type(error).__name__}: {error} - {delay:.1f}초 후 재시도"
+    )
+    return delay
+
+
+def request_with_retry(
+    send: Callable[[], T],
+    label: str,
+    budget: Optional[RetryBudget] = None,
+    max_retries: Optional[int] = None,
+    base_delay: Optional[float] = None,
+    max_delay: Optional[float] = None,
+    max_retry_after: Optional[float] = None,
+    sleep: Optional[Callable[[float], None]] = None,
+) -> T:
+    """
+    요청 하나를 재시도하며 실행
+
+    함수 전체가 아니라 실패한 페이지 요청만 다시 보내므로, 30페이지에서 실패해도
+    1페이지부터 다시 수집하지 않고 그 페이지부터 이어갑니다.
+    대기 시간은 full jitter(0 ~ 지수 대기 시간)이고, 응답에 Retry-After가 있으면 그 시간을 따릅니다.
+    Retry-After가 max_retry_after보다 길거나 예산이 없으면 재시도하지 않습니다.
+    현재 컨텍스트에 마감 시각(deadline_scope)이 있으면 요청마다 먼저 확인하고,
+    대기 시간이 마감까지 남은 시간 이상이면 재시도하지 않습니다.
+
+    Args:
+        send: 요청을 보내고 결과를 반환하는 함수 (실패 시 requests 예외 발생)
+        label: 통계와 로그에 쓸 요청 이름 (예: "sise_day")
+        budget: 실행별 재시도 예산 (None이면 요청마다 max_retries까지)
+        max_retries: 요청 하나의 최대 재시도 횟수 (None이면 설정값 PAGE_RETRY_MAX_RETRIES)
+        base_delay: 기본 대기 시간 (초, None이면 설정값)
+        max_delay: 최대 대기 시간 (초, None이면 설정값)
+        max_retry_after: 따를 수 있는 최대 Retry-After (초, None이면 설정값)
+        sleep: 대기 함수 (None이면 time.sleep, 테스트용)
+
+    Returns:
+        send()의 반환값
+
+    Raises:
+        requests.exceptions.RequestException: 재시도할 수 없는 실패, 재시도 소진, 예산 소진, 마감 전 재시도 불가
+        DeadlineExceeded: 요청 전에 마감 시각이 지났거나 작업이 취소됨
+    """
+    max_retries = settings.PAGE_RETRY_MAX_RETRIES if max_retries is None else max_retries
+    base_delay = settings.PAGE_RETRY_BASE_DELAY if base_delay is None else base_delay
+    max_delay = settings.PAGE_RETRY_MAX_DELAY if max_delay is None else max_delay
+    max_retry_after = settings.PAGE_RETRY_AFTER_MAX if max_retry_after is None else max_retry_after
+
+    deadline = current_deadline()
+    retry_count = 0
+    while True:
+        if deadline is not None:
+            deadline.check(label)
+        try:
+            return send()
+        except requests.exceptions.RequestException as e:
+            retry_count += 1
+            delay = _next_request_delay(
+                e, label, retry_count, budget, deadline, max_retries, base_delay, max_delay, max_retry_after
+            )
+            if delay is None:
+                raise
+            (sleep or time.sleep)(delay)
+
+
+async def async_request_with_retry(
+    send: Callable[[], Awaitable[T]],
+    label: str,
+    budget: Optional[RetryBudget] = None,
+    max_retries: Optional[int] = None,
+    base_delay: Optional[float] = None,
+    max_delay: Optional[float] = None,
+    max_retry_after: Optional[float] = None,
+    sleep: Optional[Callable[[float], Awaitable[None]]] = None,
+) -> T:
+    """
+    코루틴 요청 하나를 재시도하며 실행
+
+    request_with_retry와 같은 정책(재시도 가능한 오류, full jitter, Retry-After, 실행별 예산, 마감 시각)과
+    통계를 쓰고, asyncio.sleep으로 기다려 재시도 대기 중에도 이벤트 루프의 다른 요청이 처리됩니다.
+
+    Args:
+        send: 요청을 보내고 결과를 반환하는 코루틴 함수 (실패 시 requests 예외 발생)
+        sleep: 대기 코루틴 함수 (None이면 asyncio.sleep, 테스트용)
+        그 밖의 인자는 request_with_retry와 같음
+
+    Returns:
+        send()의 반환값
+
+    Raises:
+        requests.exceptions.RequestException: 재시도할 수 없는 실패, 재시도 소진, 예산 소진, 마감 전 재시도 불가
+        DeadlineExceeded: 요청 전에 마감 시각이 지났거나 작업이 취소됨
+    """
+    max_retries = settings.PAGE_RETRY_MAX_RETRIES if max_retries is None else max_retries
+    base_delay = settings.PAGE_RETRY_BASE_DELAY if base_delay is None else base_delay
+    max_delay = settings.PAGE_RETRY_MAX_DELAY if max_delay is None else max_delay
+    max_retry_after = settings.PAGE_RETRY_AFTER_MAX if max_retry_after is None else max_retry_after
+
+    deadline = current_deadline()
+    retry_count = 0
+    while True:
+        if deadline is not None:
+            deadline.check(label)
+        try:
+            return await send()
+        except requests.exceptions.RequestException as e:
+            retry_count += 1
+            delay = _next_request_delay(
+                e, label, retry_count, budget, deadline, max_retries, base_delay, max_delay, max_retry_after
+            )
+            if delay is None:
+                raise
+            await (sleep or asyncio.sleep)(delay)
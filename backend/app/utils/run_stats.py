@@ -0,0 +1,66 @@
+"""
+수집 실행별 통계 유틸리티
+
+여러 수집 job이 동시에 실행되면 페이지 변경 추적기와 수집 데이터 버퍼처럼 공유하는
+구성 요소의 누적 통계로는 실행별 수치를 구할 수 없습니다. 스케줄러는 실행마다 RunStats를 만들어
+작업 스레드의 컨텍스트에 두고(run_stats_scope), 공유 구성 요소는 현재 컨텍스트의 RunStats에도
+같은 수치를 더합니다.
+"""
+
+import threading
+from collections import Counter
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Dict, Iterator, Optional
+
+
+class RunStats:
+    """
+    수집 실행 하나의 통계 (여러 워커 스레드에서 더해도 안전)
+
+    Example:
+        run_stats = RunStats()
+        with run_stats_scope(run_stats):
+            ... 수집 (페이지 변경 추적기, 수집 데이터 버퍼가 통계를 더함) ...
+        unchanged_pages = run_stats.get('unchanged_pages')
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._counts: Counter = Counter()
+
+    def add(self, key: str, amount: int = 1) -> None:
+        """통계 값 더하기"""
+        if not amount:
+            return
+        with self._lock:
+            self._counts[key] += amount
+
+    def get(self, key: str) -> int:
+        """통계 값 조회 (없으면 0)"""
+        with self._lock:
+            return self._counts[key]
+
+    def snapshot(self) -> Dict[str, int]:
+        """모든 통계 값 복사본"""
+        with self._lock:
+            return dict(self._counts)
+
+
+# 현재 수집 실행의 통계 (스레드/태스크별)
+_current_run_stats: ContextVar[Optional[RunStats]] = ContextVar("run_stats", default=None)
+
+
+def current_run_stats() -> Optional[RunStats]:
+    """현재 컨텍스트의 실행 통계 (없으면 None)"""
+    return _current_run_stats.get()
+
+
+@contextmanager
+def run_stats_scope(run_stats: Optional[RunStats]) -> Iterator[Optional[RunStats]]:
+    """블록 안에서 run_stats를 현재 실행 통계로 사용"""
+    token = _current_run_stats.set(run_stats)
+    try:
+        yield run_stats
+    finally:
+        _current_run_stats.reset(token)
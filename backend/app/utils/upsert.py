@@ -0,0 +1,220 @@
+"""
+벌크 upsert 유틸리티
+
+여러 행을 데이터베이스 방언에 맞는 단일 INSERT ... ON CONFLICT 문으로 저장합니다.
+
+- MySQL: INSERT ... ON DUPLICATE KEY UPDATE
+- SQLite / PostgreSQL: INSERT ... ON CONFLICT (...) DO UPDATE
+
+충돌 컬럼에는 유니크 제약조건(또는 유니크 인덱스)이 있어야 합니다.
+
+skip_unchanged를 사용하면 저장된 값과 비교하여 실제로 바뀐 행만 씁니다.
+같은 값을 다시 쓰지 않으므로 MySQL redo log/binlog와 복제 부하가 줄어듭니다.
+"""
+
+import logging
+from dataclasses import dataclass, field
+from decimal import Decimal, InvalidOperation
+from typing import Dict, Iterable, List, Optional, Sequence, Set, Tuple
+
+from sqlalchemy import Float, Numeric, select, tuple_
+from sqlalchemy.dialects import mysql, postgresql, sqlite
+from sqlalchemy.orm import Session
+
+logger = logging.getLogger(__name__)
+
+# 한 문장에 담을 최대 행 수 (SQLite 바인드 파라미터 한도 고려)
+DEFAULT_BATCH_SIZE = 500
+
+
+@dataclass
+class UpsertResult:
+    """upsert 결과"""
+
+    inserted: int = 0
+    updated: int = 0
+    unchanged: int = 0  # 저장된 값과 같아 쓰지 않은 행 (skip_unchanged 사용 시)
+    # 실제로 쓴 행의 충돌 키 튜플 (예: 종목별 변경 여부 판단, 개수 비교에서는 제외)
+    written_keys: Set[Tuple] = field(default_factory=set, compare=False, repr=False)
+
+    @property
+    def total(self) -> int:
+        """처리한 행 수 (변경 없는 행 포함)"""
+        return self.inserted + self.updated + self.unchanged
+
+    @property
+    def written(self) -> int:
+        """실제로 쓴 행 수"""
+        return self.inserted + self.updated
+
+
+def _dedupe(rows: Iterable[dict], conflict_columns: Sequence[str]) -> List[dict]:
+    """충돌 키가 같은 행은 마지막 행만 남김 (한 문장에서 같은 행을 두 번 갱신할 수 없음)"""
+    by_key: Dict[Tuple, dict] = {}
+    for row in rows:
+        by_key[tuple(row[column] for column in conflict_columns)] = row
+    return list(by_key.values())
+
+
+def _build_statement(dialect: str, table, conflict_columns: Sequence[str], update_columns: Sequence[str]):
+    """
+    방언별 upsert 문 생성
+
+    값은 실행 시 파라미터 리스트로 전달하므로 문장은 한 번만 컴파일되어 캐시되고,
+    배치는 드라이버의 executemany(MySQL/PostgreSQL은 다중 VALUES INSERT)로 전송됩니다.
+    """
+    if dialect == "mysql":
+        stmt = mysql.insert(table)
+        return stmt.on_duplicate_key_update({column: stmt.inserted[column] for column in update_columns})
+
+    if dialect in ("sqlite", "postgresql"):
+        insert = sqlite.insert if dialect == "sqlite" else postgresql.insert
+        stmt = insert(table)
+        return stmt.on_conflict_do_update(
+            index_elements=list(conflict_columns),
+            set_={column: stmt.excluded[column] for column in update_columns},
+        )
+
+    raise ValueError(f"Bulk upsert is not supported for dialect: {dialect}")
+
+
+def _normalize(column, value):
+    """비교용 값 정규화 (Numeric은 컬럼 소수 자릿수로 맞춘 Decimal)"""
+    if value is None:
+        return None
+    column_type = column.type
+    try:
+        if isinstance(column_type, Float):
+            return float(value)
+        if isinstance(column_type, Numeric):
+            decimal_value = Decimal(str(value))
+            if column_type.scale is not None:
+                decimal_value = decimal_value.quantize(Decimal(1).scaleb(-column_type.scale))
+            return decimal_value
+    except (InvalidOperation, TypeError, ValueError):
+        pass
+    return value
+
+
+def _fetch_existing(
+    db: Session,
+    table,
+    batch: List[dict],
+    conflict_columns: Sequence[str],
+    value_columns: Sequence[str] = (),
+) -> Dict[Tuple, Tuple]:
+    """
+    배치 중 이미 저장된 행 조회 (한 번의 IN 쿼리)
+
+    Returns:
+        {충돌 키 튜플: 정규화한 value_columns 값 튜플}
+    """
+    key_columns = [table.c[column] for column in conflict_columns]
+    value_table_columns = [table.c[column] for column in value_columns]
+    keys = [tuple(row[column] for column in conflict_columns) for row in batch]
+    if len(key_columns) == 1:
+        condition = key_columns[0].in_([key[0] for key in keys])
+    else:
+        condition = tuple_(*key_columns).in_(keys)
+
+    existing = {}
+    width = len(key_columns)
+    for row in db.execute(select(*key_columns, *value_table_columns).where(condition)):
+        existing[tuple(row[:width])] = tuple(
+            _normalize(column, value) for column, value in zip(value_table_columns, row[width:])
+        )
+    return existing
+
+
+def _is_unchanged(
+    table,
+    row: dict,
+    stored: Dict[Tuple, Tuple],
+    conflict_columns: Sequence[str],
+    compare_columns: Sequence[str],
+) -> bool:
+    """입력 행이 저장된 행과 같은지 확인"""
+    key = tuple(row[column] for column in conflict_columns)
+    if key not in stored:
+        return False
+    values = tuple(_normalize(table.c[column], row.get(column)) for column in compare_columns)
+    return values == stored[key]
+
+
+
+def bulk_upsert(
+    db: Session,
+    model,
+    rows: Sequence[dict],
+    conflict_columns: Sequence[str],
+    update_columns: Optional[Sequence[str]] = None,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    existing_keys: Optional[Set[Tuple]] = None,
+    skip_unchanged: bool = False,
+    ignore_columns: Sequence[str] = (),
+) -> UpsertResult:
+    """
+    여러 행을 한 번에 삽입하거나 갱신
+
+    커밋은 호출 측에서 수행합니다.
+
+    Args:
+        db: 데이터베이스 세션
+        model: ORM 모델 클래스 (예: Price)
+        rows: 저장할 행 딕셔너리 리스트 (모델 컬럼 이름 사용)
+        conflict_columns: 유니크 키 컬럼 (예: ("ticker", "date"))
+        update_columns: 충돌 시 갱신할 컬럼 (None이면 키와 기본 키를 제외한 입력 컬럼 전체)
+        batch_size: 한 문장에 담을 최대 행 수
+        existing_keys: 이미 저장된 것으로 확인한 충돌 키 튜플 집합
+            (주어지면 삽입/갱신 개수 구분용 조회를 생략, skip_unchanged와 함께 사용 불가)
+        skip_unchanged: 저장된 값과 갱신 컬럼 값이 모두 같은 행은 쓰지 않음
+        ignore_columns: skip_unchanged 비교에서 제외할 컬럼 (예: 수집 시각)
+
+    Returns:
+        UpsertResult (삽입/갱신/변경 없음 개수와 실제로 쓴 행의 충돌 키)
+    """
+    if not rows:
+        return UpsertResult()
+    if skip_unchanged and existing_keys is not None:
+        raise ValueError("existing_keys cannot be combined with skip_unchanged")
+
+    table = model.__table__
+    dialect = db.get_bind().dialect.name
+
+    # 입력에 있는 모델 컬럼만 사용하고, 일부 행에 없는 컬럼은 None으로 채움
+    columns = [column.name for column in table.columns if any(column.name in row for row in rows)]
+    primary_keys = {column.name for column in table.primary_key.columns}
+    if update_columns is None:
+        update_columns = [c for c in columns if c not in conflict_columns and c not in primary_keys]
+
+    values = _dedupe(({column: row.get(column) for column in columns} for row in rows), conflict_columns)
+
+    compare_columns = [c for c in update_columns if c not in ignore_columns] if skip_unchanged else []
+
+    stmt = _build_statement(dialect, table, conflict_columns, update_columns)
+
+    result = UpsertResult()
+    for start in range(0, len(values), batch_size):
+        batch = values[start:start + batch_size]
+        if existing_keys is not None:
+            existing = sum(tuple(row[column] for column in conflict_columns) in existing_keys for row in batch)
+        else:
+            stored = _fetch_existing(db, table, batch, conflict_columns, compare_columns)
+            existing = len(stored)
+            if skip_unchanged and stored:
+                changed = [row for row in batch if not _is_unchanged(table, row, stored, conflict_columns, compare_columns)]
+                result.unchanged += len(batch) - len(changed)
+                existing -= len(batch) - len(changed)
+                batch = changed
+        if batch:
+            db.execute(stmt, batch)
+            result.written_keys.update(tuple(row[column] for column in conflict_columns) for row in batch)
+        result.inserted += len(batch) - existing
+        result.updated += existing
+
+    logger.debug(
+        f"Upserted {len(values)} rows into {table.name} "
+        f"({result.inserted} inserted, {result.updated} updated, {result.unchanged} unchanged)"
+    )
+    return result
+
@@ -0,0 +1,232 @@
+"""
+수집 워커 프로세스 진입점
+
+API 서버와 별도 프로세스에서 데이터 수집 스케줄러를 실행하고,
+API가 Redis 큐에 넣은 온디맨드 수집 작업을 꺼내 실행합니다. BACKFILL_ENABLED이면 과거 데이터 백필도 실행합니다.
+수집이 API 프로세스의 GIL과 이벤트 루프를 차지하지 않으므로 스케줄러 실행 중에도 API 응답 지연이 늘지 않습니다.
+
+사용법:
+    python -m app.worker [--concurrency 2] [--no-scheduler] [--interval 30]
+
+API 서버는 COLLECTION_WORKER_ENABLED=true로 실행하면 수집 요청을 큐에 넣기만 하고,
+스케줄러 상태는 워커가 주기적으로 게시한 값을 조회합니다.
+"""
+
+import argparse
+import asyncio
+import logging
+import signal
+import threading
+from datetime import datetime
+from typing import List, Optional, Set
+
+from app.config import settings
+from app.database import init_db
+from app.scheduler.backfill import BackfillRunner, get_backfill_runner
+from app.scheduler.collection_jobs import CollectionJobQueue, run_collection_job
+from app.scheduler.coordination import default_member_id
+from app.scheduler.data_scheduler import DataScheduler, get_scheduler
+from app.utils.http_client import close_http_client
+from app.utils.page_archive import close_page_archive
+from app.utils.redis import close_redis_client
+
+logger = logging.getLogger(__name__)
+
+# 큐 조회 실패 시 다시 시도하기 전 대기 시간 (초)
+QUEUE_ERROR_BACKOFF = 5.0
+
+
+class CollectionWorker:
+    """
+    수집 워커
+
+    Example:
+        worker = CollectionWorker(CollectionJobQueue.from_settings(), scheduler=get_scheduler())
+        worker.run()    # stop()이 호출될 때까지 실행
+    """
+
+    def __init__(
+        self,
+        queue: CollectionJobQueue,
+        scheduler: Optional[DataScheduler] = None,
+        concurrency: int = 2,
+        poll_timeout: int = 5,
+        status_interval: float = 10.0,
+        backfill: Optional[BackfillRunner] = None,
+    ):
+        """
+        Args:
+            queue: 수집 작업 큐
+            scheduler: 함께 실행할 데이터 수집 스케줄러 (None이면 큐 작업만 실행)
+            concurrency: 큐 작업을 동시에 실행할 스레드 수
+            poll_timeout: 큐가 비어 있을 때 한 번에 기다리는 시간 (초, 종료 요청 확인 간격)
+            status_interval: 스케줄러 상태 게시와 실행 중인 작업의 임대 연장 간격 (초, 작업 임대 시간보다 짧게)
+            backfill: 함께 실행할 과거 데이터 백필 실행기 (None이면 실행하지 않음)
+        """
+        self.queue = queue
+        self.scheduler = scheduler
+        self.concurrency = max(1, concurrency)
+        self.poll_timeout = poll_timeout
+        self.status_interval = status_interval
+        self.backfill = backfill
+        self.worker_id = default_member_id()
+        self._stop_event = threading.Event()
+        self._stats_lock = threading.Lock()
+        self._stats = {'processed': 0, 'succeeded': 0, 'failed': 0, 'reclaimed': 0}
+        # 이 워커가 실행 중인 작업 ID (임대 연장 대상)
+        self._running: Set[str] = set()
+
+    def process_one(self) -> bool:
+        """
+        큐에서 작업 하나를 꺼내 실행
+
+        Returns:
+            작업을 실행했으면 True, 큐가 비어 있었으면 False
+        """
+        job = self.queue.dequeue(timeout=self.poll_timeout)
+        if job is None:
+            return False
+
+        logger.info(f"Running collection job {job['id']}: {job['type']} {job['ticker']}")
+        with self._stats_lock:
+            self._running.add(job['id'])
+        try:
+            result = run_collection_job(job['type'], job['ticker'], job['params'])
+        except Exception as e:
+            logger.error(f"Collection job {job['id']} failed: {e}", exc_info=True)
+            self.queue.finish(job['id'], error=str(e))
+            self._count('failed')
+        else:
+            self.queue.finish(job['id'], result=result)
+            self._count('succeeded')
+        finally:
+            with self._stats_lock:
+                self._running.discard(job['id'])
+        return True
+
+    def maintain_jobs(self) -> None:
+        """실행 중인 작업의 임대를 연장하고, 죽은 워커가 남긴 작업을 회수"""
+        with self._stats_lock:
+            running = list(self._running)
+        self.queue.extend_leases(running)
+        reclaimed = self.queue.reclaim_expired()
+        if reclaimed:
+            with self._stats_lock:
+                self._stats['reclaimed'] += reclaimed
+
+    def _count(self, outcome: str) -> None:
+        with self._stats_lock:
+            self._stats['processed'] += 1
+            self._stats[outcome] += 1
+
+    def _consume(self) -> None:
+        """큐 작업 실행 루프 (소비 스레드)"""
+        while not self._stop_event.is_set():
+            try:
+                self.process_one()
+            except Exception as e:
+                logger.warning(f"Collection job queue unavailable: {e}")
+                self._stop_event.wait(QUEUE_ERROR_BACKOFF)
+
+    def publish_status(self) -> None:
+        """API가 조회할 수 있도록 스케줄러 상태와 작업 통계 게시"""
+        status = self.scheduler.get_status() if self.scheduler is not None else {'is_running': False}
+        with self._stats_lock:
+            jobs_processed = dict(self._stats)
+        status['worker'] = {
+            'worker_id': self.worker_id,
+            'published_at': datetime.now().isoformat(),
+            'concurrency': self.concurrency,
+            'pending_jobs': self.queue.pending(),
+            **jobs_processed,
+        }
+        self.queue.publish_worker_status(status, ttl=int(self.status_interval * 3))
+
+    def run(self) -> None:
+        """스케줄러와 소비 스레드를 시작하고 stop()이 호출될 때까지 상태 게시"""
+        if self.scheduler is not None:
+            self.scheduler.start()
+        if self.backfill is not None:
+            self.backfill.start()
+
+        consumers: List[threading.Thread] = [
+            threading.Thread(target=self._consume, name=f"collection-job-{i}", daemon=True)
+            for i in range(self.concurrency)
+        ]
+        for consumer in consumers:
+            consumer.start()
+        logger.info(
+            f"Collection worker {self.worker_id} started "
+            f"(concurrency: {self.concurrency}, scheduler: {self.scheduler is not None})"
+        )
+
+        try:
+            while not self._stop_event.is_set():
+                try:
+                    self.maintain_jobs()
+                except Exception as e:
+                    logger.warning(f"Failed to maintain collection job leases: {e}")
+                try:
+                    self.publish_status()
+                except Exception as e:
+                    logger.warning(f"Failed to publish worker status: {e}")
+                self._stop_event.wait(self.status_interval)
+        finally:
+            for consumer in consumers:
+                consumer.join(timeout=self.poll_timeout + 1)
+            if self.scheduler is not None:
+                self.scheduler.shutdown()
+            if self.backfill is not None:
+                self.backfill.stop()
+            logger.info(f"Collection worker {self.worker_id} stopped")
+
+    def stop(self) -> None:
+        """워커 종료 요청 (실행 중인 작업은 끝까지 실행)"""
+        self._stop_event.set()
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    """메인 함수"""
+    parser = argparse.ArgumentParser(description="데이터 수집 워커")
+    parser.add_argument("--concurrency", type=int, default=settings.WORKER_CONCURRENCY, help="큐 작업 동시 실행 수")
+    parser.add_argument("--no-scheduler", action="store_true", help="스케줄러 없이 큐 작업만 실행")
+    parser.add_argument("--interval", type=int, default=None, help="가격 수집 간격 (초, 기본: 30초)")
+    args = parser.parse_args(argv)
+    if not settings.COLLECTION_WORKER_ENABLED:
+        # API 서버가 프로세스 내 큐와 스케줄러를 직접 실행하므로 워커를 함께 띄우면 수집이 중복됨
+        parser.error("COLLECTION_WORKER_ENABLED must be true to run the collection worker")
+
+    logging.basicConfig(
+        level=settings.LOG_LEVEL,
+        format="%(asctime)s %(levelname)s [%(threadName)s] %(name)s: %(message)s",
+    )
+    asyncio.run(init_db())
+
+    scheduler = None
+    if not args.no_scheduler:
+        scheduler = get_scheduler(args.interval) if args.interval else get_scheduler()
+    worker = CollectionWorker(
+        CollectionJobQueue.from_settings(),
+        scheduler=scheduler,
+        concurrency=args.concurrency,
+        status_interval=settings.WORKER_STATUS_INTERVAL,
+        backfill=get_backfill_runner() if settings.BACKFILL_ENABLED else None,
+    )
+
+    def handle_signal(signum, frame):
+        logger.info(f"Received signal {signum}, stopping collection worker")
+        worker.stop()
+
+    signal.signal(signal.SIGTERM, handle_signal)
+    signal.signal(signal.SIGINT, handle_signal)
+
+    try:
+        worker.run()
+    finally:
+        close_http_client()
+        close_page_archive()
+        close_redis_client()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,118 @@
+#!/usr/bin/env python3
+"""수집 데이터 저장 처리량 벤치마크 스크립트
+
+종목마다 저장 후 커밋하는 기존 방식과 수집 데이터 버퍼(write-behind)로
+여러 종목을 큰 트랜잭션으로 모아 저장하는 방식을 같은 데이터로 비교합니다.
+
+사용법:
+    python scripts/benchmark_ingest.py [--database-url URL] [--tickers 2000] [--days 10]
+
+기본값은 임시 파일 SQLite(커밋마다 fsync)이며, MySQL로 측정하려면 빈 데이터베이스 URL을 지정합니다.
+"""
+
+import argparse
+import sys
+import tempfile
+import time
+from datetime import date, datetime, timedelta
+from pathlib import Path
+
+# 프로젝트 루트를 sys.path에 추가
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from app.db_base import Base
+from app.models import Stock
+from app.collectors.finance_collector import FinanceCollector, DATA_TYPE_PRICES
+from app.utils.ingest_buffer import IngestBuffer
+
+
+def make_rows(ticker: str, days: int) -> list:
+    """종목 하나의 가격 행 생성"""
+    start = date(2025, 1, 1)
+    return [
+        {
+            'ticker': ticker,
+            'date': start + timedelta(days=day),
+            'timestamp': datetime.now(),
+            'current_price': 10000.0 + day,
+            'open_price': 10000.0,
+            'high_price': 10100.0 + day,
+            'low_price': 9900.0,
+            'volume': 1000,
+        }
+        for day in range(days)
+    ]
+
+
+def save_per_ticker(session_factory, tickers: list, days: int) -> None:
+    """기존 방식: 종목마다 저장 후 커밋"""
+    collector = FinanceCollector()
+    db = session_factory()
+    try:
+        for ticker in tickers:
+            collector.save_price_data(db, make_rows(ticker, days))
+    finally:
+        db.close()
+
+
+def save_buffered(session_factory, tickers: list, days: int) -> None:
+    """수집 데이터 버퍼: 단일 writer가 여러 종목을 모아 저장"""
+    collector = FinanceCollector()
+    buffer = IngestBuffer(session_factory, {DATA_TYPE_PRICES: collector.write_price_data})
+    buffer.start()
+    try:
+        for ticker in tickers:
+            buffer.submit(DATA_TYPE_PRICES, make_rows(ticker, days))
+        buffer.flush()
+    finally:
+        buffer.close()
+    print(f"    buffer stats: {buffer.get_stats()}")
+
+
+def run(database_url: str, method, ticker_count: int, days: int) -> float:
+    """빈 테이블에 저장하여 소요 시간 반환"""
+    engine = create_engine(database_url)
+    Base.metadata.drop_all(bind=engine)
+    Base.metadata.create_all(bind=engine)
+    session_factory = sessionmaker(bind=engine)
+    tickers = [f"I{i:05d}" for i in range(ticker_count)]
+    try:
+        db = session_factory()
+        db.add_all(Stock(ticker=ticker, name=f"벤치마크 {ticker}", type="STOCK") for ticker in tickers)
+        db.commit()
+        db.close()
+
+        start = time.perf_counter()
+        method(session_factory, tickers, days)
+        return time.perf_counter() - start
+    finally:
+        Base.metadata.drop_all(bind=engine)
+        engine.dispose()
+
+
+def main():
+    """메인 함수"""
+    parser = argparse.ArgumentParser(description="수집 데이터 저장 처리량 벤치마크")
+    parser.add_argument("--database-url", help="벤치마크용 데이터베이스 URL (테이블을 삭제/생성함)")
+    parser.add_argument("--tickers", type=int, default=2000)
+    parser.add_argument("--days", type=int, default=10)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        database_url = args.database_url or f"sqlite:///{tmp_dir}/benchmark.db"
+        print(f"데이터베이스: {database_url}")
+        print(f"{args.tickers}개 종목 x {args.days}일")
+
+        results = {}
+        for name, method in (('per_ticker', save_per_ticker), ('buffered', save_buffered)):
+            results[name] = run(database_url, method, args.tickers, args.days)
+            rows = args.tickers * args.days
+            print(f"{name:<12} {results[name]:>8.3f}s {rows / results[name]:>10.0f} rows/s")
+        print(f"{'speedup':<12} {results['per_ticker'] / results['buffered']:>8.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,141 @@
+#!/usr/bin/env python3
+"""뉴스 중복 확인 벤치마크 스크립트
+
+기사마다 url_hash → id → url 순으로 조회하던 기존 방식과
+Bloom 필터 + IN 쿼리 + 벌크 upsert 방식을 같은 데이터로 비교합니다.
+수집 주기마다 새 기사와 이미 저장된 기사가 섞여 들어오는 상황을 재현합니다.
+
+사용법:
+    python scripts/benchmark_news_dedup.py [--database-url URL] [--existing 100000]
+                                           [--batch 50] [--rounds 20] [--new-ratio 0.2]
+
+기본값은 메모리 SQLite이며, MySQL로 측정하려면 빈 데이터베이스 URL을 지정합니다.
+"""
+
+import argparse
+import hashlib
+import sys
+import time
+from datetime import datetime
+from pathlib import Path
+
+# 프로젝트 루트를 sys.path에 추가
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from sqlalchemy import create_engine, event, insert
+from sqlalchemy.orm import sessionmaker
+
+from app.db_base import Base
+from app.models import Stock, News
+from app.collectors.news_collector import NewsCollector
+from app.utils.bloom_filter import BloomFilter
+
+TICKER = "BENCH1"
+
+
+def make_news(article_id: int) -> dict:
+    """벤치마크용 뉴스 행 생성"""
+    url = f"https://finance.naver.com/item/news_read.naver?article_id={article_id}"
+    return {
+        'id': hashlib.md5(f"{TICKER}:{url}".encode('utf-8')).hexdigest(),
+        'ticker': TICKER,
+        'title': f"벤치마크 뉴스 {article_id}",
+        'url': url,
+        'url_hash': hashlib.sha256(url.encode('utf-8')).hexdigest(),
+        'source': '벤치마크',
+        'published_at': datetime(2025, 11, 14, 10, 0, 0),
+        'collected_at': datetime.now(),
+    }
+
+
+def save_legacy(db, news_data: list) -> None:
+    """기존 방식: 기사마다 url_hash, id, url 순으로 조회 후 갱신 또는 추가"""
+    for data in news_data:
+        existing = db.query(News).filter(News.url_hash == data['url_hash']).first()
+        if not existing:
+            existing = db.query(News).filter(News.id == data['id']).first()
+        if not existing:
+            existing = db.query(News).filter(News.url == data['url']).first()
+        if existing:
+            existing.title = data['title']
+            existing.source = data['source']
+            existing.published_at = data['published_at']
+            existing.collected_at = data['collected_at']
+        else:
+            db.add(News(**data))
+    db.commit()
+
+
+def run(database_url: str, method: str, existing: int, batch: int, rounds: int, new_ratio: float) -> tuple:
+    """저장된 뉴스 existing개 위에서 batch개씩 rounds번 저장하여 (소요 시간, 쿼리 수) 반환"""
+    engine = create_engine(database_url)
+    Base.metadata.drop_all(bind=engine)
+    Base.metadata.create_all(bind=engine)
+    db = sessionmaker(bind=engine)()
+
+    queries = [0]
+
+    def count_query(conn, cursor, statement, parameters, context, executemany):
+        queries[0] += 1
+
+    try:
+        db.add(Stock(ticker=TICKER, name="벤치마크", type="STOCK"))
+        db.commit()
+        if existing:
+            db.execute(insert(News), [make_news(i) for i in range(existing)])
+            db.commit()
+
+        collector = NewsCollector(bloom_filter=BloomFilter(capacity=max(existing * 2, 1000)))
+        # 필터 초기화는 프로세스마다 한 번이므로 측정에서 제외
+        collector._find_existing_hashes(db, [])
+
+        new_per_round = int(batch * new_ratio)
+        next_id = existing
+        batches = []
+        for _ in range(rounds):
+            # 최근 기사(이미 저장됨) + 새 기사
+            seen_ids = range(max(0, next_id - (batch - new_per_round)), next_id)
+            new_ids = range(next_id, next_id + new_per_round)
+            next_id += new_per_round
+            batches.append([make_news(i) for i in (*seen_ids, *new_ids)])
+
+        event.listen(engine, "before_cursor_execute", count_query)
+        start = time.perf_counter()
+        for news_data in batches:
+            if method == 'legacy':
+                save_legacy(db, news_data)
+            else:
+                collector.save_news_data(db, [dict(data, timestamp=data['collected_at']) for data in news_data])
+        elapsed = time.perf_counter() - start
+        event.remove(engine, "before_cursor_execute", count_query)
+        return elapsed, queries[0]
+    finally:
+        db.close()
+        Base.metadata.drop_all(bind=engine)
+        engine.dispose()
+
+
+def main():
+    """메인 함수"""
+    parser = argparse.ArgumentParser(description="뉴스 중복 확인 벤치마크")
+    parser.add_argument("--database-url", default="sqlite://", help="벤치마크용 데이터베이스 URL (테이블을 삭제/생성함)")
+    parser.add_argument("--existing", type=int, default=100000, help="미리 저장해 둘 뉴스 수")
+    parser.add_argument("--batch", type=int, default=50, help="수집 주기당 뉴스 수")
+    parser.add_argument("--rounds", type=int, default=20, help="수집 주기 횟수")
+    parser.add_argument("--new-ratio", type=float, default=0.2, help="주기당 새 뉴스 비율")
+    args = parser.parse_args()
+
+    print(f"데이터베이스: {args.database_url}")
+    print(f"저장된 뉴스 {args.existing}개, 주기당 {args.batch}개 (새 뉴스 {args.new_ratio:.0%}) x {args.rounds}회")
+    print(f"{'method':<12} {'time(s)':>10} {'queries':>10} {'queries/tick':>13}")
+
+    results = {}
+    for method in ('legacy', 'bloom_batch'):
+        elapsed, queries = run(args.database_url, method, args.existing, args.batch, args.rounds, args.new_ratio)
+        results[method] = elapsed
+        print(f"{method:<12} {elapsed:>10.3f} {queries:>10} {queries / args.rounds:>13.1f}")
+    print(f"{'speedup':<12} {results['legacy'] / results['bloom_batch']:>10.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,61 @@
+#!/usr/bin/env python3
+"""HTML 파서 백엔드 벤치마크 스크립트
+
+tests/fixtures의 저장된 페이지를 백엔드별로 반복 파싱하여
+초당 처리 페이지 수를 출력합니다.
+
+사용법:
+    python scripts/benchmark_parsers.py [반복 횟수]
+"""
+
+import sys
+import time
+from pathlib import Path
+
+# 프로젝트 루트를 sys.path에 추가
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from app.collectors.finance_collector import FinanceCollector
+from app.collectors.news_collector import NewsCollector
+from app.collectors.parsers import PARSER_BS4, PARSER_LXML, get_parser
+
+FIXTURES_DIR = Path(__file__).resolve().parent.parent / "tests" / "fixtures"
+
+
+def benchmark(parse, html: str, iterations: int) -> float:
+    """페이지를 반복 파싱하여 초당 처리 페이지 수 반환"""
+    start = time.perf_counter()
+    for _ in range(iterations):
+        parse(html, "487240")
+    elapsed = time.perf_counter() - start
+    return iterations / elapsed
+
+
+def main():
+    """메인 함수"""
+    iterations = int(sys.argv[1]) if len(sys.argv) > 1 else 500
+
+    pages = {
+        'sise_day': (FIXTURES_DIR / "sise_day.html").read_text(encoding="utf-8"),
+        'frgn': (FIXTURES_DIR / "frgn.html").read_text(encoding="utf-8"),
+        'news': (FIXTURES_DIR / "news.html").read_text(encoding="utf-8"),
+    }
+
+    print(f"페이지당 {iterations}회 파싱 (pages/s)")
+    print(f"{'backend':<8} {'sise_day':>10} {'frgn':>10} {'news':>10}")
+
+    for name in (PARSER_BS4, PARSER_LXML):
+        parser = get_parser(name)
+        finance_collector = FinanceCollector(parser=parser)
+        news_collector = NewsCollector(parser=parser)
+
+        results = [
+            benchmark(finance_collector._parse_price_page, pages['sise_day'], iterations),
+            benchmark(finance_collector._parse_trading_flow_page, pages['frgn'], iterations),
+            benchmark(news_collector._parse_news_page, pages['news'], iterations),
+        ]
+        print(f"{parser.name:<8} " + " ".join(f"{rate:>10.0f}" for rate in results))
+
+
+if __name__ == "__main__":
+    main()
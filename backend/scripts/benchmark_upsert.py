@@ -0,0 +1,118 @@
+#!/usr/bin/env python3
+"""가격 데이터 저장 벤치마크 스크립트
+
+행마다 SELECT 후 갱신/추가하는 기존 방식과 벌크 upsert를
+같은 데이터로 비교합니다 (첫 실행은 삽입, 두 번째 실행은 갱신).
+
+사용법:
+    python scripts/benchmark_upsert.py [--database-url URL] [--sizes 10 1000 100000]
+
+기본값은 메모리 SQLite이며, MySQL로 측정하려면 빈 데이터베이스 URL을 지정합니다.
+"""
+
+import argparse
+import sys
+import time
+from datetime import date, datetime, timedelta
+from pathlib import Path
+
+# 프로젝트 루트를 sys.path에 추가
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from sqlalchemy import and_, create_engine
+from sqlalchemy.orm import sessionmaker
+
+from app.db_base import Base
+from app.models import Stock, Price
+from app.utils.upsert import bulk_upsert
+
+TICKER_COUNT = 100
+
+
+def make_rows(size: int, price: float) -> list:
+    """종목 100개에 나눠진 size개의 가격 행 생성"""
+    per_ticker = -(-size // TICKER_COUNT)
+    start = date(2000, 1, 1)
+    rows = []
+    for i in range(size):
+        rows.append({
+            'ticker': f"B{i // per_ticker:05d}",
+            'date': start + timedelta(days=i % per_ticker),
+            'timestamp': datetime.now(),
+            'current_price': price,
+            'change_rate': 0.5,
+            'change_amount': 100.0,
+            'open_price': price,
+            'high_price': price,
+            'low_price': price,
+            'volume': 1000,
+            'previous_close': price - 100,
+        })
+    return rows
+
+
+def save_row_by_row(db, rows: list) -> None:
+    """기존 방식: 행마다 SELECT 후 갱신 또는 추가"""
+    for data in rows:
+        existing = db.query(Price).filter(
+            and_(Price.ticker == data['ticker'], Price.date == data['date'])
+        ).first()
+        if existing:
+            for key, value in data.items():
+                setattr(existing, key, value)
+        else:
+            db.add(Price(**data))
+    db.commit()
+
+
+def save_bulk_upsert(db, rows: list) -> None:
+    """벌크 upsert"""
+    bulk_upsert(db, Price, rows, conflict_columns=('ticker', 'date'))
+    db.commit()
+
+
+def run(database_url: str, method, size: int) -> tuple:
+    """빈 테이블에 삽입 후 같은 키로 갱신하여 각각의 소요 시간 반환"""
+    engine = create_engine(database_url)
+    Base.metadata.drop_all(bind=engine)
+    Base.metadata.create_all(bind=engine)
+    db = sessionmaker(bind=engine)()
+    try:
+        db.add_all(Stock(ticker=f"B{i:05d}", name=f"벤치마크 {i}", type="STOCK") for i in range(TICKER_COUNT))
+        db.commit()
+
+        timings = []
+        for price in (10000.0, 10100.0):
+            rows = make_rows(size, price)
+            start = time.perf_counter()
+            method(db, rows)
+            timings.append(time.perf_counter() - start)
+        return tuple(timings)
+    finally:
+        db.close()
+        Base.metadata.drop_all(bind=engine)
+        engine.dispose()
+
+
+def main():
+    """메인 함수"""
+    parser = argparse.ArgumentParser(description="가격 데이터 저장 벤치마크")
+    parser.add_argument("--database-url", default="sqlite://", help="벤치마크용 데이터베이스 URL (테이블을 삭제/생성함)")
+    parser.add_argument("--sizes", nargs="+", type=int, default=[10, 1000, 100000])
+    args = parser.parse_args()
+
+    print(f"데이터베이스: {args.database_url}")
+    print(f"{'rows':>8} {'method':<12} {'insert(s)':>10} {'update(s)':>10} {'rows/s':>10}")
+
+    for size in args.sizes:
+        results = {}
+        for name, method in (('row_by_row', save_row_by_row), ('bulk_upsert', save_bulk_upsert)):
+            insert_time, update_time = run(args.database_url, method, size)
+            results[name] = insert_time + update_time
+            rate = size * 2 / results[name]
+            print(f"{size:>8} {name:<12} {insert_time:>10.3f} {update_time:>10.3f} {rate:>10.0f}")
+        print(f"{'':>8} {'speedup':<12} {results['row_by_row'] / results['bulk_upsert']:>10.1f}x")
+
+
+if __name__ == "__main__":
+    main()
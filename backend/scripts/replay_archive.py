@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+"""원본 페이지 아카이브 재처리 스크립트
+
+아카이브에 저장된 페이지를 네트워크 요청 없이 다시 파싱하여
+가격, 매매동향, 뉴스 데이터를 재구성합니다.
+
+사용법:
+    python scripts/replay_archive.py [--archive-dir DIR] [--data prices trading news]
+                                     [--ticker 487240 ...] [--start 2025-01-01] [--end 2025-12-31]
+"""
+
+import argparse
+import sys
+import time
+from datetime import datetime
+from pathlib import Path
+
+# 프로젝트 루트를 sys.path에 추가
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from app.config import settings
+from app.database import SessionLocal
+from app.collectors.finance_collector import (
+    FinanceCollector,
+    PAGE_ENDPOINT_FRGN,
+    PAGE_ENDPOINT_SISE_DAY,
+    PAGE_ENDPOINT_CHART,
+)
+from app.collectors.news_collector import NewsCollector, PAGE_ENDPOINT_NEWS
+from app.utils.page_archive import PageArchive
+
+DATA_ENDPOINTS = {
+    'prices': (PAGE_ENDPOINT_SISE_DAY, PAGE_ENDPOINT_CHART),
+    'trading': (PAGE_ENDPOINT_FRGN,),
+    'news': (PAGE_ENDPOINT_NEWS,),
+}
+
+
+def main():
+    """메인 함수"""
+    parser = argparse.ArgumentParser(description="원본 페이지 아카이브 재처리")
+    parser.add_argument("--archive-dir", default=settings.PAGE_ARCHIVE_DIR, help="아카이브 디렉토리")
+    parser.add_argument("--data", nargs="+", choices=sorted(DATA_ENDPOINTS), default=sorted(DATA_ENDPOINTS))
+    parser.add_argument("--ticker", nargs="+", help="종목 코드 (기본: 아카이브의 전체 종목)")
+    parser.add_argument("--start", type=datetime.fromisoformat, help="수집 시각 하한 (ISO 형식)")
+    parser.add_argument("--end", type=datetime.fromisoformat, help="수집 시각 상한 (ISO 형식)")
+    args = parser.parse_args()
+
+    if not Path(args.archive_dir).exists():
+        print(f"❌ 아카이브 디렉토리가 없습니다: {args.archive_dir}")
+        sys.exit(1)
+
+    archive = PageArchive(args.archive_dir)
+    finance_collector = FinanceCollector(archive=archive)
+    news_collector = NewsCollector(archive=archive)
+    replay = {
+        'prices': finance_collector.replay_prices,
+        'trading': finance_collector.replay_trading_flow,
+        'news': news_collector.replay_news,
+    }
+
+    print(f"아카이브: {args.archive_dir} {archive.get_stats()}")
+
+    db = SessionLocal()
+    start_time = time.perf_counter()
+    try:
+        for data in args.data:
+            tickers = args.ticker or sorted({
+                ticker for endpoint in DATA_ENDPOINTS[data] for ticker in archive.tickers(endpoint)
+            })
+            total = 0
+            for ticker in tickers:
+                total += replay[data](db, archive, ticker, start=args.start, end=args.end)
+            print(f"✅ {data}: {len(tickers)}개 종목, {total}개 레코드 저장")
+    except Exception as e:
+        print(f"❌ 오류 발생: {e}")
+        sys.exit(1)
+    finally:
+        db.close()
+        archive.close()
+
+    print(f"✅ 재처리 완료 ({time.perf_counter() - start_time:.1f}초)")
+
+
+if __name__ == "__main__":
+    main()
@@ -18,6 +18,7 @@ _test_db_file.close()
 
 os.environ["DATABASE_URL"] = f"sqlite:///{_test_db_path}"
 os.environ["REDIS_URL"] = "redis://localhost:6379/1"  # 테스트용 DB 1 사용
+os.environ["MARKET_CALENDAR_ENABLED"] = "false"  # 스케줄러 테스트가 실행 시각(장 시간)에 영향받지 않도록 함
 
 # 테스트용 데이터베이스 엔진 생성
 _test_engine = create_engine(
@@ -38,6 +39,16 @@ TestSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=_test_en
 # Base는 나중에 import (순환 import 방지)
 
 
+@pytest.fixture(autouse=True)
+def reset_circuit_breakers():
+    """테스트마다 엔드포인트 Circuit Breaker 초기화 (다른 테스트의 실패로 차단되지 않도록)"""
+    from app.utils.circuit_breaker import reset_circuit_breakers as reset
+
+    reset()
+    yield
+    reset()
+
+
 @pytest.fixture(scope="function")
 def db_session():
     """데이터베이스 세션 픽스처"""
@@ -0,0 +1,220 @@
+"""
+조회 빈도(access heat) 추적 및 수집 우선순위 테스트
+"""
+
+import pytest
+from unittest.mock import Mock, patch
+
+from app.models.stock import Stock
+from app.scheduler.data_scheduler import DataScheduler
+from app.scheduler.priority import TickerPrioritizer
+from app.config import settings
+from app.utils.access_heat import (
+    HEAT_BACKEND_MEMORY,
+    AccessHeatTracker,
+    RedisAccessHeatTracker,
+    get_access_heat_tracker,
+)
+
+
+class FakeClock:
+    def __init__(self, now: float = 1_700_000_000.0):
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class FakeRedis:
+    """ZINCRBY/ZSCORE/ZREVRANGE/EXPIRE만 지원하는 테스트용 Redis"""
+
+    def __init__(self):
+        self.zsets = {}
+
+    def pipeline(self, transaction=False):
+        return FakePipeline(self)
+
+    def zrevrange(self, key, start, end):
+        members = sorted(self.zsets.get(key, {}).items(), key=lambda item: item[1], reverse=True)
+        return [member for member, _ in members[start:end + 1]]
+
+
+class FakePipeline:
+    def __init__(self, redis):
+        self.redis = redis
+        self.results = []
+
+    def zincrby(self, key, amount, member):
+        zset = self.redis.zsets.setdefault(key, {})
+        zset[member] = zset.get(member, 0.0) + amount
+        self.results.append(zset[member])
+
+    def zscore(self, key, member):
+        self.results.append(self.redis.zsets.get(key, {}).get(member))
+
+    def expire(self, key, seconds):
+        self.results.append(True)
+
+    def execute(self):
+        return self.results
+
+
+class TestAccessHeatTracker:
+    """AccessHeatTracker 테스트"""
+
+    def test_heat_decays_by_half_life(self):
+        """반감기마다 heat가 절반으로 줄어드는지 테스트"""
+        clock = FakeClock()
+        tracker = AccessHeatTracker(half_life=600, clock=clock)
+        for _ in range(4):
+            tracker.record("HEAT01")
+
+        assert tracker.heat("HEAT01") == pytest.approx(4.0)
+        clock.now += 600
+        assert tracker.heat("HEAT01") == pytest.approx(2.0)
+        tracker.record("HEAT01")
+        assert tracker.heat("HEAT01") == pytest.approx(3.0)
+        assert tracker.heats(["HEAT01", "COLD01"])["COLD01"] == 0.0
+
+    def test_top(self):
+        """heat가 높은 순서 테스트"""
+        tracker = AccessHeatTracker(clock=FakeClock())
+        tracker.record("A")
+        tracker.record("B", weight=3)
+
+        assert [ticker for ticker, _ in tracker.top(2)] == ["B", "A"]
+
+    def test_redis_forward_decay(self):
+        """Redis 추적기도 같은 감소 결과를 내고 기준 시각 구간을 넘어도 유지되는지 테스트"""
+        clock = FakeClock(now=86400 * 20000 - 300)  # 구간 종료 5분 전
+        tracker = RedisAccessHeatTracker(half_life=600, client=FakeRedis(), clock=clock)
+        tracker.record("HEAT01", weight=4)
+
+        clock.now += 600  # 다음 구간으로 넘어감
+        tracker.record("HEAT01")
+
+        assert tracker.heat("HEAT01") == pytest.approx(3.0)
+        assert tracker.top(1)[0][0] == "HEAT01"
+
+    def test_memory_backend_with_worker_warns(self, caplog):
+        """수집 워커를 쓰는데 메모리 추적기를 설정하면 경고 테스트 (워커가 API 조회 빈도를 볼 수 없음)"""
+        with patch('app.utils.access_heat._access_heat_tracker', None), \
+                patch.object(settings, 'ACCESS_HEAT_BACKEND', HEAT_BACKEND_MEMORY), \
+                patch.object(settings, 'COLLECTION_WORKER_ENABLED', True):
+            tracker = get_access_heat_tracker()
+
+        assert tracker.backend == HEAT_BACKEND_MEMORY
+        assert "ACCESS_HEAT_BACKEND=redis" in caplog.text
+
+    def test_redis_failure_returns_none(self):
+        """Redis 장애 시 heats()가 None을 반환 테스트"""
+        tracker = RedisAccessHeatTracker(client=object())
+
+        tracker.record("HEAT01")  # 예외 없이 무시
+        assert tracker.heats(["HEAT01"]) is None
+
+
+class TestTickerPrioritizer:
+    """TickerPrioritizer 테스트"""
+
+    TICKERS = ["HOT", "WARM", "COLD"]
+
+    @pytest.fixture
+    def tracker(self):
+        tracker = AccessHeatTracker(clock=FakeClock())
+        tracker.record("HOT", weight=5)
+        tracker.record("WARM", weight=0.5)
+        return tracker
+
+    def test_backoff(self, tracker):
+        """heat에 따른 수집 간격 테스트"""
+        prioritizer = TickerPrioritizer(tracker, hot_heat=1.0, max_backoff=8)
+
+        assert prioritizer.backoff(5.0) == 1
+        assert prioritizer.backoff(0.5) == 2
+        assert prioritizer.backoff(0.2) == 8
+        assert prioritizer.backoff(0.0) == 8
+
+    def test_hot_every_tick_cold_backs_off(self, tracker):
+        """자주 조회되는 종목은 매 tick, 나머지는 점점 드물게 수집 테스트"""
+        prioritizer = TickerPrioritizer(tracker, hot_heat=1.0, max_backoff=4)
+
+        selections = [prioritizer.select(self.TICKERS) for _ in range(8)]
+
+        assert selections[0] == ["HOT", "WARM", "COLD"]  # 처음 보는 종목은 바로 수집
+        assert sum("HOT" in selected for selected in selections) == 8
+        assert sum("WARM" in selected for selected in selections) == 4
+        assert sum("COLD" in selected for selected in selections) == 2
+
+    def test_budget_defers_cold_tickers(self, tracker):
+        """tick당 예산을 넘는 종목은 다음 tick으로 밀림 테스트"""
+        prioritizer = TickerPrioritizer(tracker, hot_heat=1.0, max_backoff=4, budget=2)
+
+        assert prioritizer.select(self.TICKERS) == ["HOT", "WARM"]
+        assert prioritizer.get_stats()['last_deferred'] == 1
+        assert prioritizer.select(self.TICKERS) == ["HOT", "COLD"]
+
+    def test_removed_tickers_dropped(self, tracker):
+        """종목 목록에서 빠진 종목은 큐에서 제거 테스트"""
+        prioritizer = TickerPrioritizer(tracker)
+        prioritizer.select(self.TICKERS)
+
+        assert prioritizer.select(["HOT"]) == ["HOT"]
+        assert prioritizer.get_stats()['tracked'] == 1
+
+    def test_heat_unavailable_selects_all(self):
+        """heat를 조회하지 못하면 모든 종목 수집 테스트"""
+        tracker = Mock(heats=Mock(return_value=None))
+
+        assert TickerPrioritizer(tracker).select(self.TICKERS) == self.TICKERS
+
+
+class TestSchedulerPriority:
+    """스케줄러 조회 빈도 기반 가격 수집 테스트"""
+
+    @staticmethod
+    def _collect(ticker, db, data_types=None):
+        return {'ticker': ticker, 'prices_count': 1, 'trading_count': 0, 'news_count': 0,
+                'unchanged_rows': 0, 'errors': []}
+
+    @patch('app.scheduler.data_scheduler.SessionLocal')
+    def test_price_job_uses_priority(self, mock_session_local):
+        """가격 job은 조회 빈도로 고른 종목만, 다른 유형은 모든 종목 수집 테스트"""
+        mock_session_local.side_effect = lambda: Mock()
+        tracker = AccessHeatTracker(clock=FakeClock())
+        tracker.record("HOT", weight=5)
+        scheduler = DataScheduler()
+        scheduler.ticker_prioritizer = TickerPrioritizer(tracker, max_backoff=4)
+
+        with patch.object(scheduler, '_get_all_tickers', return_value=["HOT", "COLD"]), \
+                patch.object(scheduler, '_collect_data_for_ticker', side_effect=self._collect) as collect:
+            scheduler._collect_all_data(['prices'])  # 처음에는 모두
+            collect.reset_mock()
+            scheduler._collect_all_data(['prices'])
+            assert [call.args[0] for call in collect.call_args_list] == ["HOT"]
+
+            collect.reset_mock()
+            scheduler._collect_all_data(['news'])
+            assert {call.args[0] for call in collect.call_args_list} == {"HOT", "COLD"}
+
+        assert scheduler.get_status()['priority']['tracked'] == 2
+
+
+class TestAccessRecording:
+    """API 조회 빈도 기록 테스트"""
+
+    def test_stock_and_price_endpoints_record_access(self, client, db_session):
+        """종목/가격 조회 시 조회 빈도 기록 테스트"""
+        db_session.add(Stock(ticker="HEATAPI", name="조회 빈도", type="STOCK"))
+        db_session.commit()
+        tracker = AccessHeatTracker()
+
+        with patch('app.utils.access_heat._access_heat_tracker', tracker), \
+                patch('app.api.stocks.get_cache', return_value=None), \
+                patch('app.api.prices.get_cache', return_value=None):
+            assert client.get("/api/stocks/HEATAPI").status_code == 200
+            assert client.get("/api/prices/HEATAPI").status_code == 200
+            assert client.get("/api/stocks/MISSING").status_code == 404
+
+        assert tracker.heat("HEATAPI") == pytest.approx(2.0, rel=0.01)
+        assert tracker.heat("MISSING") == 0.0
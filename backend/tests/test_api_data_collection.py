@@ -3,6 +3,8 @@
 """
 
 import pytest
+import threading
+import time
 from unittest.mock import patch, Mock
 from datetime import datetime, date
 from decimal import Decimal
@@ -11,6 +13,20 @@ from app.models.stock import Stock
 from app.models.price import Price
 from app.models.trading_trend import TradingTrend
 from app.models.news import News
+from app.scheduler.collection_jobs import LocalCollectionJobQueue
+
+
+def _wait_for_job(client, response, timeout: float = 10.0) -> dict:
+    """202로 등록된 수집 작업이 끝날 때까지 작업 상태 API를 조회하여 마지막 응답 반환"""
+    job_id = response.json()["data"]["id"]
+    deadline = time.monotonic() + timeout
+    while True:
+        status_response = client.get(f"/api/data/jobs/{job_id}")
+        assert status_response.status_code == 200
+        data = status_response.json()
+        if data["data"]["status"] in ("succeeded", "failed") or time.monotonic() > deadline:
+            return data
+        time.sleep(0.02)
 
 
 class TestCollectPricesAPI:
@@ -40,7 +56,7 @@ class TestCollectPricesAPI:
         # FastAPI는 자동으로 검증하므로 422 또는 400
         assert response.status_code in [400, 422]
     
-    @patch('app.collectors.finance_collector.requests.get')
+    @patch('app.utils.http_client.HttpClient.get')
     def test_collect_prices_success(self, mock_get, client, db_session):
         """가격 데이터 수집 성공 테스트"""
         # 종목 생성
@@ -68,20 +84,20 @@ class TestCollectPricesAPI:
         
         response = client.post("/api/data/collect/prices/COLLECT001?days=2")
         
-        assert response.status_code == 200
-        data = response.json()
+        assert response.status_code == 202
+        data = _wait_for_job(client, response)
         
         assert data["success"] is True
         assert data["data"]["ticker"] == "COLLECT001"
-        assert data["data"]["saved_count"] == 2
-        assert data["data"]["days"] == 2
-        assert "Price data collected successfully" in data["message"]
+        assert data["data"]["result"]["saved_count"] == 2
+        assert data["data"]["params"]["days"] == 2
+        assert data["data"]["status"] == "succeeded"
         
         # 데이터베이스에서 확인
         prices = db_session.query(Price).filter(Price.ticker == "COLLECT001").all()
         assert len(prices) == 2
     
-    @patch('app.collectors.finance_collector.requests.get')
+    @patch('app.utils.http_client.HttpClient.get')
     def test_collect_prices_no_data(self, mock_get, client, db_session):
         """수집할 데이터가 없는 경우 테스트"""
         # 종목 생성
@@ -97,13 +113,13 @@ class TestCollectPricesAPI:
         
         response = client.post("/api/data/collect/prices/NODATA001?days=10")
         
-        assert response.status_code == 200
-        data = response.json()
+        assert response.status_code == 202
+        data = _wait_for_job(client, response)
         
         assert data["success"] is True
-        assert data["data"]["saved_count"] == 0
+        assert data["data"]["result"]["saved_count"] == 0
     
-    @patch('app.collectors.finance_collector.requests.get')
+    @patch('app.utils.http_client.HttpClient.get')
     def test_collect_prices_network_error(self, mock_get, client, db_session):
         """네트워크 오류 테스트"""
         # 종목 생성
@@ -117,12 +133,12 @@ class TestCollectPricesAPI:
         
         response = client.post("/api/data/collect/prices/ERROR001?days=10")
         
-        # 네트워크 오류 시 재시도 후에도 실패하면 빈 데이터를 반환하므로 200 OK
-        # (finance_collector가 빈 리스트를 반환하고, API가 이를 성공으로 처리)
-        assert response.status_code == 200
-        data = response.json()
+        # 네트워크 오류 시 재시도 후에도 실패하면 빈 데이터를 반환하므로 작업은 성공
+        # (finance_collector가 빈 리스트를 반환하고, 작업이 이를 성공으로 처리)
+        assert response.status_code == 202
+        data = _wait_for_job(client, response)
         assert data["success"] is True
-        assert data["data"]["saved_count"] == 0
+        assert data["data"]["result"]["saved_count"] == 0
 
 
 class TestCollectTradingFlowAPI:
@@ -175,7 +191,7 @@ class TestCollectTradingFlowAPI:
         assert data["success"] is False
         assert "INVALID_DATE_RANGE" in data.get("error_code", "")
     
-    @patch('app.collectors.finance_collector.requests.get')
+    @patch('app.utils.http_client.HttpClient.get')
     def test_collect_trading_flow_success(self, mock_get, client, db_session):
         """매매 동향 데이터 수집 성공 테스트"""
         # 종목 생성
@@ -204,14 +220,14 @@ class TestCollectTradingFlowAPI:
         
         response = client.post("/api/data/collect/trading/TRADING001?days=2")
         
-        assert response.status_code == 200
-        data = response.json()
+        assert response.status_code == 202
+        data = _wait_for_job(client, response)
         
         assert data["success"] is True
         assert data["data"]["ticker"] == "TRADING001"
-        assert data["data"]["saved_count"] == 2
-        assert data["data"]["days"] == 2
-        assert "Trading flow data collected successfully" in data["message"]
+        assert data["data"]["result"]["saved_count"] == 2
+        assert data["data"]["params"]["days"] == 2
+        assert data["data"]["status"] == "succeeded"
         
         # 데이터베이스에서 확인
         trading_flows = db_session.query(TradingTrend).filter(
@@ -219,7 +235,7 @@ class TestCollectTradingFlowAPI:
         ).all()
         assert len(trading_flows) == 2
     
-    @patch('app.collectors.finance_collector.requests.get')
+    @patch('app.utils.http_client.HttpClient.get')
     def test_collect_trading_flow_with_date_range(self, mock_get, client, db_session):
         """날짜 범위를 지정한 매매 동향 수집 테스트"""
         # 종목 생성
@@ -249,14 +265,14 @@ class TestCollectTradingFlowAPI:
             "/api/data/collect/trading/DATERANGE001?days=10&start_date=2025-11-01&end_date=2025-11-07"
         )
         
-        assert response.status_code == 200
-        data = response.json()
+        assert response.status_code == 202
+        data = _wait_for_job(client, response)
         
         assert data["success"] is True
-        assert data["data"]["start_date"] == "2025-11-01"
-        assert data["data"]["end_date"] == "2025-11-07"
+        assert data["data"]["params"]["start_date"] == "2025-11-01"
+        assert data["data"]["params"]["end_date"] == "2025-11-07"
     
-    @patch('app.collectors.finance_collector.requests.get')
+    @patch('app.utils.http_client.HttpClient.get')
     def test_collect_trading_flow_no_data(self, mock_get, client, db_session):
         """수집할 데이터가 없는 경우 테스트"""
         # 종목 생성
@@ -272,11 +288,11 @@ class TestCollectTradingFlowAPI:
         
         response = client.post("/api/data/collect/trading/NODATA002?days=10")
         
-        assert response.status_code == 200
-        data = response.json()
+        assert response.status_code == 202
+        data = _wait_for_job(client, response)
         
         assert data["success"] is True
-        assert data["data"]["saved_count"] == 0
+        assert data["data"]["result"]["saved_count"] == 0
 
 
 class TestDataCollectionAPIErrorHandling:
@@ -295,12 +311,12 @@ class TestDataCollectionAPIErrorHandling:
         
         response = client.post("/api/data/collect/prices/ERROR002?days=10")
         
-        assert response.status_code == 500
-        data = response.json()
+        # 작업은 등록되고 실패 결과가 작업 상태에 기록됨
+        assert response.status_code == 202
+        data = _wait_for_job(client, response)
         
-        # HTTPException이 발생하면 FastAPI의 기본 에러 핸들러가 처리
-        # 응답 형식이 다를 수 있음
-        assert "error" in data or "detail" in data
+        assert data["data"]["status"] == "failed"
+        assert data["data"]["error"] == "Internal error"
     
     @patch('app.collectors.finance_collector.FinanceCollector.collect_and_save_trading_flow')
     def test_collect_trading_flow_internal_error(self, mock_collect, client, db_session):
@@ -315,12 +331,12 @@ class TestDataCollectionAPIErrorHandling:
         
         response = client.post("/api/data/collect/trading/ERROR003?days=10")
         
-        assert response.status_code == 500
-        data = response.json()
+        # 작업은 등록되고 실패 결과가 작업 상태에 기록됨
+        assert response.status_code == 202
+        data = _wait_for_job(client, response)
         
-        # HTTPException이 발생하면 FastAPI의 기본 에러 핸들러가 처리
-        # 응답 형식이 다를 수 있음
-        assert "error" in data or "detail" in data
+        assert data["data"]["status"] == "failed"
+        assert data["data"]["error"] == "Internal error"
 
 
 class TestCollectNewsAPI:
@@ -350,7 +366,7 @@ class TestCollectNewsAPI:
         # FastAPI는 자동으로 검증하므로 422 또는 400
         assert response.status_code in [400, 422]
     
-    @patch('app.collectors.news_collector.requests.get')
+    @patch('app.utils.http_client.HttpClient.get')
     def test_collect_news_success(self, mock_get, client, db_session):
         """뉴스 데이터 수집 성공 테스트"""
         # 종목 생성
@@ -385,16 +401,16 @@ class TestCollectNewsAPI:
         
         response = client.post("/api/data/collect/news/NEWS001?max_items=50")
         
-        assert response.status_code == 200
-        data = response.json()
+        assert response.status_code == 202
+        data = _wait_for_job(client, response)
         
         assert data["success"] is True
         assert data["data"]["ticker"] == "NEWS001"
-        assert data["data"]["saved_count"] >= 0  # 수집된 뉴스 개수
-        assert data["data"]["max_items"] == 50
-        assert "News data collected successfully" in data["message"]
+        assert data["data"]["result"]["saved_count"] >= 0  # 수집된 뉴스 개수
+        assert data["data"]["params"]["max_items"] == 50
+        assert data["data"]["status"] == "succeeded"
     
-    @patch('app.collectors.news_collector.requests.get')
+    @patch('app.utils.http_client.HttpClient.get')
     def test_collect_news_no_data(self, mock_get, client, db_session):
         """수집할 뉴스가 없는 경우 테스트"""
         # 종목 생성
@@ -410,11 +426,11 @@ class TestCollectNewsAPI:
         
         response = client.post("/api/data/collect/news/NONEWS001?max_items=50")
         
-        assert response.status_code == 200
-        data = response.json()
+        assert response.status_code == 202
+        data = _wait_for_job(client, response)
         
         assert data["success"] is True
-        assert data["data"]["saved_count"] == 0
+        assert data["data"]["result"]["saved_count"] == 0
     
     @patch('app.collectors.news_collector.NewsCollector.collect_and_save_news')
     def test_collect_news_internal_error(self, mock_collect, client, db_session):
@@ -429,9 +445,53 @@ class TestCollectNewsAPI:
         
         response = client.post("/api/data/collect/news/ERROR004?max_items=50")
         
-        assert response.status_code == 500
-        data = response.json()
+        # 작업은 등록되고 실패 결과가 작업 상태에 기록됨
+        assert response.status_code == 202
+        data = _wait_for_job(client, response)
         
-        # HTTPException이 발생하면 FastAPI의 기본 에러 핸들러가 처리
-        assert "error" in data or "detail" in data
+        assert data["data"]["status"] == "failed"
+        assert data["data"]["error"] == "Internal error"
+
 
+
+class TestCollectionJobsAPI:
+    """수집 작업 상태 조회 및 중복 요청 병합 테스트"""
+    
+    def test_job_not_found(self, client):
+        """없는 작업 ID 조회 테스트"""
+        response = client.get("/api/data/jobs/unknown")
+        
+        assert response.status_code == 404
+        assert "NOT_FOUND" in response.json().get("error_code", "")
+    
+    def test_identical_requests_coalesced(self, client, db_session):
+        """같은 요청은 진행 중인 작업 하나로 합쳐지고, 파라미터가 다르면 새 작업 테스트"""
+        stock = Stock(ticker="DEDUP001", name="중복 테스트", type="STOCK")
+        db_session.add(stock)
+        db_session.commit()
+        
+        release = threading.Event()
+        runner = Mock(side_effect=lambda *args: release.wait(5) and {'saved_count': 1})
+        queue = LocalCollectionJobQueue(max_workers=2, runner=runner)
+        
+        with patch('app.api.data_collection.get_collection_job_queue', return_value=queue):
+            first = client.post("/api/data/collect/prices/DEDUP001?days=5")
+            second = client.post("/api/data/collect/prices/DEDUP001?days=5")
+            other = client.post("/api/data/collect/prices/DEDUP001?days=6")
+            
+            assert second.status_code == 202
+            assert second.json()["data"]["id"] == first.json()["data"]["id"]
+            assert second.json()["data"]["coalesced"] is True
+            assert other.json()["data"]["id"] != first.json()["data"]["id"]
+            
+            release.set()
+            assert _wait_for_job(client, first)["data"]["result"] == {'saved_count': 1}
+            _wait_for_job(client, other)
+            
+            # 끝난 뒤 같은 요청은 새 작업
+            third = client.post("/api/data/collect/prices/DEDUP001?days=5")
+            assert third.json()["data"]["coalesced"] is False
+            _wait_for_job(client, third)
+        
+        queue.close()
+        assert runner.call_count == 3
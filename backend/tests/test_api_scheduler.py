@@ -27,6 +27,8 @@ class TestSchedulerStatusAPI:
         assert "next_run_time" in data["data"] or data["data"]["next_run_time"] is None
         assert "last_run_time" in data["data"] or data["data"]["last_run_time"] is None
         assert "last_run_status" in data["data"] or data["data"]["last_run_status"] is None
+        assert set(data["data"]["jobs"]) == {"prices", "trading", "news"}
+        assert "last_duration" in data["data"]["jobs"]["prices"]
 
 
 class TestSchedulerStartAPI:
@@ -63,6 +65,8 @@ class TestSchedulerStartAPI:
         assert data["success"] is True
         assert data["data"]["is_running"] is True
         assert data["data"]["interval_seconds"] == 60
+        assert data["data"]["jobs"]["prices"]["interval_seconds"] == 60
+        assert data["data"]["jobs"]["prices"]["next_run_time"] is not None
         assert "Scheduler started successfully" in data["message"]
         
         # 정리
@@ -0,0 +1,338 @@
+"""
+asyncio 수집 엔진 테스트
+"""
+
+import asyncio
+import time
+import pytest
+import httpx
+import requests
+from datetime import date
+from unittest.mock import patch
+from urllib.parse import parse_qs
+
+from app.collectors.async_engine import AsyncCollectionEngine
+from app.collectors.finance_collector import PAGE_ENDPOINT_FRGN, PAGE_ENDPOINT_SISE_DAY, FinanceCollector
+from app.collectors.news_collector import NewsCollector
+from app.config import settings
+from app.scheduler.data_scheduler import DataScheduler
+from app.utils.async_http_client import AsyncHttpClient
+from app.utils.circuit_breaker import get_circuit_breaker
+from app.utils.page_tracker import PageChangeTracker
+from app.utils.rate_limiter import AsyncRateLimiter, RateLimiter
+from app.utils.retry import RetryBudget
+from app.models.stock import Stock
+from app.models.price import Price
+
+
+def _price_page(page: int) -> str:
+    """sise_day 테스트 페이지 (페이지당 10행)"""
+    rows = ""
+    for i in range(10):
+        day = 28 - (page - 1) * 10 - i
+        rows += (
+            f"<tr><td>2025.10.{day:02d}</td><td>25,050</td><td>상승205</td>"
+            f"<td>25,000</td><td>25,100</td><td>24,900</td><td>1,000</td></tr>"
+        )
+    return f'<html><body><table class="type2">{rows}</table></body></html>'
+
+
+def _trading_page(page: int) -> str:
+    """frgn 테스트 페이지 (페이지당 10행)"""
+    rows = ""
+    for i in range(10):
+        day = 28 - (page - 1) * 10 - i
+        rows += (
+            f"<tr><td>2025.10.{day:02d}</td><td>25,050</td><td>상승205</td><td>0.82</td>"
+            f"<td>1,000</td><td>1,234</td><td>-567</td></tr>"
+        )
+    return (
+        '<html><body><table class="type2"><tr><th>증권사별</th></tr></table>'
+        f'<table class="type2">{rows}</table></body></html>'
+    )
+
+
+def _news_page(page: int) -> str:
+    """뉴스 테스트 페이지 (페이지당 20개)"""
+    items = "".join(
+        f'<tr><td><a href="/item/news_read.naver?article_id={page * 100 + i}">뉴스 {page * 100 + i}</a></td></tr>'
+        for i in range(20)
+    )
+    return f"<html><body><div class='news_area'>{items}</div></body></html>"
+
+
+def _make_transport(
+    delay: float = 0.0, in_flight: list = None, fail_pages=(), requests_seen: list = None, fail_codes=()
+):
+    """Naver Finance 페이지를 흉내내는 MockTransport (ETag가 같은 조건부 GET에는 304, fail_codes 종목은 503)"""
+    state = {'current': 0}
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        state['current'] += 1
+        if in_flight is not None:
+            in_flight.append(state['current'])
+        if requests_seen is not None:
+            requests_seen.append(request)
+        try:
+            if delay:
+                await asyncio.sleep(delay)
+            params = parse_qs(request.url.query.decode())
+            page = int(params.get('page', ['1'])[0])
+            if page in fail_pages or params.get('code', [''])[0] in fail_codes:
+                return httpx.Response(503)
+            etag = f'"{request.url.path}-{page}"'
+            if request.headers.get('If-None-Match') == etag:
+                return httpx.Response(304)
+            headers = {'ETag': etag}
+            if 'sise_day' in request.url.path:
+                return httpx.Response(200, text=_price_page(page), headers=headers)
+            if 'frgn' in request.url.path:
+                return httpx.Response(200, text=_trading_page(page), headers=headers)
+            return httpx.Response(200, text=_news_page(page), headers=headers)
+        finally:
+            state['current'] -= 1
+
+    return httpx.MockTransport(handler)
+
+
+def _client(transport, min_interval: float = 0.0, max_concurrent=None) -> AsyncHttpClient:
+    """전역 예산과 분리된 RateLimiter를 쓰는 테스트 클라이언트"""
+    limiter = AsyncRateLimiter(RateLimiter(min_interval=min_interval), max_concurrent=max_concurrent)
+    return AsyncHttpClient(rate_limiter=limiter, transport=transport)
+
+
+class TestAsyncHttpClient:
+    """AsyncHttpClient 테스트"""
+
+    async def test_rate_limit_shared_with_sync_limiter(self):
+        """동기 수집과 같은 RateLimiter 호스트 버킷으로 속도 제한 테스트"""
+        limiter = RateLimiter(min_interval=0.02)
+        client = AsyncHttpClient(rate_limiter=AsyncRateLimiter(limiter), transport=_make_transport())
+
+        start = time.monotonic()
+        async with client:
+            await asyncio.gather(*(
+                client.get(f"https://finance.naver.com/item/news.naver?code=A&page={p}") for p in range(1, 6)
+            ))
+        elapsed = time.monotonic() - start
+
+        # 5개 요청 → 첫 요청 이후 4개의 0.02초 간격
+        assert elapsed >= 0.07
+        assert limiter.get_stats()['hosts']['finance.naver.com']['requests'] == 5
+        assert client.get_stats()['finance.naver.com']['requests'] == 5
+
+    async def test_concurrency_limit(self):
+        """동시 요청 수 제한 테스트"""
+        in_flight = []
+        client = _client(_make_transport(delay=0.02, in_flight=in_flight), max_concurrent=3)
+
+        async with client:
+            await asyncio.gather(*(
+                client.get(f"https://finance.naver.com/item/news.naver?code=A&page={p}") for p in range(1, 11)
+            ))
+
+        assert max(in_flight) == 3
+
+    async def test_error_status_raises_requests_error(self):
+        """4xx/5xx 응답을 requests 예외로 변환 테스트 (재시도/Circuit Breaker 판단용)"""
+        async with _client(_make_transport(fail_pages=(1,))) as client:
+            with pytest.raises(requests.exceptions.HTTPError) as exc_info:
+                await client.get("https://finance.naver.com/item/news.naver?code=A&page=1")
+
+        assert exc_info.value.response.status_code == 503
+        assert client.get_stats()['finance.naver.com']['errors'] == 1
+
+
+class TestAsyncFetch:
+    """수집기 비동기 fetch 메서드 테스트"""
+
+    async def test_fetch_prices_async(self):
+        """가격 데이터 비동기 수집 테스트"""
+        collector = FinanceCollector()
+
+        async with _client(_make_transport()) as client:
+            data = await collector.fetch_naver_finance_prices_async(client, "487240", days=25)
+
+        assert len(data) == 25
+        assert data[0]['date'] == date(2025, 10, 28)
+        assert data[0]['current_price'] == 25050.0
+        # 페이지 순서가 유지되어야 함
+        assert [row['date'] for row in data] == sorted((row['date'] for row in data), reverse=True)
+
+    async def test_fetch_prices_async_partial_on_error(self):
+        """중간 페이지 실패 시 이전 페이지까지만 반환 테스트"""
+        collector = FinanceCollector(retry_budget=RetryBudget(0))
+
+        async with _client(_make_transport(fail_pages=(2,))) as client:
+            data = await collector.fetch_naver_finance_prices_async(client, "487240", days=30)
+
+        assert len(data) == 10
+        assert collector.fetch_errors[PAGE_ENDPOINT_SISE_DAY] == 1
+
+    async def test_failed_page_retried(self, monkeypatch):
+        """실패한 페이지만 동기 수집과 같은 재시도 정책으로 다시 요청 테스트"""
+        monkeypatch.setattr(settings, 'PAGE_RETRY_BASE_DELAY', 0.0)
+        failed = set()
+        transport = _make_transport()
+
+        async def handler(request: httpx.Request) -> httpx.Response:
+            if request.url.params['page'] == '1' and not failed:
+                failed.add(1)
+                return httpx.Response(503)
+            return await transport.handle_async_request(request)
+
+        collector = FinanceCollector()
+        async with _client(httpx.MockTransport(handler)) as client:
+            data = await collector.fetch_naver_finance_prices_async(client, "487240", days=10)
+
+        assert len(data) == 10
+        assert collector.retry_budget.used == 1
+
+    async def test_open_breaker_skips_requests(self):
+        """차단 중인 엔드포인트는 요청하지 않고 건너뜀 테스트"""
+        breaker = get_circuit_breaker(PAGE_ENDPOINT_SISE_DAY)
+        for _ in range(breaker.min_requests):
+            breaker.record_failure()
+        requests_seen = []
+        collector = FinanceCollector()
+
+        async with _client(_make_transport(requests_seen=requests_seen)) as client:
+            data = await collector.fetch_naver_finance_prices_async(client, "487240", days=10)
+
+        assert data == []
+        assert requests_seen == []
+        assert collector.fetch_errors[PAGE_ENDPOINT_SISE_DAY] == 1
+
+    async def test_conditional_get_not_modified(self):
+        """저장한 페이지의 ETag로 조건부 GET, 304이면 파싱 생략 테스트"""
+        tracker = PageChangeTracker(use_redis=False)
+        collector = FinanceCollector(page_tracker=tracker)
+        requests_seen = []
+
+        async with _client(_make_transport(requests_seen=requests_seen)) as client:
+            assert len(await collector.fetch_naver_finance_prices_async(client, "487240", days=10)) == 10
+            collector.finish_pages((PAGE_ENDPOINT_SISE_DAY,), "487240", success=True)
+
+            assert await collector.fetch_naver_finance_prices_async(client, "487240", days=10) == []
+
+        assert requests_seen[-1].headers['If-None-Match'] == '"/item/sise_day.naver-1"'
+        assert tracker.get_stats()[PAGE_ENDPOINT_SISE_DAY]['not_modified'] == 1
+
+    async def test_fetch_trading_flow_async(self):
+        """매매동향 비동기 수집 테스트"""
+        collector = FinanceCollector()
+
+        async with _client(_make_transport()) as client:
+            data = await collector.fetch_naver_trading_flow_async(client, "487240", days=15)
+
+        assert len(data) == 15
+        assert data[0]['institution'] == 1234
+        assert data[0]['individual'] == -(1234 - 567)
+
+    async def test_fetch_news_async(self):
+        """뉴스 비동기 수집 테스트"""
+        collector = NewsCollector()
+
+        async with _client(_make_transport()) as client:
+            data = await collector.fetch_naver_news_async(client, "487240", max_items=30)
+
+        assert len(data) == 30
+        assert len({item['url_hash'] for item in data}) == 30
+
+
+class TestAsyncCollectionEngine:
+    """AsyncCollectionEngine 테스트"""
+
+    async def test_collect_many_tickers_concurrently(self):
+        """여러 종목 동시 수집 테스트"""
+        engine = AsyncCollectionEngine(
+            client_factory=lambda: _client(_make_transport(delay=0.05), max_concurrent=16)
+        )
+        tickers = [f"{i:06d}" for i in range(20)]
+
+        start = time.monotonic()
+        results = await engine.collect(tickers, price_days=10, trading_days=10, news_items=20)
+        elapsed = time.monotonic() - start
+
+        assert set(results) == set(tickers)
+        for ticker in tickers:
+            assert len(results[ticker]['prices']) == 10
+            assert len(results[ticker]['trading']) == 10
+            assert len(results[ticker]['news']) == 20
+            assert results[ticker]['errors'] == []
+        # 60개 요청을 순차로 처리하면 3초 이상 걸림
+        assert elapsed < 1.5
+        assert engine.last_client_stats['finance.naver.com']['requests'] == 60
+
+    async def test_fetch_errors_counted_per_ticker(self):
+        """동시에 수집하는 종목끼리 요청 실패 횟수를 공유하지 않음 테스트"""
+        engine = AsyncCollectionEngine(
+            finance_collector=FinanceCollector(retry_budget=RetryBudget(0)),
+            client_factory=lambda: _client(_make_transport(fail_codes=("BAD001",))),
+        )
+
+        results = await engine.collect(["BAD001", "GOOD01"], data_types=["prices", "trading"])
+
+        assert results["BAD001"]['fetch_errors'] == {PAGE_ENDPOINT_SISE_DAY: 1, PAGE_ENDPOINT_FRGN: 1}
+        assert results["GOOD01"]['fetch_errors'] == {}
+        assert len(results["GOOD01"]['prices']) == 10
+        assert engine.finance_collector.fetch_errors == {}
+
+    async def test_default_client_shares_collector_budget(self):
+        """기본 클라이언트는 수집기의 RateLimiter 예산을 공유 테스트"""
+        limiter = RateLimiter(min_interval=0.5)
+        engine = AsyncCollectionEngine(finance_collector=FinanceCollector(rate_limiter=limiter))
+
+        async with engine.client_factory() as client:
+            assert client.rate_limiter.limiter is limiter
+
+    def test_run_sync_wrapper(self):
+        """동기 실행 래퍼 테스트"""
+        engine = AsyncCollectionEngine(
+            client_factory=lambda: _client(_make_transport())
+        )
+
+        results = engine.run(["487240"], price_days=5, trading_days=5, news_items=5)
+
+        assert len(results["487240"]['prices']) == 5
+
+
+class TestSchedulerAsyncEngine:
+    """스케줄러 비동기 엔진 연동 테스트"""
+
+    @patch('app.scheduler.data_scheduler.SessionLocal')
+    @patch('app.scheduler.data_scheduler.AsyncCollectionEngine')
+    def test_collect_all_data_with_async_engine(self, mock_engine_cls, mock_session_local, db_session):
+        """비동기 엔진 결과 저장 테스트"""
+        db_session.add(Stock(ticker="ASYNC001", name="비동기 테스트", type="STOCK"))
+        db_session.commit()
+        mock_session_local.return_value = db_session
+
+        collector = FinanceCollector()
+        prices = collector._parse_price_page(_price_page(1), "ASYNC001")
+        mock_engine_cls.return_value.run.return_value = {
+            "ASYNC001": {'ticker': "ASYNC001", 'prices': prices, 'trading': [], 'news': [], 'errors': []}
+        }
+
+        scheduler = DataScheduler(use_async_engine=True)
+        scheduler._collect_all_data()
+
+        assert scheduler.last_run_status == "success"
+        assert db_session.query(Price).filter(Price.ticker == "ASYNC001").count() == 10
+
+    def test_failed_endpoints_mapped_to_data_types(self, db_session):
+        """엔진이 센 종목별 요청 실패를 failed_data_types로 변환 테스트"""
+        db_session.add(Stock(ticker="ASYNC002", name="비동기 실패", type="STOCK"))
+        db_session.commit()
+        prices = FinanceCollector()._parse_price_page(_price_page(1), "ASYNC002")
+        fetched = {
+            'ticker': "ASYNC002", 'prices': prices, 'trading': [], 'news': [], 'errors': [],
+            'fetch_errors': {PAGE_ENDPOINT_FRGN: 2},
+        }
+
+        scheduler = DataScheduler(use_async_engine=True)
+        scheduler.ingest_buffer = None
+        result = scheduler._save_prefetched_data("ASYNC002", fetched, db_session)
+
+        assert result['failed_data_types'] == ["trading"]
+        assert result['prices_count'] == 10
@@ -0,0 +1,235 @@
+"""
+과거 데이터 백필 테스트
+"""
+
+import pytest
+import requests
+from datetime import date, datetime, timedelta
+from unittest.mock import patch
+
+from app.collectors.finance_collector import DATA_TYPE_PRICES, DATA_TYPE_TRADING, FinanceCollector
+from app.models.backfill_checkpoint import BackfillCheckpoint
+from app.models.price import Price
+from app.models.stock import Stock
+from app.scheduler.backfill import (
+    BACKFILL_COMPLETED,
+    BACKFILL_FAILED,
+    BACKFILL_PENDING,
+    BACKFILL_RUNNING,
+    BackfillRunner,
+    checkpoint_progress,
+    request_backfill,
+)
+from app.utils.rate_limiter import get_rate_limiter
+
+TICKER = "BACK001"
+ROWS_PER_PAGE = 10
+TOTAL_PAGES = 12
+
+
+class FakeHistory:
+    """sise_day 페이지를 흉내 내는 수집 함수 (하루에 한 행, 최신순)"""
+
+    def __init__(self, total_pages=TOTAL_PAGES, fail_pages=(), repeat_last=False):
+        self.total_pages = total_pages
+        self.fail_pages = set(fail_pages)
+        self.repeat_last = repeat_last
+        self.requested = []
+
+    def __call__(self, data_type, ticker, page):
+        self.requested.append(page)
+        if page in self.fail_pages:
+            self.fail_pages.discard(page)
+            raise requests.exceptions.ConnectionError(f"page {page} reset")
+        if page > self.total_pages:
+            if not self.repeat_last:
+                return []
+            page = self.total_pages
+        today = date.today()
+        return [
+            {
+                'ticker': ticker,
+                'date': today - timedelta(days=(page - 1) * ROWS_PER_PAGE + i),
+                'timestamp': datetime.now(),
+                'current_price': 1000.0,
+            }
+            for i in range(ROWS_PER_PAGE)
+        ]
+
+
+@pytest.fixture
+def stock(db_session):
+    db_session.add(Stock(ticker=TICKER, name="백필 테스트", type="STOCK"))
+    db_session.commit()
+    return TICKER
+
+
+def make_runner(db_session, history, **kwargs):
+    collector = FinanceCollector()
+    collector.fetch_history_page = history
+    return BackfillRunner(
+        chunk_pages=5, poll_interval=0, collector=collector,
+        session_factory=lambda: db_session, owner="test:1", **kwargs,
+    )
+
+
+def get_checkpoint(db_session, data_type=DATA_TYPE_PRICES):
+    db_session.expire_all()
+    return db_session.get(BackfillCheckpoint, (TICKER, data_type))
+
+
+class TestBackfillRunner:
+    """BackfillRunner 테스트"""
+
+    def test_default_collector_shares_host_budget(self):
+        """기본 수집기는 전역 호스트 예산 안에서 백필 속도로 더 제한 테스트"""
+        runner = BackfillRunner(pages_per_minute=30.0)
+
+        assert runner.collector.rate_limiter.parent is get_rate_limiter()
+        assert runner.collector.rate_limiter.min_interval == pytest.approx(2.0)
+
+    def test_resumes_from_checkpoint_after_failure(self, db_session, stock):
+        """실패한 묶음만 롤백하고 다음 실행에서 체크포인트부터 재개 테스트"""
+        history = FakeHistory(fail_pages={7})
+        runner = make_runner(db_session, history)
+        request_backfill(db_session, TICKER, DATA_TYPE_PRICES, date.today() - timedelta(days=3650))
+
+        assert runner.run_pending() == 2
+        checkpoint = get_checkpoint(db_session)
+        assert checkpoint.status == BACKFILL_RUNNING
+        assert (checkpoint.next_page, checkpoint.rows_saved, checkpoint.failures) == (6, 50, 1)
+        assert "page 7 reset" in checkpoint.last_error
+        assert checkpoint.owner is None
+        assert db_session.query(Price).count() == 50
+
+        history.requested.clear()
+        runner.run_pending()
+
+        checkpoint = get_checkpoint(db_session)
+        assert checkpoint.status == BACKFILL_COMPLETED
+        assert history.requested[0] == 6
+        assert checkpoint.pages_done == TOTAL_PAGES
+        assert checkpoint.failures == 0
+        assert db_session.query(Price).count() == TOTAL_PAGES * ROWS_PER_PAGE
+        assert runner.get_status()['completed'] == 1
+
+    def test_stops_at_start_date(self, db_session, stock):
+        """start_date보다 과거 행은 저장하지 않고 완료 테스트"""
+        runner = make_runner(db_session, FakeHistory())
+        start_date = date.today() - timedelta(days=35)
+        request_backfill(db_session, TICKER, DATA_TYPE_PRICES, start_date)
+
+        runner.run_pending()
+
+        checkpoint = get_checkpoint(db_session)
+        assert checkpoint.status == BACKFILL_COMPLETED
+        assert checkpoint.next_page == 4  # 더 과거로 확장하면 4페이지부터 다시 수집
+        assert db_session.query(Price).count() == 36
+        assert checkpoint_progress(checkpoint)['progress'] == 1.0
+
+    def test_extend_completed_backfill(self, db_session, stock):
+        """완료된 백필에 더 과거 start_date를 요청하면 이어서 수집 테스트"""
+        history = FakeHistory()
+        runner = make_runner(db_session, history)
+        request_backfill(db_session, TICKER, DATA_TYPE_PRICES, date.today() - timedelta(days=35))
+        runner.run_pending()
+
+        checkpoint = request_backfill(db_session, TICKER, DATA_TYPE_PRICES, date.today() - timedelta(days=3650))
+        assert checkpoint.status == BACKFILL_PENDING
+        history.requested.clear()
+        runner.run_pending()
+
+        assert history.requested[0] == 4
+        assert get_checkpoint(db_session).status == BACKFILL_COMPLETED
+        assert db_session.query(Price).count() == TOTAL_PAGES * ROWS_PER_PAGE
+
+    def test_repeated_last_page_completes(self, db_session, stock):
+        """마지막 페이지를 넘어 같은 페이지가 반환되면 완료 테스트"""
+        runner = make_runner(db_session, FakeHistory(total_pages=3, repeat_last=True))
+        request_backfill(db_session, TICKER, DATA_TYPE_PRICES, date.today() - timedelta(days=3650))
+
+        runner.run_pending()
+
+        checkpoint = get_checkpoint(db_session)
+        assert checkpoint.status == BACKFILL_COMPLETED
+        assert checkpoint.pages_done == 3
+
+    def test_gives_up_after_max_failures(self, db_session, stock):
+        """연속 실패가 max_failures에 이르면 failed, 다시 요청하면 재개 테스트"""
+        history = FakeHistory(fail_pages={1})
+        runner = make_runner(db_session, history, max_failures=1)
+        request_backfill(db_session, TICKER, DATA_TYPE_PRICES, date.today() - timedelta(days=3650))
+
+        runner.run_pending()
+        assert get_checkpoint(db_session).status == BACKFILL_FAILED
+        assert runner.run_pending() == 0
+
+        checkpoint = request_backfill(db_session, TICKER, DATA_TYPE_PRICES, date.today() - timedelta(days=3650))
+        assert (checkpoint.status, checkpoint.failures, checkpoint.last_error) == (BACKFILL_PENDING, 0, None)
+        runner.run_pending()
+        assert get_checkpoint(db_session).status == BACKFILL_COMPLETED
+
+    def test_leased_checkpoint_not_claimed(self, db_session, stock):
+        """다른 프로세스가 점유 중이면 건너뛰고, 점유가 만료되면 이어받음 테스트"""
+        runner = make_runner(db_session, FakeHistory())
+        request_backfill(db_session, TICKER, DATA_TYPE_PRICES, date.today() - timedelta(days=3650))
+        checkpoint = get_checkpoint(db_session)
+        checkpoint.owner = "other:2"
+        checkpoint.lease_until = datetime.now() + timedelta(minutes=1)
+        db_session.commit()
+
+        assert runner.run_pending() == 0
+
+        checkpoint = get_checkpoint(db_session)
+        checkpoint.lease_until = datetime.now() - timedelta(seconds=1)
+        db_session.commit()
+        assert runner.run_pending(max_chunks=1) == 1
+        assert get_checkpoint(db_session).next_page == 6
+
+    def test_progress_and_eta(self):
+        """진행률과 남은 시간 추정 테스트"""
+        today = date(2025, 1, 1)
+        checkpoint = BackfillCheckpoint(
+            ticker=TICKER, data_type=DATA_TYPE_PRICES, status=BACKFILL_RUNNING,
+            start_date=today - timedelta(days=1000), oldest_date=today - timedelta(days=250),
+            next_page=18, pages_done=17, rows_saved=170, active_seconds=60.0, failures=0,
+            created_at=datetime(2025, 1, 1), updated_at=datetime(2025, 1, 1),
+        )
+
+        progress = checkpoint_progress(checkpoint, today=today)
+        assert progress['progress'] == 0.25
+        assert progress['eta_seconds'] == 180.0
+        assert checkpoint_progress(checkpoint, active_count=2, today=today)['eta_seconds'] == 360.0
+
+
+class TestBackfillAPI:
+    """백필 API 테스트"""
+
+    def test_start_and_get_backfill(self, client, stock):
+        """백필 요청 후 진행 상태 조회 테스트"""
+        with patch('app.api.data_collection.get_backfill_runner') as get_runner:
+            response = client.post(f"/api/data/backfill/{TICKER}?start_date=2020-01-01")
+
+        assert response.status_code == 202
+        data = response.json()["data"]
+        assert [item["data_type"] for item in data] == [DATA_TYPE_PRICES, DATA_TYPE_TRADING]
+        assert all(item["status"] == BACKFILL_PENDING and item["start_date"] == "2020-01-01" for item in data)
+        get_runner.return_value.wake.assert_called_once()
+
+        response = client.get(f"/api/data/backfill/{TICKER}")
+        assert response.status_code == 200
+        assert len(response.json()["data"]) == 2
+
+        response = client.get("/api/data/backfill")
+        assert response.status_code == 200
+        assert len(response.json()["data"]["checkpoints"]) == 2
+
+    def test_invalid_requests(self, client, stock):
+        """없는 종목, 잘못된 데이터 유형, 백필 요청이 없는 종목 테스트"""
+        assert client.post("/api/data/backfill/NOPE999").status_code == 404
+
+        response = client.post(f"/api/data/backfill/{TICKER}?data_type=news")
+        assert response.status_code == 400
+        assert response.json()["error_code"] == "INVALID_DATA_TYPE"
+
+        assert client.get(f"/api/data/backfill/{TICKER}").status_code == 404
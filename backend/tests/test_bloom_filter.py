@@ -0,0 +1,202 @@
+"""
+Bloom 필터 및 뉴스 배치 중복 확인 테스트
+"""
+
+import pytest
+from datetime import datetime
+from unittest.mock import patch
+
+from sqlalchemy import event
+
+from app.collectors.news_collector import NewsCollector
+from app.models.stock import Stock
+from app.models.news import News
+from app.utils.bloom_filter import BloomFilter, RedisBloomFilter
+
+
+class FakeRedis:
+    """SETBIT/GETBIT/EXISTS/SET만 지원하는 테스트용 Redis"""
+
+    def __init__(self):
+        self.bitmaps = {}
+        self.values = {}
+
+    def pipeline(self, transaction=False):
+        return FakePipeline(self)
+
+    def exists(self, key):
+        return int(key in self.bitmaps or key in self.values)
+
+    def set(self, key, value):
+        self.values[key] = value
+        return True
+
+    def delete(self, *keys):
+        return sum(
+            int(self.bitmaps.pop(key, None) is not None) + int(self.values.pop(key, None) is not None)
+            for key in keys
+        )
+
+
+class FakePipeline:
+    def __init__(self, redis):
+        self.redis = redis
+        self.commands = []
+
+    def setbit(self, key, offset, value):
+        self.commands.append(('set', key, offset, value))
+
+    def getbit(self, key, offset):
+        self.commands.append(('get', key, offset, None))
+
+    def execute(self):
+        results = []
+        for op, key, offset, value in self.commands:
+            bits = self.redis.bitmaps.setdefault(key, set()) if op == 'set' else self.redis.bitmaps.get(key, set())
+            results.append(int(offset in bits))
+            if op == 'set' and value:
+                bits.add(offset)
+        return results
+
+
+def _news(ticker: str, article_id: int, title: str = "뉴스") -> dict:
+    collector = NewsCollector(bloom_filter=BloomFilter(capacity=1000))
+    url = f"https://finance.naver.com/item/news_read.naver?article_id={article_id}"
+    return {
+        'id': collector._generate_news_id(url, ticker),
+        'ticker': ticker,
+        'title': f"{title} {article_id}",
+        'url': url,
+        'url_hash': collector._generate_url_hash(url),
+        'source': '테스트',
+        'published_at': datetime(2025, 11, 14, 10, 0, 0),
+        'timestamp': datetime.now(),
+    }
+
+
+class TestBloomFilter:
+    """BloomFilter 테스트"""
+
+    def test_no_false_negatives(self):
+        """추가한 키는 항상 포함으로 판별 테스트"""
+        bloom = BloomFilter(capacity=1000, error_rate=0.01)
+        keys = [f"key-{i}" for i in range(1000)]
+        bloom.add_many(keys)
+
+        assert all(bloom.contains_many(keys))
+        assert "key-1" in bloom
+
+    def test_false_positive_rate(self):
+        """거짓 양성 비율이 목표치 근처인지 테스트"""
+        bloom = BloomFilter(capacity=1000, error_rate=0.01)
+        bloom.add_many(f"key-{i}" for i in range(1000))
+
+        false_positives = sum(bloom.contains_many([f"other-{i}" for i in range(10000)]))
+
+        assert false_positives < 300  # 목표 1% (100개), 여유 있게 3%
+
+    def test_sizing(self):
+        """비트 수/해시 수 계산 테스트"""
+        bloom = BloomFilter(capacity=1_000_000, error_rate=0.001)
+
+        assert bloom.num_hashes == 10
+        assert 14_000_000 < bloom.num_bits < 15_000_000
+
+    @pytest.mark.parametrize("capacity,error_rate", [(0, 0.01), (100, 0), (100, 1)])
+    def test_invalid_arguments(self, capacity, error_rate):
+        """잘못된 설정 테스트"""
+        with pytest.raises(ValueError):
+            BloomFilter(capacity=capacity, error_rate=error_rate)
+
+    def test_redis_backend_shared(self):
+        """Redis 필터는 인스턴스 간 공유 테스트"""
+        redis = FakeRedis()
+        writer = RedisBloomFilter("bloom:test", capacity=1000, client=redis)
+        reader = RedisBloomFilter("bloom:test", capacity=1000, client=redis)
+
+        assert reader.needs_warmup()
+        writer.add_many(["a", "b"])
+
+        assert reader.contains_many(["a", "b", "c"])[:2] == [True, True]
+        # 비트맵 키가 있어도 채우기를 마치기 전에는 다른 프로세스도 채움
+        assert reader.needs_warmup()
+
+        writer.mark_warmed()
+        assert not reader.needs_warmup()
+
+        writer.clear()
+        assert not redis.exists(writer.warmed_key)
+
+    def test_redis_failure_answers_maybe(self):
+        """Redis 장애 시 '있을 수 있음'으로 답해 DB 확인으로 대체 테스트"""
+        bloom = RedisBloomFilter("bloom:test", capacity=1000, client=object())
+
+        assert bloom.contains_many(["a", "b"]) == [True, True]
+
+
+class TestNewsBatchDeduplication:
+    """save_news_data 배치 중복 확인 테스트"""
+
+    @pytest.fixture
+    def stock(self, db_session):
+        db_session.add(Stock(ticker="BLOOM01", name="블룸", type="STOCK"))
+        db_session.commit()
+
+    def _count_queries(self, db_session):
+        statements = []
+        engine = db_session.get_bind()
+
+        def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+            statements.append(statement)
+
+        event.listen(engine, "before_cursor_execute", before_cursor_execute)
+        return statements, lambda: event.remove(engine, "before_cursor_execute", before_cursor_execute)
+
+    def test_new_articles_skip_lookup(self, db_session, stock):
+        """새 뉴스만 있으면 중복 조회 없이 한 번에 삽입 테스트"""
+        collector = NewsCollector(bloom_filter=BloomFilter(capacity=1000))
+        collector.save_news_data(db_session, [_news("BLOOM01", 0)])  # 필터 초기화
+
+        statements, remove = self._count_queries(db_session)
+        try:
+            saved = collector.save_news_data(db_session, [_news("BLOOM01", i) for i in range(1, 51)])
+        finally:
+            remove()
+
+        assert saved == 50
+        assert not any(s.startswith("SELECT") for s in statements)
+        assert sum(s.startswith("INSERT") for s in statements) == 1
+        assert db_session.query(News).count() == 51
+
+    def test_possible_duplicates_single_query(self, db_session, stock):
+        """이미 저장된 뉴스는 IN 쿼리 한 번으로 확인 후 갱신 테스트"""
+        collector = NewsCollector(bloom_filter=BloomFilter(capacity=1000))
+        collector.save_news_data(db_session, [_news("BLOOM01", i) for i in range(10)])
+
+        statements, remove = self._count_queries(db_session)
+        try:
+            with patch('app.collectors.news_collector.logger') as mock_logger:
+                saved = collector.save_news_data(
+                    db_session, [_news("BLOOM01", i, title="수정") for i in range(5, 15)]
+                )
+        finally:
+            remove()
+
+        assert saved == 10
+        assert sum(s.startswith("SELECT") for s in statements) == 1
+        assert "5 inserted, 5 updated" in mock_logger.info.call_args[0][0]
+        assert db_session.query(News).count() == 15
+        assert db_session.query(News).filter(News.title == "수정 5").count() == 1
+
+    def test_warmup_from_database(self, db_session, stock):
+        """기존 데이터로 필터를 채운 뒤 중복 판별 테스트"""
+        existing = _news("BLOOM01", 1)
+        db_session.add(News(**{k: v for k, v in existing.items() if k != 'timestamp'}, collected_at=datetime.now()))
+        db_session.commit()
+        bloom = BloomFilter(capacity=1000)
+
+        with patch('app.collectors.news_collector.logger') as mock_logger:
+            NewsCollector(bloom_filter=bloom).save_news_data(db_session, [_news("BLOOM01", 1, title="수정")])
+
+        assert existing['url_hash'] in bloom
+        assert "0 inserted, 1 updated" in mock_logger.info.call_args[0][0]
@@ -0,0 +1,159 @@
+"""
+Circuit Breaker 테스트
+"""
+
+from unittest.mock import patch
+
+import pytest
+import requests
+
+from app.collectors.finance_collector import PAGE_ENDPOINT_FRGN, FinanceCollector
+from app.utils.circuit_breaker import (
+    CIRCUIT_CLOSED,
+    CIRCUIT_HALF_OPEN,
+    CIRCUIT_OPEN,
+    CircuitBreaker,
+    CircuitOpenError,
+    get_circuit_breaker,
+)
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 100.0
+
+    def __call__(self):
+        return self.now
+
+
+def make_breaker(clock):
+    return CircuitBreaker(
+        "frgn", failure_rate=0.5, min_requests=4, window=4, open_seconds=30.0, half_open_probes=2, clock=clock,
+    )
+
+
+class TestCircuitBreaker:
+    """상태 전환 테스트"""
+
+    def test_opens_on_failure_rate(self):
+        """최소 요청 수 이상에서 실패 비율을 넘으면 차단 테스트"""
+        breaker = make_breaker(FakeClock())
+
+        breaker.record_success()
+        breaker.record_failure()
+        breaker.record_failure()
+        assert breaker.state == CIRCUIT_CLOSED  # 아직 최소 요청 수 미만
+
+        breaker.record_failure()
+        assert breaker.state == CIRCUIT_OPEN
+        with pytest.raises(CircuitOpenError):
+            breaker.before_request()
+        assert breaker.get_state()['rejected'] == 1
+
+    def test_half_open_probes_close(self):
+        """open_seconds 후 확인 요청만 허용하고, 모두 성공하면 closed 테스트"""
+        clock = FakeClock()
+        breaker = make_breaker(clock)
+        for _ in range(4):
+            breaker.record_failure()
+
+        clock.now += 30
+        assert breaker.state == CIRCUIT_HALF_OPEN
+        breaker.before_request()
+        breaker.before_request()
+        with pytest.raises(CircuitOpenError):
+            breaker.before_request()  # 확인 요청 슬롯 모두 사용 중
+
+        breaker.record_success()
+        breaker.record_success()
+        assert breaker.state == CIRCUIT_CLOSED
+        breaker.before_request()
+
+    def test_failed_probe_reopens(self):
+        """확인 요청이 실패하면 다시 open 테스트"""
+        clock = FakeClock()
+        breaker = make_breaker(clock)
+        for _ in range(4):
+            breaker.record_failure()
+        clock.now += 30
+        breaker.before_request()
+
+        breaker.record_failure()
+
+        assert breaker.state == CIRCUIT_OPEN
+        assert breaker.get_state()['opens'] == 2
+
+    def test_release_frees_probe_slot(self):
+        """결과 없이 끝난 확인 요청은 슬롯만 반납 테스트"""
+        clock = FakeClock()
+        breaker = make_breaker(clock)
+        for _ in range(4):
+            breaker.record_failure()
+        clock.now += 30
+        breaker.before_request()
+        breaker.before_request()
+
+        breaker.release()
+
+        assert breaker.state == CIRCUIT_HALF_OPEN
+        breaker.before_request()
+
+
+class TestCollectorCircuitBreaker:
+    """수집기 연동 테스트"""
+
+    @patch('app.utils.retry.time.sleep')
+    @patch('app.utils.http_client.HttpClient.get')
+    def test_open_breaker_skips_data_type(self, mock_get, mock_sleep):
+        """재시도 후에도 실패한 요청이 쌓이면 해당 데이터 유형은 요청 없이 건너뜀 테스트"""
+        mock_get.side_effect = requests.exceptions.ConnectionError("maintenance")
+        collector = FinanceCollector()
+        breaker = get_circuit_breaker(PAGE_ENDPOINT_FRGN)
+
+        for _ in range(breaker.min_requests):
+            assert collector.fetch_naver_trading_flow("487240", days=10) == []
+        assert breaker.state == CIRCUIT_OPEN
+
+        mock_get.reset_mock()
+        assert collector.fetch_naver_trading_flow("000660", days=10) == []
+        mock_get.assert_not_called()
+
+    @patch('app.utils.http_client.HttpClient.get')
+    def test_client_errors_do_not_open(self, mock_get):
+        """404 등 upstream이 응답한 오류는 실패로 세지 않음 테스트"""
+        response = requests.Response()
+        response.status_code = 404
+        mock_get.return_value = response
+        collector = FinanceCollector()
+
+        for _ in range(12):
+            collector.fetch_naver_trading_flow("487240", days=10)
+
+        assert get_circuit_breaker(PAGE_ENDPOINT_FRGN).state == CIRCUIT_CLOSED
+
+    @patch('app.utils.http_client.HttpClient.get')
+    def test_unexpected_error_releases_probe(self, mock_get):
+        """half-open 확인 요청 중 RequestException이 아닌 오류가 나도 슬롯을 반납 테스트"""
+        clock = FakeClock()
+        breaker = make_breaker(clock)
+        for _ in range(4):
+            breaker.record_failure()
+        clock.now += 30
+        mock_get.side_effect = ValueError("unexpected")
+        collector = FinanceCollector()
+
+        with patch('app.collectors.finance_collector.get_circuit_breaker', return_value=breaker):
+            for _ in range(breaker.half_open_probes + 1):
+                with pytest.raises(ValueError):
+                    collector._get_page(PAGE_ENDPOINT_FRGN, "https://finance.naver.com/item/frgn.naver", {})
+
+        assert breaker.state == CIRCUIT_HALF_OPEN
+        assert breaker.get_state()['rejected'] == 0
+
+    def test_scheduler_status(self, client):
+        """스케줄러 상태에 엔드포인트별 Circuit Breaker 상태 포함 테스트"""
+        response = client.get("/api/scheduler/status")
+
+        breakers = response.json()["data"]["circuit_breakers"]
+        assert set(breakers) >= {"sise_day", "frgn", "news"}
+        assert breakers["frgn"]["state"] == CIRCUIT_CLOSED
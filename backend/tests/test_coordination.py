@@ -0,0 +1,306 @@
+"""
+여러 프로세스/노드 간 수집 조정 테스트
+"""
+
+import pytest
+from collections import Counter
+from unittest.mock import Mock, patch
+
+from app.scheduler.coordination import (
+    COORDINATION_LEADER,
+    COORDINATION_SHARDED,
+    LEADER_FENCE_NAME,
+    LEADER_LOCK_KEY,
+    RELEASE_SCRIPT,
+    RENEW_SCRIPT,
+    ClusterCoordinator,
+    ConsistentHashRing,
+    LeadershipLostError,
+)
+from app.models import SchedulerFence
+from app.scheduler.data_scheduler import DataScheduler
+
+
+class FakeClock:
+    def __init__(self, now: float = 1_700_000_000.0):
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class FakeRedis:
+    """리더 락과 멤버십에 쓰는 명령만 지원하는 테스트용 Redis (만료는 expire_key로 흉내)"""
+
+    def __init__(self):
+        self.values = {}
+        self.zsets = {}
+
+    def get(self, key):
+        return self.values.get(key)
+
+    def set(self, key, value, nx=False, px=None):
+        if nx and key in self.values:
+            return None
+        self.values[key] = value
+        return True
+
+    def incr(self, key):
+        self.values[key] = int(self.values.get(key, 0)) + 1
+        return self.values[key]
+
+    def eval(self, script, numkeys, key, token, *args):
+        if self.values.get(key) != token:
+            return 0
+        if script == RELEASE_SCRIPT:
+            del self.values[key]
+        assert script in (RENEW_SCRIPT, RELEASE_SCRIPT)
+        return 1
+
+    def expire_key(self, key):
+        self.values.pop(key, None)
+
+    def zrem(self, key, member):
+        self.zsets.get(key, {}).pop(member, None)
+
+    def pipeline(self, transaction=False):
+        return FakePipeline(self)
+
+
+class FakePipeline:
+    def __init__(self, redis):
+        self.redis = redis
+        self.results = []
+
+    def zadd(self, key, mapping):
+        self.redis.zsets.setdefault(key, {}).update(mapping)
+        self.results.append(len(mapping))
+
+    def zremrangebyscore(self, key, minimum, maximum):
+        zset = self.redis.zsets.get(key, {})
+        expired = [member for member, score in zset.items() if score <= maximum]
+        for member in expired:
+            del zset[member]
+        self.results.append(len(expired))
+
+    def zrange(self, key, start, end):
+        self.results.append(sorted(self.redis.zsets.get(key, {}), key=self.redis.zsets[key].get))
+
+    def execute(self):
+        return self.results
+
+
+class TestConsistentHashRing:
+    """ConsistentHashRing 테스트"""
+
+    TICKERS = [f"{i:06d}" for i in range(2000)]
+
+    def test_balanced(self):
+        """종목이 멤버들에게 고르게 나뉘는지 테스트"""
+        ring = ConsistentHashRing(["a", "b", "c", "d"], replicas=64)
+        counts = Counter(ring.owner(ticker) for ticker in self.TICKERS)
+
+        assert set(counts) == {"a", "b", "c", "d"}
+        assert min(counts.values()) > len(self.TICKERS) / 4 * 0.6
+
+    def test_member_join_moves_only_its_share(self):
+        """멤버가 추가되면 새 멤버 몫의 종목만 옮겨가는지 테스트"""
+        before = ConsistentHashRing(["a", "b", "c"])
+        after = ConsistentHashRing(["a", "b", "c", "d"])
+
+        moved = [ticker for ticker in self.TICKERS if before.owner(ticker) != after.owner(ticker)]
+
+        assert all(after.owner(ticker) == "d" for ticker in moved)
+        assert len(moved) < len(self.TICKERS) * 0.4
+
+    def test_empty(self):
+        """멤버가 없으면 None 테스트"""
+        assert ConsistentHashRing().owner("005930") is None
+
+
+class TestLeaderCoordination:
+    """리더 락 모드 테스트"""
+
+    @pytest.fixture
+    def redis(self):
+        return FakeRedis()
+
+    def test_single_leader(self, redis):
+        """한 프로세스만 리더가 되고 fencing 토큰이 발급되는지 테스트"""
+        first = ClusterCoordinator(COORDINATION_LEADER, member_id="w1", client=redis)
+        second = ClusterCoordinator(COORDINATION_LEADER, member_id="w2", client=redis)
+        first.heartbeat()
+        second.heartbeat()
+
+        assert first.can_run() and not second.can_run()
+        assert first.fencing_token == 1
+        first.verify()
+        first.heartbeat()  # 연장
+        assert first.is_leader
+
+    def test_failover_fences_stale_leader(self, redis):
+        """락이 만료되어 다른 프로세스가 리더가 되면 이전 리더의 커밋을 막는지 테스트"""
+        first = ClusterCoordinator(COORDINATION_LEADER, member_id="w1", client=redis)
+        second = ClusterCoordinator(COORDINATION_LEADER, member_id="w2", client=redis)
+        first.heartbeat()
+
+        redis.expire_key(LEADER_LOCK_KEY)  # w1 일시 정지로 락 만료
+        second.heartbeat()
+
+        assert second.is_leader
+        assert second.fencing_token > 1
+        with pytest.raises(LeadershipLostError):
+            first.verify()
+        first.heartbeat()  # 연장 실패로 리더 자격 상실
+        assert not first.is_leader
+        assert first.get_status()['fencing_rejections'] == 1
+
+    def test_fencing_token_rejected_by_database(self, redis, db_session):
+        """Redis 확인을 통과해도 더 큰 토큰이 이미 커밋되었으면 이전 리더의 트랜잭션을 거부하는지 테스트"""
+        first = ClusterCoordinator(COORDINATION_LEADER, member_id="w1", client=redis)
+        second = ClusterCoordinator(COORDINATION_LEADER, member_id="w2", client=redis)
+        first.heartbeat()
+        first.verify(db_session)
+        db_session.commit()
+
+        stale_lock = redis.get(LEADER_LOCK_KEY)
+        redis.expire_key(LEADER_LOCK_KEY)
+        second.heartbeat()
+        second.verify(db_session)
+        db_session.commit()
+
+        # w1이 Redis 락을 확인한 직후 일시 정지한 경우를 흉내 (Redis 확인은 통과)
+        redis.values[LEADER_LOCK_KEY] = stale_lock
+        with pytest.raises(LeadershipLostError):
+            first.verify(db_session)
+        db_session.rollback()
+
+        assert db_session.get(SchedulerFence, LEADER_FENCE_NAME).token == second.fencing_token
+        assert first.get_status()['fencing_rejections'] == 1
+
+    def test_release_hands_over(self, redis):
+        """종료 시 락을 해제하면 다른 프로세스가 바로 이어받는지 테스트"""
+        first = ClusterCoordinator(COORDINATION_LEADER, member_id="w1", client=redis)
+        second = ClusterCoordinator(COORDINATION_LEADER, member_id="w2", client=redis)
+        first.heartbeat()
+        first.release()
+        second.heartbeat()
+
+        assert second.is_leader
+
+    def test_redis_failure_stops_collection(self):
+        """Redis에 접근할 수 없으면 수집하지 않음 테스트"""
+        coordinator = ClusterCoordinator(COORDINATION_LEADER, member_id="w1", client=object())
+        coordinator.heartbeat()
+
+        assert not coordinator.can_run()
+        assert coordinator.get_status()['healthy'] is False
+
+
+class TestShardedCoordination:
+    """종목 분할 모드 테스트"""
+
+    TICKERS = [f"{i:06d}" for i in range(300)]
+
+    def test_members_partition_tickers(self):
+        """멤버들이 종목을 중복 없이 모두 나눠 갖는지 테스트"""
+        redis = FakeRedis()
+        clock = FakeClock()
+        members = [
+            ClusterCoordinator(COORDINATION_SHARDED, member_id=f"w{i}", client=redis, clock=clock)
+            for i in range(3)
+        ]
+        for member in members:
+            member.heartbeat()
+        for member in members:  # 나중에 들어온 멤버까지 반영
+            member.heartbeat()
+
+        shards = [member.assign(self.TICKERS) for member in members]
+
+        assert sorted(sum(shards, [])) == self.TICKERS
+        assert all(shards)
+
+    def test_dead_member_rebalanced(self):
+        """heartbeat가 끊긴 멤버의 종목이 남은 멤버에게 넘어가는지 테스트"""
+        redis = FakeRedis()
+        clock = FakeClock()
+        alive = ClusterCoordinator(COORDINATION_SHARDED, member_id="w1", member_ttl=30, client=redis, clock=clock)
+        dead = ClusterCoordinator(COORDINATION_SHARDED, member_id="w2", member_ttl=30, client=redis, clock=clock)
+        dead.heartbeat()
+        alive.heartbeat()
+        assert len(alive.assign(self.TICKERS)) < len(self.TICKERS)
+
+        clock.now += 31
+        alive.heartbeat()
+
+        assert alive.assign(self.TICKERS) == self.TICKERS
+        assert alive.get_status()['members'] == ["w1"]
+        assert alive.get_status()['rebalances'] == 2
+
+
+class TestSchedulerCoordination:
+    """스케줄러 수집 조정 테스트"""
+
+    @staticmethod
+    def _collect(ticker, db, data_types=None):
+        return {'ticker': ticker, 'prices_count': 1, 'trading_count': 0, 'news_count': 0,
+                'unchanged_rows': 0, 'errors': []}
+
+    @patch('app.scheduler.data_scheduler.SessionLocal')
+    def test_standby_does_not_collect(self, mock_session_local):
+        """리더가 아닌 프로세스는 수집하지 않음 테스트"""
+        redis = FakeRedis()
+        leader = ClusterCoordinator(COORDINATION_LEADER, member_id="w1", client=redis)
+        leader.heartbeat()
+        scheduler = DataScheduler()
+        scheduler.coordinator = ClusterCoordinator(COORDINATION_LEADER, member_id="w2", client=redis)
+        scheduler.coordinator.heartbeat()
+
+        scheduler._collect_all_data(['news'])
+
+        mock_session_local.assert_not_called()
+        assert scheduler.last_run_status == "standby"
+        assert scheduler.get_status()['coordination']['is_leader'] is False
+
+    @patch('app.scheduler.data_scheduler.SessionLocal')
+    def test_sharded_collects_own_tickers(self, mock_session_local):
+        """종목 분할 모드에서는 자기 몫의 종목만 수집 테스트"""
+        mock_session_local.side_effect = lambda: Mock()
+        redis = FakeRedis()
+        clock = FakeClock()
+        other = ClusterCoordinator(COORDINATION_SHARDED, member_id="w2", client=redis, clock=clock)
+        other.heartbeat()
+        scheduler = DataScheduler()
+        scheduler.coordinator = ClusterCoordinator(COORDINATION_SHARDED, member_id="w1", client=redis, clock=clock)
+        scheduler.coordinator.heartbeat()
+        other.heartbeat()
+        tickers = [f"{i:06d}" for i in range(20)]
+
+        with patch.object(scheduler, '_get_all_tickers', return_value=tickers), \
+                patch.object(scheduler, '_collect_data_for_ticker', side_effect=self._collect) as collect:
+            scheduler._collect_all_data(['news'])
+
+        collected = {call.args[0] for call in collect.call_args_list}
+        assert collected == set(scheduler.coordinator.assign(tickers))
+        assert collected.isdisjoint(other.assign(tickers))
+
+    @patch('app.scheduler.data_scheduler.SessionLocal')
+    def test_lost_leadership_rolls_back(self, mock_session_local):
+        """수집 중 리더 락을 잃으면 종목 트랜잭션을 커밋하지 않음 테스트"""
+        session = Mock()
+        mock_session_local.return_value = session
+        redis = FakeRedis()
+        scheduler = DataScheduler()
+        scheduler.coordinator = ClusterCoordinator(COORDINATION_LEADER, member_id="w1", client=redis)
+        scheduler.coordinator.heartbeat()
+
+        def collect(ticker, db, data_types=None):
+            redis.expire_key(LEADER_LOCK_KEY)
+            return self._collect(ticker, db, data_types)
+
+        with patch.object(scheduler, '_collect_data_for_ticker', side_effect=collect):
+            with pytest.raises(LeadershipLostError):
+                scheduler._run_ticker_task("005930", None, {}, ['news'])
+
+        session.commit.assert_not_called()
+        session.rollback.assert_called_once()
@@ -137,7 +137,7 @@ class TestFinanceCollectorFetch:
         """수집기 픽스처"""
         return FinanceCollector()
     
-    @patch('app.collectors.finance_collector.requests.get')
+    @patch('app.utils.http_client.HttpClient.get')
     def test_fetch_naver_finance_prices_success(self, mock_get, collector):
         """가격 데이터 수집 성공 테스트"""
         # Mock HTML 응답
@@ -166,7 +166,7 @@ class TestFinanceCollectorFetch:
         assert data[0]['current_price'] == 25050.0
         assert data[1]['date'] == date(2025, 11, 6)
     
-    @patch('app.collectors.finance_collector.requests.get')
+    @patch('app.utils.http_client.HttpClient.get')
     def test_fetch_naver_finance_prices_table_not_found(self, mock_get, collector):
         """테이블을 찾을 수 없는 경우 테스트"""
         mock_response = Mock()
@@ -178,7 +178,7 @@ class TestFinanceCollectorFetch:
         
         assert len(data) == 0
     
-    @patch('app.collectors.finance_collector.requests.get')
+    @patch('app.utils.http_client.HttpClient.get')
     def test_fetch_naver_finance_prices_network_error(self, mock_get, collector):
         """네트워크 오류 테스트"""
         import requests
@@ -188,8 +188,23 @@ class TestFinanceCollectorFetch:
         
         # 재시도 후에도 실패하면 빈 리스트 반환
         assert len(data) == 0
-    
-    @patch('app.collectors.finance_collector.requests.get')
+
+    @patch('app.utils.http_client.HttpClient.get')
+    def test_fetch_stops_when_deadline_exceeded(self, mock_get, collector):
+        """마감이 지난 작업은 일부 데이터를 반환하지 않고 DeadlineExceeded 전파 테스트"""
+        from app.utils.deadline import Deadline, DeadlineExceeded, deadline_scope
+        deadline = Deadline(25.0)
+        deadline.cancel()
+
+        with deadline_scope(deadline):
+            with pytest.raises(DeadlineExceeded):
+                collector.fetch_naver_finance_prices("487240", days=5)
+            with pytest.raises(DeadlineExceeded):
+                collector.fetch_naver_trading_flow("487240", days=5)
+
+        mock_get.assert_not_called()
+
+    @patch('app.utils.http_client.HttpClient.get')
     def test_fetch_naver_trading_flow_success(self, mock_get, collector):
         """매매 동향 데이터 수집 성공 테스트"""
         # Mock HTML 응답 (두 개의 type2 테이블)
@@ -378,7 +393,7 @@ class TestFinanceCollectorIntegration:
         """수집기 픽스처"""
         return FinanceCollector()
     
-    @patch('app.collectors.finance_collector.requests.get')
+    @patch('app.utils.http_client.HttpClient.get')
     def test_collect_and_save_prices_integration(self, mock_get, collector, db_session):
         """가격 데이터 수집 및 저장 통합 테스트"""
         # 종목 생성
@@ -416,3 +431,225 @@ class TestFinanceCollectorIntegration:
 
 
 
+
+
+class TestFinanceCollectorIncremental:
+    """FinanceCollector 증분 수집 테스트"""
+    
+    @pytest.fixture
+    def collector(self):
+        """수집기 픽스처"""
+        return FinanceCollector()
+    
+    @staticmethod
+    def _page_response(page):
+        """페이지당 10행의 sise_day 응답 생성 (2025.10.28부터 역순)"""
+        rows = ""
+        for i in range(10):
+            day = 28 - (page - 1) * 10 - i
+            rows += (
+                f"<tr><td>2025.10.{day:02d}</td><td>25,050</td><td>상승205</td>"
+                f"<td>25,000</td><td>25,100</td><td>24,900</td><td>1,000</td></tr>"
+            )
+        mock_response = Mock()
+        mock_response.text = f'<html><body><table class="type2">{rows}</table></body></html>'
+        mock_response.raise_for_status = Mock()
+        return mock_response
+    
+    @patch('app.utils.http_client.HttpClient.get')
+    def test_fetch_since_stops_at_stored_date(self, mock_get, collector):
+        """저장된 날짜가 포함된 페이지에서 페이징 중단 테스트"""
+        mock_get.side_effect = lambda url, **kwargs: self._page_response(int(url.rsplit('=', 1)[1]))
+        
+        data = collector.fetch_naver_finance_prices("487240", days=30, since=date(2025, 10, 25))
+        
+        assert mock_get.call_count == 1
+        assert [row['date'] for row in data] == [date(2025, 10, 28), date(2025, 10, 27), date(2025, 10, 26)]
+    
+    @patch('app.utils.http_client.HttpClient.get')
+    def test_fetch_since_pages_until_stored_date(self, mock_get, collector):
+        """저장된 날짜가 다음 페이지에 있으면 해당 페이지까지 수집 테스트"""
+        mock_get.side_effect = lambda url, **kwargs: self._page_response(int(url.rsplit('=', 1)[1]))
+        
+        data = collector.fetch_naver_finance_prices("487240", days=30, since=date(2025, 10, 15))
+        
+        assert mock_get.call_count == 2
+        assert len(data) == 13
+        assert data[-1]['date'] == date(2025, 10, 16)
+    
+    @patch('app.utils.retry.time.sleep')
+    @patch('app.utils.http_client.HttpClient.get')
+    def test_page_retry_resumes_failed_page(self, mock_get, mock_sleep, collector):
+        """실패한 페이지만 다시 요청하고 이어서 수집, 재시도 예산 차감 테스트"""
+        import requests
+        failed = []
+        
+        def side_effect(url, **kwargs):
+            page = int(url.rsplit('=', 1)[1])
+            if page == 2 and not failed:
+                failed.append(page)
+                raise requests.exceptions.ConnectionError("reset")
+            return self._page_response(page)
+        
+        mock_get.side_effect = side_effect
+        
+        data = collector.fetch_naver_finance_prices("487240", days=25)
+        
+        pages = [int(call.args[0].rsplit('=', 1)[1]) for call in mock_get.call_args_list]
+        assert pages == [1, 2, 2, 3]
+        assert len(data) == 25
+        assert collector.retry_budget.used == 1
+    
+    def test_get_latest_price_date(self, collector, db_session):
+        """저장된 최신 날짜 조회 테스트"""
+        db_session.add(Stock(ticker="WM001", name="워터마크", type="STOCK"))
+        db_session.commit()
+        db_session.add_all([
+            Price(ticker="WM001", date=date(2025, 10, 20), timestamp=datetime.now(), current_price=Decimal("100")),
+            Price(ticker="WM001", date=date(2025, 10, 22), timestamp=datetime.now(), current_price=Decimal("100")),
+        ])
+        db_session.commit()
+        
+        assert collector.get_latest_price_date(db_session, "WM001") == date(2025, 10, 22)
+        assert collector.get_latest_price_date(db_session, "NONE001") is None
+    
+    @patch('app.utils.http_client.HttpClient.get')
+    def test_collect_and_save_prices_incremental(self, mock_get, collector, db_session):
+        """증분 수집 시 새 행만 저장 테스트"""
+        db_session.add(Stock(ticker="WM002", name="증분 수집", type="STOCK"))
+        db_session.commit()
+        db_session.add(
+            Price(ticker="WM002", date=date(2025, 10, 26), timestamp=datetime.now(), current_price=Decimal("100"))
+        )
+        db_session.commit()
+        mock_get.side_effect = lambda url, **kwargs: self._page_response(int(url.rsplit('=', 1)[1]))
+        
+        saved_count = collector.collect_and_save_prices(
+            db_session, "WM002", days=10, incremental=True, source="html"
+        )
+        
+        assert saved_count == 2
+        assert mock_get.call_count == 1
+        assert db_session.query(Price).filter(Price.ticker == "WM002").count() == 3
+    
+    @patch('app.utils.http_client.HttpClient.get')
+    def test_collect_and_save_prices_full_resync(self, mock_get, collector, db_session):
+        """전체 재동기화 시 저장된 날짜와 무관하게 수집 테스트"""
+        db_session.add(Stock(ticker="WM003", name="전체 재동기화", type="STOCK"))
+        db_session.commit()
+        db_session.add(
+            Price(ticker="WM003", date=date(2025, 10, 26), timestamp=datetime.now(), current_price=Decimal("100"))
+        )
+        db_session.commit()
+        mock_get.side_effect = lambda url, **kwargs: self._page_response(int(url.rsplit('=', 1)[1]))
+        
+        saved_count = collector.collect_and_save_prices(
+            db_session, "WM003", days=10, incremental=False, source="html"
+        )
+        
+        assert saved_count == 10
+
+
+class TestFinanceCollectorChartSource:
+    """FinanceCollector fchart 일괄 조회 테스트"""
+    
+    CHART_XML = """<?xml version="1.0" encoding="EUC-KR" ?>
+<protocol>
+<chartdata symbol="487240" name="테스트" count="4" timeframe="day" precision="0" origintime="20240101">
+<item data="20251104|24800|25000|24700|25000|900000" />
+<item data="20251105|25000|25100|24600|24845|950000" />
+<item data="20251106|24900|25000|24800|24845|950000" />
+<item data="20251107|25700|25765|25000|25050|1036539" />
+</chartdata>
+</protocol>"""
+    
+    @pytest.fixture
+    def collector(self):
+        """수집기 픽스처"""
+        return FinanceCollector()
+    
+    @staticmethod
+    def _response(text):
+        mock_response = Mock()
+        mock_response.text = text
+        mock_response.raise_for_status = Mock()
+        return mock_response
+    
+    @patch('app.utils.http_client.HttpClient.get')
+    def test_fetch_chart_prices(self, mock_get, collector):
+        """일괄 조회 응답 파싱 테스트 (1회 요청, 최신순)"""
+        mock_get.return_value = self._response(self.CHART_XML)
+        
+        data = collector.fetch_naver_chart_prices("487240", days=3)
+        
+        assert mock_get.call_count == 1
+        assert "count=4" in mock_get.call_args[0][0]
+        assert [row['date'] for row in data] == [date(2025, 11, 7), date(2025, 11, 6), date(2025, 11, 5)]
+        latest = data[0]
+        assert latest['current_price'] == 25050.0
+        assert latest['open_price'] == 25700.0
+        assert latest['volume'] == 1036539.0
+        assert latest['previous_close'] == 24845.0
+        assert latest['change_amount'] == 205.0
+        assert latest['change_rate'] == 0.83
+        assert data[1]['change_rate'] == 0.0
+    
+    @patch('app.utils.http_client.HttpClient.get')
+    def test_fetch_chart_prices_since(self, mock_get, collector):
+        """증분 수집 기준 날짜 적용 테스트"""
+        mock_get.return_value = self._response(self.CHART_XML)
+        
+        data = collector.fetch_naver_chart_prices("487240", days=3, since=date(2025, 11, 6))
+        
+        assert [row['date'] for row in data] == [date(2025, 11, 7)]
+    
+    def test_chart_and_html_rows_match(self, collector):
+        """같은 거래일의 chart 행과 HTML 행이 같은 값 테스트"""
+        html_content = """
+        <table class="type2">
+            <tr><td>2025.11.07</td><td>25,050</td><td>상승205</td><td>25,700</td><td>25,765</td><td>25,000</td><td>1,036,539</td></tr>
+        </table>
+        """
+        
+        chart_row = collector._parse_chart_data(self.CHART_XML, "487240")[0]
+        html_row = collector._parse_price_page(html_content, "487240")[0]
+        
+        chart_row.pop('timestamp')
+        html_row.pop('timestamp')
+        assert html_row == chart_row
+        assert html_row['previous_close'] == 24845.0
+    
+    @patch('app.utils.http_client.HttpClient.get')
+    def test_fetch_prices_falls_back_to_html(self, mock_get, collector):
+        """일괄 조회 실패 시 HTML 페이지 순회로 대체 테스트"""
+        html_content = """
+        <table class="type2">
+            <tr><td>2025.11.07</td><td>25,050</td><td>상승205</td><td>25,700</td><td>25,765</td><td>25,000</td><td>1,036,539</td></tr>
+        </table>
+        """
+        mock_get.side_effect = lambda url, **kwargs: self._response(
+            "<protocol></protocol>" if "sise.nhn" in url else html_content
+        )
+        
+        data = collector.fetch_prices("487240", days=1, source="chart")
+        
+        assert len(data) == 1
+        assert data[0]['date'] == date(2025, 11, 7)
+        requested = [call[0][0] for call in mock_get.call_args_list]
+        assert "sise.nhn" in requested[0]
+        assert "sise_day.naver" in requested[1]
+    
+    @patch('app.utils.http_client.HttpClient.get')
+    def test_collect_and_save_prices_chart(self, mock_get, collector, db_session):
+        """일괄 조회 데이터 저장 테스트"""
+        db_session.add(Stock(ticker="CHART001", name="차트 수집", type="STOCK"))
+        db_session.commit()
+        mock_get.return_value = self._response(self.CHART_XML.replace('487240', 'CHART001'))
+        
+        saved_count = collector.collect_and_save_prices(db_session, "CHART001", days=3, source="chart")
+        
+        assert saved_count == 3
+        saved = db_session.query(Price).filter(
+            Price.ticker == "CHART001", Price.date == date(2025, 11, 7)
+        ).first()
+        assert float(saved.previous_close) == 24845.0
@@ -0,0 +1,105 @@
+"""
+공유 HTTP 클라이언트 테스트
+"""
+
+import pytest
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from app.utils.http_client import HttpClient, get_http_client, close_http_client
+
+
+class _KeepAliveHandler(BaseHTTPRequestHandler):
+    """Keep-Alive를 지원하는 테스트용 핸들러"""
+
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):
+        body = b"<html><body>ok</body></html>"
+        self.send_response(200)
+        self.send_header("Content-Type", "text/html")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture
+def local_server():
+    """로컬 HTTP 서버 픽스처"""
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _KeepAliveHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        yield f"http://127.0.0.1:{server.server_address[1]}"
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+class TestHttpClient:
+    """HttpClient 테스트"""
+
+    def test_default_headers(self):
+        """기본 헤더 (압축 협상, Keep-Alive) 테스트"""
+        client = HttpClient()
+
+        assert 'gzip' in client.session.headers['Accept-Encoding']
+        assert client.session.headers['Connection'] == 'keep-alive'
+        assert 'User-Agent' in client.session.headers
+        client.close()
+
+    def test_connection_reuse_stats(self, local_server):
+        """같은 호스트에 대한 연결 재사용 통계 테스트"""
+        client = HttpClient(pool_connections=2, pool_maxsize=2)
+
+        for page in range(1, 4):
+            response = client.get(f"{local_server}/item/sise_day.naver?page={page}")
+            assert response.status_code == 200
+
+        stats = client.get_stats()['127.0.0.1']
+        assert stats['requests'] == 3
+        assert stats['new_connections'] == 1
+        assert stats['reused_connections'] == 2
+        assert stats['latency_seconds'] >= 0
+        assert stats['avg_latency_ms'] >= 0
+        client.close()
+
+    def test_response_listener(self, local_server):
+        """응답 관찰 콜백에 상태 코드와 지연, 요청 실패 전달 테스트"""
+        client = HttpClient()
+        observed = []
+        client.add_response_listener(lambda *args: observed.append(args))
+
+        client.get(local_server)
+        with pytest.raises(Exception):
+            client.get("http://127.0.0.1:1/", timeout=1)
+
+        host, status, latency, error = observed[0]
+        assert (host, status, error) == ("127.0.0.1", 200, None)
+        assert latency > 0
+        assert observed[1][1] is None and observed[1][3] is not None
+        assert client.get_stats()['127.0.0.1']['latency_seconds'] > 0
+        client.close()
+
+    def test_reset_stats(self, local_server):
+        """통계 초기화 테스트"""
+        client = HttpClient()
+        client.get(local_server)
+
+        client.reset_stats()
+
+        assert client.get_stats() == {}
+        client.close()
+
+    def test_get_http_client_singleton(self):
+        """싱글톤 패턴 테스트"""
+        close_http_client()
+
+        client1 = get_http_client()
+        client2 = get_http_client()
+
+        assert client1 is client2
+        close_http_client()
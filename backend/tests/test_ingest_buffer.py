@@ -0,0 +1,245 @@
+"""
+write-behind 수집 데이터 버퍼 테스트
+"""
+
+import threading
+import pytest
+from datetime import date, datetime
+from unittest.mock import Mock, patch
+
+from sqlalchemy.orm import sessionmaker
+
+from app.collectors.finance_collector import FinanceCollector, DATA_TYPE_PRICES, DATA_TYPE_TRADING
+from app.models.stock import Stock
+from app.models.price import Price
+from app.models.trading_trend import TradingTrend
+from app.scheduler.coordination import LeadershipLostError
+from app.scheduler.data_scheduler import DataScheduler
+from app.utils.ingest_buffer import IngestBuffer
+from app.utils.run_stats import RunStats, run_stats_scope
+from app.utils.upsert import UpsertResult
+
+
+def _price_row(ticker: str, day: int) -> dict:
+    return {
+        'ticker': ticker,
+        'date': date(2025, 10, day),
+        'timestamp': datetime(2025, 10, day, 16),
+        'current_price': 25050.0,
+        'high_price': 25500.0,
+        'low_price': 24500.0,
+        'volume': 1000,
+    }
+
+
+@pytest.fixture
+def stocks(db_session):
+    """종목 픽스처 (외래 키)"""
+    db_session.add_all([Stock(ticker=f"BUF00{i}", name=f"버퍼 {i}", type="STOCK") for i in range(3)])
+    db_session.commit()
+
+
+@pytest.fixture
+def session_factory(db_session):
+    """writer 스레드용 세션 팩토리 (테스트 엔진 공유)"""
+    return sessionmaker(bind=db_session.get_bind())
+
+
+@pytest.fixture
+def make_buffer(session_factory):
+    """버퍼 생성 픽스처 (테스트 종료 시 close)"""
+    buffers = []
+
+    def factory(**kwargs):
+        collector = FinanceCollector()
+        writers = kwargs.pop('writers', {DATA_TYPE_PRICES: collector.write_price_data})
+        buffer = IngestBuffer(session_factory, writers, **kwargs)
+        buffer.start()
+        buffers.append(buffer)
+        return buffer
+
+    yield factory
+    for buffer in buffers:
+        buffer.close(timeout=5)
+
+
+class TestIngestBuffer:
+    """IngestBuffer 테스트"""
+
+    def test_batches_tickers_into_one_transaction(self, make_buffer, stocks, db_session):
+        """여러 종목의 행을 한 트랜잭션으로 저장 테스트"""
+        buffer = make_buffer(max_batch_rows=1000, max_age=60)
+        callback = Mock()
+
+        for i in range(3):
+            buffer.submit(DATA_TYPE_PRICES, [_price_row(f"BUF00{i}", day) for day in (1, 2)], callback=callback)
+        assert buffer.flush(timeout=5)
+
+        stats = buffer.get_stats()
+        assert stats['transactions'] == 1
+        assert stats['inserted'] == 6
+        assert stats['pending_rows'] == 0
+        assert callback.call_count == 3
+        callback.assert_called_with(True)
+        assert db_session.query(Price).count() == 6
+
+    def test_flush_by_size(self, make_buffer, stocks, db_session):
+        """대기 행 수가 max_batch_rows에 도달하면 flush 없이 저장 테스트"""
+        buffer = make_buffer(max_batch_rows=2, max_age=60)
+        done = threading.Event()
+
+        buffer.submit(DATA_TYPE_PRICES, [_price_row("BUF000", 1), _price_row("BUF000", 2)],
+                      callback=lambda ok: done.set())
+
+        assert done.wait(timeout=5)
+        assert db_session.query(Price).count() == 2
+
+    def test_flush_by_age(self, make_buffer, stocks):
+        """가장 오래된 행이 max_age를 넘으면 저장 테스트"""
+        buffer = make_buffer(max_batch_rows=1000, max_age=0.05)
+        done = threading.Event()
+
+        buffer.submit(DATA_TYPE_PRICES, [_price_row("BUF000", 1)], callback=lambda ok: done.set())
+
+        assert done.wait(timeout=5)
+        assert buffer.get_stats()['transactions'] == 1
+
+    def test_backpressure_blocks_submit(self, make_buffer):
+        """저장이 느리면 대기 행 상한에서 submit이 블록 테스트"""
+        release = threading.Event()
+
+        def slow_writer(db, rows):
+            release.wait(timeout=5)
+            return UpsertResult(inserted=len(rows))
+
+        buffer = make_buffer(writers={'rows': slow_writer}, max_batch_rows=1, max_pending_rows=2,
+                             submit_timeout=0.1)
+        buffer.submit('rows', [{}, {}])  # writer가 가져가 저장 중 (in-flight)
+
+        with pytest.raises(TimeoutError):
+            buffer.submit('rows', [{}])
+
+        release.set()
+        assert buffer.flush(timeout=5)
+        buffer.submit('rows', [{}])
+        assert buffer.flush(timeout=5)
+        stats = buffer.get_stats()
+        assert stats['backpressure_waits'] == 1
+        assert stats['submitted_rows'] == 3
+
+    def test_failed_submission_is_isolated(self, make_buffer, stocks, db_session):
+        """한 종목의 저장 실패가 다른 종목 저장을 막지 않음 테스트"""
+        buffer = make_buffer(max_batch_rows=1000, max_age=60)
+        results = {}
+
+        buffer.submit(DATA_TYPE_PRICES, [_price_row("BUF000", 1)], callback=lambda ok: results.update(good=ok))
+        # 존재하지 않는 종목 (외래 키 위반)
+        buffer.submit(DATA_TYPE_PRICES, [_price_row("MISSING", 1)], callback=lambda ok: results.update(bad=ok))
+        assert buffer.flush(timeout=5)
+
+        assert results == {'good': True, 'bad': False}
+        assert buffer.get_stats()['failed_submissions'] == 1
+        assert db_session.query(Price).count() == 1
+
+    def test_close_flushes_pending_rows(self, session_factory, stocks, db_session):
+        """종료 시 남은 행 저장 테스트"""
+        buffer = IngestBuffer(session_factory, {DATA_TYPE_PRICES: FinanceCollector().write_price_data},
+                              max_batch_rows=1000, max_age=60)
+        buffer.start()
+        buffer.submit(DATA_TYPE_PRICES, [_price_row("BUF000", 1)])
+
+        buffer.close(timeout=5)
+
+        assert not buffer.is_running
+        assert db_session.query(Price).count() == 1
+        with pytest.raises(RuntimeError):
+            buffer.submit(DATA_TYPE_PRICES, [_price_row("BUF000", 2)])
+
+    def test_before_commit_rejects_transaction(self, make_buffer, stocks, db_session):
+        """커밋 직전 확인이 실패하면 저장하지 않음 테스트 (리더 락을 잃은 경우)"""
+        before_commit = Mock(side_effect=RuntimeError("leadership lost"))
+        buffer = make_buffer(max_batch_rows=1000, max_age=60, before_commit=before_commit)
+        results = []
+
+        buffer.submit(DATA_TYPE_PRICES, [_price_row("BUF000", 1)], callback=results.append)
+        assert buffer.flush(timeout=5)
+
+        assert results == [False]
+        before_commit.assert_called_once()
+        assert db_session.query(Price).count() == 0
+
+    def test_fatal_error_fails_batch_without_replay(self, make_buffer, stocks, db_session):
+        """fatal_errors 예외는 제출 단위로 다시 저장하지 않고 배치 전체를 실패 처리 테스트"""
+        before_commit = Mock(side_effect=LeadershipLostError("leadership lost"))
+        buffer = make_buffer(max_batch_rows=1000, max_age=60, before_commit=before_commit,
+                             fatal_errors=(LeadershipLostError,))
+        results = []
+
+        for ticker in ("BUF000", "BUF001", "BUF002"):
+            buffer.submit(DATA_TYPE_PRICES, [_price_row(ticker, 1)], callback=results.append)
+        assert buffer.flush(timeout=5)
+
+        assert results == [False, False, False]
+        before_commit.assert_called_once()
+        assert buffer.get_stats()['failed_submissions'] == 3
+        assert db_session.query(Price).count() == 0
+
+    def test_unchanged_rows_counted_per_run(self, make_buffer, stocks):
+        """한 트랜잭션에 섞인 제출도 수집 실행별로 변경 없는 행 수 집계 테스트"""
+        buffer = make_buffer(max_batch_rows=1000, max_age=60)
+        buffer.submit(DATA_TYPE_PRICES, [_price_row("BUF000", 1)])
+        assert buffer.flush(timeout=5)
+        first_run, second_run = RunStats(), RunStats()
+
+        with run_stats_scope(first_run):
+            buffer.submit(DATA_TYPE_PRICES, [_price_row("BUF000", 1)])
+        with run_stats_scope(second_run):
+            buffer.submit(DATA_TYPE_PRICES, [_price_row("BUF001", 1)])
+        assert buffer.flush(timeout=5)
+
+        assert first_run.get('unchanged_rows') == 1
+        assert second_run.get('unchanged_rows') == 0
+        assert buffer.get_stats()['transactions'] == 2
+
+    def test_unknown_kind(self, make_buffer):
+        """등록되지 않은 데이터 유형 테스트"""
+        with pytest.raises(ValueError):
+            make_buffer().submit('unknown', [{}])
+
+
+class TestSchedulerIngestBuffer:
+    """스케줄러 버퍼 저장 테스트"""
+
+    def test_prefetched_data_saved_through_buffer(self, session_factory, stocks, db_session):
+        """비동기 엔진 수집 결과를 버퍼로 저장하고 페이지 지문 확정 테스트"""
+        scheduler = DataScheduler()
+        finance_collector = FinanceCollector()
+        scheduler.ingest_buffer = IngestBuffer(session_factory, {
+            DATA_TYPE_PRICES: finance_collector.write_price_data,
+            DATA_TYPE_TRADING: finance_collector.write_trading_flow_data,
+            'news': Mock(return_value=UpsertResult()),
+        }, max_batch_rows=1000, max_age=60)
+        scheduler.ingest_buffer.start()
+        scheduler.page_tracker = Mock()
+        fetched = {
+            'prices': [_price_row("BUF001", 1)],
+            'trading': [{'ticker': "BUF001", 'date': date(2025, 10, 1), 'timestamp': datetime.now(),
+                         'individual': 1, 'institution': -1, 'foreign_investor': 0, 'total': 0}],
+            'news': [],
+        }
+
+        try:
+            with patch('app.scheduler.data_scheduler.FinanceCollector.save_price_data') as mock_save:
+                result = scheduler._save_prefetched_data("BUF001", fetched, db_session)
+                assert scheduler.ingest_buffer.flush(timeout=5)
+            mock_save.assert_not_called()
+        finally:
+            scheduler.ingest_buffer.close(timeout=5)
+
+        assert result['prices_count'] == 1
+        assert result['trading_count'] == 1
+        assert db_session.query(Price).count() == 1
+        assert db_session.query(TradingTrend).count() == 1
+        committed = {call.args[0] for call in scheduler.page_tracker.commit.call_args_list}
+        # 가격은 소스(chart/sise_day)와 관계없이 두 엔드포인트의 지문을 함께 확정
+        assert committed == {"chart", "sise_day", "frgn", "news"}
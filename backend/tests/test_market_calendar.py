@@ -0,0 +1,207 @@
+"""
+KRX 거래 일정 및 장 시간 기반 수집 주기 테스트
+"""
+
+import pytest
+import requests
+from datetime import date, datetime, timedelta
+from unittest.mock import Mock, patch
+from zoneinfo import ZoneInfo
+
+from app.collectors.finance_collector import DATA_TYPE_PRICES, DATA_TYPE_TRADING
+from app.collectors.news_collector import DATA_TYPE_NEWS
+from app.scheduler.collection_policy import CollectionPolicy
+from app.scheduler.data_scheduler import DataScheduler
+from app.utils.market_calendar import (
+    DEFAULT_CALENDAR_PATH,
+    MarketCalendar,
+    PHASE_CLOSED,
+    PHASE_OPEN,
+    PHASE_POST_CLOSE,
+    PHASE_PRE_OPEN,
+)
+
+KST = ZoneInfo("Asia/Seoul")
+
+
+def kst(*args) -> datetime:
+    return datetime(*args, tzinfo=KST)
+
+
+@pytest.fixture
+def calendar():
+    return MarketCalendar.from_file(DEFAULT_CALENDAR_PATH)
+
+
+@pytest.fixture
+def policy(calendar):
+    return CollectionPolicy(
+        calendar,
+        price_interval=30,
+        price_final_delay=300,
+        trading_final_delay=1800,
+        news_interval_open=300,
+        news_interval_closed=1800,
+    )
+
+
+class TestMarketCalendar:
+    """MarketCalendar 테스트"""
+
+    @pytest.mark.parametrize("day,expected", [
+        (date(2025, 11, 14), True),   # 금요일
+        (date(2025, 11, 15), False),  # 토요일
+        (date(2025, 10, 7), False),   # 추석 연휴
+        (date(2025, 12, 31), False),  # 연말 휴장일
+        (date(2026, 2, 17), False),   # 설날
+    ])
+    def test_is_trading_day(self, calendar, day, expected):
+        """주말/휴장일 판별 테스트"""
+        assert calendar.is_trading_day(day) is expected
+
+    @pytest.mark.parametrize("moment,expected", [
+        (kst(2025, 11, 14, 8, 59), PHASE_PRE_OPEN),
+        (kst(2025, 11, 14, 9, 0), PHASE_OPEN),
+        (kst(2025, 11, 14, 15, 29), PHASE_OPEN),
+        (kst(2025, 11, 14, 15, 30), PHASE_POST_CLOSE),
+        (kst(2025, 11, 15, 12, 0), PHASE_CLOSED),
+    ])
+    def test_phase(self, calendar, moment, expected):
+        """장 구분 테스트"""
+        assert calendar.phase(moment) == expected
+
+    def test_special_session(self, calendar):
+        """수능일은 10:00 개장, 16:30 마감 테스트"""
+        assert calendar.phase(kst(2025, 11, 13, 9, 30)) == PHASE_PRE_OPEN
+        assert calendar.phase(kst(2025, 11, 13, 16, 0)) == PHASE_OPEN
+
+    def test_timezone_conversion(self, calendar):
+        """UTC 시각은 KST로 변환 후 판별 테스트"""
+        assert calendar.phase(datetime(2025, 11, 14, 1, 0, tzinfo=ZoneInfo("UTC"))) == PHASE_OPEN
+
+    def test_last_close_skips_holidays(self, calendar):
+        """연휴 중 직전 장 마감은 연휴 전 거래일 테스트"""
+        assert calendar.last_close(kst(2025, 10, 8, 12, 0)) == kst(2025, 10, 2, 15, 30)
+        assert calendar.next_open(kst(2025, 10, 8, 12, 0)) == kst(2025, 10, 10, 9, 0)
+
+    def test_uncovered_year_warns_once(self, calendar):
+        """데이터가 없는 연도는 주말만 휴장으로 간주하고 한 번만 경고 테스트"""
+        with patch('app.utils.market_calendar.logger') as mock_logger:
+            assert calendar.is_trading_day(date(2030, 1, 1))
+            assert not calendar.is_trading_day(date(2030, 1, 5))
+
+        mock_logger.warning.assert_called_once()
+
+
+class TestCollectionPolicy:
+    """CollectionPolicy 테스트"""
+
+    def test_first_run_collects_everything(self, policy):
+        """처음 실행은 장 구분과 관계없이 모두 수집 테스트"""
+        assert policy.due_data_types(kst(2025, 11, 15, 3, 0)) == [DATA_TYPE_PRICES, DATA_TYPE_TRADING, DATA_TYPE_NEWS]
+
+    def test_intraday_cadence(self, policy):
+        """정규장에는 가격을 매 주기, 뉴스는 5분마다, 매매동향은 수집하지 않음 테스트"""
+        start = kst(2025, 11, 14, 10, 0)
+        policy.mark_collected([DATA_TYPE_PRICES, DATA_TYPE_TRADING, DATA_TYPE_NEWS], start)
+
+        assert policy.due_data_types(start + timedelta(seconds=30)) == [DATA_TYPE_PRICES]
+        assert policy.due_data_types(start + timedelta(minutes=5)) == [DATA_TYPE_PRICES, DATA_TYPE_NEWS]
+
+    def test_after_close_final_collections(self, policy):
+        """장 마감 후 종가와 매매동향을 확정 시점에 한 번씩 수집 테스트"""
+        policy.mark_collected([DATA_TYPE_PRICES, DATA_TYPE_TRADING, DATA_TYPE_NEWS], kst(2025, 11, 14, 15, 29, 45))
+
+        assert policy.due_data_types(kst(2025, 11, 14, 15, 32)) == []
+        assert policy.due_data_types(kst(2025, 11, 14, 15, 35)) == [DATA_TYPE_PRICES]
+        policy.mark_collected([DATA_TYPE_PRICES], kst(2025, 11, 14, 15, 35))
+        assert policy.due_data_types(kst(2025, 11, 14, 15, 40)) == []
+        assert DATA_TYPE_TRADING in policy.due_data_types(kst(2025, 11, 14, 16, 0))
+
+    def test_weekend_only_news(self, policy):
+        """주말에는 뉴스만 30분 간격으로 수집 테스트"""
+        policy.mark_collected([DATA_TYPE_PRICES, DATA_TYPE_TRADING, DATA_TYPE_NEWS], kst(2025, 11, 14, 16, 0))
+
+        assert policy.due_data_types(kst(2025, 11, 15, 12, 0)) == [DATA_TYPE_NEWS]
+        policy.mark_collected([DATA_TYPE_NEWS], kst(2025, 11, 15, 12, 0))
+        assert policy.due_data_types(kst(2025, 11, 15, 12, 10)) == []
+
+    def test_unknown_data_type(self, policy):
+        """알 수 없는 데이터 유형 테스트"""
+        with pytest.raises(ValueError):
+            policy.is_due("unknown", kst(2025, 11, 14, 10, 0))
+
+    def test_requests_reduced_over_week(self, policy):
+        """30초 간격으로 일주일 실행 시 수집 횟수가 20% 미만으로 줄어드는지 테스트"""
+        moment = kst(2025, 11, 10, 0, 0)  # 월요일
+        end = moment + timedelta(days=7)
+        runs = 0
+        collections = 0
+        while moment < end:
+            data_types = policy.due_data_types(moment)
+            policy.mark_collected(data_types, moment)
+            runs += 1
+            collections += len(data_types)
+            moment += timedelta(seconds=30)
+
+        # 매 실행마다 세 유형을 모두 수집하던 방식 대비
+        assert collections < runs * 3 * 0.2
+
+
+class TestSchedulerMarketCalendar:
+    """스케줄러 장 시간 기반 수집 테스트"""
+
+    @pytest.fixture
+    def scheduler(self, policy):
+        scheduler = DataScheduler()
+        scheduler.collection_policy = policy
+        return scheduler
+
+    def test_skips_when_nothing_due(self, scheduler, policy):
+        """수집할 데이터 유형이 없으면 실행을 건너뜀 테스트"""
+        now = kst(2025, 11, 15, 12, 0)
+        policy.mark_collected([DATA_TYPE_PRICES, DATA_TYPE_TRADING, DATA_TYPE_NEWS], now)
+
+        with patch.object(policy.calendar, 'now', return_value=now + timedelta(minutes=1)), \
+                patch('app.scheduler.data_scheduler.SessionLocal') as mock_session_local:
+            scheduler._collect_all_data()
+
+        mock_session_local.assert_not_called()
+        assert scheduler.last_run_status == "skipped"
+        assert scheduler.get_status()['market']['phase'] == PHASE_CLOSED
+
+    def test_collects_only_due_types(self, scheduler, policy):
+        """장 중에는 가격만 수집하고 수집 시각 기록 테스트"""
+        start = kst(2025, 11, 14, 10, 0)
+        policy.mark_collected([DATA_TYPE_PRICES, DATA_TYPE_TRADING, DATA_TYPE_NEWS], start)
+        collect = Mock(return_value={'ticker': "CAL001", 'prices_count': 1, 'trading_count': 0,
+                                     'news_count': 0, 'unchanged_rows': 0, 'errors': []})
+
+        with patch.object(policy.calendar, 'now', return_value=start + timedelta(seconds=30)), \
+                patch('app.scheduler.data_scheduler.SessionLocal', side_effect=lambda: Mock()), \
+                patch.object(scheduler, '_get_all_tickers', return_value=["CAL001"]), \
+                patch.object(scheduler, '_collect_data_for_ticker', collect):
+            scheduler._collect_all_data()
+
+        assert collect.call_args.args[2] == [DATA_TYPE_PRICES]
+        assert scheduler.last_run_status == "success"
+        assert policy.get_status(start + timedelta(seconds=30))['last_collected'][DATA_TYPE_PRICES] == \
+            (start + timedelta(seconds=30)).isoformat()
+
+    @patch('app.utils.retry.time.sleep')
+    @patch('app.utils.http_client.HttpClient.get')
+    def test_failed_type_stays_due(self, mock_get, mock_sleep, scheduler, policy):
+        """모든 종목의 요청이 실패하면 수집 완료로 기록하지 않아 다음 실행에서도 수집 대상 테스트"""
+        mock_get.side_effect = requests.exceptions.ConnectionError("upstream down")
+        now = kst(2025, 11, 15, 12, 0)
+        policy.mark_collected([DATA_TYPE_PRICES, DATA_TYPE_TRADING, DATA_TYPE_NEWS], now - timedelta(hours=1))
+        assert policy.is_due(DATA_TYPE_NEWS, now)
+
+        with patch.object(policy.calendar, 'now', return_value=now), \
+                patch('app.scheduler.data_scheduler.SessionLocal', side_effect=lambda: Mock()), \
+                patch.object(scheduler, '_get_all_tickers', return_value=["CAL001", "CAL002"]):
+            scheduler._collect_all_data([DATA_TYPE_NEWS])
+
+        assert mock_get.called
+        assert policy.is_due(DATA_TYPE_NEWS, now + timedelta(seconds=1))
+        assert policy.get_status(now)['last_collected'][DATA_TYPE_NEWS] == (now - timedelta(hours=1)).isoformat()
@@ -142,7 +142,7 @@ class TestNewsCollectorFetch:
         """수집기 픽스처"""
         return NewsCollector()
     
-    @patch('app.collectors.news_collector.requests.get')
+    @patch('app.utils.http_client.HttpClient.get')
     def test_fetch_naver_news_success(self, mock_get, collector):
         """뉴스 데이터 수집 성공 테스트"""
         # Mock HTML 응답
@@ -178,7 +178,7 @@ class TestNewsCollectorFetch:
         assert data[0]['url'].startswith("https://finance.naver.com")
         assert data[0]['id'] is not None
     
-    @patch('app.collectors.news_collector.requests.get')
+    @patch('app.utils.http_client.HttpClient.get')
     def test_fetch_naver_news_table_format(self, mock_get, collector):
         """테이블 형식 뉴스 리스트 테스트"""
         html_content = """
@@ -204,7 +204,7 @@ class TestNewsCollectorFetch:
         assert len(data) >= 1
         assert data[0]['ticker'] == "487240"
     
-    @patch('app.collectors.news_collector.requests.get')
+    @patch('app.utils.http_client.HttpClient.get')
     def test_fetch_naver_news_no_list_found(self, mock_get, collector):
         """뉴스 리스트를 찾을 수 없는 경우 테스트"""
         mock_response = Mock()
@@ -216,7 +216,7 @@ class TestNewsCollectorFetch:
         
         assert len(data) == 0
     
-    @patch('app.collectors.news_collector.requests.get')
+    @patch('app.utils.http_client.HttpClient.get')
     def test_fetch_naver_news_network_error(self, mock_get, collector):
         """네트워크 오류 테스트"""
         import requests
@@ -227,7 +227,7 @@ class TestNewsCollectorFetch:
         # 재시도 후에도 실패하면 빈 리스트 반환
         assert len(data) == 0
     
-    @patch('app.collectors.news_collector.requests.get')
+    @patch('app.utils.http_client.HttpClient.get')
     def test_fetch_naver_news_max_items_limit(self, mock_get, collector):
         """최대 개수 제한 테스트"""
         # 여러 페이지의 뉴스 데이터 생성
@@ -421,7 +421,7 @@ class TestNewsCollectorIntegration:
         """수집기 픽스처"""
         return NewsCollector()
     
-    @patch('app.collectors.news_collector.requests.get')
+    @patch('app.utils.http_client.HttpClient.get')
     def test_collect_and_save_news_integration(self, mock_get, collector, db_session):
         """뉴스 데이터 수집 및 저장 통합 테스트"""
         # 종목 생성
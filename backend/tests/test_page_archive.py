@@ -0,0 +1,146 @@
+"""
+원본 페이지 아카이브 및 replay 테스트
+"""
+
+import pytest
+from datetime import date, datetime
+from pathlib import Path
+from unittest.mock import Mock, patch
+
+from app.collectors.finance_collector import FinanceCollector
+from app.collectors.news_collector import NewsCollector
+from app.models.stock import Stock
+from app.models.price import Price
+from app.models.trading_trend import TradingTrend
+from app.models.news import News
+from app.utils.page_archive import CODEC_ZLIB, PageArchive
+
+FIXTURES_DIR = Path(__file__).parent / "fixtures"
+
+
+def _load(name: str) -> str:
+    return (FIXTURES_DIR / name).read_text(encoding="utf-8")
+
+
+@pytest.fixture
+def archive(tmp_path):
+    """임시 디렉토리 아카이브 픽스처"""
+    archive = PageArchive(tmp_path / "archive")
+    yield archive
+    archive.close()
+
+
+class TestPageArchive:
+    """PageArchive 테스트"""
+
+    def test_store_and_read(self, archive):
+        """저장 후 읽기 테스트"""
+        html = _load("sise_day.html")
+        archive.store("487240", "sise_day", 1, "https://finance.naver.com/item/sise_day.naver", html)
+
+        entries = archive.entries("sise_day", ticker="487240")
+
+        assert len(entries) == 1
+        assert entries[0].page == 1
+        assert archive.read(entries[0]) == html
+        stats = archive.get_stats()
+        assert stats['stored_bytes'] < stats['raw_bytes']
+
+    def test_consecutive_duplicates_are_skipped(self, archive):
+        """직전과 같은 본문은 인덱스에 추가하지 않음 테스트"""
+        archive.store("487240", "news", 1, None, "a")
+        archive.store("487240", "news", 1, None, "a")
+        archive.store("487240", "news", 1, None, "b")
+        archive.store("487240", "news", 1, None, "a")
+
+        assert [archive.read(entry) for entry in archive.entries("news")] == ["a", "b", "a"]
+        # 같은 본문은 한 번만 저장
+        assert archive.get_stats()['objects'] == 2
+
+    def test_entries_filter_by_time(self, archive):
+        """수집 시각 범위 조회 테스트"""
+        archive.store("A", "frgn", 1, None, "old", fetched_at=datetime(2025, 1, 1))
+        archive.store("A", "frgn", 1, None, "new", fetched_at=datetime(2025, 6, 1))
+        archive.store("B", "frgn", 1, None, "other", fetched_at=datetime(2025, 6, 1))
+
+        entries = archive.entries("frgn", ticker="A", start=datetime(2025, 3, 1))
+
+        assert [archive.read(entry) for entry in entries] == ["new"]
+        assert archive.tickers("frgn") == ["A", "B"]
+
+    def test_index_persists_across_instances(self, tmp_path):
+        """아카이브 재오픈 테스트"""
+        first = PageArchive(tmp_path / "archive")
+        first.store("487240", "sise_day", 1, None, "body")
+        first.close()
+
+        reopened = PageArchive(tmp_path / "archive")
+        reopened.store("487240", "sise_day", 1, None, "body")
+
+        assert len(reopened.entries("sise_day")) == 1
+        reopened.close()
+
+    @patch('app.utils.page_archive.zstandard', None)
+    def test_zlib_fallback(self, tmp_path):
+        """zstandard 미설치 시 zlib 압축 테스트"""
+        archive = PageArchive(tmp_path / "archive")
+        archive.store("487240", "news", 1, None, "뉴스 본문")
+
+        entry = archive.entries("news")[0]
+        assert entry.codec == CODEC_ZLIB
+        assert archive.read(entry) == "뉴스 본문"
+        archive.close()
+
+
+class TestCollectorArchiveReplay:
+    """수집기 아카이브 저장 및 replay 테스트"""
+
+    @patch('app.utils.http_client.HttpClient.get')
+    def test_fetch_archives_pages(self, mock_get, archive):
+        """수집 시 원본 페이지 저장 테스트"""
+        mock_response = Mock()
+        mock_response.text = _load("sise_day.html")
+        mock_response.raise_for_status = Mock()
+        mock_get.return_value = mock_response
+        collector = FinanceCollector(archive=archive)
+
+        collector.fetch_naver_finance_prices("487240", days=5)
+
+        entries = archive.entries("sise_day", ticker="487240")
+        assert len(entries) == 1
+        assert entries[0].url.endswith("code=487240&page=1")
+
+    def test_replay_rebuilds_all_data(self, archive, db_session):
+        """아카이브에서 가격/매매동향/뉴스 재구성 테스트"""
+        db_session.add(Stock(ticker="487240", name="KODEX AI전력핵심설비", type="ETF"))
+        db_session.commit()
+        archive.store("487240", "sise_day", 1, None, _load("sise_day.html"), fetched_at=datetime(2025, 10, 28, 16))
+        archive.store("487240", "frgn", 1, None, _load("frgn.html"), fetched_at=datetime(2025, 10, 28, 16))
+        archive.store("487240", "news", 1, None, _load("news.html"), fetched_at=datetime(2025, 10, 28, 16))
+
+        finance_collector = FinanceCollector(archive=archive)
+        news_collector = NewsCollector(archive=archive)
+
+        with patch('app.utils.http_client.HttpClient.get') as mock_get:
+            assert finance_collector.replay_prices(db_session, archive, "487240") == 5
+            assert finance_collector.replay_trading_flow(db_session, archive, "487240") == 4
+            assert news_collector.replay_news(db_session, archive, "487240") == 4
+            mock_get.assert_not_called()
+
+        price = db_session.query(Price).filter(Price.date == date(2025, 10, 28)).first()
+        assert price.timestamp == datetime(2025, 10, 28, 16)
+        assert db_session.query(TradingTrend).count() == 4
+        assert db_session.query(News).count() == 4
+
+    def test_replay_latest_fetch_wins(self, archive, db_session):
+        """같은 날짜는 나중에 수집한 페이지 값 사용 테스트"""
+        db_session.add(Stock(ticker="487240", name="KODEX AI전력핵심설비", type="ETF"))
+        db_session.commit()
+        intraday = _load("sise_day.html").replace("25,050", "25,080", 1)
+        archive.store("487240", "sise_day", 1, None, intraday, fetched_at=datetime(2025, 10, 28, 10))
+        archive.store("487240", "sise_day", 1, None, _load("sise_day.html"), fetched_at=datetime(2025, 10, 28, 16))
+
+        FinanceCollector(archive=archive).replay_prices(db_session, archive, "487240")
+
+        price = db_session.query(Price).filter(Price.date == date(2025, 10, 28)).first()
+        assert float(price.current_price) == 25050.0
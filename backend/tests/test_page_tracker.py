@@ -0,0 +1,196 @@
+"""
+페이지 변경 추적 테스트
+"""
+
+import pytest
+from unittest.mock import Mock, patch
+
+from app.collectors.finance_collector import FinanceCollector
+from app.collectors.news_collector import NewsCollector
+from app.models.stock import Stock
+from app.models.price import Price
+from app.utils.page_tracker import PageChangeTracker
+from app.utils.run_stats import RunStats, run_stats_scope
+
+
+def _response(text: str, status_code: int = 200, headers: dict = None):
+    """HttpClient.get 응답 모킹"""
+    response = Mock()
+    response.text = text
+    response.status_code = status_code
+    response.headers = headers or {}
+    response.raise_for_status = Mock()
+    return response
+
+
+def _price_page(day: int = 28, price: str = "25,050") -> str:
+    """sise_day 테스트 페이지 (10행)"""
+    rows = "".join(
+        f"<tr><td>2025.10.{day - i:02d}</td><td>{price}</td><td>상승205</td>"
+        f"<td>25,000</td><td>25,100</td><td>24,900</td><td>1,000</td></tr>"
+        for i in range(10)
+    )
+    return f'<html><body><table class="type2">{rows}</table></body></html>'
+
+
+@pytest.fixture
+def tracker():
+    """메모리 전용 추적기 픽스처"""
+    return PageChangeTracker(use_redis=False)
+
+
+class TestPageChangeTracker:
+    """PageChangeTracker 테스트"""
+
+    def test_unchanged_after_commit(self, tracker):
+        """확정된 본문과 같은 페이지 테스트"""
+        assert tracker.check("sise_day", "487240", 1, "<html>a</html>") is False
+        tracker.commit("sise_day", "487240")
+
+        assert tracker.check("sise_day", "487240", 1, "<html>a</html>") is True
+        assert tracker.check("sise_day", "487240", 1, "<html>b</html>") is False
+        assert tracker.get_stats()['sise_day'] == {'checked': 3, 'unchanged': 1, 'not_modified': 0}
+
+    def test_discard_keeps_previous_fingerprint(self, tracker):
+        """저장 실패 시 이전 지문 유지 테스트"""
+        tracker.check("news", "487240", 1, "old")
+        tracker.commit("news", "487240")
+
+        tracker.check("news", "487240", 1, "new")
+        tracker.discard("news", "487240")
+
+        assert tracker.check("news", "487240", 1, "new") is False
+        assert tracker.check("news", "487240", 1, "old") is True
+
+    def test_unchanged_pages_counted_per_run(self, tracker):
+        """현재 실행 통계에만 그 실행의 변경 없는 페이지 수를 더함 테스트"""
+        tracker.check("news", "487240", 1, "body")
+        tracker.commit("news", "487240")
+        first_run, second_run = RunStats(), RunStats()
+
+        with run_stats_scope(first_run):
+            tracker.check("news", "487240", 1, "body")
+            tracker.is_unchanged("news", "487240", 2, _response("", status_code=304))
+        with run_stats_scope(second_run):
+            tracker.check("news", "487240", 1, "changed")
+
+        assert first_run.get('unchanged_pages') == 2
+        assert second_run.get('unchanged_pages') == 0
+        assert tracker.get_stats()['news']['unchanged'] == 2
+
+    def test_keys_are_per_ticker_and_page(self, tracker):
+        """종목·페이지별 지문 분리 테스트"""
+        tracker.check("frgn", "A", 1, "body")
+        tracker.commit("frgn", "A")
+
+        assert tracker.check("frgn", "B", 1, "body") is False
+        assert tracker.check("frgn", "A", 2, "body") is False
+
+    def test_conditional_get_headers(self, tracker):
+        """ETag/Last-Modified 조건부 GET 헤더 테스트"""
+        response = _response("body", headers={'ETag': '"abc"', 'Last-Modified': 'Tue, 28 Oct 2025 06:00:00 GMT'})
+        tracker.is_unchanged("chart", "487240", 1, response)
+        tracker.commit("chart", "487240")
+
+        headers = tracker.request_headers("chart", "487240", 1, {'User-Agent': 'test'})
+
+        assert headers['User-Agent'] == 'test'
+        assert headers['If-None-Match'] == '"abc"'
+        assert headers['If-Modified-Since'] == 'Tue, 28 Oct 2025 06:00:00 GMT'
+
+    def test_not_modified_response(self, tracker):
+        """304 응답 테스트"""
+        assert tracker.is_unchanged("chart", "487240", 1, _response("", status_code=304)) is True
+        assert tracker.get_stats()['chart']['not_modified'] == 1
+
+    def test_redis_store(self):
+        """Redis 저장소 테스트"""
+        store = {}
+        with patch('app.utils.page_tracker.set_cache', side_effect=lambda k, v, ttl: store.__setitem__(k, v)), \
+                patch('app.utils.page_tracker.get_cache', side_effect=store.get):
+            PageChangeTracker().check("news", "487240", 1, "body")
+            writer = PageChangeTracker()
+            writer.check("news", "487240", 1, "body")
+            writer.commit("news", "487240")
+
+            # 재시작한 프로세스에서도 이전 지문 사용
+            assert PageChangeTracker().check("news", "487240", 1, "body") is True
+
+
+class TestCollectorPageSkip:
+    """수집기 페이지 변경 생략 테스트"""
+
+    @patch('app.utils.http_client.HttpClient.get')
+    def test_unchanged_price_page_skips_save(self, mock_get, tracker, db_session):
+        """같은 sise_day 페이지 재수집 시 저장 생략 테스트"""
+        db_session.add(Stock(ticker="HASH001", name="해시", type="STOCK"))
+        db_session.commit()
+        mock_get.return_value = _response(_price_page())
+        collector = FinanceCollector(page_tracker=tracker)
+
+        assert collector.collect_and_save_prices(db_session, "HASH001", days=10, source="html") == 10
+
+        with patch.object(collector, 'save_price_data') as mock_save, \
+                patch.object(collector, '_parse_price_page') as mock_parse:
+            assert collector.collect_and_save_prices(db_session, "HASH001", days=10, source="html") == 0
+            mock_parse.assert_not_called()
+            mock_save.assert_not_called()
+
+        assert tracker.get_stats()['sise_day']['unchanged'] == 1
+
+    @patch('app.utils.http_client.HttpClient.get')
+    def test_changed_price_page_is_saved(self, mock_get, tracker, db_session):
+        """바뀐 페이지는 다시 저장 테스트"""
+        db_session.add(Stock(ticker="HASH002", name="해시", type="STOCK"))
+        db_session.commit()
+        collector = FinanceCollector(page_tracker=tracker)
+
+        mock_get.return_value = _response(_price_page(price="25,050"))
+        collector.collect_and_save_prices(db_session, "HASH002", days=10, source="html")
+        mock_get.return_value = _response(_price_page(price="25,080"))
+        collector.collect_and_save_prices(db_session, "HASH002", days=10, source="html")
+
+        latest = db_session.query(Price).filter(Price.ticker == "HASH002").order_by(Price.date.desc()).first()
+        assert float(latest.current_price) == 25080.0
+
+    @patch('app.utils.http_client.HttpClient.get')
+    def test_unchanged_chart_skips_html_fallback(self, mock_get, tracker, db_session):
+        """같은 chart 응답 재수집 시 HTML 대체 없이 저장 생략 테스트 ("데이터 없음"과 구분)"""
+        db_session.add(Stock(ticker="HASH004", name="해시", type="STOCK"))
+        db_session.commit()
+        chart = "".join(f'<item data="202510{day:02d}|25000|25100|24900|25050|1000" />' for day in range(20, 24))
+        mock_get.return_value = _response(f"<protocol><chartdata>{chart}</chartdata></protocol>")
+        collector = FinanceCollector(page_tracker=tracker)
+
+        assert collector.collect_and_save_prices(db_session, "HASH004", days=3, source="chart") == 3
+
+        mock_get.reset_mock()
+        with patch.object(collector, 'save_price_data') as mock_save:
+            assert collector.collect_and_save_prices(db_session, "HASH004", days=3, source="chart") == 0
+            mock_save.assert_not_called()
+
+        requested = [call[0][0] for call in mock_get.call_args_list]
+        assert len(requested) == 1 and "sise.nhn" in requested[0]
+        assert tracker.get_stats()['chart']['unchanged'] == 1
+
+    @patch('app.utils.http_client.HttpClient.get')
+    def test_failed_save_does_not_commit(self, mock_get, tracker, db_session):
+        """저장 실패 시 다음 수집에서 다시 처리 테스트"""
+        mock_get.return_value = _response(_price_page())
+        collector = FinanceCollector(page_tracker=tracker)
+
+        with patch.object(collector, 'save_price_data', return_value=0):
+            collector.collect_and_save_prices(db_session, "HASH003", days=10, source="html")
+
+        assert collector.fetch_naver_finance_prices("HASH003", days=10) != []
+
+    @patch('app.utils.http_client.HttpClient.get')
+    def test_unchanged_news_page(self, mock_get, tracker, db_session):
+        """같은 뉴스 페이지 재수집 시 생략 테스트"""
+        html = "<div class='news_area'><tr><td><a href='/item/news_read.naver?article_id=1'>뉴스</a></td></tr></div>"
+        mock_get.return_value = _response(html)
+        collector = NewsCollector(page_tracker=tracker)
+
+        collector.finish_pages("487240", success=bool(collector.fetch_naver_news("487240", max_items=1)))
+
+        assert collector.fetch_naver_news("487240", max_items=1) == []
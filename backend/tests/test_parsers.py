@@ -0,0 +1,111 @@
+"""
+HTML 파서 백엔드 테스트
+
+저장된 Naver Finance 페이지(tests/fixtures)를 각 백엔드로 파싱하여
+수집기가 만드는 행 데이터가 동일한지 확인합니다.
+"""
+
+import pytest
+from datetime import date
+from pathlib import Path
+from unittest.mock import patch
+
+from app.collectors.finance_collector import FinanceCollector
+from app.collectors.news_collector import NewsCollector
+from app.collectors.parsers import BeautifulSoupParser, LxmlParser, get_parser
+
+FIXTURES_DIR = Path(__file__).parent / "fixtures"
+
+PARSERS = [BeautifulSoupParser(), LxmlParser()]
+
+
+def _load(name: str) -> str:
+    return (FIXTURES_DIR / name).read_text(encoding="utf-8")
+
+
+def _without_timestamp(rows):
+    """수집 시각(timestamp)은 호출마다 달라지므로 비교에서 제외"""
+    return [{k: v for k, v in row.items() if k != 'timestamp'} for row in rows]
+
+
+class TestParserParity:
+    """백엔드 간 파싱 결과 일치 테스트"""
+
+    def test_price_rows_parity(self):
+        """sise_day 가격 데이터 일치 테스트"""
+        html = _load("sise_day.html")
+        results = [
+            _without_timestamp(FinanceCollector(parser=parser)._parse_price_page(html, "487240"))
+            for parser in PARSERS
+        ]
+
+        assert results[0] == results[1]
+        assert len(results[0]) == 5
+        assert results[0][0]['date'] == date(2025, 10, 28)
+        assert results[0][0]['current_price'] == 25050.0
+        assert results[0][0]['volume'] == 1234567.0
+        assert results[0][1]['change_rate'] < 0
+
+    def test_trading_rows_parity(self):
+        """frgn 매매동향 데이터 일치 테스트"""
+        html = _load("frgn.html")
+        results = [
+            _without_timestamp(FinanceCollector(parser=parser)._parse_trading_flow_page(html, "487240"))
+            for parser in PARSERS
+        ]
+
+        assert results[0] == results[1]
+        assert len(results[0]) == 4
+        assert results[0][0]['institution'] == 12345
+        assert results[0][0]['foreign_investor'] == -5678
+
+    def test_news_items_parity(self):
+        """뉴스 목록 데이터 일치 테스트"""
+        html = _load("news.html")
+        results = [
+            _without_timestamp(NewsCollector(parser=parser)._parse_news_page(html, "487240"))
+            for parser in PARSERS
+        ]
+
+        assert results[0] == results[1]
+        assert len(results[0]) == 4
+        assert results[0][1]['title'] == "전력 인프라 투자 확대… 관련 ETF강세"
+        assert results[0][2]['url'].startswith("https://finance.naver.com/item/news_read.naver")
+
+    @pytest.mark.parametrize("parser", PARSERS, ids=lambda p: p.name)
+    def test_missing_table_returns_none(self, parser):
+        """대상 요소가 없는 페이지 테스트"""
+        html = "<html><body><p>점검 중입니다</p></body></html>"
+
+        assert parser.price_rows(html) is None
+        assert parser.trading_rows(html) is None
+        assert parser.news_items(html) is None
+
+    @pytest.mark.parametrize("parser", PARSERS, ids=lambda p: p.name)
+    def test_empty_document_returns_none(self, parser):
+        """빈 응답 본문 테스트"""
+        assert parser.price_rows("") is None
+        assert parser.news_items("   ") is None
+
+
+class TestGetParser:
+    """get_parser 테스트"""
+
+    def test_default_backend(self):
+        """기본 백엔드 (lxml) 테스트"""
+        assert isinstance(get_parser(), LxmlParser)
+        assert get_parser() is get_parser()
+
+    def test_bs4_backend(self):
+        """bs4 백엔드 선택 테스트"""
+        assert isinstance(get_parser("bs4"), BeautifulSoupParser)
+
+    def test_unknown_backend(self):
+        """알 수 없는 백엔드 테스트"""
+        with pytest.raises(ValueError):
+            get_parser("html5lib")
+
+    @patch('app.collectors.parsers.lxml_html', None)
+    def test_fallback_without_lxml(self):
+        """lxml 미설치 시 bs4 대체 테스트"""
+        assert isinstance(get_parser("lxml"), BeautifulSoupParser)
@@ -0,0 +1,300 @@
+"""
+Rate Limiter 테스트
+"""
+
+import asyncio
+import math
+import threading
+from unittest.mock import patch
+
+import pytest
+import redis
+
+from app.utils.rate_limiter import (
+    RATE_LIMIT_BACKEND_REDIS,
+    TOKEN_BUCKET_SCRIPT,
+    AimdController,
+    AsyncRateLimiter,
+    RateLimiter,
+    TokenBucket,
+    host_of,
+)
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 100.0
+
+    def __call__(self):
+        return self.now
+
+
+class FakeRedis:
+    """토큰 버킷 스크립트를 파이썬으로 실행하는 테스트용 Redis"""
+
+    def __init__(self, clock):
+        self.clock = clock
+        self.hashes = {}
+        self.calls = []
+
+    def eval(self, script, numkeys, key, rate, capacity, requested, ttl_ms):
+        assert script == TOKEN_BUCKET_SCRIPT and numkeys == 1
+        self.calls.append((key, rate, capacity, ttl_ms))
+        now = self.clock()
+        tokens, ts = self.hashes.get(key, (capacity, now))
+        tokens = min(capacity, tokens + max(0, now - ts) * rate) - requested
+        self.hashes[key] = (tokens, now)
+        return 0 if tokens >= 0 else math.ceil(-tokens / rate * 1_000_000)
+
+
+class TestTokenBucket:
+    """TokenBucket 테스트"""
+
+    def test_burst_then_reserve_in_order(self):
+        """용량만큼 바로 허용하고, 이후 요청은 도착 순서대로 뒤 슬롯 예약 테스트"""
+        clock = FakeClock()
+        bucket = TokenBucket(rate=10.0, capacity=3, clock=clock)
+
+        assert [bucket.reserve() for _ in range(3)] == [0.0, 0.0, 0.0]
+        assert bucket.reserve() == pytest.approx(0.1)
+        assert bucket.reserve() == pytest.approx(0.2)
+
+        clock.now += 1.0
+        assert bucket.reserve() == 0.0
+
+    def test_unlimited(self):
+        """rate가 0이면 대기하지 않음 테스트"""
+        bucket = TokenBucket(rate=0.0, capacity=1)
+        assert [bucket.reserve() for _ in range(5)] == [0.0] * 5
+
+
+class TestRateLimiter:
+    """RateLimiter 테스트"""
+
+    def test_per_host_buckets(self):
+        """호스트마다 별도 버킷 테스트"""
+        limiter = RateLimiter(min_interval=1.0, burst=1)
+
+        with patch('app.utils.rate_limiter.time.sleep') as sleep:
+            limiter.wait_if_needed("finance.naver.com")
+            limiter.wait_if_needed("fchart.stock.naver.com")
+            sleep.assert_not_called()
+
+            limiter.wait_if_needed("finance.naver.com")
+            assert sleep.call_count == 1
+
+        stats = limiter.get_stats()
+        assert stats['total_requests'] == 3
+        assert stats['hosts']['finance.naver.com']['requests'] == 2
+        assert stats['hosts']['fchart.stock.naver.com']['requests'] == 1
+
+    def test_no_sleep_under_lock(self):
+        """대기 중인 스레드가 있어도 다른 스레드는 잠금에 막히지 않고 예약 테스트"""
+        limiter = RateLimiter(min_interval=10.0, burst=1)
+        limiter.wait_if_needed("host")
+        sleeping = threading.Event()
+        release = threading.Event()
+
+        def blocking_sleep(seconds):
+            sleeping.set()
+            release.wait(5)
+
+        with patch('app.utils.rate_limiter.time.sleep', side_effect=blocking_sleep):
+            waiter = threading.Thread(target=limiter.wait_if_needed, args=("host",))
+            waiter.start()
+            assert sleeping.wait(5)
+
+            # 첫 대기 스레드가 자는 동안 다음 슬롯을 바로 예약
+            assert limiter._reserve("host") == pytest.approx(20.0, abs=0.5)
+            assert limiter.get_stats()['total_requests'] == 1
+            release.set()
+            waiter.join(5)
+
+    def test_max_concurrent(self):
+        """동시 요청 수 제한 테스트"""
+        limiter = RateLimiter(min_interval=0, max_concurrent=1)
+        entered = threading.Event()
+
+        with limiter.limit("host"):
+            thread = threading.Thread(target=lambda: (limiter.acquire("host"), entered.set(), limiter.release()))
+            thread.start()
+            assert not entered.wait(0.1)
+            assert limiter.get_stats()['current_concurrent'] == 1
+        thread.join(5)
+        assert entered.is_set()
+        assert limiter.get_stats()['current_concurrent'] == 0
+
+    def test_default_budget_matches_legacy_interval(self):
+        """기본 설정은 기존 0.5초 간격(초당 2회, burst 1)이고 AIMD도 그보다 올리지 않음 테스트"""
+        limiter = RateLimiter.from_settings()
+
+        assert (limiter.rate, limiter.burst) == (2.0, 1)
+        for _ in range(20):
+            limiter.record_response("host", 200, 0.1)
+        assert limiter.host_rate("host") <= 2.0
+
+    def test_host_of(self):
+        """URL 호스트 추출 테스트"""
+        assert host_of("https://finance.naver.com/item/sise_day.naver?code=1&page=2") == "finance.naver.com"
+
+
+class TestAimdController:
+    """AIMD 속도 조절 테스트"""
+
+    def make_controller(self, clock):
+        return AimdController(
+            initial_rate=4.0, min_rate=1.0, max_rate=5.0, increase_step=0.5,
+            decrease_factor=0.5, latency_target=2.0, cooldown=1.0, clock=clock,
+        )
+
+    def test_additive_increase_up_to_max(self):
+        """약 1초 분량의 정상 응답마다 increase_step씩 올리고 max_rate에서 멈춤 테스트"""
+        controller = self.make_controller(FakeClock())
+
+        assert [controller.observe("host", 200, 0.1) for _ in range(4)] == [None, None, None, 4.5]
+        for _ in range(20):
+            controller.observe("host", 200, 0.1)
+        assert controller.rate("host") == 5.0
+
+    def test_multiplicative_decrease_with_cooldown(self):
+        """429/5xx·실패·느린 응답에 비율만큼 낮추고, cooldown 안에서는 한 번만 낮춤 테스트"""
+        clock = FakeClock()
+        controller = self.make_controller(clock)
+
+        assert controller.observe("host", 429, 0.1) == 2.0
+        assert controller.observe("host", 503, 0.1) is None
+        clock.now += 1.5
+        assert controller.observe("host", None, 0.0, TimeoutError()) == 1.0
+        clock.now += 1.5
+        assert controller.observe("host", 200, 3.0) is None  # 이미 min_rate
+        assert controller.observe("other", 404, 0.1) is None
+
+        stats = controller.get_stats()
+        assert stats['hosts']['host'] == {'rate': 1.0, 'increases': 0, 'decreases': 2}
+        assert [d['reason'] for d in stats['decisions']] == ["status 429", "error TimeoutError"]
+
+    def test_limiter_applies_new_rate(self):
+        """RateLimiter가 조절된 속도를 호스트 버킷에 적용하고 통계에 노출 테스트"""
+        controller = self.make_controller(FakeClock())
+        limiter = RateLimiter(min_interval=0.25, burst=1, controller=controller)
+        limiter.wait_if_needed("host")
+
+        limiter.record_response("host", 429, 0.1)
+
+        assert limiter._buckets["host"].rate == 2.0
+        assert limiter._reserve("host") == pytest.approx(0.5, abs=0.05)
+        stats = limiter.get_stats()
+        assert stats['adaptive']['hosts']['host']['rate'] == 2.0
+        assert stats['adaptive']['decisions'][0]['action'] == "decrease"
+
+
+class TestAsyncRateLimiter:
+    """AsyncRateLimiter 테스트"""
+
+    async def test_shares_buckets_and_stats(self):
+        """동기 RateLimiter와 같은 버킷·통계를 쓰고 asyncio.sleep으로 대기 테스트"""
+        limiter = RateLimiter(min_interval=1.0, burst=1)
+        async_limiter = AsyncRateLimiter(limiter)
+        limiter.wait_if_needed("host")
+
+        with patch('app.utils.rate_limiter.asyncio.sleep') as sleep:
+            async with async_limiter.limit("host"):
+                assert limiter.get_stats()['current_concurrent'] == 1
+        sleep.assert_awaited_once()
+        assert sleep.await_args.args[0] == pytest.approx(1.0, abs=0.05)
+
+        stats = async_limiter.get_stats()
+        assert stats['hosts']['host']['requests'] == 2
+        assert stats['current_concurrent'] == 0
+
+    async def test_does_not_block_event_loop(self):
+        """대기하는 동안 다른 코루틴이 실행 테스트"""
+        async_limiter = AsyncRateLimiter(RateLimiter(min_interval=0.2, burst=1))
+        ticks = []
+
+        async def ticker():
+            for _ in range(3):
+                ticks.append(1)
+                await asyncio.sleep(0.01)
+
+        async def limited():
+            for _ in range(2):
+                async with async_limiter:
+                    pass
+
+        await asyncio.gather(limited(), ticker())
+        assert len(ticks) == 3
+        assert async_limiter.get_stats()['total_wait_time'] > 0
+
+
+class TestRedisRateLimiter:
+    """redis 백엔드 테스트"""
+
+    def test_shared_bucket_across_limiters(self):
+        """같은 Redis를 쓰는 제한기(프로세스)끼리 버킷 공유 테스트"""
+        fake = FakeRedis(FakeClock())
+        worker_a = RateLimiter(min_interval=0.5, burst=2, backend=RATE_LIMIT_BACKEND_REDIS, client=fake)
+        worker_b = RateLimiter(min_interval=0.5, burst=2, backend=RATE_LIMIT_BACKEND_REDIS, client=fake)
+
+        assert worker_a._reserve("finance.naver.com") == 0.0
+        assert worker_b._reserve("finance.naver.com") == 0.0
+        assert worker_a._reserve("finance.naver.com") == pytest.approx(0.5)
+        assert worker_b._reserve("finance.naver.com") == pytest.approx(1.0)
+        assert fake.calls[0][0] == "rate_limit:finance.naver.com"
+
+    def test_falls_back_to_local_bucket(self):
+        """Redis에 접근할 수 없으면 프로세스 내 버킷 사용 테스트"""
+        fake = FakeRedis(FakeClock())
+        limiter = RateLimiter(min_interval=0.5, burst=1, backend=RATE_LIMIT_BACKEND_REDIS, client=fake)
+
+        with patch.object(fake, 'eval', side_effect=redis.ConnectionError("down")):
+            assert limiter._reserve("host") == 0.0
+            assert limiter._reserve("host") > 0
+
+        assert limiter.get_stats()['redis_fallbacks'] == 2
+        assert limiter._reserve("host") == 0.0
+
+    def test_redis_retried_after_interval(self):
+        """Redis 실패 후 retry 간격 동안은 Redis에 요청하지 않음 테스트"""
+        fake = FakeRedis(FakeClock())
+        limiter = RateLimiter(
+            min_interval=0.5, burst=1, backend=RATE_LIMIT_BACKEND_REDIS, client=fake, redis_retry_interval=30.0
+        )
+
+        with patch('app.utils.rate_limiter.time.monotonic', return_value=1000.0), \
+                patch.object(fake, 'eval', side_effect=redis.ConnectionError("down")) as failing:
+            limiter._reserve("host")
+            limiter._reserve("host")
+        assert failing.call_count == 1
+
+        with patch('app.utils.rate_limiter.time.monotonic', return_value=1031.0):
+            assert limiter._reserve("host") == 0.0
+        assert fake.calls
+        assert limiter.get_stats()['redis_fallbacks'] == 2
+
+
+class TestParentRateLimiter:
+    """상위 예산(parent) 테스트"""
+
+    def test_sub_limit_takes_parent_tokens(self):
+        """하위 제한기의 요청도 상위 예산의 같은 호스트 토큰을 사용 테스트"""
+        parent = RateLimiter(min_interval=0.0)
+        limiter = RateLimiter(min_interval=0.0, parent=parent)
+
+        with limiter.limit("finance.naver.com"):
+            pass
+
+        assert parent.get_stats()['hosts']['finance.naver.com']['requests'] == 1
+        assert limiter.get_stats()['hosts']['finance.naver.com']['requests'] == 1
+
+    def test_waits_for_slower_of_both_limits(self):
+        """상위 예산이 막혀 있으면 하위 제한에 여유가 있어도 대기 테스트"""
+        parent = RateLimiter(min_interval=0.5, burst=1)
+        parent._reserve("host")
+        limiter = RateLimiter(min_interval=0.0, parent=parent)
+
+        with patch('app.utils.rate_limiter.time.sleep') as sleep:
+            waited = limiter.wait_if_needed("host")
+
+        assert waited == pytest.approx(0.5, abs=0.05)
+        sleep.assert_called_once()
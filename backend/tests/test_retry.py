@@ -0,0 +1,167 @@
+"""
+재시도 데코레이터 테스트
+"""
+
+from unittest.mock import Mock, patch
+
+import pytest
+import requests
+
+from app.utils.deadline import Deadline, DeadlineExceeded, deadline_scope
+from app.utils.retry import (
+    RetryBudget,
+    async_retry_with_backoff,
+    backoff_delay,
+    get_retry_stats,
+    request_with_retry,
+    reset_retry_stats,
+    retry_with_backoff,
+)
+
+
+@pytest.fixture(autouse=True)
+def clean_stats():
+    reset_retry_stats()
+    yield
+    reset_retry_stats()
+
+
+class TestBackoffDelay:
+    """대기 시간 계산 테스트"""
+
+    def test_exponential_with_cap(self):
+        """지수 증가와 max_delay 상한 테스트"""
+        assert [backoff_delay(n, 1.0, 5.0) for n in range(1, 5)] == [1.0, 2.0, 4.0, 5.0]
+
+    def test_full_jitter(self):
+        """jitter는 0 ~ 지수 대기 시간 범위 테스트"""
+        delays = [backoff_delay(3, 1.0, 10.0, jitter=True) for _ in range(50)]
+        assert all(0 <= delay <= 4.0 for delay in delays)
+        assert len(set(delays)) > 1
+
+
+class TestRetryDecorators:
+    """동기/비동기 재시도 데코레이터 테스트"""
+
+    def test_sync_retry_records_stats(self):
+        """동기 재시도 후 성공과 통계 기록 테스트"""
+        calls = []
+
+        @retry_with_backoff(max_retries=2, base_delay=1.0, exceptions=(ValueError,))
+        def flaky():
+            calls.append(1)
+            if len(calls) < 3:
+                raise ValueError("boom")
+            return "ok"
+
+        with patch('app.utils.retry.time.sleep') as sleep:
+            assert flaky() == "ok"
+        assert [c.args[0] for c in sleep.call_args_list] == [1.0, 2.0]
+        assert get_retry_stats()['retries'] == 2
+
+    async def test_async_retry_shares_stats(self):
+        """비동기 재시도는 asyncio.sleep으로 대기하고 같은 통계에 기록 테스트"""
+        @async_retry_with_backoff(max_retries=1, base_delay=1.0, exceptions=(ValueError,))
+        async def always_fails():
+            raise ValueError("boom")
+
+        with patch('app.utils.retry.asyncio.sleep') as sleep:
+            with pytest.raises(ValueError):
+                await always_fails()
+        sleep.assert_awaited_once()
+        assert 0 <= sleep.await_args.args[0] <= 1.0
+
+        stats = get_retry_stats()
+        assert (stats['retries'], stats['failures']) == (1, 1)
+        name = always_fails.__qualname__
+        assert stats['functions'][name] == {'retries': 1, 'failures': 1, 'delay': stats['total_delay']}
+
+    def test_async_decorator_requires_coroutine(self):
+        """코루틴 함수가 아니면 TypeError 테스트"""
+        with pytest.raises(TypeError):
+            async_retry_with_backoff()(lambda: None)
+
+
+def http_error(status, retry_after=None):
+    response = Mock(status_code=status, headers={'Retry-After': retry_after} if retry_after else {})
+    return requests.exceptions.HTTPError(f"{status}", response=response)
+
+
+class FlakySend:
+    """정해진 예외를 차례로 던진 뒤 성공하는 요청"""
+
+    def __init__(self, *errors):
+        self.errors = list(errors)
+        self.calls = 0
+
+    def __call__(self):
+        self.calls += 1
+        if self.errors:
+            raise self.errors.pop(0)
+        return "ok"
+
+
+class TestRequestWithRetry:
+    """페이지 요청 단위 재시도 테스트"""
+
+    def test_retries_transient_errors_with_full_jitter(self):
+        """타임아웃/5xx는 0 ~ 지수 대기 시간 jitter로 재시도 테스트"""
+        send = FlakySend(requests.exceptions.Timeout("slow"), http_error(503))
+        sleeps = []
+
+        assert request_with_retry(send, "sise_day", max_retries=3, base_delay=1.0, max_delay=10.0,
+                                  sleep=sleeps.append) == "ok"
+        assert send.calls == 3
+        assert 0 <= sleeps[0] <= 1.0 and 0 <= sleeps[1] <= 2.0
+        assert get_retry_stats()['functions']['sise_day']['retries'] == 2
+
+    def test_honours_retry_after(self):
+        """Retry-After만큼 기다리고, 상한보다 길면 재시도하지 않음 테스트"""
+        sleeps = []
+        request_with_retry(FlakySend(http_error(429, "7")), "frgn", max_retry_after=60, sleep=sleeps.append)
+        assert sleeps == [7.0]
+
+        with pytest.raises(requests.exceptions.HTTPError):
+            request_with_retry(FlakySend(http_error(429, "120")), "frgn", max_retry_after=60, sleep=sleeps.append)
+        assert sleeps == [7.0]
+
+    def test_does_not_retry_client_errors(self):
+        """404 등은 바로 실패 테스트"""
+        send = FlakySend(http_error(404))
+        with pytest.raises(requests.exceptions.HTTPError):
+            request_with_retry(send, "news", sleep=lambda _: None)
+        assert send.calls == 1
+
+    def test_budget_shared_across_requests(self):
+        """실행 예산을 모두 쓰면 다음 요청은 재시도하지 않음 테스트"""
+        budget = RetryBudget(1)
+        request_with_retry(FlakySend(requests.exceptions.ConnectionError()), "news", budget=budget,
+                           sleep=lambda _: None)
+
+        with pytest.raises(requests.exceptions.ConnectionError):
+            request_with_retry(FlakySend(requests.exceptions.ConnectionError()), "news", budget=budget,
+                               sleep=lambda _: None)
+        assert (budget.used, budget.denied) == (1, 1)
+
+    def test_retry_wait_capped_by_deadline(self):
+        """Retry-After가 작업 마감까지 남은 시간보다 길면 기다리지 않음 테스트"""
+        sleeps = []
+        send = FlakySend(http_error(429, "30"))
+
+        with deadline_scope(Deadline(25.0)):
+            with pytest.raises(requests.exceptions.HTTPError):
+                request_with_retry(send, "frgn", max_retry_after=60, sleep=sleeps.append)
+
+        assert sleeps == [] and send.calls == 1
+
+    def test_cancelled_deadline_stops_before_request(self):
+        """취소된 작업은 요청을 보내지 않음 테스트"""
+        deadline = Deadline(25.0)
+        deadline.cancel()
+        send = FlakySend()
+
+        with deadline_scope(deadline):
+            with pytest.raises(DeadlineExceeded):
+                request_with_retry(send, "news", sleep=lambda _: None)
+
+        assert send.calls == 0
@@ -3,10 +3,14 @@ DataScheduler 단위 테스트
 """
 
 import pytest
+import time
 from unittest.mock import patch, Mock, MagicMock
 from datetime import datetime
 from apscheduler.schedulers.background import BackgroundScheduler
 
+from app.collectors.finance_collector import FinanceCollector
+from app.collectors.news_collector import NewsCollector
+from app.scheduler.coordination import LeadershipLostError
 from app.scheduler.data_scheduler import DataScheduler, get_scheduler
 from app.models.stock import Stock
 from app.models.price import Price
@@ -198,6 +202,131 @@ class TestDataSchedulerDataCollection:
         # 오류는 로그에 기록되지만 전체 상태는 성공
 
 
+class TestDataSchedulerWorkerPool:
+    """DataScheduler 종목별 병렬 수집 테스트"""
+    
+    TICKERS = [f"POOL{i:03d}" for i in range(50)]
+    
+    @staticmethod
+    def _fake_collect(delay: float, slow_ticker: str = None, slow_delay: float = 0.0):
+        """지연 후 성공 결과를 반환하는 종목 수집 함수"""
+        sessions = []
+        
+        def collect(ticker, db, data_types=None):
+            sessions.append(db)
+            time.sleep(slow_delay if ticker == slow_ticker else delay)
+            return {'ticker': ticker, 'prices_count': 1, 'trading_count': 1, 'news_count': 1,
+                    'unchanged_rows': 0, 'errors': []}
+        
+        return collect, sessions
+    
+    @patch('app.scheduler.data_scheduler.SessionLocal')
+    def test_tickers_run_concurrently_with_own_sessions(self, mock_session_local):
+        """50개 종목이 종목별 세션으로 동시에 수집되어 한 주기 안에 끝나는지 테스트"""
+        scheduler = DataScheduler(max_workers=10)
+        mock_session_local.side_effect = lambda: Mock()
+        collect, sessions = self._fake_collect(delay=0.05)
+        
+        with patch.object(scheduler, '_get_all_tickers', return_value=self.TICKERS), \
+                patch.object(scheduler, '_collect_data_for_ticker', side_effect=collect):
+            start = time.monotonic()
+            scheduler._collect_all_data()
+            elapsed = time.monotonic() - start
+        
+        # 순차 실행이면 2.5초
+        assert elapsed < 1.5
+        assert scheduler.last_run_status == "success"
+        assert scheduler.last_run_stats['total_prices'] == 50
+        assert len({id(db) for db in sessions}) == 50
+        for db in sessions:
+            db.commit.assert_called_once()
+            db.close.assert_called_once()
+    
+    @patch('app.scheduler.data_scheduler.SessionLocal')
+    def test_task_timeout(self, mock_session_local):
+        """타임아웃을 넘긴 종목은 실패로 기록하고 기다리지 않음 테스트"""
+        scheduler = DataScheduler(max_workers=4)
+        scheduler.task_timeout = 0.2
+        mock_session_local.side_effect = lambda: Mock()
+        collect, _ = self._fake_collect(delay=0.01, slow_ticker="POOL000", slow_delay=3.0)
+        
+        with patch.object(scheduler, '_collect_data_for_ticker', side_effect=collect):
+            start = time.monotonic()
+            results = scheduler._run_ticker_tasks(self.TICKERS[:8], None)
+            elapsed = time.monotonic() - start
+        
+        assert elapsed < 2.0
+        assert isinstance(results["POOL000"], TimeoutError)
+        assert sum(isinstance(result, dict) for result in results.values()) == 7
+    
+    @patch('app.scheduler.data_scheduler.SessionLocal')
+    def test_timed_out_task_does_not_commit(self, mock_session_local):
+        """타임아웃으로 포기한 종목이 백그라운드에서 끝나도 커밋하지 않음 테스트"""
+        scheduler = DataScheduler(max_workers=2)
+        scheduler.task_timeout = 0.2
+        session = Mock()
+        mock_session_local.return_value = session
+        collect, _ = self._fake_collect(delay=0.6)
+        
+        with patch.object(scheduler, '_collect_data_for_ticker', side_effect=collect):
+            results = scheduler._run_ticker_tasks(["POOL000"], None)
+            assert isinstance(results["POOL000"], TimeoutError)
+            time.sleep(0.8)  # 백그라운드 작업이 끝날 때까지 대기
+        
+        session.commit.assert_not_called()
+        session.rollback.assert_called_once()
+        session.close.assert_called_once()
+    
+    @patch('app.scheduler.data_scheduler.SessionLocal')
+    def test_task_exception_rolls_back(self, mock_session_local):
+        """종목 작업 예외 시 해당 세션만 롤백 테스트"""
+        scheduler = DataScheduler(max_workers=2)
+        sessions = {}
+        
+        def collect(ticker, db, data_types=None):
+            sessions[ticker] = db
+            if ticker == "POOL001":
+                raise RuntimeError("boom")
+            return {'ticker': ticker, 'prices_count': 1, 'trading_count': 0, 'news_count': 0,
+                    'unchanged_rows': 0, 'errors': []}
+        
+        mock_session_local.side_effect = lambda: Mock()
+        with patch.object(scheduler, '_collect_data_for_ticker', side_effect=collect):
+            results = scheduler._run_ticker_tasks(self.TICKERS[:3], None)
+        
+        assert isinstance(results["POOL001"], RuntimeError)
+        assert results["POOL000"]['prices_count'] == 1
+        sessions["POOL001"].rollback.assert_called_once()
+        sessions["POOL000"].rollback.assert_not_called()
+
+    
+    @pytest.mark.parametrize("prefetched", [False, True])
+    @patch('app.scheduler.data_scheduler.SessionLocal')
+    def test_lost_leadership_saves_no_rows(self, mock_session_local, prefetched, db_session):
+        """fencing 확인에 실패한 종목은 수집한 행을 하나도 저장하지 않음 테스트 (수집기가 따로 커밋하지 않음)"""
+        db_session.add(Stock(ticker="FENCE01", name="펜싱", type="STOCK"))
+        db_session.commit()
+        mock_session_local.return_value = db_session
+        html = (
+            '<table class="type2"><tr><td>2025.11.07</td><td>25,050</td><td>상승205</td>'
+            '<td>25,700</td><td>25,765</td><td>25,000</td><td>1,036,539</td></tr></table>'
+        )
+        prices = FinanceCollector()._parse_price_page(html, "FENCE01")
+        scheduler = DataScheduler(max_workers=1)
+        scheduler.ingest_buffer = None
+        scheduler.coordinator = Mock()
+        scheduler.coordinator.verify.side_effect = LeadershipLostError("fenced")
+        fetched = {"FENCE01": {'ticker': "FENCE01", 'prices': prices, 'trading': [], 'news': [], 'errors': []}}
+        
+        with patch.object(FinanceCollector, 'fetch_prices', return_value=prices), \
+                patch.object(FinanceCollector, 'fetch_naver_trading_flow', return_value=[]), \
+                patch.object(NewsCollector, 'fetch_naver_news', return_value=[]):
+            results = scheduler._run_ticker_tasks(["FENCE01"], fetched if prefetched else None)
+        
+        assert isinstance(results["FENCE01"], LeadershipLostError)
+        assert db_session.query(Price).filter(Price.ticker == "FENCE01").count() == 0
+
+
 class TestDataSchedulerControl:
     """DataScheduler 제어 메서드 테스트"""
     
@@ -282,10 +411,10 @@ class TestDataSchedulerControl:
         scheduler.stop()
     
     def test_get_status_after_run(self, scheduler):
-        """실행 후 상태 조회 테스트"""
-        scheduler.last_run_time = datetime(2025, 11, 14, 10, 0, 0)
-        scheduler.last_run_status = "success"
-        scheduler.last_run_error = None
+        """실행 후 상태 조회 테스트 (최상위 상태는 가장 최근에 실행한 job 기준)"""
+        scheduler.jobs['prices'].last_run_time = datetime(2025, 11, 14, 10, 0, 0)
+        scheduler.jobs['prices'].last_run_status = "success"
+        scheduler.jobs['prices'].last_run_error = None
         
         status = scheduler.get_status()
         
@@ -294,6 +423,189 @@ class TestDataSchedulerControl:
         assert status['last_run_error'] is None
 
 
+class TestDataSchedulerJobs:
+    """DataScheduler 데이터 유형별 job 테스트"""
+    
+    @pytest.fixture
+    def scheduler(self):
+        """스케줄러 픽스처"""
+        scheduler = DataScheduler(interval_seconds=45)
+        yield scheduler
+        scheduler.shutdown()
+    
+    def test_jobs_registered_with_own_intervals(self, scheduler):
+        """데이터 유형마다 별도 job과 간격으로 등록 테스트"""
+        scheduler.jobs['news'].interval_seconds = 900
+        scheduler.start()
+        
+        for data_type, interval in (('prices', 45), ('trading', 600), ('news', 900)):
+            job = scheduler.scheduler.get_job(f"{data_type}_collection_job")
+            assert job is not None
+            assert job.trigger.interval.total_seconds() == interval
+            assert job.args == (data_type,)
+    
+    def test_disabled_job_not_registered(self, scheduler):
+        """사용하지 않도록 설정한 job은 등록하지 않음 테스트"""
+        scheduler.jobs['trading'].enabled = False
+        scheduler.start()
+        
+        status = scheduler.get_status()
+        
+        assert scheduler.scheduler.get_job("trading_collection_job") is None
+        assert status['jobs']['trading']['enabled'] is False
+        assert status['jobs']['trading']['next_run_time'] is None
+        assert status['jobs']['prices']['next_run_time'] is not None
+        assert status['next_run_time'] == min(
+            job['next_run_time'] for job in status['jobs'].values() if job['next_run_time']
+        )
+    
+    def test_run_job_records_duration(self, scheduler):
+        """job 실행 시 해당 데이터 유형만 수집하고 소요 시간 기록 테스트"""
+        def collect_all(data_types):
+            time.sleep(0.05)
+            return {'status': "success", 'error': None, 'stats': {'total_news': 3}}
+        
+        with patch.object(scheduler, '_collect_all_data', side_effect=collect_all) as mock_collect:
+            scheduler._run_job('news')
+        
+        mock_collect.assert_called_once_with(['news'])
+        status = scheduler.get_status()['jobs']['news']
+        assert status['last_run_status'] == "success"
+        assert status['last_duration'] >= 0.05
+        assert status['last_run_stats'] == {'total_news': 3}
+        assert status['last_run_time'] is not None
+        assert scheduler.get_status()['jobs']['prices']['last_run_time'] is None
+    
+    @patch('app.scheduler.data_scheduler.SessionLocal')
+    def test_collect_all_data_single_type(self, mock_session_local, scheduler):
+        """데이터 유형을 지정하면 해당 유형만 수집 테스트"""
+        mock_session_local.side_effect = lambda: Mock()
+        collect = Mock(return_value={'ticker': "JOB001", 'prices_count': 0, 'trading_count': 2,
+                                     'news_count': 0, 'unchanged_rows': 0, 'errors': []})
+        
+        with patch.object(scheduler, '_get_all_tickers', return_value=["JOB001"]), \
+                patch.object(scheduler, '_collect_data_for_ticker', collect):
+            outcome = scheduler._collect_all_data(['trading'])
+        
+        assert collect.call_args.args[2] == ['trading']
+        assert outcome['status'] == "success"
+        assert outcome['stats']['total_trading'] == 2
+
+    
+    def test_concurrent_jobs_keep_own_status(self, scheduler):
+        """동시에 실행된 job이 서로의 실행 상태를 덮어쓰지 않음 테스트 (최상위 상태는 최근 job 기준)"""
+        outcomes = {
+            'prices': {'status': "success", 'error': None, 'stats': {'total_prices': 5}},
+            'news': {'status': "error", 'error': "news failed", 'stats': {}},
+        }
+        
+        with patch.object(scheduler, '_collect', side_effect=lambda data_types: outcomes[data_types[0]]):
+            scheduler._collect_all_data(['prices'])
+            time.sleep(0.01)
+            scheduler._collect_all_data(['news'])
+        
+        jobs = scheduler.get_jobs_status()
+        assert jobs['prices']['last_run_status'] == "success"
+        assert jobs['prices']['last_run_stats'] == {'total_prices': 5}
+        assert jobs['news']['last_run_status'] == "error"
+        assert jobs['trading']['last_run_status'] is None
+        assert scheduler.last_run_status == "error"
+        assert scheduler.last_run_error == "news failed"
+
+
+class TestDataSchedulerOverrun:
+    """DataScheduler 실행 겹침 방지 및 적응형 간격 테스트"""
+    
+    @pytest.fixture
+    def scheduler(self):
+        """스케줄러 픽스처"""
+        scheduler = DataScheduler(interval_seconds=30)
+        yield scheduler
+        scheduler.shutdown()
+    
+    @staticmethod
+    def _outcome(status="success"):
+        return {'status': status, 'error': None, 'stats': {}}
+    
+    def test_jobs_do_not_overlap(self, scheduler):
+        """job은 동시에 하나만 실행되고 밀린 실행은 합쳐짐 테스트"""
+        scheduler.start()
+        
+        job = scheduler.scheduler.get_job("prices_collection_job")
+        
+        assert job.max_instances == 1
+        assert job.coalesce is True
+    
+    def test_overrun_recorded(self, scheduler):
+        """실행 간격보다 오래 걸린 실행을 overrun으로 기록 테스트"""
+        scheduler.jobs['prices'].effective_interval = 0.01
+        
+        with patch.object(scheduler, '_collect_all_data', side_effect=lambda data_types: time.sleep(0.05) or self._outcome()):
+            scheduler._run_job('prices')
+        
+        status = scheduler.get_status()
+        assert status['jobs']['prices']['overruns'] == 1
+        assert len(status['jobs']['prices']['recent_durations']) == 1
+        assert status['overruns'] == 1
+    
+    def test_skipped_runs_not_in_history(self, scheduler):
+        """수집하지 않고 건너뛴 실행은 소요 시간 기록에서 제외 테스트"""
+        with patch.object(scheduler, '_collect_all_data', return_value=self._outcome("skipped")):
+            scheduler._run_job('news')
+        
+        assert scheduler.get_status()['jobs']['news']['recent_durations'] == []
+    
+    def test_max_instances_event_counted(self, scheduler):
+        """이전 실행이 끝나지 않아 건너뛴 실행 집계 테스트"""
+        from apscheduler.events import EVENT_JOB_MAX_INSTANCES
+        
+        scheduler._on_job_event(Mock(code=EVENT_JOB_MAX_INSTANCES, job_id="news_collection_job"))
+        
+        status = scheduler.get_status()
+        assert status['jobs']['news']['skipped_runs'] == 1
+        assert status['overruns'] == 1
+    
+    def test_adaptive_interval_stretches_and_shrinks(self, scheduler):
+        """실행 시간에 맞춰 간격을 늘렸다가 빨라지면 설정 간격으로 되돌림 테스트"""
+        scheduler.adaptive_interval = True
+        scheduler.start()
+        job = scheduler.jobs['prices']
+        
+        job.durations.extend([40.0] * 5)
+        scheduler._adapt_interval(job)
+        assert job.effective_interval == 60.0
+        assert scheduler.scheduler.get_job(job.job_id).trigger.interval.total_seconds() == 60.0
+        
+        job.durations.clear()
+        job.durations.extend([5.0] * 5)
+        scheduler._adapt_interval(job)
+        assert job.effective_interval == 30
+        assert scheduler.get_status()['jobs']['prices']['effective_interval_seconds'] == 30
+    
+    def test_adaptive_interval_upstream_latency(self, scheduler):
+        """upstream 응답 지연이 목표를 넘으면 간격을 늘리되 최대 배율로 제한 테스트"""
+        scheduler.adaptive_interval = True
+        job = scheduler.jobs['prices']
+        job.durations.append(5.0)
+        
+        job.last_latency = 2.0
+        scheduler._adapt_interval(job)
+        assert job.effective_interval == 60.0
+        
+        job.last_latency = 10.0
+        scheduler._adapt_interval(job)
+        assert job.effective_interval == 120.0
+    
+    def test_average_latency(self):
+        """HTTP 통계 스냅샷 사이의 평균 응답 지연 계산 테스트"""
+        before = {'finance.naver.com': {'requests': 10, 'latency_seconds': 2.0}}
+        after = {'finance.naver.com': {'requests': 14, 'latency_seconds': 3.0},
+                 'search.naver.com': {'requests': 1, 'latency_seconds': 0.5}}
+        
+        assert DataScheduler._average_latency(before, after) == pytest.approx(0.3)
+        assert DataScheduler._average_latency(after, after) is None
+
+
 class TestDataSchedulerIntegration:
     """DataScheduler 통합 테스트"""
     
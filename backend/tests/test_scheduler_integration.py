@@ -220,19 +220,20 @@ class TestSchedulerAutoCollection:
         # 스케줄러 시작
         scheduler.start()
         
-        # job이 등록되었는지 확인
-        job = scheduler.scheduler.get_job(scheduler.job_id)
-        assert job is not None
-        assert job.name == "Data Collection Job"
-        
-        # next_run_time이 설정되었는지 확인
-        if job.next_run_time:
-            assert job.next_run_time > datetime.now()
+        # 데이터 유형별 job이 등록되었는지 확인
+        for job_state in scheduler.jobs.values():
+            job = scheduler.scheduler.get_job(job_state.job_id)
+            assert job is not None
+            assert job.name == job_state.name
+            
+            # next_run_time이 설정되었는지 확인
+            if job.next_run_time:
+                assert job.next_run_time > datetime.now(job.next_run_time.tzinfo)
         
         # 스케줄러 중지
         scheduler.stop()
         
         # 중지 후 job이 제거되었는지 확인
-        job_after_stop = scheduler.scheduler.get_job(scheduler.job_id)
-        assert job_after_stop is None
+        for job_state in scheduler.jobs.values():
+            assert scheduler.scheduler.get_job(job_state.job_id) is None
 
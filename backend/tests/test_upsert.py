@@ -0,0 +1,198 @@
+"""
+벌크 upsert 테스트
+"""
+
+import pytest
+from collections import Counter
+from datetime import date, datetime
+from decimal import Decimal
+from unittest.mock import patch
+
+from sqlalchemy.dialects import mysql, postgresql
+
+from app.collectors.finance_collector import FinanceCollector, DATA_TYPE_PRICES
+from app.models.data_check import DataCheck
+from app.models.stock import Stock
+from app.models.price import Price
+from app.models.trading_trend import TradingTrend
+from app.utils.upsert import UpsertResult, _build_statement, bulk_upsert
+
+
+def _price_row(day: int, price: float = 25050.0) -> dict:
+    return {
+        'ticker': "UPS001",
+        'date': date(2025, 10, day),
+        'timestamp': datetime(2025, 10, day, 16),
+        'current_price': price,
+        'volume': 1000,
+    }
+
+
+@pytest.fixture
+def stock(db_session):
+    """종목 픽스처 (외래 키)"""
+    db_session.add(Stock(ticker="UPS001", name="업서트", type="STOCK"))
+    db_session.commit()
+
+
+class TestBulkUpsert:
+    """bulk_upsert 테스트"""
+
+    def test_insert_then_update_counts(self, db_session, stock):
+        """삽입/갱신 개수 구분 테스트"""
+        result = bulk_upsert(db_session, Price, [_price_row(1), _price_row(2)], ('ticker', 'date'))
+        db_session.commit()
+        assert result == UpsertResult(inserted=2, updated=0)
+
+        result = bulk_upsert(db_session, Price, [_price_row(2, 25100.0), _price_row(3)], ('ticker', 'date'))
+        db_session.commit()
+        assert result == UpsertResult(inserted=1, updated=1)
+        assert result.total == 2
+
+        prices = {p.date.day: p.current_price for p in db_session.query(Price).filter(Price.ticker == "UPS001")}
+        assert prices == {1: Decimal("25050.00"), 2: Decimal("25100.00"), 3: Decimal("25050.00")}
+
+    def test_duplicate_keys_in_batch(self, db_session, stock):
+        """같은 키가 여러 번 있으면 마지막 행 사용 테스트"""
+        result = bulk_upsert(db_session, Price, [_price_row(1), _price_row(1, 25080.0)], ('ticker', 'date'))
+        db_session.commit()
+
+        assert result.inserted == 1
+        assert db_session.query(Price).one().current_price == Decimal("25080.00")
+
+    def test_multiple_batches(self, db_session, stock):
+        """배치 분할 테스트"""
+        rows = [_price_row(day) for day in range(1, 31)]
+
+        with patch.object(db_session, 'execute', wraps=db_session.execute) as mock_execute:
+            result = bulk_upsert(db_session, Price, rows, ('ticker', 'date'), batch_size=10)
+        db_session.commit()
+
+        assert result.inserted == 30
+        # 배치당 기존 키 조회 1회 + upsert 1회
+        assert mock_execute.call_count == 6
+        assert db_session.query(Price).count() == 30
+
+    def test_update_columns_limit(self, db_session, stock):
+        """갱신 컬럼 지정 테스트"""
+        bulk_upsert(db_session, Price, [_price_row(1)], ('ticker', 'date'))
+        bulk_upsert(db_session, Price, [_price_row(1, 25080.0) | {'volume': 5}], ('ticker', 'date'),
+                    update_columns=['volume'])
+        db_session.commit()
+
+        price = db_session.query(Price).one()
+        assert price.current_price == Decimal("25050.00")
+        assert price.volume == 5
+
+    def test_empty_rows(self, db_session):
+        """빈 입력 테스트"""
+        assert bulk_upsert(db_session, Price, [], ('ticker', 'date')) == UpsertResult()
+
+    @pytest.mark.parametrize("dialect,expected", [
+        (mysql.dialect(), "ON DUPLICATE KEY UPDATE"),
+        (postgresql.dialect(), "ON CONFLICT (ticker, date) DO UPDATE"),
+    ])
+    def test_dialect_statements(self, dialect, expected):
+        """MySQL/PostgreSQL upsert 문 생성 테스트"""
+        stmt = _build_statement(dialect.name, TradingTrend.__table__, ('ticker', 'date'), ['individual'])
+
+        assert expected in str(stmt.compile(dialect=dialect))
+
+    def test_unsupported_dialect(self):
+        """지원하지 않는 방언 테스트"""
+        with pytest.raises(ValueError):
+            _build_statement("oracle", Price.__table__, ('ticker', 'date'), ['volume'])
+
+
+class TestSkipUnchanged:
+    """저장된 값과 같은 행 쓰기 생략 테스트"""
+
+    def test_unchanged_rows_not_written(self, db_session, stock):
+        """값이 같은 행은 쓰지 않고 바뀐 행만 갱신 테스트"""
+        bulk_upsert(db_session, Price, [_price_row(1), _price_row(2)], ('ticker', 'date'))
+        db_session.commit()
+
+        rows = [_price_row(1) | {'timestamp': datetime(2025, 11, 1)}, _price_row(2, 25100.0), _price_row(3)]
+        with patch.object(db_session, 'execute', wraps=db_session.execute) as mock_execute:
+            result = bulk_upsert(db_session, Price, rows, ('ticker', 'date'),
+                                 skip_unchanged=True, ignore_columns=('timestamp',))
+        db_session.commit()
+
+        assert result == UpsertResult(inserted=1, updated=1, unchanged=1)
+        assert result.written == 2
+        # 기존 행 조회 1회 + 바뀐 행 upsert 1회
+        assert mock_execute.call_count == 2
+        assert len(mock_execute.call_args[0][1]) == 2
+        unchanged = db_session.query(Price).filter(Price.date == date(2025, 10, 1)).one()
+        assert unchanged.timestamp == datetime(2025, 10, 1, 16)
+
+    def test_numeric_precision_normalized(self, db_session, stock):
+        """float 입력과 저장된 Decimal 값 비교 테스트"""
+        bulk_upsert(db_session, Price, [_price_row(1) | {'change_rate': 0.1 + 0.2}], ('ticker', 'date'))
+        db_session.commit()
+
+        result = bulk_upsert(db_session, Price, [_price_row(1) | {'change_rate': 0.3}], ('ticker', 'date'),
+                             skip_unchanged=True, ignore_columns=('timestamp',))
+
+        assert result.unchanged == 1
+
+    def test_all_unchanged_skips_statement(self, db_session, stock):
+        """모든 행이 같으면 upsert 문을 실행하지 않음 테스트"""
+        bulk_upsert(db_session, Price, [_price_row(1)], ('ticker', 'date'))
+        db_session.commit()
+
+        with patch.object(db_session, 'execute', wraps=db_session.execute) as mock_execute:
+            result = bulk_upsert(db_session, Price, [_price_row(1)], ('ticker', 'date'), skip_unchanged=True)
+
+        assert result == UpsertResult(unchanged=1)
+        assert mock_execute.call_count == 1
+
+    def test_existing_keys_conflict(self, db_session):
+        """existing_keys와 skip_unchanged 동시 사용 불가 테스트"""
+        with pytest.raises(ValueError):
+            bulk_upsert(db_session, Price, [_price_row(1)], ('ticker', 'date'),
+                        existing_keys=set(), skip_unchanged=True)
+
+
+class TestCollectorDiffWrites:
+    """수집기 저장 시 변경 없는 행 생략 및 확인 시각 기록 테스트"""
+
+    def test_resave_records_check_only(self, db_session, stock):
+        """같은 데이터를 다시 저장하면 행은 그대로 두고 확인 시각만 갱신 테스트"""
+        write_stats = Counter()
+        collector = FinanceCollector(write_stats=write_stats)
+        rows = [_price_row(day) | {'high_price': 25500.0, 'low_price': 24500.0} for day in (1, 2)]
+
+        assert collector.save_price_data(db_session, rows) == 2
+        first_check = db_session.query(DataCheck).one()
+        assert first_check.data_type == DATA_TYPE_PRICES
+        changed_at = first_check.last_changed_at
+
+        assert collector.save_price_data(db_session, [row | {'timestamp': datetime.now()} for row in rows]) == 2
+        db_session.expire_all()
+        check = db_session.query(DataCheck).one()
+
+        assert write_stats == Counter(inserted=2, unchanged=2)
+        assert check.last_changed_at == changed_at
+        assert check.last_checked_at >= changed_at
+        assert {p.timestamp for p in db_session.query(Price)} == {datetime(2025, 10, 1, 16), datetime(2025, 10, 2, 16)}
+
+    def test_batch_marks_only_written_tickers_changed(self, db_session, stock):
+        """여러 종목을 한 번에 저장하면 실제로 행을 쓴 종목만 last_changed_at 갱신 테스트"""
+        db_session.add(Stock(ticker="UPS002", name="업서트 2", type="STOCK"))
+        db_session.commit()
+        collector = FinanceCollector()
+        rows = [_price_row(1) | {'high_price': 25500.0, 'low_price': 24500.0}]
+        other = [row | {'ticker': "UPS002"} for row in rows]
+        collector.save_price_data(db_session, rows + other)
+        changed_at = {check.ticker: check.last_changed_at for check in db_session.query(DataCheck)}
+
+        result = collector.write_price_data(db_session, rows + [other[0] | {'current_price': 25100.0}])
+        db_session.commit()
+        db_session.expire_all()
+        checks = {check.ticker: check for check in db_session.query(DataCheck)}
+
+        assert result.written_keys == {("UPS002", date(2025, 10, 1))}
+        assert checks["UPS001"].last_changed_at == changed_at["UPS001"]
+        assert checks["UPS002"].last_changed_at > changed_at["UPS002"]
+        assert checks["UPS001"].last_checked_at > changed_at["UPS001"]
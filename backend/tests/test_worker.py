@@ -0,0 +1,296 @@
+"""
+수집 워커와 수집 작업 큐 테스트
+"""
+
+import pytest
+from unittest.mock import Mock, patch
+
+from app.models.stock import Stock
+from app.scheduler.collection_jobs import (
+    JOB_FAILED,
+    JOB_PROCESSING_KEY,
+    JOB_QUEUE_KEY,
+    JOB_QUEUED,
+    JOB_RUNNING,
+    JOB_SUCCEEDED,
+    CollectionJobQueue,
+)
+from app.worker import CollectionWorker, main
+
+
+class FakeRedis:
+    """작업 큐에 쓰는 명령만 지원하는 테스트용 Redis"""
+
+    def __init__(self):
+        self.values = {}
+        self.lists = {}
+
+    def get(self, key):
+        return self.values.get(key)
+
+    def set(self, key, value, ex=None, nx=False):
+        if nx and key in self.values:
+            return None
+        self.values[key] = value
+        return True
+
+    def delete(self, key):
+        self.values.pop(key, None)
+
+    def exists(self, key):
+        return int(key in self.values)
+
+    def expire_key(self, key):
+        self.values.pop(key, None)
+
+    def lpush(self, key, value):
+        self.lists.setdefault(key, []).insert(0, value)
+
+    def rpush(self, key, value):
+        self.lists.setdefault(key, []).append(value)
+
+    def blmove(self, source, destination, timeout, src='LEFT', dest='RIGHT'):
+        items = self.lists.get(source)
+        if not items:
+            return None
+        value = items.pop() if src == 'RIGHT' else items.pop(0)
+        target = self.lists.setdefault(destination, [])
+        target.insert(0, value) if dest == 'LEFT' else target.append(value)
+        return value
+
+    def lrem(self, key, count, value):
+        items = self.lists.get(key, [])
+        removed = 0
+        while value in items and (count == 0 or removed < count):
+            items.remove(value)
+            removed += 1
+        return removed
+
+    def lrange(self, key, start, end):
+        return list(self.lists.get(key, []))
+
+    def llen(self, key):
+        return len(self.lists.get(key, []))
+
+
+@pytest.fixture
+def queue():
+    return CollectionJobQueue(client=FakeRedis())
+
+
+class TestCollectionJobQueue:
+    """CollectionJobQueue 테스트"""
+
+    def test_enqueue_dequeue_finish(self, queue):
+        """작업 등록, 꺼내기, 완료 상태 전이 테스트"""
+        job = queue.enqueue("prices", "487240", {"days": 10})
+        assert job['status'] == JOB_QUEUED
+        assert queue.pending() == 1
+
+        running = queue.dequeue(timeout=0)
+        assert running['id'] == job['id']
+        assert queue.get(job['id'])['status'] == JOB_RUNNING
+
+        queue.finish(job['id'], result={'saved_count': 10})
+        finished = queue.get(job['id'])
+        assert finished['status'] == JOB_SUCCEEDED
+        assert finished['result'] == {'saved_count': 10}
+        assert queue.dequeue(timeout=0) is None
+
+    def test_fifo(self, queue):
+        """먼저 등록한 작업부터 꺼내는지 테스트"""
+        first = queue.enqueue("prices", "A", {"days": 1})
+        queue.enqueue("news", "B", {"max_items": 5})
+
+        assert queue.dequeue(timeout=0)['id'] == first['id']
+
+    def test_identical_jobs_coalesced(self, queue):
+        """같은 요청이 대기/실행 중이면 그 작업을 반환하고, 끝나면 새 작업 테스트"""
+        first = queue.enqueue("prices", "A", {"days": 5, "incremental": False})
+        second = queue.enqueue("prices", "A", {"incremental": False, "days": 5})
+
+        assert second['id'] == first['id'] and second['coalesced'] is True
+        assert queue.pending() == 1
+
+        queue.dequeue(timeout=0)
+        assert queue.enqueue("prices", "A", {"days": 5, "incremental": False})['id'] == first['id']
+
+        queue.finish(first['id'], result={'saved_count': 5})
+        third = queue.enqueue("prices", "A", {"days": 5, "incremental": False})
+        assert third['id'] != first['id'] and third['coalesced'] is False
+
+    def test_dead_worker_job_requeued(self, queue):
+        """워커가 죽어 임대가 만료된 작업을 다시 큐에 넣고, 시도 횟수를 넘으면 실패 처리 테스트"""
+        queue.max_attempts = 2
+        job = queue.enqueue("prices", "A", {"days": 5})
+        queue.dequeue(timeout=0)
+        assert queue.reclaim_expired() == 0  # 임대 유지 중
+
+        queue.client.expire_key(queue._lease_key(job['id']))
+        assert queue.reclaim_expired() == 1
+        assert queue.get(job['id'])['status'] == JOB_QUEUED
+
+        retried = queue.dequeue(timeout=0)
+        assert retried['id'] == job['id'] and retried['attempts'] == 2
+
+        queue.client.expire_key(queue._lease_key(job['id']))
+        assert queue.reclaim_expired() == 0
+        assert queue.get(job['id'])['status'] == JOB_FAILED
+        assert queue.client.llen(JOB_PROCESSING_KEY) == 0
+
+    def test_stale_running_job_not_coalesced(self, queue):
+        """임대가 만료된 실행 중 작업에는 합치지 않고 새 작업을 만드는지 테스트"""
+        first = queue.enqueue("prices", "A", {"days": 5})
+        queue.dequeue(timeout=0)
+        queue.client.expire_key(queue._lease_key(first['id']))
+
+        second = queue.enqueue("prices", "A", {"days": 5})
+
+        assert second['id'] != first['id'] and second['coalesced'] is False
+        queue.reclaim_expired()
+        assert queue.get(first['id'])['status'] == JOB_FAILED  # 새 작업이 대신하므로 다시 실행하지 않음
+        assert queue.dequeue(timeout=0)['id'] == second['id']
+
+    def test_unleased_queued_job_reclaimed_after_grace(self, queue):
+        """꺼낸 직후 임대를 잡기 전인 작업은 유예 시간이 지난 뒤에만 회수하는지 테스트"""
+        queue.claim_grace_seconds = 30
+        job = queue.enqueue("prices", "A", {"days": 5})
+        queue.client.blmove(JOB_QUEUE_KEY, JOB_PROCESSING_KEY, 0, src='RIGHT', dest='LEFT')
+
+        with patch('app.scheduler.collection_jobs.time.time', return_value=1000.0):
+            assert queue.reclaim_expired() == 0
+        assert queue.client.llen(JOB_PROCESSING_KEY) == 1
+
+        with patch('app.scheduler.collection_jobs.time.time', return_value=1031.0):
+            assert queue.reclaim_expired() == 1
+        assert queue.get(job['id'])['status'] == JOB_QUEUED
+        assert queue.client.llen(JOB_PROCESSING_KEY) == 0
+        assert queue.client.get(queue._unleased_key(job['id'])) is None
+
+    def test_unknown_job_type(self, queue):
+        """알 수 없는 작업 유형 테스트"""
+        with pytest.raises(ValueError):
+            queue.enqueue("unknown", "A", {})
+
+
+class TestCollectionWorker:
+    """CollectionWorker 테스트"""
+
+    def test_process_one_success(self, queue):
+        """큐 작업을 실행하고 결과 기록 테스트"""
+        job = queue.enqueue("news", "487240", {"max_items": 5})
+        worker = CollectionWorker(queue, poll_timeout=0)
+
+        with patch('app.worker.run_collection_job', return_value={'saved_count': 5}) as run:
+            assert worker.process_one() is True
+
+        run.assert_called_once_with("news", "487240", {"max_items": 5})
+        assert queue.get(job['id'])['status'] == JOB_SUCCEEDED
+        assert worker.process_one() is False
+
+    def test_process_one_failure(self, queue):
+        """작업 실패 시 오류 기록 테스트"""
+        job = queue.enqueue("prices", "487240", {"days": 10})
+        worker = CollectionWorker(queue, poll_timeout=0)
+
+        with patch('app.worker.run_collection_job', side_effect=RuntimeError("upstream down")):
+            worker.process_one()
+
+        failed = queue.get(job['id'])
+        assert failed['status'] == JOB_FAILED
+        assert failed['error'] == "upstream down"
+
+    def test_maintain_jobs_extends_running_lease(self, queue):
+        """실행 중인 작업의 임대를 연장해 회수되지 않는지 테스트"""
+        job = queue.enqueue("news", "487240", {"max_items": 5})
+        worker = CollectionWorker(queue, poll_timeout=0)
+
+        def run(*args):
+            queue.client.expire_key(queue._lease_key(job['id']))
+            worker.maintain_jobs()
+            assert queue.get(job['id'])['status'] == JOB_RUNNING
+            return {'saved_count': 5}
+
+        with patch('app.worker.run_collection_job', side_effect=run):
+            worker.process_one()
+
+        assert queue.get(job['id'])['status'] == JOB_SUCCEEDED
+
+    def test_publish_status(self, queue):
+        """스케줄러 상태와 작업 통계 게시 테스트"""
+        scheduler = Mock(get_status=Mock(return_value={'is_running': True, 'interval_seconds': 30}))
+        worker = CollectionWorker(queue, scheduler=scheduler)
+
+        worker.publish_status()
+
+        status = queue.get_worker_status()
+        assert status['is_running'] is True
+        assert status['worker']['pending_jobs'] == 0
+        assert status['worker']['processed'] == 0
+
+
+class TestWorkerMain:
+    """수집 워커 진입점 테스트"""
+
+    def test_refuses_to_start_without_worker_mode(self):
+        """COLLECTION_WORKER_ENABLED가 아니면 프로세스 내 큐로 실행하지 않고 종료하는지 테스트"""
+        with patch('app.config.settings.COLLECTION_WORKER_ENABLED', False), \
+                patch('app.worker.CollectionWorker') as worker_cls, \
+                pytest.raises(SystemExit) as exc_info:
+            main(["--no-scheduler"])
+
+        assert exc_info.value.code != 0
+        worker_cls.assert_not_called()
+
+    def test_uses_redis_queue(self):
+        """워커는 Redis 작업 큐를 직접 생성해 실행하는지 테스트"""
+        with patch('app.config.settings.COLLECTION_WORKER_ENABLED', True), \
+                patch('app.config.settings.BACKFILL_ENABLED', False), \
+                patch('app.worker.init_db', new=Mock(return_value=None)), \
+                patch('app.worker.asyncio.run'), \
+                patch('app.worker.signal.signal'), \
+                patch('app.worker.close_redis_client'), \
+                patch('app.worker.CollectionWorker') as worker_cls:
+            main(["--no-scheduler"])
+
+        assert isinstance(worker_cls.call_args.args[0], CollectionJobQueue)
+        worker_cls.return_value.run.assert_called_once()
+
+
+class TestWorkerModeAPI:
+    """COLLECTION_WORKER_ENABLED API 테스트"""
+
+    @pytest.fixture
+    def worker_mode(self, queue):
+        with patch('app.config.settings.COLLECTION_WORKER_ENABLED', True), \
+                patch('app.api.data_collection.get_collection_job_queue', return_value=queue), \
+                patch('app.api.scheduler.get_collection_job_queue', return_value=queue):
+            yield queue
+
+    def test_collect_enqueues(self, client, db_session, worker_mode):
+        """수집 API가 작업을 수집 워커 큐에 넣는지 테스트"""
+        db_session.add(Stock(ticker="QUEUE001", name="큐 테스트", type="STOCK"))
+        db_session.commit()
+
+        response = client.post("/api/data/collect/trading/QUEUE001?days=5&start_date=2025-01-01")
+
+        assert response.status_code == 202
+        data = response.json()["data"]
+        assert data["status"] == JOB_QUEUED
+        assert data["params"] == {"days": 5, "start_date": "2025-01-01", "end_date": None}
+        assert worker_mode.pending() == 1
+
+    def test_scheduler_status_from_worker(self, client, worker_mode):
+        """스케줄러 상태는 워커가 게시한 값을 반환 테스트"""
+        assert client.get("/api/scheduler/status").json()["data"] == {'is_running': False, 'worker': None}
+
+        worker_mode.publish_worker_status({'is_running': True, 'worker': {'worker_id': "w1"}}, ttl=30)
+        assert client.get("/api/scheduler/status").json()["data"]["worker"]["worker_id"] == "w1"
+
+    def test_scheduler_control_rejected(self, client, worker_mode):
+        """워커 모드에서는 API로 스케줄러를 시작/중지할 수 없음 테스트"""
+        response = client.post("/api/scheduler/start")
+
+        assert response.status_code == 400
+        assert response.json()["error_code"] == "SCHEDULER_IN_WORKER"
+        assert client.post("/api/scheduler/stop").status_code == 400